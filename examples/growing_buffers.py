@@ -1,5 +1,5 @@
 """
-Example showing how to resize Buffers with orphan()
+Example showing how to resize Buffers with resize()
 
 This can be useful for batch drawing an arbitrary
 amount of geometry over time.
@@ -18,8 +18,8 @@ class Points:
 
     The point set is created using an initial buffer allocation.
     When the buffer is to small we double the size.
-    When the buffer do not need resizing we only do a partial
-    buffer update.
+    The existing points are kept by resize() on the GPU
+    so we only write the new points.
     """
     def __init__(self, ctx, num_points):
         """
@@ -27,7 +27,7 @@ class Points:
             ctx: moderngl context
             num_points: Initial number of points to allocate
         """
-        self.points = []
+        self.num_points = 0
         self.ctx = ctx
         self.buffer = self.ctx.buffer(reserve=num_points * 12)  # 12 bytes for a 3f
         self.program = self.ctx.program(
@@ -58,34 +58,28 @@ class Points:
 
     @property
     def count(self):
-        return len(self.points) // 3
+        return self.num_points
 
     @property
     def byte_size(self):
         """int: Byte size of the point data"""
-        return len(self.points) * 4  # 4 byte per float
+        return self.num_points * 12  # 12 bytes for a 3f
 
     def add(self, num):
         """Adds num points random points"""
-        resized = False
         old_points_size = self.byte_size
         new = list(self._gen_random_points(num))
-        self.points = self.points + new
+        self.num_points += num
 
         # Keep doubling the buffer size until we reach an acceptable size
         while self.byte_size > self.buffer.size:
-            resized = True
             print("Buffer resized {} -> {}".format(self.buffer.size, self.buffer.size * 2))
             print("New capacity is {} points".format(self.buffer.size * 2 // 12))
-            self.buffer.orphan(self.buffer.size * 2)
-
-        if resized:
-            # Re-write the entire buffer
-            self.buffer.write(struct.pack('{}f'.format(len(self.points)), *self.points))
-        else:
-            # Partial buffer update
-            print("Partial buffer update adding {} points".format(len(new) // 3))
-            self.buffer.write(struct.pack('{}f'.format(len(new)), *new), offset=old_points_size)
+            self.buffer.resize(self.buffer.size * 2)
+
+        # The old points are preserved, only write the new ones
+        print("Partial buffer update adding {} points".format(len(new) // 3))
+        self.buffer.write(struct.pack('{}f'.format(len(new)), *new), offset=old_points_size)
 
     def _gen_random_points(self, num):
         for _ in range(num * 3):
@@ -4,20 +4,32 @@
 
 from .error import *
 from .buffer import *
+from .buffer_pool import *
 from .compute_shader import *
 from .conditional_render import *
 from .context import *
 from .framebuffer import *
+from .indirect_buffer import *
+from .pending_program import *
 from .program import *
+from .program_cache import *
+from .program_pipeline import *
 from .program_members import *
 from .query import *
+from .readback import *
+from .recorder import *
 from .renderbuffer import *
 from .scope import *
+from .shader_library import *
+from .stream_buffer import *
 from .texture import *
 from .texture_3d import *
 from .texture_array import *
 from .texture_cube import *
+from .transform_feedback import *
+from .uniform_struct import *
 from .vertex_array import *
+from .vertex_layout import *
 from .sampler import *
 
 __version__ = '5.6.0'
@@ -1,3 +1,8 @@
+from contextlib import contextmanager
+
+from .error import Error
+from .readback import Readback
+
 __all__ = ['Buffer']
 
 
@@ -14,12 +19,13 @@ class Buffer:
         Copy buffer content using :py:meth:`Context.copy_buffer`.
     '''
 
-    __slots__ = ['mglo', '_size', '_dynamic', '_glo', 'ctx', 'extra']
+    __slots__ = ['mglo', '_size', '_dynamic', '_dtype', '_glo', 'ctx', 'extra']
 
     def __init__(self):
         self.mglo = None  #: Internal representation for debug purposes only.
         self._size = None  #: Orignal buffer size during creation
         self._dynamic = None
+        self._dtype = None
         self._glo = None
         self.ctx = None  #: The context this object belongs to
         self.extra = None  #: Any - Attribute for storing user defined objects
@@ -47,6 +53,15 @@ class Buffer:
 
         return self._dynamic
 
+    @property
+    def dtype(self):
+        '''
+            numpy.dtype: The structured dtype of the content or ``None``.
+            It is detected when the buffer is created from a structured NumPy array.
+        '''
+
+        return self._dtype
+
     @property
     def glo(self) -> int:
         '''
@@ -69,11 +84,38 @@ class Buffer:
 
         self.mglo.write(data, offset)
 
+    def write_many(self, offsets, data) -> None:
+        '''
+            Write many ranges with a single call.
+
+            The data is either a single contiguous object split into
+            ``len(offsets)`` equal parts or a list of objects, one for each offset.
+            Adjacent and overlapping ranges are merged. Dense updates are written
+            through a single mapping, sparse ones with one ``glBufferSubData`` per merged range.
+            Where ranges overlap the later one wins.
+
+            Args:
+                offsets (list): The offsets as a list of ints or an array of 32 or 64 bit integers.
+                data (bytes): The data or a list of data.
+
+            .. rubric:: Example
+
+            .. code-block:: python
+
+                >>> transforms.write_many(np.array([0, 256, 1024], 'i8'), matrices.tobytes())
+        '''
+
+        self.mglo.write_many(offsets, data)
+
     def write_chunks(self, data, start, step, count) -> None:
         '''
             Split data to count equal parts.
 
             Write the chunks using offsets calculated from start, step and stop.
+            Only the range covered by the chunks is mapped.
+
+            The data can be any object supporting the buffer protocol,
+            including strided ones such as a column of a NumPy array.
 
             Args:
                 data (bytes): The data.
@@ -115,6 +157,31 @@ class Buffer:
 
         return self.mglo.read_into(buffer, size, offset, write_offset)
 
+    def read_async(self, size=-1, *, offset=0) -> 'Readback':
+        '''
+            Start reading the content without waiting for the GPU.
+
+            The range is copied into a staging buffer and a fence is inserted.
+            Use the returned :py:class:`Readback` to collect the content later.
+
+            Args:
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                offset (int): The offset.
+
+            Returns:
+                :py:class:`Readback` object
+        '''
+
+        res = Readback.__new__(Readback)
+        res.mglo, res._size, _ = self.mglo.read_async(size, offset)
+        res._data = None
+        res._released = False
+        res.ctx = self.ctx
+        res.extra = None
+        return res
+
     def read_chunks(self, chunk_size, start, step, count) -> bytes:
         '''
             Read the content.
@@ -141,6 +208,9 @@ class Buffer:
             Read and concatenate the chunks of size chunk_size
             using offsets calculated from start, step and stop.
 
+            The buffer can be any writable object supporting the buffer protocol,
+            including strided ones such as a column of a NumPy array.
+
             Args:
                 buffer (bytearray): The buffer that will receive the content.
                 chunk_size (int): The chunk size.
@@ -152,21 +222,126 @@ class Buffer:
                 write_offset (int): The write offset.
         '''
 
-        return self.mglo.read(buffer, chunk_size, start, step, count, write_offset)
+        return self.mglo.read_chunks_into(buffer, chunk_size, start, step, count, write_offset)
 
-    def clear(self, size=-1, *, offset=0, chunk=None) -> None:
+    def clear(self, size=-1, *, offset=0, chunk=None, fmt=None) -> None:
         '''
             Clear the content.
 
+            The buffer is filled on the GPU with ``glClearBufferSubData`` when it is available
+            and the offset and size are multiples of the chunk size.
+            Otherwise the range is mapped and filled on the CPU.
+
             Args:
                 size (int): The size. Value ``-1`` means all.
 
             Keyword Args:
                 offset (int): The offset.
                 chunk (bytes): The chunk to use repeatedly.
+                fmt (str): The format of the chunk, for example ``'4f'`` or ``'1u4'``.
+                           By default the chunk is copied bit by bit.
+
+            .. rubric:: Example
+
+            .. code-block:: python
+
+                >>> ssbo.clear(chunk=struct.pack('4f', 0.0, 0.0, 0.0, 1.0), fmt='4f')
+        '''
+
+        self.mglo.clear(size, offset, chunk, fmt)
+
+    @contextmanager
+    def map(self, offset=0, size=-1, *, read=False, write=True, invalidate=False,
+            unsynchronized=False, flush_explicit=False):
+        '''
+            Map a range of the buffer and yield a :py:class:`memoryview` of it.
+
+            The memoryview points directly into the mapped memory, no copies are made.
+            The range is unmapped and the memoryview is released when the ``with`` block exits.
+
+            Args:
+                offset (int): The offset.
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                read (bool): Map the range for reading.
+                write (bool): Map the range for writing.
+                invalidate (bool): Discard the previous content of the range.
+                unsynchronized (bool): Do not wait for pending operations on the buffer.
+                flush_explicit (bool): Modified ranges must be flushed with :py:meth:`flush_range`.
+
+            .. rubric:: Example
+
+            .. code-block:: python
+
+                >>> with vbo.map(1024, 256, invalidate=True) as view:
+                ...     view[:] = np.zeros(64, 'f4').tobytes()
         '''
 
-        self.mglo.clear(size, offset, chunk)
+        view = self.mglo.map(offset, size, read, write, invalidate, unsynchronized, flush_explicit)
+        try:
+            yield view
+        finally:
+            try:
+                view.release()
+            except BufferError:
+                self.mglo.unmap()
+                raise Error('the mapped range is still referenced after unmapping')
+            self.mglo.unmap()
+
+    @contextmanager
+    def as_array(self, dtype=None, offset=0, count=-1, *, read=False, write=True, invalidate=False):
+        '''
+            Map a range of the buffer and yield a NumPy array viewing it.
+
+            The array points directly into the mapped memory, no copies are made.
+            The array must not be used after the ``with`` block exits.
+
+            Args:
+                dtype (numpy.dtype): The dtype of the array. By default :py:attr:`dtype` is used.
+                offset (int): The offset.
+                count (int): The number of elements. Value ``-1`` means as many as fit.
+
+            Keyword Args:
+                read (bool): Map the range for reading.
+                write (bool): Map the range for writing.
+                invalidate (bool): Discard the previous content of the range.
+
+            .. rubric:: Example
+
+            .. code-block:: python
+
+                >>> with vbo.as_array(vertex_dtype, count=100) as vertices:
+                ...     vertices['in_color'] = (1.0, 0.0, 0.0)
+        '''
+
+        import numpy as np
+
+        dtype = np.dtype(self._dtype if dtype is None else dtype)
+
+        if count < 0:
+            count = (self.size - offset) // dtype.itemsize
+
+        with self.map(offset, count * dtype.itemsize, read=read, write=write, invalidate=invalidate) as view:
+            array = np.frombuffer(view, dtype, count)
+            array.flags.writeable = write
+            try:
+                yield array
+            finally:
+                del array
+
+    def flush_range(self, offset=0, size=-1) -> None:
+        '''
+            Flush a modified range of the buffer mapped with ``flush_explicit=True``.
+
+            The offset is relative to the start of the mapped range.
+
+            Args:
+                offset (int): The offset.
+                size (int): The size. Value ``-1`` means the rest of the mapped range.
+        '''
+
+        self.mglo.flush_range(offset, size)
 
     def bind_to_uniform_block(self, binding=0, *, offset=0, size=-1) -> None:
         '''
@@ -248,6 +423,25 @@ class Buffer:
 
         self.mglo.orphan(size)
 
+    def resize(self, size, *, preserve=True) -> None:
+        '''
+            Change the size of the buffer keeping its content.
+
+            The content is copied on the GPU, no data is transferred from or to the CPU.
+            The buffer keeps its OpenGL object, the vertex arrays and scopes
+            referencing it remain valid. Their :py:attr:`VertexArray.vertices`
+            is not recomputed.
+
+            Args:
+                size (int): The new size of the buffer.
+
+            Keyword Args:
+                preserve (bool): Keep the content. When the buffer shrinks the content is truncated.
+                                 When ``False`` this is the same as :py:meth:`orphan`.
+        '''
+
+        self.mglo.resize(size, preserve)
+
     def release(self) -> None:
         '''
             Release the ModernGL object.
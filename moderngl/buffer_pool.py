@@ -0,0 +1,256 @@
+import bisect
+
+from .error import Error
+
+__all__ = ['BufferPool', 'BufferRange']
+
+
+class BufferRange:
+    '''
+        A BufferRange is an aligned range sub-allocated from a :py:class:`BufferPool`.
+
+        BufferRanges can be used in place of a :py:class:`Buffer` in the
+        content of :py:meth:`Context.vertex_array`. The attribute pointers
+        will start at the offset of the range.
+
+        A BufferRange object cannot be instantiated directly.
+        Use :py:meth:`BufferPool.allocate` to create one.
+    '''
+
+    __slots__ = ['pool', 'offset', 'size', '_alignment', 'extra']
+
+    def __init__(self):
+        self.pool = None  #: BufferPool: The pool this range was allocated from.
+        self.offset = None  #: int: The byte offset of the range in the buffer.
+        self.size = None  #: int: The size of the range.
+        self._alignment = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<BufferRange: %d+%d>' % (self.offset, self.size)
+
+    @property
+    def buffer(self) -> 'Buffer':
+        '''
+            Buffer: The shared buffer of the pool.
+        '''
+
+        return self.pool.buffer
+
+    def write(self, data, *, offset=0) -> None:
+        '''
+            Write the content.
+
+            Args:
+                data (bytes): The data.
+
+            Keyword Args:
+                offset (int): The offset relative to the start of the range.
+        '''
+
+        if offset < 0 or offset + memoryview(data).nbytes > self.size:
+            raise Error('out of range offset = %d' % offset)
+
+        self.pool.buffer.write(data, offset=self.offset + offset)
+
+    def read(self, size=-1, *, offset=0) -> bytes:
+        '''
+            Read the content.
+
+            Args:
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                offset (int): The offset relative to the start of the range.
+
+            Returns:
+                bytes
+        '''
+
+        if size < 0:
+            size = self.size - offset
+
+        if offset < 0 or offset + size > self.size:
+            raise Error('out of range offset = %d or size = %d' % (offset, size))
+
+        return self.pool.buffer.read(size, offset=self.offset + offset)
+
+    def release(self) -> None:
+        '''
+            Return the range to the pool.
+        '''
+
+        self.pool.free(self)
+
+
+class BufferPool:
+    '''
+        A BufferPool packs many small allocations into a single :py:class:`Buffer`.
+
+        Ranges are sub-allocated with a first-fit search of a free list.
+        Released ranges are coalesced with their free neighbours and reused.
+        Using a single buffer for thousands of small meshes avoids creating
+        thousands of OpenGL objects and rebinding vertex arrays between draws.
+
+        A BufferPool object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.buffer_pool` to create one.
+    '''
+
+    __slots__ = ['buffer', '_alignment', '_free', '_ranges', 'ctx', 'extra']
+
+    def __init__(self):
+        self.buffer = None  #: Buffer: The shared buffer.
+        self._alignment = None
+        self._free = None
+        self._ranges = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<BufferPool: %d>' % self.buffer.glo
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of the shared buffer.
+        '''
+
+        return self.buffer.size
+
+    @property
+    def alignment(self) -> int:
+        '''
+            int: The default alignment of the allocated ranges.
+        '''
+
+        return self._alignment
+
+    @property
+    def stats(self) -> dict:
+        '''
+            dict: The number of allocations and the used, free and largest free byte sizes.
+        '''
+
+        free = sum(size for _, size in self._free)
+        return {
+            'size': self.buffer.size,
+            'allocations': len(self._ranges),
+            'used': sum(r.size for r in self._ranges),
+            'free': free,
+            'free_blocks': len(self._free),
+            'largest_free': max((size for _, size in self._free), default=0),
+        }
+
+    def allocate(self, size, *, alignment=None) -> 'BufferRange':
+        '''
+            Allocate a range from the pool.
+
+            Args:
+                size (int): The size of the range.
+
+            Keyword Args:
+                alignment (int): The alignment of the offset. By default the alignment of the pool is used.
+
+            Returns:
+                :py:class:`BufferRange` object
+        '''
+
+        if alignment is None:
+            alignment = self._alignment
+
+        if size <= 0 or alignment <= 0:
+            raise Error('invalid size = %d or alignment = %d' % (size, alignment))
+
+        for i, (start, length) in enumerate(self._free):
+            offset = (start + alignment - 1) // alignment * alignment
+            end = offset + size
+            if end > start + length:
+                continue
+
+            blocks = []
+            if offset > start:
+                blocks.append((start, offset - start))
+            if end < start + length:
+                blocks.append((end, start + length - end))
+            self._free[i:i + 1] = blocks
+
+            res = BufferRange.__new__(BufferRange)
+            res.pool = self
+            res.offset = offset
+            res.size = size
+            res._alignment = alignment
+            res.extra = None
+            self._ranges.append(res)
+            return res
+
+        raise Error('the pool cannot fit %d bytes' % size)
+
+    def free(self, buffer_range) -> None:
+        '''
+            Return a range to the pool.
+
+            Args:
+                buffer_range (BufferRange): The range to free.
+        '''
+
+        if buffer_range.pool is not self or buffer_range not in self._ranges:
+            raise Error('the range does not belong to this pool')
+
+        self._ranges.remove(buffer_range)
+        self._insert_free(buffer_range.offset, buffer_range.size)
+        buffer_range.size = 0
+
+    def defragment(self) -> None:
+        '''
+            Move the allocated ranges to the start of the buffer.
+
+            The content is copied on the GPU and the offsets of the
+            live :py:class:`BufferRange` objects are updated.
+            VertexArrays created with the old offsets must be recreated.
+        '''
+
+        self._ranges.sort(key=lambda r: r.offset)
+
+        moves = []
+        end = 0
+        for r in self._ranges:
+            offset = (end + r._alignment - 1) // r._alignment * r._alignment
+            moves.append((r, offset))
+            end = offset + r.size
+
+        if all(r.offset == offset for r, offset in moves):
+            return
+
+        # Overlapping copies within the same buffer are not allowed, use a staging buffer.
+        staging = self.ctx.buffer(reserve=max(end, 1))
+        for r, offset in moves:
+            self.ctx.copy_buffer(staging, self.buffer, r.size, read_offset=r.offset, write_offset=offset)
+        self.ctx.copy_buffer(self.buffer, staging, end)
+        staging.release()
+
+        for r, offset in moves:
+            r.offset = offset
+
+        self._free = [(end, self.buffer.size - end)] if end < self.buffer.size else []
+
+    def release(self) -> None:
+        '''
+            Release the shared buffer.
+        '''
+
+        self.buffer.release()
+
+    def _insert_free(self, offset, size):
+        i = bisect.bisect(self._free, (offset, size))
+
+        if i < len(self._free) and offset + size == self._free[i][0]:
+            size += self._free.pop(i)[1]
+
+        if i > 0 and self._free[i - 1][0] + self._free[i - 1][1] == offset:
+            offset, prev = self._free.pop(i - 1)
+            size += prev
+            i -= 1
+
+        self._free.insert(i, (offset, size))
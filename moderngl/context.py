@@ -1,22 +1,35 @@
 import os
 import warnings
-from typing import Dict, Tuple
+from collections import ChainMap, OrderedDict
+from typing import Dict, List, Tuple
 
 from .buffer import Buffer
+from .buffer_pool import BufferPool, BufferRange
 from .compute_shader import ComputeShader
 from .conditional_render import ConditionalRender
+from .error import Error
 from .framebuffer import Framebuffer
-from .program import Program, detect_format
-from .program_members import (Attribute, Subroutine, Uniform, UniformBlock,
-                              Varying)
+from .indirect_buffer import IndirectCommandBuffer
+from .pending_program import PendingProgram
+from .program import (Program, _dtype_parts, _LazyMembers, _program_member,
+                      detect_format)
+from .program_cache import (_cache_discard, _cache_lookup, _cache_result,
+                            _cached_build)
+from .program_pipeline import ProgramPipeline
 from .query import Query
+from .recorder import Recorder
 from .renderbuffer import Renderbuffer
 from .scope import Scope
+from .shader_library import ShaderLibrary
+from .stream_buffer import StreamBuffer
 from .texture import Texture
 from .texture_3d import Texture3D
 from .texture_array import TextureArray
 from .texture_cube import TextureCube
+from .transform_feedback import TransformFeedback
+from .uniform_struct import UniformStruct, _layout_dtype
 from .vertex_array import VertexArray
+from .vertex_layout import VertexLayout
 from .sampler import Sampler
 
 try:
@@ -63,6 +76,9 @@ LAST_VERTEX_CONVENTION = 0x8E4E
 DEFAULT_BLENDING = (SRC_ALPHA, ONE_MINUS_SRC_ALPHA)
 PREMULTIPLIED_ALPHA = (SRC_ALPHA, ONE)
 
+# the shader stages in the order of the shaders of a program
+_SHADER_STAGES = ('vertex', 'fragment', 'geometry', 'tess_control', 'tess_evaluation')
+
 
 class Context:
     '''
@@ -96,12 +112,13 @@ class Context:
     FIRST_VERTEX_CONVENTION = 0x8E4D
     LAST_VERTEX_CONVENTION = 0x8E4E
 
-    __slots__ = ['mglo', '_screen', '_info', 'version_code', 'fbo', 'extra']
+    __slots__ = ['mglo', '_screen', '_info', '_recorder', 'version_code', 'fbo', 'extra']
 
     def __init__(self):
         self.mglo = None  #: Internal representation for debug purposes only.
         self._screen = None
         self._info = None
+        self._recorder = None
         self.version_code = None  #: int: The OpenGL version code. Reports ``410`` for OpenGL 4.1
         #: Framebuffer: The active framebuffer.
         #: Set every time :py:meth:`Framebuffer.use()` is called.
@@ -118,7 +135,7 @@ class Context:
     @property
     def line_width(self) -> float:
         '''
-            float: Set the default line width.
+            float: Set/get the default line width.
         '''
 
         return self.mglo.line_width
@@ -142,7 +159,7 @@ class Context:
     @property
     def depth_func(self) -> str:
         '''
-            int: Set the default depth func.
+            str: Set/get the default depth func.
             The depth function is set using a string.
 
             Example::
@@ -157,7 +174,7 @@ class Context:
                 ctx.depth_func = '1'   # GL_ALWAYS
         '''
 
-        raise NotImplementedError()
+        return self.mglo.depth_func
 
     @depth_func.setter
     def depth_func(self, value):
@@ -166,8 +183,9 @@ class Context:
     @property
     def blend_func(self):
         '''
-            tuple: Set the blend func (write only)
+            tuple: Set/get the blend func.
             Blend func can be set for rgb and alpha separately if needed.
+            The getter returns the ``(src_rgb, dst_rgb, src_alpha, dst_alpha)`` tuple.
 
             Supported blend functions are::
 
@@ -194,7 +212,7 @@ class Context:
                 )
         '''
 
-        raise NotImplementedError()
+        return self.mglo.blend_func
 
     @blend_func.setter
     def blend_func(self, value):
@@ -203,8 +221,9 @@ class Context:
     @property
     def blend_equation(self):
         '''
-            tuple: Set the blend equation (write only).
+            tuple: Set/get the blend equation.
             Blend equation can be set for rgb and alpha separately if needed.
+            The getter returns the ``(rgb, alpha)`` tuple.
 
             Supported functions are::
 
@@ -223,7 +242,7 @@ class Context:
                 ctx.blend_func = moderngl.FUNC_ADD, moderngl.MAX
         '''
 
-        raise NotImplementedError()
+        return self.mglo.blend_equation
 
     @blend_equation.setter
     def blend_equation(self, value):
@@ -236,7 +255,6 @@ class Context:
     def multisample(self) -> bool:
         '''
             bool: Enable/disable multisample mode (``GL_MULTISAMPLE``).
-            This property is write only.
 
             Example::
 
@@ -246,7 +264,7 @@ class Context:
                 ctx.multisample = False
         '''
 
-        raise NotImplementedError()
+        return self.mglo.multisample
 
     @multisample.setter
     def multisample(self, value):
@@ -255,13 +273,14 @@ class Context:
     @property
     def provoking_vertex(self):
         '''
-            This property is write only
+            int: Set/get the provoking vertex convention.
 
             Example::
 
                 ctx.provoking_vertex = moderngl.FIRST_VERTEX_CONVENTION
         '''
-        raise NotImplementedError()
+
+        return self.mglo.provoking_vertex
 
     @provoking_vertex.setter
     def provoking_vertex(self, value):
@@ -434,6 +453,17 @@ class Context:
 
         return self.mglo.error
 
+    @property
+    def skipped_uniform_writes(self) -> int:
+        '''
+            int: The number of uniform writes skipped because the value did not change.
+
+            ModernGL keeps the last value written to every uniform and skips
+            writing the same value again.
+        '''
+
+        return self.mglo.skipped_uniform_writes
+
     @property
     def info(self) -> Dict[str, object]:
         '''
@@ -521,6 +551,31 @@ class Context:
 
         return self._info
 
+    @property
+    def recorder(self) -> 'Recorder':
+        '''
+            Recorder: The command recorder of the context.
+
+            .. code-block:: python
+
+                with ctx.recorder:
+                    ctx.clear(1.0, 1.0, 1.0)
+                    vao1.render()
+                    vao2.render()
+
+                bytecode = ctx.recorder.dump()
+        '''
+
+        if self._recorder is None:
+            self._recorder = Recorder.__new__(Recorder)
+            self._recorder.mglo = self.mglo
+            self._recorder._bytecode = None
+            self._recorder._recording = False
+            self._recorder.ctx = self
+            self._recorder.extra = None
+
+        return self._recorder
+
     def clear(self, red=0.0, green=0.0, blue=0.0, alpha=0.0, depth=1.0, *,
               viewport=None, color=None) -> None:
         '''
@@ -625,6 +680,59 @@ class Context:
 
         self.mglo.finish()
 
+    def memory_barrier(self, barriers=None) -> None:
+        '''
+            Order the memory transactions issued before the barrier relative to those issued after.
+
+            Required before using the output of a compute shader as vertices, indices or draw commands.
+
+            Args:
+                barriers (int): The OpenGL barrier bits. By default all barriers are used.
+        '''
+
+        if barriers is None:
+            barriers = 0xFFFFFFFF
+
+        self.mglo.memory_barrier(barriers)
+
+    def invalidate_state_cache(self) -> None:
+        '''
+            Forget the bindings cached by moderngl.
+
+            ModernGL skips binding the programs, vertex arrays, framebuffers, textures,
+            samplers and buffers that are already bound. Call this method after foreign
+            code such as Qt or pyglet made OpenGL calls using this context.
+            The uniform values kept by moderngl are forgotten as well.
+        '''
+
+        self.mglo.invalidate_state_cache()
+
+    def sync_state(self) -> None:
+        '''
+            Query the context state from OpenGL.
+
+            The settable state such as :py:attr:`line_width`, :py:attr:`depth_func`
+            or the :py:attr:`viewport` is mirrored by moderngl and the getters
+            do not call ``glGet``. Call this method after foreign code changed the state.
+            The bindings cached by moderngl are reset as well.
+        '''
+
+        self.mglo.sync_state()
+
+    def replay(self, bytecode) -> None:
+        '''
+            Execute the commands captured by the :py:attr:`recorder` in a single call.
+
+            The bytecode can only be replayed by the context that recorded it.
+            It carries the objects it references, a copy converted to plain bytes cannot be replayed.
+            Replaying while recording appends the commands to the current recording.
+
+            Args:
+                bytecode (bytes): The bytecode returned by :py:meth:`Recorder.dump`.
+        '''
+
+        self.mglo.replay(bytecode, getattr(bytecode, '_objects', ()))
+
     def copy_buffer(self, dst, src, size=-1, *, read_offset=0, write_offset=0) -> None:
         '''
             Copy buffer content.
@@ -678,7 +786,7 @@ class Context:
         res.extra = None
         return res
 
-    def buffer(self, data=None, *, reserve=0, dynamic=False) -> Buffer:
+    def buffer(self, data=None, *, reserve=0, dynamic=False, dtype=None) -> Buffer:
         '''
             Create a :py:class:`Buffer` object.
 
@@ -688,6 +796,8 @@ class Context:
             Keyword Args:
                 reserve (int): The number of bytes to reserve.
                 dynamic (bool): Treat buffer as dynamic.
+                dtype (numpy.dtype): The structured dtype of the content.
+                                     Detected from the data when it is a structured NumPy array.
 
             Returns:
                 :py:class:`Buffer` object
@@ -696,9 +806,136 @@ class Context:
         if type(reserve) is str:
             reserve = mgl.strsize(reserve)
 
+        if dtype is None and getattr(getattr(data, 'dtype', None), 'names', None) is not None:
+            dtype = data.dtype
+
         res = Buffer.__new__(Buffer)
         res.mglo, res._size, res._glo = self.mglo.buffer(data, reserve, dynamic)
         res._dynamic = dynamic
+        res._dtype = dtype
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def storage_buffer(self, storage_block, count=0, *, dynamic=False) -> Buffer:
+        '''
+            Create a :py:class:`Buffer` object sized for a shader storage block.
+
+            The runtime-sized array at the end of the block is given ``count`` elements.
+            The :py:attr:`Buffer.dtype` is the std430 layout of the block,
+            :py:meth:`Buffer.as_array` returns a zero-copy structured view of the buffer.
+
+            Args:
+                storage_block (StorageBlock): The storage block of a program or a compute shader.
+                count (int): The number of elements in the runtime-sized array.
+
+            Keyword Args:
+                dynamic (bool): Treat buffer as dynamic.
+
+            Returns:
+                :py:class:`Buffer` object
+
+            .. rubric:: Example
+
+            .. code-block:: python
+
+                >>> particles = ctx.storage_buffer(compute_shader['Particles'], 1000)
+                >>> with particles.as_array() as block:
+                ...     block[0]['particles']['velocity'] = 0.0
+        '''
+
+        dtype = storage_block.dtype(count)
+        return self.buffer(reserve=dtype.itemsize, dynamic=dynamic, dtype=dtype)
+
+    def buffer_pool(self, size, *, alignment=16, dynamic=True) -> 'BufferPool':
+        '''
+            Create a :py:class:`BufferPool` object.
+
+            Args:
+                size (int): The size of the shared buffer.
+
+            Keyword Args:
+                alignment (int): The default alignment of the allocated ranges.
+                dynamic (bool): Treat the shared buffer as dynamic.
+
+            Returns:
+                :py:class:`BufferPool` object
+        '''
+
+        if type(size) is str:
+            size = mgl.strsize(size)
+
+        res = BufferPool.__new__(BufferPool)
+        res.buffer = self.buffer(reserve=size, dynamic=dynamic)
+        res._alignment = alignment
+        res._free = [(0, size)]
+        res._ranges = []
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def indirect_command_buffer(self, capacity, *, indexed=True) -> 'IndirectCommandBuffer':
+        '''
+            Create an :py:class:`IndirectCommandBuffer` object.
+
+            Args:
+                capacity (int): The maximum number of draw commands.
+
+            Keyword Args:
+                indexed (bool): Lay out the commands for vertex arrays with an index buffer.
+
+            Returns:
+                :py:class:`IndirectCommandBuffer` object
+        '''
+
+        if capacity <= 0:
+            raise Error('invalid capacity = %d' % capacity)
+
+        res = IndirectCommandBuffer.__new__(IndirectCommandBuffer)
+        res.buffer = self.buffer(reserve=capacity * 20)
+        res.visible_buffer = None
+        res.count_buffer = None
+        res._capacity = capacity
+        res._count = 0
+        res._indexed = indexed
+        res._culled = False
+        res._spheres = None
+        res._cull_shader = None
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def stream_buffer(self, size, frames=3) -> 'StreamBuffer':
+        '''
+            Create a :py:class:`StreamBuffer` object.
+
+            The buffer is backed by immutable storage that stays
+            persistently and coherently mapped for its whole lifetime.
+            Requires OpenGL 4.4 or ``ARB_buffer_storage``.
+
+            Args:
+                size (int): The size of the buffer in bytes.
+                frames (int): The number of frames in the ring.
+
+            Returns:
+                :py:class:`StreamBuffer` object
+        '''
+
+        if type(size) is str:
+            size = mgl.strsize(size)
+
+        buffer = Buffer.__new__(Buffer)
+        buffer.mglo, buffer._size, buffer._glo = self.mglo.stream_buffer(size, frames)
+        buffer._dynamic = True
+        buffer._dtype = None
+        buffer.ctx = self
+        buffer.extra = None
+
+        res = StreamBuffer.__new__(StreamBuffer)
+        res.mglo = buffer.mglo
+        res.buffer = buffer
+        res._frames = frames
+        res._frame = 0
         res.ctx = self
         res.extra = None
         return res
@@ -853,6 +1090,9 @@ class Context:
             Args:
                 program (Program): The program used when rendering.
                 content (list): A list of (buffer, format, attributes).
+                                The buffer can be a :py:class:`BufferRange`.
+                                The format can be a structured NumPy dtype,
+                                the attributes default to the field names.
                                 See :ref:`buffer-format-label`.
                 index_buffer (Buffer): An index buffer.
 
@@ -864,15 +1104,19 @@ class Context:
                 :py:class:`VertexArray` object
         '''
 
-        members = program._members
+        content = [_dtype_content(entry) for entry in content]
+        layout = self.vertex_layout(program, [entry[1:] for entry in content], skip_errors=skip_errors)
         index_buffer_mglo = None if index_buffer is None else index_buffer.mglo
-        content = tuple((a.mglo, b) + tuple(getattr(members.get(x), 'mglo', None)
-                        for x in c) for a, b, *c in content)
+        buffers = tuple(
+            (a.buffer.mglo, a.offset, a.size) if type(a) is BufferRange else (a.mglo, 0, -1)
+            for a, *_ in content
+        )
 
         res = VertexArray.__new__(VertexArray)
-        res.mglo, res._glo = self.mglo.vertex_array(program.mglo, content, index_buffer_mglo,
-                                                    index_element_size, skip_errors)
+        res.mglo, res._glo = self.mglo.vertex_array(program.mglo, layout.mglo, buffers,
+                                                    index_buffer_mglo, index_element_size)
         res._program = program
+        res._layout = layout
         res._index_buffer = index_buffer
         res._index_element_size = index_element_size
         res.ctx = self
@@ -880,6 +1124,49 @@ class Context:
         res.scope = None
         return res
 
+    def vertex_layout(self, program, content, *, skip_errors=False) -> 'VertexLayout':
+        '''
+            Create a :py:class:`VertexLayout` object.
+
+            The layouts are cached per program and content,
+            the same object is returned for the same arguments.
+
+            Args:
+                program (Program): The program providing the attribute locations.
+                content (list): A list of (format, attributes).
+                                The format can be a structured NumPy dtype,
+                                the attributes default to the field names.
+                                See :ref:`buffer-format-label`.
+
+            Keyword Args:
+                skip_errors (bool): Ignore missing attributes.
+
+            Returns:
+                :py:class:`VertexLayout` object
+        '''
+
+        content = tuple(_dtype_content((None,) + tuple(entry))[1:] for entry in content)
+        key = (content, skip_errors)
+
+        res = program._layouts.get(key)
+        if res is not None:
+            return res
+
+        members = program._members
+        layout_content = tuple(
+            (fmt,) + tuple(getattr(members.get(x), 'mglo', None) for x in attributes)
+            for fmt, *attributes in content
+        )
+
+        res = VertexLayout.__new__(VertexLayout)
+        res.mglo = self.mglo.vertex_layout(program.mglo, layout_content, skip_errors)
+        res._program = program
+        res._content = content
+        res.ctx = self
+        res.extra = None
+        program._layouts[key] = res
+        return res
+
     def simple_vertex_array(self, program, buffer, *attributes,
                             index_buffer=None, index_element_size=4) -> 'VertexArray':
         '''
@@ -905,7 +1192,8 @@ class Context:
         return self.vertex_array(program, content, index_buffer, index_element_size)
 
     def program(self, *, vertex_shader, fragment_shader=None, geometry_shader=None,
-                tess_control_shader=None, tess_evaluation_shader=None, varyings=()) -> 'Program':
+                tess_control_shader=None, tess_evaluation_shader=None, varyings=(),
+                varyings_capture_mode='interleaved', cache=None, lazy=False) -> 'Program':
         '''
             Create a :py:class:`Program` object.
 
@@ -917,50 +1205,258 @@ class Context:
             Args:
                 shaders (list): A list of :py:class:`Shader` objects.
                 varyings (list): A list of varying names.
+                varyings_capture_mode (str): ``'interleaved'`` writes the varyings
+                    into a single buffer, ``'separate'`` writes each varying
+                    into its own buffer.
+                cache (bool): Use the program cache, see :py:func:`set_program_cache`.
+                    By default the cache is used when it was set.
+                lazy (bool): Create the member objects on their first access.
+                    The names and locations are queried once when the program is linked.
+
+            Returns:
+                :py:class:`Program` object
+        '''
+
+        shaders, varyings, separate = self._program_sources(
+            vertex_shader, fragment_shader, geometry_shader, tess_control_shader,
+            tess_evaluation_shader, varyings, varyings_capture_mode,
+        )
+
+        def build(binary, reflection, retrievable):
+            return self.mglo.program(*shaders, varyings, separate, binary, reflection, retrievable, lazy, False)
+
+        return self._wrap_program(_cached_build(self, cache, build, 'program', shaders, varyings, separate))
+
+    def program_async(self, *, vertex_shader, fragment_shader=None, geometry_shader=None,
+                      tess_control_shader=None, tess_evaluation_shader=None, varyings=(),
+                      varyings_capture_mode='interleaved', cache=None, lazy=False) -> 'PendingProgram':
+        '''
+            Compile and link a program without waiting for the driver.
+
+            The parameters are the same as for :py:meth:`Context.program`.
+            The errors are raised by :py:meth:`PendingProgram.result`.
+            Programs found in the program cache are loaded immediately.
+
+            Returns:
+                :py:class:`PendingProgram` object
+        '''
+
+        shaders, varyings, separate = self._program_sources(
+            vertex_shader, fragment_shader, geometry_shader, tess_control_shader,
+            tess_evaluation_shader, varyings, varyings_capture_mode,
+        )
+
+        directory, key, binary, reflection = _cache_lookup(self, cache, 'program', shaders, varyings, separate)
+
+        res = PendingProgram.__new__(PendingProgram)
+        res.mglo = None
+        res._program = None
+        res._finish = lambda result: self._wrap_program(_cache_result(directory, key, result))
+        res.ctx = self
+        res.extra = None
+
+        if binary is not None:
+            try:
+                result = self.mglo.program(*shaders, varyings, separate, binary, reflection, True, lazy, False)
+                res._program = res._finish(result)
+                return res
+            except (TypeError, Error):
+                _cache_discard(directory, key)
+
+        res.mglo = self.mglo.program_submit(*shaders, varyings, separate, directory is not None, lazy)
+        return res
+
+    def shader_stage(self, kind, source, *, cache=None, lazy=False) -> 'Program':
+        '''
+            Create a separable :py:class:`Program` object with a single shader stage.
+
+            Separable programs are combined with :py:meth:`Context.program_pipeline`
+            without linking them again. The outputs of a stage must match the inputs of the next stage.
+            Stages of the vertex processing may need to redeclare the ``gl_PerVertex`` block.
+
+            Args:
+                kind (str): ``'vertex'``, ``'fragment'``, ``'geometry'``,
+                    ``'tess_control'`` or ``'tess_evaluation'``.
+                source (str): The source of the shader.
+
+            Keyword Args:
+                cache (bool): Use the program cache, see :py:func:`set_program_cache`.
+                    By default the cache is used when it was set.
+                lazy (bool): Create the member objects on their first access.
 
             Returns:
                 :py:class:`Program` object
         '''
 
+        if kind not in _SHADER_STAGES:
+            raise Error('invalid shader stage: %s' % kind)
+
+        shaders = tuple(source if stage == kind else None for stage in _SHADER_STAGES)
+
+        def build(binary, reflection, retrievable):
+            return self.mglo.program(*shaders, (), False, binary, reflection, retrievable, lazy, True)
+
+        return self._wrap_program(_cached_build(self, cache, build, 'shader_stage', shaders))
+
+    def program_pipeline(self, *, vertex=None, fragment=None, geometry=None, tess_control=None,
+                         tess_evaluation=None) -> 'ProgramPipeline':
+        '''
+            Create a :py:class:`ProgramPipeline` object.
+
+            The stages are separable programs created with :py:meth:`Context.shader_stage`.
+            Requires OpenGL 4.1 or ``GL_ARB_separate_shader_objects``.
+
+            Keyword Args:
+                vertex (Program): The vertex stage.
+                fragment (Program): The fragment stage.
+                geometry (Program): The geometry stage.
+                tess_control (Program): The tessellation control stage.
+                tess_evaluation (Program): The tessellation evaluation stage.
+
+            Returns:
+                :py:class:`ProgramPipeline` object
+        '''
+
+        stages = {
+            'vertex': vertex,
+            'fragment': fragment,
+            'geometry': geometry,
+            'tess_control': tess_control,
+            'tess_evaluation': tess_evaluation,
+        }
+
+        mglo_stages = tuple(None if stages[kind] is None else stages[kind].mglo for kind in _SHADER_STAGES)
+
+        res = ProgramPipeline.__new__(ProgramPipeline)
+        res.mglo, res._glo = self.mglo.program_pipeline(*mglo_stages)
+
+        # the members are looked up in the order of the stages in the pipeline
+        order = ('vertex', 'tess_control', 'tess_evaluation', 'geometry', 'fragment')
+        res._stages = {kind: stages[kind] for kind in order if stages[kind] is not None}
+        res._members = ChainMap(*(stage._members for stage in res._stages.values()))
+
+        # the subroutine uniforms are ordered like the subroutines of the vertex array
+        res._subroutines = tuple(
+            name for kind in ('vertex', 'fragment', 'geometry', 'tess_evaluation', 'tess_control')
+            if stages[kind] is not None for name in stages[kind]._subroutines
+        )
+        res._geom = (None, None, 0) if geometry is None else geometry._geom
+        res._layouts = {}
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def compile_many(self, programs) -> List[PendingProgram]:
+        '''
+            Compile and link many programs without waiting for the driver.
+
+            Every program is submitted before any status is queried.
+            Resolving the returned programs in order lets the driver compile
+            the rest in the meantime when ``GL_KHR_parallel_shader_compile`` is supported.
+
+            Args:
+                programs (list): The keyword arguments of :py:meth:`Context.program` for each program.
+
+            Returns:
+                list: :py:class:`PendingProgram` objects in the same order.
+        '''
+
+        return [self.program_async(**kwargs) for kwargs in programs]
+
+    def _program_sources(self, vertex_shader, fragment_shader, geometry_shader, tess_control_shader,
+                         tess_evaluation_shader, varyings, varyings_capture_mode) -> tuple:
         if type(varyings) is str:
             varyings = (varyings,)
 
         varyings = tuple(varyings)
 
+        if varyings_capture_mode not in ('interleaved', 'separate'):
+            raise Error('varyings_capture_mode must be interleaved or separate')
+
+        shaders = (vertex_shader, fragment_shader, geometry_shader, tess_control_shader, tess_evaluation_shader)
+        separate = varyings_capture_mode == 'separate'
+        return shaders, varyings, separate
+
+    def _wrap_program(self, result) -> 'Program':
         res = Program.__new__(Program)
-        res.mglo, ls1, ls2, ls3, ls4, ls5, res._subroutines, res._geom, res._glo = self.mglo.program(
-            vertex_shader, fragment_shader, geometry_shader, tess_control_shader, tess_evaluation_shader,
-            varyings
-        )
+        res.mglo, ls1, ls2, ls3, ls4, ls5, res._subroutines, res._geom, ls6, res._glo = result
 
-        members = {}
+        reflection = res.mglo.reflection
 
-        for item in ls1:
-            obj = Attribute.__new__(Attribute)
-            obj.mglo, obj._location, obj._array_length, obj._dimension, obj._shape, obj._name = item
-            members[obj.name] = obj
+        if reflection is not None:
+            members = _LazyMembers(res.mglo, reflection)
+        else:
+            members = {}
 
-        for item in ls2:
-            obj = Varying.__new__(Varying)
-            obj._number, obj._array_length, obj._dimension, obj._name = item
-            members[obj.name] = obj
+            for kind, items in (('a', ls1), ('v', ls2), ('u', ls3), ('b', ls4), ('r', ls5), ('s', ls6)):
+                for item in items:
+                    obj = _program_member(kind, item)
+                    members[obj.name] = obj
 
-        for item in ls3:
-            obj = Uniform.__new__(Uniform)
-            obj.mglo, obj._location, obj._array_length, obj._dimension, obj._name = item
-            members[obj.name] = obj
+        res._members = members
+        res._layouts = {}
+        res.ctx = self
+        res.extra = None
+        return res
 
-        for item in ls4:
-            obj = UniformBlock.__new__(UniformBlock)
-            obj.mglo, obj._index, obj._size, obj._name = item
-            members[obj.name] = obj
+    def shader_library(self, *, capacity=64) -> 'ShaderLibrary':
+        '''
+            Create a :py:class:`ShaderLibrary` object.
 
-        for item in ls5:
-            obj = Subroutine.__new__(Subroutine)
-            obj._index, obj._name = item
-            members[obj.name] = obj
+            Keyword Args:
+                capacity (int): The maximum number of program variants kept.
 
-        res._members = members
+            Returns:
+                :py:class:`ShaderLibrary` object
+        '''
+
+        if capacity < 1:
+            raise Error('the capacity must be positive')
+
+        res = ShaderLibrary.__new__(ShaderLibrary)
+        res._files = {}
+        res._variants = OrderedDict()
+        res._capacity = capacity
+        res._compiles = 0
+        res._hits = 0
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def uniform_struct(self, uniform_block, buffer=None, *, offset=0) -> 'UniformStruct':
+        '''
+            Create a :py:class:`UniformStruct` object packing the members of a uniform block
+            with the std140 or shared layout reported by :py:attr:`UniformBlock.layout`.
+
+            Args:
+                uniform_block (UniformBlock): The uniform block to pack.
+                buffer (Buffer): The buffer holding the block.
+                    A dynamic buffer of the size of the block is created when it is ``None``.
+
+            Keyword Args:
+                offset (int): The offset of the block in the buffer.
+
+            Returns:
+                :py:class:`UniformStruct` object
+        '''
+
+        import numpy as np
+
+        dtype, fields = _layout_dtype(uniform_block.layout, uniform_block.size)
+
+        if buffer is None:
+            buffer = self.buffer(reserve=uniform_block.size, dynamic=True)
+
+        if offset < 0 or offset + uniform_block.size > buffer.size:
+            raise Error('the uniform block does not fit in the buffer')
+
+        res = UniformStruct.__new__(UniformStruct)
+        res.buffer = buffer
+        res.offset = offset
+        res.size = uniform_block.size
+        res._array = np.zeros(1, dtype)
+        res._fields = fields
+        res._dirty = set(fields)
         res.ctx = self
         res.extra = None
         return res
@@ -988,6 +1484,30 @@ class Context:
         res.extra = None
         return res
 
+    def transform_feedback(self, buffers) -> 'TransformFeedback':
+        '''
+            Create a :py:class:`TransformFeedback` object.
+
+            Args:
+                buffers (list): The buffers to capture the varyings into.
+                    The index of the buffer is the transform feedback binding.
+
+            Returns:
+                :py:class:`TransformFeedback` object
+        '''
+
+        if type(buffers) is Buffer:
+            buffers = (buffers,)
+
+        buffers = tuple(buffers)
+
+        res = TransformFeedback.__new__(TransformFeedback)
+        res.mglo, res._glo = self.mglo.transform_feedback(tuple(buffer.mglo for buffer in buffers))
+        res._buffers = buffers
+        res.ctx = self
+        res.extra = None
+        return res
+
     def scope(self, framebuffer=None, enable_only=None, *, textures=(),
               uniform_buffers=(), storage_buffers=(), samplers=(), enable=None) -> 'Scope':
         '''
@@ -1128,7 +1648,7 @@ class Context:
         res.extra = None
         return res
 
-    def compute_shader(self, source) -> 'ComputeShader':
+    def compute_shader(self, source, *, cache=None) -> 'ComputeShader':
         '''
             A :py:class:`ComputeShader` is a Shader Stage that is used entirely
             for computing arbitrary information. While it can do rendering, it
@@ -1137,24 +1657,26 @@ class Context:
             Args:
                 source (str): The source of the compute shader.
 
+            Keyword Args:
+                cache (bool): Use the program cache, see :py:func:`set_program_cache`.
+                    By default the cache is used when it was set.
+
             Returns:
                 :py:class:`ComputeShader` object
         '''
 
+        def build(binary, reflection, retrievable):
+            return self.mglo.compute_shader(source, binary, reflection, retrievable)
+
         res = ComputeShader.__new__(ComputeShader)
-        res.mglo, ls1, ls2, ls3, ls4, res._glo = self.mglo.compute_shader(source)
+        res.mglo, ls1, ls2, ls3, res._glo = _cached_build(self, cache, build, 'compute_shader', source)
 
         members = {}
 
-        for item in ls1:
-            obj = Uniform.__new__(Uniform)
-            obj.mglo, obj._location, obj._array_length, obj._dimension, obj._name = item
-            members[obj.name] = obj
-
-        for item in ls2:
-            obj = UniformBlock.__new__(UniformBlock)
-            obj.mglo, obj._index, obj._size, obj._name = item
-            members[obj.name] = obj
+        for kind, items in (('u', ls1), ('b', ls2), ('s', ls3)):
+            for item in items:
+                obj = _program_member(kind, item)
+                members[obj.name] = obj
 
         res._members = members
         res.ctx = self
@@ -1285,6 +1807,7 @@ def create_context(require=None, standalone=False, **settings) -> Context:
     ctx = Context.__new__(Context)
     ctx.mglo, ctx.version_code = mgl.create_context(None, standalone, require)
     ctx._info = None
+    ctx._recorder = None
     ctx.extra = None
 
     if ctx.version_code < require:
@@ -1332,6 +1855,7 @@ def create_standalone_context(require=None, **settings) -> 'Context':
     ctx._screen = None
     ctx.fbo = None
     ctx._info = None
+    ctx._recorder = None
     ctx.extra = None
 
     if require is not None and ctx.version_code < require:
@@ -1339,3 +1863,29 @@ def create_standalone_context(require=None, **settings) -> 'Context':
             require, ctx.version_code))
 
     return ctx
+
+
+def _dtype_content(entry) -> tuple:
+    '''
+        Replace a NumPy dtype in a VertexArray content entry with its format.
+        The attributes default to the field names in the order of the format,
+        a trailing ``'/i'`` or ``'/r'`` is the divisor.
+    '''
+
+    buffer, fmt, *attributes = entry
+
+    if isinstance(fmt, str):
+        return entry
+
+    divisor = ''
+    if attributes and attributes[-1] in ('/v', '/i', '/r'):
+        divisor = attributes.pop()
+
+    parts = _dtype_parts(fmt)
+
+    if not attributes:
+        attributes = [name for _, name in parts if name is not None]
+        if not attributes:
+            raise Error('the dtype has no fields, the attributes must be given')
+
+    return (buffer, ' '.join(part for part, _ in parts) + divisor) + tuple(attributes)
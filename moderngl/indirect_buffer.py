@@ -0,0 +1,254 @@
+from .buffer import Buffer
+from .error import Error
+
+__all__ = ['IndirectCommandBuffer']
+
+CULLING_SHADER = '''
+    #version 430
+
+    layout (local_size_x = 64) in;
+
+    struct Command {
+        uint count;
+        uint instances;
+        uint first;
+        uint base_vertex;
+        uint base_instance;
+    };
+
+    layout (std430, binding = 0) readonly buffer Commands {
+        Command commands[];
+    };
+
+    layout (std430, binding = 1) writeonly buffer Visible {
+        Command visible[];
+    };
+
+    layout (std430, binding = 2) readonly buffer Spheres {
+        vec4 spheres[];
+    };
+
+    layout (std430, binding = 3) buffer DrawCount {
+        uint draw_count;
+    };
+
+    uniform mat4 view_projection;
+    uniform uint num_commands;
+
+    void main() {
+        uint index = gl_GlobalInvocationID.x;
+        if (index >= num_commands || commands[index].instances == 0u) {
+            return;
+        }
+
+        vec4 sphere = spheres[index];
+        mat4 rows = transpose(view_projection);
+
+        vec4 planes[6] = vec4[](
+            rows[3] + rows[0], rows[3] - rows[0],
+            rows[3] + rows[1], rows[3] - rows[1],
+            rows[3] + rows[2], rows[3] - rows[2]
+        );
+
+        for (int i = 0; i < 6; ++i) {
+            if (dot(planes[i].xyz, sphere.xyz) + planes[i].w < -sphere.w * length(planes[i].xyz)) {
+                return;
+            }
+        }
+
+        visible[atomicAdd(draw_count, 1u)] = commands[index];
+    }
+'''
+
+
+class IndirectCommandBuffer:
+    '''
+        An IndirectCommandBuffer holds the draw commands of :py:meth:`VertexArray.render_indirect`.
+
+        The commands are packed from NumPy arrays with a single buffer write.
+        Optionally the commands can be culled on the GPU against the view frustum
+        using a bounding sphere for each command. The visible commands and their
+        number are written by a compute shader, so the scene can be rendered with a
+        single :py:meth:`render` call without reading anything back.
+
+        An IndirectCommandBuffer object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.indirect_command_buffer` to create one.
+    '''
+
+    __slots__ = ['buffer', 'visible_buffer', 'count_buffer', '_capacity', '_count', '_indexed',
+                 '_culled', '_spheres', '_cull_shader', 'ctx', 'extra']
+
+    def __init__(self):
+        self.buffer = None  #: Buffer: The draw commands.
+        self.visible_buffer = None  #: Buffer: The visible draw commands written by :py:meth:`cull`.
+        self.count_buffer = None  #: Buffer: The number of visible draw commands written by :py:meth:`cull`.
+        self._capacity = None
+        self._count = None
+        self._indexed = None
+        self._culled = None
+        self._spheres = None
+        self._cull_shader = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<IndirectCommandBuffer: %d/%d>' % (self._count, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        '''
+            int: The maximum number of draw commands.
+        '''
+
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        '''
+            int: The number of draw commands written.
+        '''
+
+        return self._count
+
+    @property
+    def indexed(self) -> bool:
+        '''
+            bool: The commands are laid out for vertex arrays with an index buffer.
+        '''
+
+        return self._indexed
+
+    def write(self, counts, *, instances=1, firsts=0, base_vertices=0, base_instances=0, offset=0) -> int:
+        '''
+            Pack and write draw commands.
+
+            Every argument can be a NumPy array or a single value used for all the commands.
+            Requires NumPy.
+
+            Args:
+                counts (array): The number of vertices or indices of each command.
+
+            Keyword Args:
+                instances (array): The number of instances of each command.
+                firsts (array): The first vertex or index of each command.
+                base_vertices (array): The value added to the indices. Offsets the first vertex when not indexed.
+                base_instances (array): The first instance of each command.
+                offset (int): The index of the first command to write.
+
+            Returns:
+                int: The number of commands written.
+        '''
+
+        import numpy as np
+
+        counts = np.asarray(counts, 'i4').ravel()
+        num = counts.size
+
+        if offset < 0 or offset + num > self._capacity:
+            raise Error('%d commands at offset %d do not fit in %d' % (num, offset, self._capacity))
+
+        commands = np.zeros((num, 5), 'i4')
+        commands[:, 0] = counts
+        commands[:, 1] = instances
+        commands[:, 2] = firsts
+
+        if self._indexed:
+            commands[:, 3] = base_vertices
+            commands[:, 4] = base_instances
+        else:
+            commands[:, 2] += base_vertices
+            commands[:, 3] = base_instances
+
+        self.buffer.write(commands, offset=offset * 20)
+        self._count = max(self._count, offset + num)
+        self._culled = False
+        return num
+
+    def cull(self, spheres, view_projection) -> None:
+        '''
+            Write the commands visible from the view projection
+            to the :py:attr:`visible_buffer` and their number to the :py:attr:`count_buffer`.
+
+            The culling runs in a compute shader and requires OpenGL 4.3.
+            Commands with zero instances are always culled.
+
+            Args:
+                spheres (Buffer): The bounding spheres of the commands as ``4f`` (x, y, z, radius).
+                                  Bytes or arrays converted to ``f4`` are uploaded to an internal buffer.
+                view_projection (tuple): The view projection matrix in the layout of a ``mat4`` uniform.
+        '''
+
+        if self._cull_shader is None:
+            self._cull_shader = self.ctx.compute_shader(CULLING_SHADER)
+            self.visible_buffer = self.ctx.buffer(reserve=self._capacity * 20)
+            self.count_buffer = self.ctx.buffer(reserve=4)
+
+        if not isinstance(spheres, Buffer):
+            if isinstance(spheres, (bytes, bytearray, memoryview)):
+                data = memoryview(spheres)
+            else:
+                import numpy as np
+                data = memoryview(np.ascontiguousarray(spheres, 'f4'))
+            if self._spheres is None or self._spheres.size < data.nbytes:
+                if self._spheres is not None:
+                    self._spheres.release()
+                self._spheres = self.ctx.buffer(data)
+            else:
+                self._spheres.write(data)
+            spheres = self._spheres
+
+        if spheres.size < self._count * 16:
+            raise Error('%d bounding spheres are required' % self._count)
+
+        # Commands that are not overwritten draw nothing when the count cannot be read by the driver.
+        self.count_buffer.clear()
+        self.visible_buffer.clear(self._count * 20)
+        self._culled = True
+
+        if not self._count:
+            return
+
+        if hasattr(view_projection, 'astype'):
+            view_projection = view_projection.astype('f4').tobytes()
+
+        if isinstance(view_projection, (bytes, bytearray, memoryview)):
+            self._cull_shader['view_projection'].write(view_projection)
+        else:
+            self._cull_shader['view_projection'].value = tuple(view_projection)
+
+        self._cull_shader['num_commands'].value = self._count
+
+        self.buffer.bind_to_storage_buffer(0, size=self._count * 20)
+        self.visible_buffer.bind_to_storage_buffer(1)
+        spheres.bind_to_storage_buffer(2, size=self._count * 16)
+        self.count_buffer.bind_to_storage_buffer(3)
+
+        self._cull_shader.run((self._count + 63) // 64)
+        self.ctx.memory_barrier()
+
+    def render(self, vertex_array, mode=None) -> None:
+        '''
+            Render the commands with :py:meth:`VertexArray.render_indirect`.
+
+            After :py:meth:`cull` only the visible commands are rendered.
+            The number of visible commands is read by the GPU with ``ARB_indirect_parameters``.
+
+            Args:
+                vertex_array (VertexArray): The vertex array to render.
+                mode (int): By default :py:data:`TRIANGLES` will be used.
+        '''
+
+        if self._culled:
+            vertex_array.render_indirect(self.visible_buffer, mode, self._count, count_buffer=self.count_buffer)
+        else:
+            vertex_array.render_indirect(self.buffer, mode, self._count)
+
+    def release(self) -> None:
+        '''
+            Release the buffers and the culling shader.
+        '''
+
+        for obj in (self.buffer, self.visible_buffer, self.count_buffer, self._spheres, self._cull_shader):
+            if obj is not None:
+                obj.release()
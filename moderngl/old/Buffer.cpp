@@ -1,5 +1,9 @@
 #include "Types.hpp"
 
+char * MGLBuffer_map_span(MGLBuffer * self, Py_ssize_t offset, Py_ssize_t size, int access);
+void MGLBuffer_unmap_span(MGLBuffer * self);
+void MGLBuffer_copy_strided(Py_buffer * view, Py_ssize_t skip, char * base, Py_ssize_t chunk_size, Py_ssize_t step, Py_ssize_t count, bool to_chunks);
+
 PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 	PyObject * data;
 	int reserve;
@@ -83,6 +87,87 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 	return result;
 }
 
+PyObject * MGLContext_stream_buffer(MGLContext * self, PyObject * args) {
+	Py_ssize_t size;
+	int frames;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"nI",
+		&size,
+		&frames
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (frames < 1) {
+		MGLError_Set("invalid number of frames: %d", frames);
+		return 0;
+	}
+
+	if (size < frames) {
+		MGLError_Set("the buffer cannot be smaller than the number of frames");
+		return 0;
+	}
+
+	const GLMethods & gl = self->gl;
+
+	if (!gl.BufferStorage) {
+		MGLError_Set("stream buffers require OpenGL 4.4 or ARB_buffer_storage");
+		return 0;
+	}
+
+	MGLBuffer * buffer = (MGLBuffer *)MGLBuffer_Type.tp_alloc(&MGLBuffer_Type, 0);
+
+	buffer->size = size;
+	buffer->dynamic = true;
+
+	buffer->buffer_obj = 0;
+	gl.GenBuffers(1, (GLuint *)&buffer->buffer_obj);
+
+	if (!buffer->buffer_obj) {
+		MGLError_Set("cannot create buffer");
+		Py_DECREF(buffer);
+		return 0;
+	}
+
+	int flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT;
+
+	gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
+	gl.BufferStorage(GL_ARRAY_BUFFER, buffer->size, 0, flags);
+	buffer->mapped = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, buffer->size, flags);
+
+	if (!buffer->mapped) {
+		MGLError_Set("cannot map the buffer");
+		gl.DeleteBuffers(1, (GLuint *)&buffer->buffer_obj);
+		Py_DECREF(buffer);
+		return 0;
+	}
+
+	buffer->frames = frames;
+	buffer->frame = 0;
+	buffer->frame_size = size / frames;
+	buffer->frame_head = 0;
+	buffer->fences = new GLsync[frames];
+
+	for (int i = 0; i < frames; ++i) {
+		buffer->fences[i] = 0;
+	}
+
+	Py_INCREF(self);
+	buffer->context = self;
+
+	Py_INCREF(buffer);
+
+	PyObject * result = PyTuple_New(3);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)buffer);
+	PyTuple_SET_ITEM(result, 1, PyLong_FromSsize_t(buffer->size));
+	PyTuple_SET_ITEM(result, 2, PyLong_FromLong(buffer->buffer_obj));
+	return result;
+}
+
 PyObject * MGLBuffer_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
 	MGLBuffer * self = (MGLBuffer *)type->tp_alloc(type, 0);
 
@@ -111,9 +196,14 @@ PyObject * MGLBuffer_write(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
 	Py_buffer buffer_view;
 
-	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_SIMPLE);
+	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_STRIDED_RO);
 	if (get_buffer < 0) {
 		MGLError_Set("data (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
 		return 0;
@@ -125,6 +215,27 @@ PyObject * MGLBuffer_write(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (!buffer_view.len) {
+		PyBuffer_Release(&buffer_view);
+		Py_RETURN_NONE;
+	}
+
+	// strided sources are gathered directly into the mapped range
+	if (self->mapped || !PyBuffer_IsContiguous(&buffer_view, 'C')) {
+		int access = self->mapped ? GL_MAP_WRITE_BIT : (GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_RANGE_BIT);
+		char * map = MGLBuffer_map_span(self, offset, buffer_view.len, access);
+
+		if (!map) {
+			PyBuffer_Release(&buffer_view);
+			return 0;
+		}
+
+		MGLBuffer_copy_strided(&buffer_view, 0, map, buffer_view.len, buffer_view.len, 1, true);
+		MGLBuffer_unmap_span(self);
+		PyBuffer_Release(&buffer_view);
+		Py_RETURN_NONE;
+	}
+
 	const GLMethods & gl = self->context->gl;
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
 	gl.BufferSubData(GL_ARRAY_BUFFER, (GLintptr)offset, buffer_view.len, buffer_view.buf);
@@ -132,6 +243,293 @@ PyObject * MGLBuffer_write(MGLBuffer * self, PyObject * args) {
 	Py_RETURN_NONE;
 }
 
+struct MGLWriteRange {
+	Py_ssize_t offset;
+	Py_ssize_t size;
+	const char * src;
+	Py_ssize_t index;
+};
+
+int MGLWriteRange_compare_offset(const void * a, const void * b) {
+	const MGLWriteRange * lhs = (const MGLWriteRange *)a;
+	const MGLWriteRange * rhs = (const MGLWriteRange *)b;
+	if (lhs->offset != rhs->offset) {
+		return lhs->offset < rhs->offset ? -1 : 1;
+	}
+	return lhs->index < rhs->index ? -1 : (lhs->index > rhs->index);
+}
+
+int MGLWriteRange_compare_index(const void * a, const void * b) {
+	const MGLWriteRange * lhs = (const MGLWriteRange *)a;
+	const MGLWriteRange * rhs = (const MGLWriteRange *)b;
+	return lhs->index < rhs->index ? -1 : (lhs->index > rhs->index);
+}
+
+// Reads a sequence of ints or a buffer of 32 or 64 bit integers.
+Py_ssize_t * MGLBuffer_parse_offsets(PyObject * offsets, Py_ssize_t * count) {
+	Py_buffer view;
+
+	if (PyObject_GetBuffer(offsets, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) == 0) {
+		const char * fmt = view.format ? view.format : "B";
+		if (*fmt == '@' || *fmt == '=' || *fmt == '<') {
+			fmt += 1;
+		}
+
+		bool is_signed = fmt[0] && strchr("ilqn", fmt[0]);
+		bool is_unsigned = fmt[0] && strchr("ILQN", fmt[0]);
+
+		if (fmt[1] || (!is_signed && !is_unsigned) || (view.itemsize != 4 && view.itemsize != 8)) {
+			MGLError_Set("the offsets must be 32 or 64 bit integers");
+			PyBuffer_Release(&view);
+			return 0;
+		}
+
+		*count = view.len / view.itemsize;
+		Py_ssize_t * result = new Py_ssize_t[*count + 1];
+
+		for (Py_ssize_t i = 0; i < *count; ++i) {
+			if (view.itemsize == 4) {
+				result[i] = is_signed ? (Py_ssize_t)((int *)view.buf)[i] : (Py_ssize_t)((unsigned *)view.buf)[i];
+			} else {
+				result[i] = (Py_ssize_t)((long long *)view.buf)[i];
+			}
+		}
+
+		PyBuffer_Release(&view);
+		return result;
+	}
+
+	PyErr_Clear();
+
+	PyObject * seq = PySequence_Fast(offsets, "");
+	if (!seq) {
+		PyErr_Clear();
+		MGLError_Set("the offsets must be a sequence of integers");
+		return 0;
+	}
+
+	*count = PySequence_Fast_GET_SIZE(seq);
+	Py_ssize_t * result = new Py_ssize_t[*count + 1];
+
+	for (Py_ssize_t i = 0; i < *count; ++i) {
+		result[i] = PyLong_AsSsize_t(PySequence_Fast_GET_ITEM(seq, i));
+	}
+
+	Py_DECREF(seq);
+
+	if (PyErr_Occurred()) {
+		PyErr_Clear();
+		MGLError_Set("the offsets must be a sequence of integers");
+		delete[] result;
+		return 0;
+	}
+
+	return result;
+}
+
+PyObject * MGLBuffer_write_many(MGLBuffer * self, PyObject * args) {
+	PyObject * offsets;
+	PyObject * data;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OO",
+		&offsets,
+		&data
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
+	Py_ssize_t count = 0;
+	Py_ssize_t * offset_array = MGLBuffer_parse_offsets(offsets, &count);
+
+	if (!offset_array) {
+		return 0;
+	}
+
+	bool separate = PyList_Check(data) || PyTuple_Check(data);
+	Py_ssize_t num_views = separate ? PySequence_Fast_GET_SIZE(data) : 1;
+
+	if (separate && num_views != count) {
+		MGLError_Set("%zd offsets were given for %zd buffers", count, num_views);
+		delete[] offset_array;
+		return 0;
+	}
+
+	Py_buffer * views = new Py_buffer[num_views + 1];
+	MGLWriteRange * ranges = new MGLWriteRange[count + 1];
+	Py_ssize_t num_ranges = 0;
+	Py_ssize_t acquired = 0;
+	bool failed = false;
+
+	for (Py_ssize_t i = 0; i < num_views; ++i) {
+		PyObject * item = separate ? PySequence_Fast_GET_ITEM(data, i) : data;
+		if (PyObject_GetBuffer(item, &views[i], PyBUF_C_CONTIGUOUS) < 0) {
+			PyErr_Clear();
+			MGLError_Set("data (%s) does not support buffer interface", Py_TYPE(item)->tp_name);
+			failed = true;
+			break;
+		}
+		acquired += 1;
+	}
+
+	if (!failed && !separate && count && views[0].len % count) {
+		MGLError_Set("the data size %zd cannot be split into %zd equal ranges", views[0].len, count);
+		failed = true;
+	}
+
+	for (Py_ssize_t i = 0; !failed && i < count; ++i) {
+		MGLWriteRange range;
+		range.offset = offset_array[i];
+		range.size = separate ? views[i].len : views[0].len / count;
+		range.src = separate ? (const char *)views[i].buf : (const char *)views[0].buf + range.size * i;
+		range.index = i;
+
+		if (range.offset < 0 || range.offset + range.size > self->size) {
+			MGLError_Set("out of range offset = %zd or size = %zd", range.offset, range.size);
+			failed = true;
+			break;
+		}
+
+		if (range.size) {
+			ranges[num_ranges++] = range;
+		}
+	}
+
+	if (failed || !num_ranges) {
+		for (Py_ssize_t i = 0; i < acquired; ++i) {
+			PyBuffer_Release(&views[i]);
+		}
+		delete[] views;
+		delete[] ranges;
+		delete[] offset_array;
+		if (failed) {
+			return 0;
+		}
+		Py_RETURN_NONE;
+	}
+
+	// The ranges are kept in the original order too, later writes win where they overlap.
+	MGLWriteRange * sorted = new MGLWriteRange[num_ranges];
+	memcpy(sorted, ranges, sizeof(MGLWriteRange) * num_ranges);
+	qsort(sorted, num_ranges, sizeof(MGLWriteRange), MGLWriteRange_compare_offset);
+
+	// Merge the adjacent and overlapping ranges into spans.
+	Py_ssize_t num_spans = 0;
+	Py_ssize_t covered = 0;
+	Py_ssize_t largest_span = 0;
+	Py_ssize_t start = sorted[0].offset;
+	Py_ssize_t end = start;
+
+	for (Py_ssize_t i = 0; i < num_ranges; ++i) {
+		if (sorted[i].offset > end) {
+			num_spans += 1;
+			covered += end - start;
+			largest_span = end - start > largest_span ? end - start : largest_span;
+			start = sorted[i].offset;
+		}
+		if (sorted[i].offset + sorted[i].size > end) {
+			end = sorted[i].offset + sorted[i].size;
+		}
+	}
+
+	num_spans += 1;
+	covered += end - start;
+	largest_span = end - start > largest_span ? end - start : largest_span;
+
+	const GLMethods & gl = self->context->gl;
+	Py_ssize_t first = sorted[0].offset;
+	Py_ssize_t extent = end - first;
+
+	// Dense updates are written through a single mapping, sparse ones with a SubData call per span.
+	if (self->mapped || (num_spans > 1 && covered * 2 >= extent)) {
+		int access = self->mapped ? GL_MAP_WRITE_BIT : (GL_MAP_WRITE_BIT | GL_MAP_FLUSH_EXPLICIT_BIT);
+		char * map = MGLBuffer_map_span(self, first, extent, access);
+
+		if (map) {
+			for (Py_ssize_t i = 0; i < num_ranges; ++i) {
+				memcpy(map + ranges[i].offset - first, ranges[i].src, ranges[i].size);
+			}
+
+			if (!self->mapped) {
+				start = sorted[0].offset;
+				end = start;
+				for (Py_ssize_t i = 0; i <= num_ranges; ++i) {
+					if (i == num_ranges || sorted[i].offset > end) {
+						gl.FlushMappedBufferRange(GL_ARRAY_BUFFER, start - first, end - start);
+						if (i == num_ranges) {
+							break;
+						}
+						start = sorted[i].offset;
+					}
+					if (sorted[i].offset + sorted[i].size > end) {
+						end = sorted[i].offset + sorted[i].size;
+					}
+				}
+			}
+
+			MGLBuffer_unmap_span(self);
+		} else {
+			failed = true;
+		}
+	} else {
+		char * staging = 0;
+		gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+
+		Py_ssize_t i = 0;
+		while (i < num_ranges) {
+			Py_ssize_t j = i + 1;
+			start = sorted[i].offset;
+			end = start + sorted[i].size;
+			while (j < num_ranges && sorted[j].offset <= end) {
+				if (sorted[j].offset + sorted[j].size > end) {
+					end = sorted[j].offset + sorted[j].size;
+				}
+				j += 1;
+			}
+
+			if (j == i + 1) {
+				gl.BufferSubData(GL_ARRAY_BUFFER, (GLintptr)start, end - start, sorted[i].src);
+			} else {
+				if (!staging) {
+					staging = new char[largest_span];
+				}
+				qsort(sorted + i, j - i, sizeof(MGLWriteRange), MGLWriteRange_compare_index);
+				for (Py_ssize_t k = i; k < j; ++k) {
+					memcpy(staging + sorted[k].offset - start, sorted[k].src, sorted[k].size);
+				}
+				gl.BufferSubData(GL_ARRAY_BUFFER, (GLintptr)start, end - start, staging);
+			}
+
+			i = j;
+		}
+
+		delete[] staging;
+	}
+
+	for (Py_ssize_t i = 0; i < acquired; ++i) {
+		PyBuffer_Release(&views[i]);
+	}
+
+	delete[] views;
+	delete[] sorted;
+	delete[] ranges;
+	delete[] offset_array;
+
+	if (failed) {
+		return 0;
+	}
+
+	Py_RETURN_NONE;
+}
+
 PyObject * MGLBuffer_read(MGLBuffer * self, PyObject * args) {
 	Py_ssize_t size;
 	Py_ssize_t offset;
@@ -147,6 +545,11 @@ PyObject * MGLBuffer_read(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
 	if (size < 0) {
 		size = self->size - offset;
 	}
@@ -159,6 +562,13 @@ PyObject * MGLBuffer_read(MGLBuffer * self, PyObject * args) {
 	const GLMethods & gl = self->context->gl;
 
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+
+	if (self->mapped) {
+		PyObject * data = PyBytes_FromStringAndSize(0, size);
+		gl.GetBufferSubData(GL_ARRAY_BUFFER, offset, size, PyBytes_AS_STRING(data));
+		return data;
+	}
+
 	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_READ_BIT);
 
 	if (!map) {
@@ -192,6 +602,11 @@ PyObject * MGLBuffer_read_into(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
 	if (size < 0) {
 		size = self->size - offset;
 	}
@@ -218,9 +633,23 @@ PyObject * MGLBuffer_read_into(MGLBuffer * self, PyObject * args) {
 	const GLMethods & gl = self->context->gl;
 
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_READ_BIT);
 
 	char * ptr = (char *)buffer_view.buf + write_offset;
+
+	if (self->mapped) {
+		gl.GetBufferSubData(GL_ARRAY_BUFFER, offset, size, ptr);
+		PyBuffer_Release(&buffer_view);
+		Py_RETURN_NONE;
+	}
+
+	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_READ_BIT);
+
+	if (!map) {
+		MGLError_Set("cannot map the buffer");
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
+
 	memcpy(ptr, map, size);
 
 	gl.UnmapBuffer(GL_ARRAY_BUFFER);
@@ -229,6 +658,102 @@ PyObject * MGLBuffer_read_into(MGLBuffer * self, PyObject * args) {
 	Py_RETURN_NONE;
 }
 
+char * MGLBuffer_map_span(MGLBuffer * self, Py_ssize_t offset, Py_ssize_t size, int access) {
+	if (self->mapped) {
+		if (access & GL_MAP_READ_BIT) {
+			MGLError_Set("stream buffers are mapped write-only");
+			return 0;
+		}
+		return self->mapped + offset;
+	}
+
+	const GLMethods & gl = self->context->gl;
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	char * map = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, access);
+
+	if (!map) {
+		MGLError_Set("cannot map the buffer");
+		return 0;
+	}
+
+	return map;
+}
+
+void MGLBuffer_unmap_span(MGLBuffer * self) {
+	if (self->mapped) {
+		return;
+	}
+
+	const GLMethods & gl = self->context->gl;
+	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+}
+
+// Copies between the logical (C order) bytes of a strided view and equally sized chunks.
+// The bytes [skip, skip + chunk_size * count) of the view are mapped to the chunks
+// starting at base and placed step bytes apart.
+void MGLBuffer_copy_strided(Py_buffer * view, Py_ssize_t skip, char * base, Py_ssize_t chunk_size, Py_ssize_t step, Py_ssize_t count, bool to_chunks) {
+	Py_ssize_t total = chunk_size * count;
+
+	if (PyBuffer_IsContiguous(view, 'C')) {
+		char * ptr = (char *)view->buf + skip;
+		for (Py_ssize_t i = 0; i < count; ++i) {
+			if (to_chunks) {
+				memcpy(base, ptr, chunk_size);
+			} else {
+				memcpy(ptr, base, chunk_size);
+			}
+			ptr += chunk_size;
+			base += step;
+		}
+		return;
+	}
+
+	Py_ssize_t itemsize = view->itemsize;
+	Py_ssize_t items = view->len / itemsize;
+	Py_ssize_t index[PyBUF_MAX_NDIM] = {};
+
+	for (Py_ssize_t i = 0; i < items; ++i) {
+		Py_ssize_t begin = i * itemsize - skip;
+
+		if (begin + itemsize > 0 && begin < total) {
+			char * item = (char *)view->buf;
+			for (int d = 0; d < view->ndim; ++d) {
+				item += index[d] * view->strides[d];
+			}
+
+			if (begin >= 0 && begin + itemsize <= total && begin % chunk_size + itemsize <= chunk_size) {
+				char * chunk = base + begin / chunk_size * step + begin % chunk_size;
+				if (to_chunks) {
+					memcpy(chunk, item, itemsize);
+				} else {
+					memcpy(item, chunk, itemsize);
+				}
+			} else {
+				// the item is split between chunks or clipped by the range
+				for (Py_ssize_t j = 0; j < itemsize; ++j) {
+					Py_ssize_t pos = begin + j;
+					if (pos < 0 || pos >= total) {
+						continue;
+					}
+					char * chunk = base + pos / chunk_size * step + pos % chunk_size;
+					if (to_chunks) {
+						*chunk = item[j];
+					} else {
+						item[j] = *chunk;
+					}
+				}
+			}
+		}
+
+		for (int d = view->ndim - 1; d >= 0; --d) {
+			if (++index[d] < view->shape[d]) {
+				break;
+			}
+			index[d] = 0;
+		}
+	}
+}
+
 PyObject * MGLBuffer_write_chunks(MGLBuffer * self, PyObject * args) {
 	PyObject * data;
 	Py_ssize_t start;
@@ -248,23 +773,30 @@ PyObject * MGLBuffer_write_chunks(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
+	if (count <= 0) {
+		MGLError_Set("invalid count = %zd", count);
+		return 0;
+	}
+
 	Py_ssize_t abs_step = step > 0 ? step : -step;
 
 	Py_buffer buffer_view;
 
-	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_SIMPLE);
+	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_STRIDED_RO);
 	if (get_buffer < 0) {
 		MGLError_Set("data (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-
 	Py_ssize_t chunk_size = buffer_view.len / count;
 
 	if (buffer_view.len != chunk_size * count) {
-		MGLError_Set("data (%d bytes) cannot be divided to %d equal chunks", buffer_view.len, count);
+		MGLError_Set("data (%zd bytes) cannot be divided to %zd equal chunks", buffer_view.len, count);
 		PyBuffer_Release(&buffer_view);
 		return 0;
 	}
@@ -279,23 +811,25 @@ PyObject * MGLBuffer_write_chunks(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	char * write_ptr = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, GL_MAP_WRITE_BIT);
-	char * read_ptr = (char *)buffer_view.buf;
+	if (!chunk_size) {
+		PyBuffer_Release(&buffer_view);
+		Py_RETURN_NONE;
+	}
 
-	if (!write_ptr) {
-		MGLError_Set("cannot map the buffer");
+	// map only the span touched by the chunks
+	Py_ssize_t first = step > 0 ? start : start + count * step - step;
+	Py_ssize_t span = count * abs_step - abs_step + chunk_size;
+
+	char * map = MGLBuffer_map_span(self, first, span, GL_MAP_WRITE_BIT);
+
+	if (!map) {
 		PyBuffer_Release(&buffer_view);
 		return 0;
 	}
 
-	write_ptr += start;
-	for (Py_ssize_t i = 0; i < count; ++i) {
-		memcpy(write_ptr, read_ptr, chunk_size);
-		read_ptr += chunk_size;
-		write_ptr += step;
-	}
+	MGLBuffer_copy_strided(&buffer_view, 0, map + (start - first), chunk_size, step, count, true);
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_unmap_span(self);
 	PyBuffer_Release(&buffer_view);
 	Py_RETURN_NONE;
 }
@@ -319,39 +853,48 @@ PyObject * MGLBuffer_read_chunks(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
 	Py_ssize_t abs_step = step > 0 ? step : -step;
 
 	if (start < 0) {
 		start = self->size + start;
 	}
 
-	if (start < 0 || chunk_size < 0 || chunk_size > abs_step || start + chunk_size > self->size || start + count * step - step < 0 || start + count * step - step + chunk_size > self->size) {
+	if (count < 0 || start < 0 || chunk_size < 0 || chunk_size > abs_step || start + chunk_size > self->size || start + count * step - step < 0 || start + count * step - step + chunk_size > self->size) {
 		MGLError_Set("size error");
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
+	PyObject * data = PyBytes_FromStringAndSize(0, chunk_size * count);
 
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	if (!chunk_size || !count) {
+		return data;
+	}
 
-	char * read_ptr = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, GL_MAP_READ_BIT);
+	Py_ssize_t first = step > 0 ? start : start + count * step - step;
+	Py_ssize_t span = count * abs_step - abs_step + chunk_size;
+
+	char * read_ptr = MGLBuffer_map_span(self, first, span, GL_MAP_READ_BIT);
 
 	if (!read_ptr) {
-		MGLError_Set("cannot map the buffer");
+		Py_DECREF(data);
 		return 0;
 	}
 
-	PyObject * data = PyBytes_FromStringAndSize(0, chunk_size * count);
 	char * write_ptr = PyBytes_AS_STRING(data);
 
-	read_ptr += start;
+	read_ptr += start - first;
 	for (Py_ssize_t i = 0; i < count; ++i) {
 		memcpy(write_ptr, read_ptr, chunk_size);
 		write_ptr += chunk_size;
 		read_ptr += step;
 	}
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_unmap_span(self);
 	return data;
 }
 
@@ -378,34 +921,54 @@ PyObject * MGLBuffer_read_chunks_into(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	Py_buffer buffer_view;
-
-	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_WRITABLE);
-	if (get_buffer < 0) {
-		MGLError_Set("the buffer (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
+	Py_ssize_t abs_step = step > 0 ? step : -step;
 
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	if (start < 0) {
+		start = self->size + start;
+	}
+
+	if (count < 0 || start < 0 || chunk_size < 0 || chunk_size > abs_step || start + chunk_size > self->size || start + count * step - step < 0 || start + count * step - step + chunk_size > self->size) {
+		MGLError_Set("size error");
+		return 0;
+	}
 
-	char * read_ptr = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, GL_MAP_READ_BIT);
-	char * write_ptr = (char *)buffer_view.buf + write_offset;
+	Py_buffer buffer_view;
 
-	if (!read_ptr) {
-		MGLError_Set("cannot map the buffer");
+	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_STRIDED);
+	if (get_buffer < 0) {
+		MGLError_Set("the buffer (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
 		return 0;
 	}
 
-	read_ptr += start;
-	for (Py_ssize_t i = 0; i < count; ++i) {
-		memcpy(write_ptr, read_ptr, chunk_size);
-		write_ptr += chunk_size;
-		read_ptr += step;
+	if (write_offset < 0 || buffer_view.len < write_offset + chunk_size * count) {
+		MGLError_Set("the buffer is too small");
+		PyBuffer_Release(&buffer_view);
+		return 0;
 	}
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	if (!chunk_size || !count) {
+		PyBuffer_Release(&buffer_view);
+		Py_RETURN_NONE;
+	}
+
+	Py_ssize_t first = step > 0 ? start : start + count * step - step;
+	Py_ssize_t span = count * abs_step - abs_step + chunk_size;
+
+	char * map = MGLBuffer_map_span(self, first, span, GL_MAP_READ_BIT);
+
+	if (!map) {
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
+
+	MGLBuffer_copy_strided(&buffer_view, write_offset, map + (start - first), chunk_size, step, count, false);
+
+	MGLBuffer_unmap_span(self);
 	PyBuffer_Release(&buffer_view);
 	Py_RETURN_NONE;
 }
@@ -414,69 +977,147 @@ PyObject * MGLBuffer_clear(MGLBuffer * self, PyObject * args) {
 	Py_ssize_t size;
 	Py_ssize_t offset;
 	PyObject * chunk;
+	const char * fmt;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"nnO",
+		"nnOz",
 		&size,
 		&offset,
-		&chunk
+		&chunk,
+		&fmt
 	);
 
 	if (!args_ok) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
 	if (size < 0) {
 		size = self->size - offset;
 	}
 
-	Py_buffer buffer_view;
+	int components = 0;
+	MGLDataType * data_type = 0;
+
+	if (fmt) {
+		// '4f', '1u4', 'f4' -> number of components, then the dtype
+		const char * ptr = fmt;
+		components = 1;
+		if (*ptr >= '1' && *ptr <= '4') {
+			components = *ptr++ - '0';
+		}
+
+		char dtype[3] = {ptr[0], '4', 0};
+		if (ptr[0] && ptr[1]) {
+			dtype[1] = ptr[1];
+		}
+
+		data_type = (ptr[0] && (!ptr[1] || !ptr[2])) ? from_dtype(dtype) : 0;
+
+		if (!data_type) {
+			MGLError_Set("invalid fmt: %s", fmt);
+			return 0;
+		}
+	}
+
+	if (offset < 0 || size < 0 || offset + size > self->size) {
+		MGLError_Set("out of range offset = %zd or size = %zd", offset, size);
+		return 0;
+	}
+
+	char * pattern = 0;
+	Py_ssize_t pattern_size = 0;
 
 	if (chunk != Py_None) {
-		int get_buffer = PyObject_GetBuffer(chunk, &buffer_view, PyBUF_SIMPLE);
+		Py_buffer buffer_view;
+
+		int get_buffer = PyObject_GetBuffer(chunk, &buffer_view, PyBUF_STRIDED_RO);
 		if (get_buffer < 0) {
 			MGLError_Set("the chunk (%s) does not support buffer interface", Py_TYPE(chunk)->tp_name);
 			return 0;
 		}
 
-		if (size % buffer_view.len != 0) {
+		if (data_type && buffer_view.len != components * data_type->size) {
+			MGLError_Set("the chunk size %zd does not match the fmt %s", buffer_view.len, fmt);
+			PyBuffer_Release(&buffer_view);
+			return 0;
+		}
+
+		if (!buffer_view.len || size % buffer_view.len != 0) {
 			MGLError_Set("the chunk does not fit the size");
 			PyBuffer_Release(&buffer_view);
 			return 0;
 		}
-	} else {
-		buffer_view.len = 0;
-		buffer_view.buf = 0;
+
+		pattern_size = buffer_view.len;
+		pattern = new char[pattern_size];
+		PyBuffer_ToContiguous(pattern, &buffer_view, pattern_size, 'C');
+		PyBuffer_Release(&buffer_view);
+	}
+
+	if (!size) {
+		delete[] pattern;
+		Py_RETURN_NONE;
 	}
 
 	const GLMethods & gl = self->context->gl;
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
 
-	char * map = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_WRITE_BIT);
+	if (!data_type) {
+		// Without a fmt the chunk is copied bit by bit using an unsigned integer format.
+		switch (pattern ? pattern_size : 1) {
+			case 1: components = 1; data_type = from_dtype("u1"); break;
+			case 2: components = 1; data_type = from_dtype("u2"); break;
+			case 4: components = 1; data_type = from_dtype("u4"); break;
+			case 8: components = 2; data_type = from_dtype("u4"); break;
+			case 12: components = 3; data_type = from_dtype("u4"); break;
+			case 16: components = 4; data_type = from_dtype("u4"); break;
+		}
+	}
+
+	// RGB is only a valid buffer format for 32 bit components.
+	bool clear_supported = data_type && (components != 3 || data_type->size == 4);
+
+	if (gl.ClearBufferSubData && clear_supported) {
+		Py_ssize_t element_size = components * data_type->size;
+
+		if (offset % element_size == 0 && size % element_size == 0) {
+			gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+			gl.ClearBufferSubData(
+				GL_ARRAY_BUFFER,
+				data_type->internal_format[components],
+				(GLintptr)offset,
+				(GLsizeiptr)size,
+				data_type->base_format[components],
+				data_type->gl_type,
+				pattern
+			);
+			delete[] pattern;
+			Py_RETURN_NONE;
+		}
+	}
+
+	char * map = MGLBuffer_map_span(self, offset, size, GL_MAP_WRITE_BIT);
 
 	if (!map) {
-		MGLError_Set("cannot map the buffer");
+		delete[] pattern;
 		return 0;
 	}
 
-	if (buffer_view.len) {
-		char * src = (char *)buffer_view.buf;
-		Py_ssize_t divisor = buffer_view.len;
-
-		for (Py_ssize_t i = 0; i < size; ++i) {
-			map[i] = src[i % divisor];
+	if (pattern) {
+		for (Py_ssize_t i = 0; i < size; i += pattern_size) {
+			memcpy(map + i, pattern, pattern_size);
 		}
 	} else {
-		memset(map + offset, 0, size);
-	}
-
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
-
-	if (chunk != Py_None) {
-		PyBuffer_Release(&buffer_view);
+		memset(map, 0, size);
 	}
 
+	MGLBuffer_unmap_span(self);
+	delete[] pattern;
 	Py_RETURN_NONE;
 }
 
@@ -493,6 +1134,16 @@ PyObject * MGLBuffer_orphan(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
+	if (self->mapped) {
+		MGLError_Set("stream buffers cannot be orphaned");
+		return 0;
+	}
+
 	if (size > 0) {
 		self->size = size;
 	}
@@ -503,6 +1154,79 @@ PyObject * MGLBuffer_orphan(MGLBuffer * self, PyObject * args) {
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLBuffer_resize(MGLBuffer * self, PyObject * args) {
+	Py_ssize_t size;
+	int preserve;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"np",
+		&size,
+		&preserve
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (size <= 0) {
+		MGLError_Set("invalid size = %zd", size);
+		return 0;
+	}
+
+	if (self->mapped) {
+		MGLError_Set("stream buffers cannot be resized");
+		return 0;
+	}
+
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
+	const GLMethods & gl = self->context->gl;
+
+	Py_ssize_t keep = preserve ? (size < self->size ? size : self->size) : 0;
+	int staging_obj = 0;
+
+	// The buffer keeps its name so the vertex arrays referencing it remain valid.
+	// The preserved content makes a round trip through a staging buffer on the GPU.
+	if (keep) {
+		gl.GenBuffers(1, (GLuint *)&staging_obj);
+
+		if (!staging_obj) {
+			MGLError_Set("cannot create buffer");
+			return 0;
+		}
+
+		gl.BindBuffer(GL_COPY_WRITE_BUFFER, staging_obj);
+		gl.BufferData(GL_COPY_WRITE_BUFFER, keep, 0, GL_STREAM_COPY);
+		gl.BindBuffer(GL_COPY_READ_BUFFER, self->buffer_obj);
+		gl.CopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, keep);
+	}
+
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	gl.BufferData(GL_ARRAY_BUFFER, size, 0, self->dynamic ? GL_DYNAMIC_DRAW : GL_STATIC_DRAW);
+	self->size = size;
+
+	if (keep) {
+		gl.BindBuffer(GL_COPY_READ_BUFFER, staging_obj);
+		gl.BindBuffer(GL_COPY_WRITE_BUFFER, self->buffer_obj);
+		gl.CopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, keep);
+		gl.DeleteBuffers(1, (GLuint *)&staging_obj);
+	}
+
+	Py_RETURN_NONE;
+}
+
+// The offset and the size are recorded as two words each.
+void MGLBuffer_record_bind(MGLBuffer * self, int target, int binding, Py_ssize_t offset, Py_ssize_t size) {
+	long long range[2] = {offset, size};
+	int record[7] = {MGLContext_record_object(self->context, (PyObject *)self), target, binding};
+	memcpy(record + 3, range, sizeof(range));
+	MGLContext_record(self->context, MGL_RECORD_BIND_BUFFER_RANGE, record, 7);
+}
+
 PyObject * MGLBuffer_bind_to_uniform_block(MGLBuffer * self, PyObject * args) {
 	int binding;
 	Py_ssize_t offset;
@@ -524,8 +1248,12 @@ PyObject * MGLBuffer_bind_to_uniform_block(MGLBuffer * self, PyObject * args) {
 		size = self->size - offset;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.BindBufferRange(GL_UNIFORM_BUFFER, binding, self->buffer_obj, offset, size);
+	MGLContext_bind_buffer_range(self->context, GL_UNIFORM_BUFFER, binding, self->buffer_obj, offset, size);
+
+	if (self->context->recording) {
+		MGLBuffer_record_bind(self, GL_UNIFORM_BUFFER, binding, offset, size);
+	}
+
 	Py_RETURN_NONE;
 }
 
@@ -550,11 +1278,387 @@ PyObject * MGLBuffer_bind_to_storage_buffer(MGLBuffer * self, PyObject * args) {
 		size = self->size - offset;
 	}
 
+	MGLContext_bind_buffer_range(self->context, GL_SHADER_STORAGE_BUFFER, binding, self->buffer_obj, offset, size);
+
+	if (self->context->recording) {
+		MGLBuffer_record_bind(self, GL_SHADER_STORAGE_BUFFER, binding, offset, size);
+	}
+
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLBuffer_map(MGLBuffer * self, PyObject * args) {
+	Py_ssize_t offset;
+	Py_ssize_t size;
+	int read;
+	int write;
+	int invalidate;
+	int unsynchronized;
+	int flush_explicit;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"nnppppp",
+		&offset,
+		&size,
+		&read,
+		&write,
+		&invalidate,
+		&unsynchronized,
+		&flush_explicit
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (size < 0) {
+		size = self->size - offset;
+	}
+
+	if (offset < 0 || size <= 0 || offset + size > self->size) {
+		MGLError_Set("out of range offset = %zd or size = %zd", offset, size);
+		return 0;
+	}
+
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is already mapped");
+		return 0;
+	}
+
+	if (!read && !write) {
+		MGLError_Set("the buffer must be mapped for reading or writing");
+		return 0;
+	}
+
+	if (read && invalidate) {
+		MGLError_Set("invalidate cannot be combined with read");
+		return 0;
+	}
+
+	if (flush_explicit && !write) {
+		MGLError_Set("flush_explicit requires write");
+		return 0;
+	}
+
+	int access = 0;
+	access |= read ? GL_MAP_READ_BIT : 0;
+	access |= write ? GL_MAP_WRITE_BIT : 0;
+	access |= invalidate ? GL_MAP_INVALIDATE_RANGE_BIT : 0;
+	access |= unsynchronized ? GL_MAP_UNSYNCHRONIZED_BIT : 0;
+	access |= flush_explicit ? GL_MAP_FLUSH_EXPLICIT_BIT : 0;
+
+	char * map = 0;
+
+	if (self->mapped) {
+		if (read) {
+			MGLError_Set("stream buffers are mapped write-only");
+			return 0;
+		}
+
+		// the persistent mapping is coherent, explicit flushes are no-ops
+		map = self->mapped + offset;
+		access &= ~GL_MAP_FLUSH_EXPLICIT_BIT;
+	} else {
+		const GLMethods & gl = self->context->gl;
+		gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+		map = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, access);
+
+		if (!map) {
+			MGLError_Set("cannot map the buffer");
+			return 0;
+		}
+	}
+
+	self->map_ptr = map;
+	self->map_offset = offset;
+	self->map_size = size;
+	self->map_access = access;
+
+	return PyMemoryView_FromMemory(map, size, write ? PyBUF_WRITE : PyBUF_READ);
+}
+
+PyObject * MGLBuffer_flush_range(MGLBuffer * self, PyObject * args) {
+	Py_ssize_t offset;
+	Py_ssize_t size;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"nn",
+		&offset,
+		&size
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (!self->map_ptr) {
+		MGLError_Set("the buffer is not mapped");
+		return 0;
+	}
+
+	if (size < 0) {
+		size = self->map_size - offset;
+	}
+
+	if (offset < 0 || size < 0 || offset + size > self->map_size) {
+		MGLError_Set("out of range offset = %zd or size = %zd", offset, size);
+		return 0;
+	}
+
+	if (!(self->map_access & GL_MAP_FLUSH_EXPLICIT_BIT)) {
+		Py_RETURN_NONE;
+	}
+
+	const GLMethods & gl = self->context->gl;
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	gl.FlushMappedBufferRange(GL_ARRAY_BUFFER, offset, size);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLBuffer_unmap(MGLBuffer * self) {
+	if (!self->map_ptr) {
+		Py_RETURN_NONE;
+	}
+
+	self->map_ptr = 0;
+	self->map_offset = 0;
+	self->map_size = 0;
+	self->map_access = 0;
+
+	if (self->mapped) {
+		Py_RETURN_NONE;
+	}
+
 	const GLMethods & gl = self->context->gl;
-	gl.BindBufferRange(GL_SHADER_STORAGE_BUFFER, binding, self->buffer_obj, offset, size);
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+
+	if (!gl.UnmapBuffer(GL_ARRAY_BUFFER)) {
+		MGLError_Set("the buffer content was corrupted while mapped");
+		return 0;
+	}
+
 	Py_RETURN_NONE;
 }
 
+Py_ssize_t MGLBuffer_stream_reserve(MGLBuffer * self, Py_ssize_t size, Py_ssize_t alignment) {
+	if (!self->mapped) {
+		MGLError_Set("the buffer is not a stream buffer");
+		return -1;
+	}
+
+	if (size < 0 || alignment < 1) {
+		MGLError_Set("invalid size = %zd or alignment = %zd", size, alignment);
+		return -1;
+	}
+
+	Py_ssize_t start = self->frame_size * self->frame;
+	Py_ssize_t offset = (start + self->frame_head + alignment - 1) / alignment * alignment;
+
+	if (offset + size > start + self->frame_size) {
+		MGLError_Set("the frame is full: cannot allocate %zd bytes from the remaining %zd", size, start + self->frame_size - offset);
+		return -1;
+	}
+
+	self->frame_head = offset + size - start;
+	return offset;
+}
+
+PyObject * MGLBuffer_stream_allocate(MGLBuffer * self, PyObject * args) {
+	Py_ssize_t size;
+	Py_ssize_t alignment;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"nn",
+		&size,
+		&alignment
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	Py_ssize_t offset = MGLBuffer_stream_reserve(self, size, alignment);
+
+	if (offset < 0) {
+		return 0;
+	}
+
+	return PyLong_FromSsize_t(offset);
+}
+
+PyObject * MGLBuffer_stream_write(MGLBuffer * self, PyObject * args) {
+	PyObject * data;
+	Py_ssize_t alignment;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"On",
+		&data,
+		&alignment
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	Py_buffer buffer_view;
+
+	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_SIMPLE);
+	if (get_buffer < 0) {
+		MGLError_Set("data (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
+		return 0;
+	}
+
+	Py_ssize_t offset = MGLBuffer_stream_reserve(self, buffer_view.len, alignment);
+
+	if (offset < 0) {
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
+
+	memcpy(self->mapped + offset, buffer_view.buf, buffer_view.len);
+	PyBuffer_Release(&buffer_view);
+	return PyLong_FromSsize_t(offset);
+}
+
+PyObject * MGLBuffer_stream_next_frame(MGLBuffer * self) {
+	if (!self->mapped) {
+		MGLError_Set("the buffer is not a stream buffer");
+		return 0;
+	}
+
+	const GLMethods & gl = self->context->gl;
+
+	// fence the commands reading the current frame
+	self->fences[self->frame] = gl.FenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
+
+	self->frame = (self->frame + 1) % self->frames;
+	self->frame_head = 0;
+
+	// wait until the gpu is done with the next frame
+	GLsync fence = self->fences[self->frame];
+
+	if (fence) {
+		GLenum status = gl.ClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000);
+
+		while (status == GL_TIMEOUT_EXPIRED) {
+			status = gl.ClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000);
+		}
+
+		gl.DeleteSync(fence);
+		self->fences[self->frame] = 0;
+
+		if (status == GL_WAIT_FAILED) {
+			MGLError_Set("cannot wait for the frame");
+			return 0;
+		}
+	}
+
+	return PyLong_FromLong(self->frame);
+}
+
+PyObject * MGLBuffer_read_async(MGLBuffer * self, PyObject * args) {
+	Py_ssize_t size;
+	Py_ssize_t offset;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"nn",
+		&size,
+		&offset
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (self->map_ptr) {
+		MGLError_Set("the buffer is mapped");
+		return 0;
+	}
+
+	if (size < 0) {
+		size = self->size - offset;
+	}
+
+	if (offset < 0 || size <= 0 || offset + size > self->size) {
+		MGLError_Set("out of range offset = %zd or size = %zd", offset, size);
+		return 0;
+	}
+
+	const GLMethods & gl = self->context->gl;
+
+	MGLBuffer * staging = (MGLBuffer *)MGLBuffer_Type.tp_alloc(&MGLBuffer_Type, 0);
+
+	staging->size = size;
+	staging->dynamic = true;
+
+	staging->buffer_obj = 0;
+	gl.GenBuffers(1, (GLuint *)&staging->buffer_obj);
+
+	if (!staging->buffer_obj) {
+		MGLError_Set("cannot create buffer");
+		Py_DECREF(staging);
+		return 0;
+	}
+
+	gl.BindBuffer(GL_COPY_WRITE_BUFFER, staging->buffer_obj);
+	gl.BufferData(GL_COPY_WRITE_BUFFER, size, 0, GL_STREAM_READ);
+
+	gl.BindBuffer(GL_COPY_READ_BUFFER, self->buffer_obj);
+	gl.CopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, offset, 0, size);
+
+	staging->fence = gl.FenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
+
+	Py_INCREF(self->context);
+	staging->context = self->context;
+
+	Py_INCREF(staging);
+
+	PyObject * result = PyTuple_New(3);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)staging);
+	PyTuple_SET_ITEM(result, 1, PyLong_FromSsize_t(staging->size));
+	PyTuple_SET_ITEM(result, 2, PyLong_FromLong(staging->buffer_obj));
+	return result;
+}
+
+PyObject * MGLBuffer_fence_wait(MGLBuffer * self, PyObject * args) {
+	unsigned long long timeout;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"K",
+		&timeout
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (!self->fence) {
+		Py_RETURN_TRUE;
+	}
+
+	const GLMethods & gl = self->context->gl;
+	GLenum status = gl.ClientWaitSync(self->fence, GL_SYNC_FLUSH_COMMANDS_BIT, timeout);
+
+	if (status == GL_WAIT_FAILED) {
+		MGLError_Set("cannot wait for the fence");
+		return 0;
+	}
+
+	if (status == GL_TIMEOUT_EXPIRED) {
+		Py_RETURN_FALSE;
+	}
+
+	gl.DeleteSync(self->fence);
+	self->fence = 0;
+	Py_RETURN_TRUE;
+}
+
 PyObject * MGLBuffer_release(MGLBuffer * self) {
 	MGLBuffer_Invalidate(self);
 	Py_RETURN_NONE;
@@ -566,6 +1670,7 @@ PyObject * MGLBuffer_size(MGLBuffer * self) {
 
 PyMethodDef MGLBuffer_tp_methods[] = {
 	{"write", (PyCFunction)MGLBuffer_write, METH_VARARGS, 0},
+	{"write_many", (PyCFunction)MGLBuffer_write_many, METH_VARARGS, 0},
 	{"read", (PyCFunction)MGLBuffer_read, METH_VARARGS, 0},
 	{"read_into", (PyCFunction)MGLBuffer_read_into, METH_VARARGS, 0},
 	{"write_chunks", (PyCFunction)MGLBuffer_write_chunks, METH_VARARGS, 0},
@@ -573,15 +1678,43 @@ PyMethodDef MGLBuffer_tp_methods[] = {
 	{"read_chunks_into", (PyCFunction)MGLBuffer_read_chunks_into, METH_VARARGS, 0},
 	{"clear", (PyCFunction)MGLBuffer_clear, METH_VARARGS, 0},
 	{"orphan", (PyCFunction)MGLBuffer_orphan, METH_VARARGS, 0},
+	{"resize", (PyCFunction)MGLBuffer_resize, METH_VARARGS, 0},
 	{"bind_to_uniform_block", (PyCFunction)MGLBuffer_bind_to_uniform_block, METH_VARARGS, 0},
 	{"bind_to_storage_buffer", (PyCFunction)MGLBuffer_bind_to_storage_buffer, METH_VARARGS, 0},
 	{"release", (PyCFunction)MGLBuffer_release, METH_NOARGS, 0},
 	{"size", (PyCFunction)MGLBuffer_size, METH_NOARGS, 0},
+	{"map", (PyCFunction)MGLBuffer_map, METH_VARARGS, 0},
+	{"flush_range", (PyCFunction)MGLBuffer_flush_range, METH_VARARGS, 0},
+	{"unmap", (PyCFunction)MGLBuffer_unmap, METH_NOARGS, 0},
+	{"read_async", (PyCFunction)MGLBuffer_read_async, METH_VARARGS, 0},
+	{"fence_wait", (PyCFunction)MGLBuffer_fence_wait, METH_VARARGS, 0},
+	{"stream_allocate", (PyCFunction)MGLBuffer_stream_allocate, METH_VARARGS, 0},
+	{"stream_write", (PyCFunction)MGLBuffer_stream_write, METH_VARARGS, 0},
+	{"stream_next_frame", (PyCFunction)MGLBuffer_stream_next_frame, METH_NOARGS, 0},
 	{0},
 };
 
 int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flags) {
-	int access = (flags == PyBUF_SIMPLE) ? GL_MAP_READ_BIT : (GL_MAP_READ_BIT | GL_MAP_WRITE_BIT);
+	if (self->mapped) {
+		view->buf = self->mapped;
+		view->len = self->size;
+		view->readonly = 0;
+		view->itemsize = 1;
+
+		view->format = 0;
+		view->ndim = 0;
+		view->shape = 0;
+		view->strides = 0;
+		view->suboffsets = 0;
+
+		Py_INCREF(self);
+		view->obj = (PyObject *)self;
+		return 0;
+	}
+
+	// map for writing only when a writable view is requested
+	bool writable = (flags & PyBUF_WRITABLE) ? true : false;
+	int access = writable ? (GL_MAP_READ_BIT | GL_MAP_WRITE_BIT) : GL_MAP_READ_BIT;
 
 	const GLMethods & gl = self->context->gl;
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
@@ -595,6 +1728,7 @@ int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flag
 
 	view->buf = map;
 	view->len = self->size;
+	view->readonly = writable ? 0 : 1;
 	view->itemsize = 1;
 
 	view->format = 0;
@@ -609,7 +1743,12 @@ int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flag
 }
 
 void MGLBuffer_tp_as_buffer_release_view(MGLBuffer * self, Py_buffer * view) {
+	if (self->mapped) {
+		return;
+	}
+
 	const GLMethods & gl = self->context->gl;
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
 	gl.UnmapBuffer(GL_ARRAY_BUFFER);
 }
 
@@ -667,7 +1806,29 @@ void MGLBuffer_Invalidate(MGLBuffer * buffer) {
 	// TODO: decref
 
 	const GLMethods & gl = buffer->context->gl;
+
+	if (buffer->fence) {
+		gl.DeleteSync(buffer->fence);
+		buffer->fence = 0;
+	}
+
+	if (buffer->mapped) {
+		for (int i = 0; i < buffer->frames; ++i) {
+			if (buffer->fences[i]) {
+				gl.DeleteSync(buffer->fences[i]);
+			}
+		}
+
+		delete[] buffer->fences;
+		buffer->fences = 0;
+
+		gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
+		gl.UnmapBuffer(GL_ARRAY_BUFFER);
+		buffer->mapped = 0;
+	}
+
 	gl.DeleteBuffers(1, (GLuint *)&buffer->buffer_obj);
+	MGLContext_forget_buffer(buffer->context, buffer->buffer_obj);
 
 	Py_TYPE(buffer) = &MGLInvalidObject_Type;
 	Py_DECREF(buffer);
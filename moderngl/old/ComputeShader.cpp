@@ -4,11 +4,17 @@
 
 PyObject * MGLContext_compute_shader(MGLContext * self, PyObject * args) {
 	PyObject * source;
+	PyObject * binary;
+	PyObject * reflection;
+	int retrievable;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"O",
-		&source
+		"OOOp",
+		&source,
+		&binary,
+		&reflection,
+		&retrievable
 	);
 
 	if (!args_ok) {
@@ -20,215 +26,153 @@ PyObject * MGLContext_compute_shader(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	const char * source_str = PyUnicode_AsUTF8(source);
-
-	MGLComputeShader * compute_shader = (MGLComputeShader *)MGLComputeShader_Type.tp_alloc(&MGLComputeShader_Type, 0);
-
-	Py_INCREF(self);
-	compute_shader->context = self;
-
 	const GLMethods & gl = self->gl;
 
-	int program_obj = gl.CreateProgram();
+	int program_obj = 0;
+	int shader_obj = 0;
 
-	if (!program_obj) {
-		MGLError_Set("cannot create program");
-		return 0;
+	if (binary != Py_None && reflection != Py_None) {
+		program_obj = MGLContext_load_program_binary(self, binary, 0);
 	}
 
-	int shader_obj = gl.CreateShader(GL_COMPUTE_SHADER);
-
-	if (!shader_obj) {
-		MGLError_Set("cannot create the shader object");
-		return 0;
-	}
+	bool from_binary = program_obj != 0;
 
-	gl.ShaderSource(shader_obj, 1, &source_str, 0);
-	gl.CompileShader(shader_obj);
+	if (!from_binary) {
+		const char * source_str = PyUnicode_AsUTF8(source);
 
-	int compiled = GL_FALSE;
-	gl.GetShaderiv(shader_obj, GL_COMPILE_STATUS, &compiled);
+		program_obj = gl.CreateProgram();
 
-	if (!compiled) {
-		const char * message = "GLSL Compiler failed";
-		const char * title = "ComputeShader";
-		const char * underline = "=============";
-
-		int log_len = 0;
-		gl.GetShaderiv(shader_obj, GL_INFO_LOG_LENGTH, &log_len);
+		if (!program_obj) {
+			MGLError_Set("cannot create program");
+			return 0;
+		}
 
-		char * log = new char[log_len];
-		gl.GetShaderInfoLog(shader_obj, log_len, &log_len, log);
+		shader_obj = gl.CreateShader(GL_COMPUTE_SHADER);
 
-		gl.DeleteShader(shader_obj);
+		if (!shader_obj) {
+			MGLError_Set("cannot create the shader object");
+			return 0;
+		}
 
-		MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
+		gl.ShaderSource(shader_obj, 1, &source_str, 0);
+		gl.CompileShader(shader_obj);
 
-		delete[] log;
-		return 0;
-	}
+		int compiled = GL_FALSE;
+		gl.GetShaderiv(shader_obj, GL_COMPILE_STATUS, &compiled);
 
-	gl.AttachShader(program_obj, shader_obj);
-	gl.LinkProgram(program_obj);
+		if (!compiled) {
+			const char * message = "GLSL Compiler failed";
+			const char * title = "ComputeShader";
+			const char * underline = "=============";
 
-	int linked = GL_FALSE;
-	gl.GetProgramiv(program_obj, GL_LINK_STATUS, &linked);
+			int log_len = 0;
+			gl.GetShaderiv(shader_obj, GL_INFO_LOG_LENGTH, &log_len);
 
-	if (!linked) {
-		const char * message = "GLSL Linker failed";
-		const char * title = "ComputeShader";
-		const char * underline = "=============";
+			char * log = new char[log_len];
+			gl.GetShaderInfoLog(shader_obj, log_len, &log_len, log);
 
-		int log_len = 0;
-		gl.GetProgramiv(program_obj, GL_INFO_LOG_LENGTH, &log_len);
+			gl.DeleteShader(shader_obj);
 
-		char * log = new char[log_len];
-		gl.GetProgramInfoLog(program_obj, log_len, &log_len, log);
+			MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
 
-		gl.DeleteProgram(program_obj);
+			delete[] log;
+			return 0;
+		}
 
-		MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
+		gl.AttachShader(program_obj, shader_obj);
 
-		delete[] log;
-		return 0;
-	}
+		if (retrievable && gl.ProgramParameteri) {
+			gl.ProgramParameteri(program_obj, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE);
+		}
 
-	compute_shader->shader_obj = shader_obj;
-	compute_shader->program_obj = program_obj;
+		gl.LinkProgram(program_obj);
 
-	int num_uniforms = 0;
-	int num_uniform_blocks = 0;
-	int num_subroutines = 0;
-	int num_subroutine_uniforms = 0;
+		int linked = GL_FALSE;
+		gl.GetProgramiv(program_obj, GL_LINK_STATUS, &linked);
 
-	gl.GetProgramiv(program_obj, GL_ACTIVE_UNIFORMS, &num_uniforms);
-	gl.GetProgramiv(program_obj, GL_ACTIVE_UNIFORM_BLOCKS, &num_uniform_blocks);
-	gl.GetProgramStageiv(program_obj, GL_COMPUTE_SHADER, GL_ACTIVE_SUBROUTINES, &num_subroutines);
-	gl.GetProgramStageiv(program_obj, GL_COMPUTE_SHADER, GL_ACTIVE_SUBROUTINE_UNIFORMS, &num_subroutine_uniforms);
+		if (!linked) {
+			const char * message = "GLSL Linker failed";
+			const char * title = "ComputeShader";
+			const char * underline = "=============";
 
-	PyObject * uniforms_lst = PyTuple_New(num_uniforms);
-	PyObject * uniform_blocks_lst = PyTuple_New(num_uniform_blocks);
-	PyObject * subroutines_lst = PyTuple_New(num_subroutines);
-	PyObject * subroutine_uniforms_lst = PyTuple_New(num_subroutine_uniforms);
+			int log_len = 0;
+			gl.GetProgramiv(program_obj, GL_INFO_LOG_LENGTH, &log_len);
 
-	int uniform_counter = 0;
-	for (int i = 0; i < num_uniforms; ++i) {
-		int type = 0;
-		int array_length = 0;
-		int name_len = 0;
-		char name[256];
+			char * log = new char[log_len];
+			gl.GetProgramInfoLog(program_obj, log_len, &log_len, log);
 
-		gl.GetActiveUniform(program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
-		int location = gl.GetUniformLocation(program_obj, name);
+			gl.DeleteProgram(program_obj);
 
-		clean_glsl_name(name, name_len);
+			MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
 
-		if (location < 0) {
-			continue;
+			delete[] log;
+			return 0;
 		}
+	}
 
-		MGLUniform * mglo = (MGLUniform *)MGLUniform_Type.tp_alloc(&MGLUniform_Type, 0);
-		mglo->type = type;
-		mglo->location = location;
-		mglo->array_length = array_length;
-		mglo->program_obj = program_obj;
-		MGLUniform_Complete(mglo, gl);
-
-		PyObject * item = PyTuple_New(5);
-		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
-		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(location));
-		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(array_length));
-		PyTuple_SET_ITEM(item, 3, PyLong_FromLong(mglo->dimension));
-		PyTuple_SET_ITEM(item, 4, PyUnicode_FromStringAndSize(name, name_len));
-
-		PyTuple_SET_ITEM(uniforms_lst, uniform_counter, item);
-		++uniform_counter;
+	if (from_binary) {
+		Py_INCREF(reflection);
+	} else {
+		reflection = Py_BuildValue(
+			"(NNN)",
+			MGLProgram_query_uniforms(gl, program_obj),
+			MGLProgram_query_uniform_blocks(gl, program_obj),
+			MGLProgram_query_storage_blocks(gl, program_obj)
+		);
 	}
 
-	if (uniform_counter != num_uniforms) {
-		_PyTuple_Resize(&uniforms_lst, uniform_counter);
+	PyObject * uniforms;
+	PyObject * uniform_blocks;
+	PyObject * storage_blocks;
+
+	PyObject * uniforms_lst = 0;
+	PyObject * uniform_blocks_lst = 0;
+	PyObject * storage_blocks_lst = 0;
+
+	if (PyArg_ParseTuple(reflection, "OOO", &uniforms, &uniform_blocks, &storage_blocks)) {
+		uniforms_lst = MGLProgram_uniform_members(self, program_obj, uniforms);
 	}
 
-	for (int i = 0; i < num_uniform_blocks; ++i) {
-		int size = 0;
-		int name_len = 0;
-		char name[256];
+	if (uniforms_lst) {
+		uniform_blocks_lst = MGLProgram_uniform_block_members(gl, program_obj, uniform_blocks);
+	}
 
-		gl.GetActiveUniformBlockName(program_obj, i, 256, &name_len, name);
-		int index = gl.GetUniformBlockIndex(program_obj, name);
-		gl.GetActiveUniformBlockiv(program_obj, index, GL_UNIFORM_BLOCK_DATA_SIZE, &size);
+	if (uniform_blocks_lst) {
+		storage_blocks_lst = MGLProgram_storage_block_members(gl, program_obj, storage_blocks);
+	}
 
-		clean_glsl_name(name, name_len);
+	if (!storage_blocks_lst) {
+		Py_XDECREF(uniforms_lst);
+		Py_XDECREF(uniform_blocks_lst);
+		Py_DECREF(reflection);
+		gl.DeleteProgram(program_obj);
+		return 0;
+	}
 
-		MGLUniformBlock * mglo = (MGLUniformBlock *)MGLUniformBlock_Type.tp_alloc(&MGLUniformBlock_Type, 0);
+	MGLComputeShader * compute_shader = (MGLComputeShader *)MGLComputeShader_Type.tp_alloc(&MGLComputeShader_Type, 0);
 
-		mglo->index = index;
-		mglo->size = size;
-		mglo->program_obj = program_obj;
-		mglo->gl = &gl;
+	Py_INCREF(self);
+	compute_shader->context = self;
 
-		PyObject * item = PyTuple_New(4);
-		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
-		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(index));
-		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(size));
-		PyTuple_SET_ITEM(item, 3, PyUnicode_FromStringAndSize(name, name_len));
+	compute_shader->shader_obj = shader_obj;
+	compute_shader->program_obj = program_obj;
 
-		PyTuple_SET_ITEM(uniform_blocks_lst, i, item);
-	}
+	PyObject * cache_entry = Py_None;
 
-	int subroutine_uniforms_base = 0;
-	int subroutines_base = 0;
-
-	if (self->version_code >= 400) {
-		const int shader_type[5] = {
-			GL_VERTEX_SHADER,
-			GL_FRAGMENT_SHADER,
-			GL_GEOMETRY_SHADER,
-			GL_TESS_EVALUATION_SHADER,
-			GL_TESS_CONTROL_SHADER,
-		};
-
-		for (int st = 0; st < 5; ++st) {
-			int num_subroutines = 0;
-			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINES, &num_subroutines);
-
-			int num_subroutine_uniforms = 0;
-			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINE_UNIFORMS, &num_subroutine_uniforms);
-
-			for (int i = 0; i < num_subroutines; ++i) {
-				int name_len = 0;
-				char name[256];
-
-				gl.GetActiveSubroutineName(program_obj, shader_type[st], i, 256, &name_len, name);
-				int index = gl.GetSubroutineIndex(program_obj, shader_type[st], name);
-
-				PyObject * item = PyTuple_New(2);
-				PyTuple_SET_ITEM(item, 0, PyLong_FromLong(index));
-				PyTuple_SET_ITEM(item, 1, PyUnicode_FromStringAndSize(name, name_len));
-				PyTuple_SET_ITEM(subroutines_lst, subroutines_base + i, item);
-			}
-
-			for (int i = 0; i < num_subroutine_uniforms; ++i) {
-				int name_len = 0;
-				char name[256];
-
-				gl.GetActiveSubroutineUniformName(program_obj, shader_type[st], i, 256, &name_len, name);
-				int location = subroutine_uniforms_base + gl.GetSubroutineUniformLocation(program_obj, shader_type[st], name);
-				PyTuple_SET_ITEM(subroutine_uniforms_lst, location, PyUnicode_FromStringAndSize(name, name_len));
-			}
-
-			subroutine_uniforms_base += num_subroutine_uniforms;
-			subroutines_base += num_subroutines;
-		}
+	if (retrievable && !from_binary) {
+		cache_entry = MGLContext_get_program_binary(self, program_obj);
+	} else {
+		Py_INCREF(Py_None);
 	}
 
-	PyObject * result = PyTuple_New(6);
+	PyObject * result = PyTuple_New(7);
 	PyTuple_SET_ITEM(result, 0, (PyObject *)compute_shader);
 	PyTuple_SET_ITEM(result, 1, uniforms_lst);
 	PyTuple_SET_ITEM(result, 2, uniform_blocks_lst);
-	PyTuple_SET_ITEM(result, 3, subroutines_lst);
-	PyTuple_SET_ITEM(result, 4, subroutine_uniforms_lst);
-	PyTuple_SET_ITEM(result, 5, PyLong_FromLong(compute_shader->program_obj));
+	PyTuple_SET_ITEM(result, 3, storage_blocks_lst);
+	PyTuple_SET_ITEM(result, 4, PyLong_FromLong(compute_shader->program_obj));
+	PyTuple_SET_ITEM(result, 5, reflection);
+	PyTuple_SET_ITEM(result, 6, cache_entry);
 	return result;
 }
 
@@ -264,7 +208,7 @@ PyObject * MGLComputeShader_run(MGLComputeShader * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program_obj);
+	MGLContext_use_program(self->context, self->program_obj);
 	gl.DispatchCompute(x, y, z);
 
 	Py_RETURN_NONE;
@@ -131,6 +131,26 @@ PyObject * MGLContext_finish(MGLContext * self) {
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLContext_memory_barrier(MGLContext * self, PyObject * args) {
+	unsigned barriers;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"I",
+		&barriers
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (self->gl.MemoryBarrier) {
+		self->gl.MemoryBarrier(barriers);
+	}
+
+	Py_RETURN_NONE;
+}
+
 PyObject * MGLContext_copy_buffer(MGLContext * self, PyObject * args) {
 	MGLBuffer * dst;
 	MGLBuffer * src;
@@ -229,7 +249,8 @@ PyObject * MGLContext_copy_framebuffer(MGLContext * self, PyObject * args) {
 			GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT,
 			GL_NEAREST
 		);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->bound_framebuffer->framebuffer_obj);
+		self->state.framebuffer = -1;
+		MGLContext_bind_framebuffer(self, self->bound_framebuffer->framebuffer_obj);
 
 	} else if (Py_TYPE(dst) == &MGLTexture_Type) {
 
@@ -262,7 +283,8 @@ PyObject * MGLContext_copy_framebuffer(MGLContext * self, PyObject * args) {
 
 		gl.BindFramebuffer(GL_READ_FRAMEBUFFER, src->framebuffer_obj);
 		gl.CopyTexImage2D(texture_target, 0, format, 0, 0, width, height, 0);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->bound_framebuffer->framebuffer_obj);
+		self->state.framebuffer = -1;
+		MGLContext_bind_framebuffer(self, self->bound_framebuffer->framebuffer_obj);
 
 	} else {
 
@@ -291,6 +313,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 
 	int bound_framebuffer = 0;
 	gl.GetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING, &bound_framebuffer);
+	self->state.framebuffer = bound_framebuffer;
 
 	int framebuffer_obj = bound_framebuffer;
 	if (glo != Py_None) {
@@ -315,7 +338,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 		return result;
 	}
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, framebuffer_obj);
+	MGLContext_bind_framebuffer(self, framebuffer_obj);
 
 	int num_color_attachments = self->max_color_attachments;
 
@@ -346,8 +369,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 			break;
 		}
 		case GL_TEXTURE: {
-			gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
-			gl.BindTexture(GL_TEXTURE_2D, color_attachment_name);
+			MGLContext_bind_texture(self, self->default_texture_unit, GL_TEXTURE_2D, color_attachment_name);
 			gl.GetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_WIDTH, &width);
 			gl.GetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_HEIGHT, &height);
 			break;
@@ -388,7 +410,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 	framebuffer->width = width;
 	framebuffer->height = height;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, bound_framebuffer);
+	MGLContext_bind_framebuffer(self, bound_framebuffer);
 
 	Py_INCREF(framebuffer);
 
@@ -427,30 +449,117 @@ PyObject * MGLContext_clear_samplers(MGLContext * self, PyObject * args) {
 		end = min(end, self->max_texture_units);
 	}
 
+	for(int i = start; i < end; i++) {
+		MGLContext_bind_sampler(self, i, 0);
+	}
+
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_sync_state(MGLContext * self) {
 	const GLMethods & gl = self->gl;
 
-	for(int i = start; i < end; i++) {
-		gl.BindSampler(i, 0);
+	self->enable_flags = 0;
+
+	if (gl.IsEnabled(GL_BLEND)) {
+		self->enable_flags |= MGL_BLEND;
+	}
+
+	if (gl.IsEnabled(GL_DEPTH_TEST)) {
+		self->enable_flags |= MGL_DEPTH_TEST;
+	}
+
+	if (gl.IsEnabled(GL_CULL_FACE)) {
+		self->enable_flags |= MGL_CULL_FACE;
+	}
+
+	if (gl.IsEnabled(GL_RASTERIZER_DISCARD)) {
+		self->enable_flags |= MGL_RASTERIZER_DISCARD;
 	}
 
+	gl.GetIntegerv(GL_FRONT_FACE, &self->front_face);
+	gl.GetIntegerv(GL_DEPTH_FUNC, &self->depth_func);
+
+	gl.GetIntegerv(GL_BLEND_SRC_RGB, &self->blend_func_src);
+	gl.GetIntegerv(GL_BLEND_DST_RGB, &self->blend_func_dst);
+	gl.GetIntegerv(GL_BLEND_SRC_ALPHA, &self->blend_func_src_alpha);
+	gl.GetIntegerv(GL_BLEND_DST_ALPHA, &self->blend_func_dst_alpha);
+	gl.GetIntegerv(GL_BLEND_EQUATION_RGB, &self->blend_equation_rgb);
+	gl.GetIntegerv(GL_BLEND_EQUATION_ALPHA, &self->blend_equation_alpha);
+
+	// the polygon mode may be returned for the front and back faces
+	int polygon_mode[2] = {GL_FILL, GL_FILL};
+	gl.GetIntegerv(GL_POLYGON_MODE, polygon_mode);
+	self->wireframe = polygon_mode[0] == GL_LINE;
+
+	self->multisample = gl.IsEnabled(GL_MULTISAMPLE) ? true : false;
+	gl.GetIntegerv(GL_PROVOKING_VERTEX, &self->provoking_vertex);
+
+	gl.GetFloatv(GL_LINE_WIDTH, &self->line_width);
+	gl.GetFloatv(GL_POINT_SIZE, &self->point_size);
+
+	if (self->version_code >= 400) {
+		gl.GetIntegerv(GL_PATCH_VERTICES, &self->patch_vertices);
+	}
+
+	// the viewport and the scissor belong to the bound framebuffer
+	MGLFramebuffer * framebuffer = self->bound_framebuffer;
+
+	int viewport[4] = {};
+	gl.GetIntegerv(GL_VIEWPORT, viewport);
+
+	framebuffer->viewport_x = viewport[0];
+	framebuffer->viewport_y = viewport[1];
+	framebuffer->viewport_width = viewport[2];
+	framebuffer->viewport_height = viewport[3];
+
+	if (gl.IsEnabled(GL_SCISSOR_TEST)) {
+		int scissor_box[4] = {};
+		gl.GetIntegerv(GL_SCISSOR_BOX, scissor_box);
+
+		framebuffer->scissor_enabled = true;
+		framebuffer->scissor_x = scissor_box[0];
+		framebuffer->scissor_y = scissor_box[1];
+		framebuffer->scissor_width = scissor_box[2];
+		framebuffer->scissor_height = scissor_box[3];
+	} else {
+		framebuffer->scissor_enabled = false;
+		framebuffer->scissor_x = 0;
+		framebuffer->scissor_y = 0;
+		framebuffer->scissor_width = framebuffer->width;
+		framebuffer->scissor_height = framebuffer->height;
+	}
+
+	MGLContext_reset_state_cache(self);
+
 	Py_RETURN_NONE;
 }
 
 PyObject * MGLContext_buffer(MGLContext * self, PyObject * args);
+PyObject * MGLContext_stream_buffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture3d(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture_array(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture_cube(MGLContext * self, PyObject * args);
 PyObject * MGLContext_depth_texture(MGLContext * self, PyObject * args);
 PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args);
+PyObject * MGLContext_vertex_layout(MGLContext * self, PyObject * args);
 PyObject * MGLContext_program(MGLContext * self, PyObject * args);
+PyObject * MGLContext_program_pipeline(MGLContext * self, PyObject * args);
 PyObject * MGLContext_framebuffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_renderbuffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_depth_renderbuffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_compute_shader(MGLContext * self, PyObject * args);
 PyObject * MGLContext_query(MGLContext * self, PyObject * args);
+PyObject * MGLContext_transform_feedback(MGLContext * self, PyObject * args);
+PyObject * MGLContext_program_submit(MGLContext * self, PyObject * args);
 PyObject * MGLContext_scope(MGLContext * self, PyObject * args);
 PyObject * MGLContext_sampler(MGLContext * self, PyObject * args);
+PyObject * MGLContext_record_begin(MGLContext * self);
+PyObject * MGLContext_record_end(MGLContext * self);
+PyObject * MGLContext_replay(MGLContext * self, PyObject * args);
+PyObject * MGLContext_invalidate_state_cache(MGLContext * self);
+PyObject * MGLContext_get_skipped_uniform_writes(MGLContext * self);
 
 PyObject * MGLContext_release(MGLContext * self) {
 	// TODO:
@@ -463,25 +572,36 @@ PyMethodDef MGLContext_tp_methods[] = {
 	{"enable", (PyCFunction)MGLContext_enable, METH_VARARGS, 0},
 	{"disable", (PyCFunction)MGLContext_disable, METH_VARARGS, 0},
 	{"finish", (PyCFunction)MGLContext_finish, METH_NOARGS, 0},
+	{"memory_barrier", (PyCFunction)MGLContext_memory_barrier, METH_VARARGS, 0},
 	{"copy_buffer", (PyCFunction)MGLContext_copy_buffer, METH_VARARGS, 0},
 	{"copy_framebuffer", (PyCFunction)MGLContext_copy_framebuffer, METH_VARARGS, 0},
 	{"detect_framebuffer", (PyCFunction)MGLContext_detect_framebuffer, METH_VARARGS, 0},
 	{"clear_samplers", (PyCFunction)MGLContext_clear_samplers, METH_VARARGS, 0},
+	{"sync_state", (PyCFunction)MGLContext_sync_state, METH_NOARGS, 0},
+	{"record_begin", (PyCFunction)MGLContext_record_begin, METH_NOARGS, 0},
+	{"record_end", (PyCFunction)MGLContext_record_end, METH_NOARGS, 0},
+	{"replay", (PyCFunction)MGLContext_replay, METH_VARARGS, 0},
+	{"invalidate_state_cache", (PyCFunction)MGLContext_invalidate_state_cache, METH_NOARGS, 0},
 
 	{"buffer", (PyCFunction)MGLContext_buffer, METH_VARARGS, 0},
+	{"stream_buffer", (PyCFunction)MGLContext_stream_buffer, METH_VARARGS, 0},
 	{"texture", (PyCFunction)MGLContext_texture, METH_VARARGS, 0},
 	{"texture3d", (PyCFunction)MGLContext_texture3d, METH_VARARGS, 0},
 	{"texture_array", (PyCFunction)MGLContext_texture_array, METH_VARARGS, 0},
 	{"texture_cube", (PyCFunction)MGLContext_texture_cube, METH_VARARGS, 0},
 	{"depth_texture", (PyCFunction)MGLContext_depth_texture, METH_VARARGS, 0},
 	{"vertex_array", (PyCFunction)MGLContext_vertex_array, METH_VARARGS, 0},
+	{"vertex_layout", (PyCFunction)MGLContext_vertex_layout, METH_VARARGS, 0},
 	{"program", (PyCFunction)MGLContext_program, METH_VARARGS, 0},
+	{"program_pipeline", (PyCFunction)MGLContext_program_pipeline, METH_VARARGS, 0},
 	// {"shader", (PyCFunction)MGLContext_shader, METH_VARARGS, 0},
 	{"framebuffer", (PyCFunction)MGLContext_framebuffer, METH_VARARGS, 0},
 	{"renderbuffer", (PyCFunction)MGLContext_renderbuffer, METH_VARARGS, 0},
 	{"depth_renderbuffer", (PyCFunction)MGLContext_depth_renderbuffer, METH_VARARGS, 0},
 	{"compute_shader", (PyCFunction)MGLContext_compute_shader, METH_VARARGS, 0},
 	{"query", (PyCFunction)MGLContext_query, METH_VARARGS, 0},
+	{"transform_feedback", (PyCFunction)MGLContext_transform_feedback, METH_VARARGS, 0},
+	{"program_submit", (PyCFunction)MGLContext_program_submit, METH_VARARGS, 0},
 	{"scope", (PyCFunction)MGLContext_scope, METH_VARARGS, 0},
 	{"sampler", (PyCFunction)MGLContext_sampler, METH_VARARGS, 0},
 
@@ -491,11 +611,7 @@ PyMethodDef MGLContext_tp_methods[] = {
 };
 
 PyObject * MGLContext_get_line_width(MGLContext * self) {
-	float line_width = 0.0f;
-
-	self->gl.GetFloatv(GL_LINE_WIDTH, &line_width);
-
-	return PyFloat_FromDouble(line_width);
+	return PyFloat_FromDouble(self->line_width);
 }
 
 int MGLContext_set_line_width(MGLContext * self, PyObject * value) {
@@ -505,17 +621,14 @@ int MGLContext_set_line_width(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
+	self->line_width = line_width;
 	self->gl.LineWidth(line_width);
 
 	return 0;
 }
 
 PyObject * MGLContext_get_point_size(MGLContext * self) {
-	float point_size = 0.0f;
-
-	self->gl.GetFloatv(GL_POINT_SIZE, &point_size);
-
-	return PyFloat_FromDouble(point_size);
+	return PyFloat_FromDouble(self->point_size);
 }
 
 int MGLContext_set_point_size(MGLContext * self, PyObject * value) {
@@ -525,16 +638,18 @@ int MGLContext_set_point_size(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
+	self->point_size = point_size;
 	self->gl.PointSize(point_size);
 
 	return 0;
 }
 
-// NOTE: currently never called from python
 PyObject * MGLContext_get_blend_func(MGLContext * self) {
-	PyObject * res = PyTuple_New(2);
+	PyObject * res = PyTuple_New(4);
 	PyTuple_SET_ITEM(res, 0, PyLong_FromLong(self->blend_func_src));
 	PyTuple_SET_ITEM(res, 1, PyLong_FromLong(self->blend_func_dst));
+	PyTuple_SET_ITEM(res, 2, PyLong_FromLong(self->blend_func_src_alpha));
+	PyTuple_SET_ITEM(res, 3, PyLong_FromLong(self->blend_func_dst_alpha));
 	return res;
 }
 
@@ -560,16 +675,19 @@ int MGLContext_set_blend_func(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
+	self->blend_func_src = src_rgb;
+	self->blend_func_dst = dst_rgb;
+	self->blend_func_src_alpha = src_alpha;
+	self->blend_func_dst_alpha = dst_alpha;
 	self->gl.BlendFuncSeparate(src_rgb, dst_rgb, src_alpha, dst_alpha);
 
 	return 0;
 }
 
-// NOTE: currently never called from python
 PyObject * MGLContext_get_blend_equation(MGLContext * self) {
 	PyObject * res = PyTuple_New(2);
-	PyTuple_SET_ITEM(res, 0, PyLong_FromLong(GL_FUNC_ADD));
-	PyTuple_SET_ITEM(res, 1, PyLong_FromLong(GL_FUNC_ADD));
+	PyTuple_SET_ITEM(res, 0, PyLong_FromLong(self->blend_equation_rgb));
+	PyTuple_SET_ITEM(res, 1, PyLong_FromLong(self->blend_equation_alpha));
 	return res;
 }
 
@@ -591,6 +709,8 @@ int MGLContext_set_blend_equation(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
+	self->blend_equation_rgb = mode_rgb;
+	self->blend_equation_alpha = mode_alpha;
 	self->gl.BlendEquationSeparate(mode_rgb, mode_alpha);
 
 	return 0;
@@ -636,8 +756,8 @@ int MGLContext_set_multisample(MGLContext * self, PyObject * value) {
 	return -1;
 }
 
-int MGLContext_get_provoking_vertex(MGLContext * self) {
-	return self->provoking_vertex;
+PyObject * MGLContext_get_provoking_vertex(MGLContext * self) {
+	return PyLong_FromLong(self->provoking_vertex);
 }
 
 int MGLContext_set_provoking_vertex(MGLContext * self, PyObject * value) {
@@ -745,11 +865,7 @@ int MGLContext_set_front_face(MGLContext * self, PyObject * value) {
 }
 
 PyObject * MGLContext_get_patch_vertices(MGLContext * self) {
-	int patch_vertices = 0;
-
-	self->gl.GetIntegerv(GL_PATCH_VERTICES, &patch_vertices);
-
-	return PyLong_FromLong(patch_vertices);
+	return PyLong_FromLong(self->patch_vertices);
 }
 
 int MGLContext_set_patch_vertices(MGLContext * self, PyObject * value) {
@@ -763,6 +879,7 @@ int MGLContext_set_patch_vertices(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
+	self->patch_vertices = patch_vertices;
 	self->gl.PatchParameteri(GL_PATCH_VERTICES, patch_vertices);
 
 	return 0;
@@ -1329,6 +1446,7 @@ PyGetSetDef MGLContext_tp_getseters[] = {
 
 	{(char *)"info", (getter)MGLContext_get_info, 0, 0, 0},
 	{(char *)"error", (getter)MGLContext_get_error, 0, 0, 0},
+	{(char *)"skipped_uniform_writes", (getter)MGLContext_get_skipped_uniform_writes, 0, 0, 0},
 	{0},
 };
 
@@ -146,7 +146,7 @@ PyObject * MGLContext_framebuffer(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self, framebuffer->framebuffer_obj);
 
 	for (int i = 0; i < color_attachments_len; ++i) {
 		PyObject * item = PyTuple_GET_ITEM(color_attachments, i);
@@ -200,7 +200,7 @@ PyObject * MGLContext_framebuffer(MGLContext * self, PyObject * args) {
 
 	int status = gl.CheckFramebufferStatus(GL_FRAMEBUFFER);
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self, self->bound_framebuffer->framebuffer_obj);
 
 	if (status != GL_FRAMEBUFFER_COMPLETE) {
 		const char * message = "the framebuffer is not complete";
@@ -387,19 +387,33 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 
 	}
 
-	const GLMethods & gl = self->context->gl;
+	float color[4] = {r, g, b, a};
+	int viewport_rect[4] = {x, y, width, height};
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	if (self->context->recording) {
+		int record[11] = {MGLContext_record_object(self->context, (PyObject *)self), 0, 0, 0, 0, 0, viewport != Py_None, x, y, width, height};
+		memcpy(record + 1, color, sizeof(color));
+		memcpy(record + 5, &depth, sizeof(depth));
+		MGLContext_record(self->context, MGL_RECORD_FRAMEBUFFER_CLEAR, record, 11);
+	}
 
-	if (self->framebuffer_obj) {
+	MGLFramebuffer_clear_core(self, color, depth, viewport != Py_None ? viewport_rect : 0);
+	Py_RETURN_NONE;
+}
+
+void MGLFramebuffer_clear_core(MGLFramebuffer * self, const float * color, float depth, const int * viewport) {
+	const GLMethods & gl = self->context->gl;
+
+	if (MGLContext_bind_framebuffer(self->context, self->framebuffer_obj) && self->framebuffer_obj) {
 		gl.DrawBuffers(self->draw_buffers_len, self->draw_buffers);
 	}
 
-	gl.ClearColor(r, g, b, a);
+	gl.ClearColor(color[0], color[1], color[2], color[3]);
 	gl.ClearDepth(depth);
 
 	for (int i = 0; i < self->draw_buffers_len; ++i) {
-		gl.ColorMaski(
+		MGLContext_color_mask(
+			self->context,
 			i,
 			self->color_mask[i * 4 + 0],
 			self->color_mask[i * 4 + 1],
@@ -408,28 +422,24 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 		);
 	}
 
-	gl.DepthMask(self->depth_mask);
+	MGLContext_depth_mask(self->context, self->depth_mask);
 
 	// Respect the passed in viewport even with scissor enabled
-	if (viewport != Py_None) {
-		gl.Enable(GL_SCISSOR_TEST);
-		gl.Scissor(x, y, width, height);
+	if (viewport) {
+		MGLContext_scissor(self->context, true, viewport[0], viewport[1], viewport[2], viewport[3]);
 		gl.Clear(GL_DEPTH_BUFFER_BIT | GL_COLOR_BUFFER_BIT);
 
 		// restore scissor if enabled
-		if (self->scissor_enabled) {
-			gl.Scissor(
-				self->scissor_x, self->scissor_y,
-				self->scissor_width, self->scissor_height
-			);
-		} else {
-			gl.Disable(GL_SCISSOR_TEST);
-		}
+		MGLContext_scissor(
+			self->context, self->scissor_enabled,
+			self->scissor_x, self->scissor_y,
+			self->scissor_width, self->scissor_height
+		);
 	} else {
 		// clear with scissor if enabled
 		if (self->scissor_enabled) {
-			gl.Enable(GL_SCISSOR_TEST);
-			gl.Scissor(
+			MGLContext_scissor(
+				self->context, true,
 				self->scissor_x, self->scissor_y,
 				self->scissor_width, self->scissor_height
 			);
@@ -437,22 +447,30 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 		gl.Clear(GL_DEPTH_BUFFER_BIT | GL_COLOR_BUFFER_BIT);
 	}
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
+}
+
+PyObject * MGLFramebuffer_use(MGLFramebuffer * self) {
+	if (self->context->recording) {
+		int record[1] = {MGLContext_record_object(self->context, (PyObject *)self)};
+		MGLContext_record(self->context, MGL_RECORD_FRAMEBUFFER_USE, record, 1);
+	}
 
+	MGLFramebuffer_use_core(self);
 	Py_RETURN_NONE;
 }
 
-PyObject * MGLFramebuffer_use(MGLFramebuffer * self) {
+void MGLFramebuffer_use_core(MGLFramebuffer * self) {
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
-
-	if (self->framebuffer_obj) {
+	// the draw buffers are part of the framebuffer object
+	if (MGLContext_bind_framebuffer(self->context, self->framebuffer_obj) && self->framebuffer_obj) {
 		gl.DrawBuffers(self->draw_buffers_len, self->draw_buffers);
 	}
 
 	if (self->viewport_width && self->viewport_height) {
-		gl.Viewport(
+		MGLContext_viewport(
+			self->context,
 			self->viewport_x,
 			self->viewport_y,
 			self->viewport_width,
@@ -460,18 +478,15 @@ PyObject * MGLFramebuffer_use(MGLFramebuffer * self) {
 		);
 	}
 
-	if (self->scissor_enabled) {
-		gl.Enable(GL_SCISSOR_TEST);
-		gl.Scissor(
-			self->scissor_x, self->scissor_y,
-			self->scissor_width, self->scissor_height
-		);
-	} else {
-		gl.Disable(GL_SCISSOR_TEST);
-	}
+	MGLContext_scissor(
+		self->context, self->scissor_enabled,
+		self->scissor_x, self->scissor_y,
+		self->scissor_width, self->scissor_height
+	);
 
 	for (int i = 0; i < self->draw_buffers_len; ++i) {
-		gl.ColorMaski(
+		MGLContext_color_mask(
+			self->context,
 			i,
 			self->color_mask[i * 4 + 0],
 			self->color_mask[i * 4 + 1],
@@ -480,13 +495,11 @@ PyObject * MGLFramebuffer_use(MGLFramebuffer * self) {
 		);
 	}
 
-	gl.DepthMask(self->depth_mask);
+	MGLContext_depth_mask(self->context, self->depth_mask);
 
 	Py_INCREF(self);
 	Py_DECREF(self->context->bound_framebuffer);
 	self->context->bound_framebuffer = self;
-
-	Py_RETURN_NONE;
 }
 
 PyObject * MGLFramebuffer_read(MGLFramebuffer * self, PyObject * args) {
@@ -586,7 +599,7 @@ PyObject * MGLFramebuffer_read(MGLFramebuffer * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 	// if (self->framebuffer_obj) {
 	gl.ReadBuffer(read_depth ? GL_NONE : (GL_COLOR_ATTACHMENT0 + attachment));
 	// } else {
@@ -596,7 +609,7 @@ PyObject * MGLFramebuffer_read(MGLFramebuffer * self, PyObject * args) {
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 	gl.ReadPixels(x, y, width, height, base_format, pixel_type, data);
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 	return result;
 }
@@ -703,12 +716,12 @@ PyObject * MGLFramebuffer_read_into(MGLFramebuffer * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 		gl.ReadBuffer(read_depth ? GL_NONE : (GL_COLOR_ATTACHMENT0 + attachment));
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.ReadPixels(x, y, width, height, base_format, pixel_type, (void *)write_offset);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, 0);
 
 	} else {
@@ -731,12 +744,12 @@ PyObject * MGLFramebuffer_read_into(MGLFramebuffer * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 		gl.ReadBuffer(read_depth ? GL_NONE : (GL_COLOR_ATTACHMENT0 + attachment));
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.ReadPixels(x, y, width, height, base_format, pixel_type, ptr);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 		PyBuffer_Release(&buffer_view);
 	}
@@ -783,9 +796,8 @@ int MGLFramebuffer_set_viewport(MGLFramebuffer * self, PyObject * value, void *
 	self->viewport_height = viewport_height;
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-
-		gl.Viewport(
+		MGLContext_viewport(
+			self->context,
 			self->viewport_x,
 			self->viewport_y,
 			self->viewport_width,
@@ -836,15 +848,9 @@ int MGLFramebuffer_set_scissor(MGLFramebuffer * self, PyObject * value, void * c
 	self->scissor_enabled = MGLFramebuffer_scissor_enabled(self);
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-
-		if (self->scissor_enabled) {
-			gl.Enable(GL_SCISSOR_TEST);
-		} else {
-			gl.Disable(GL_SCISSOR_TEST);
-		}
-
-		gl.Scissor(
+		MGLContext_scissor(
+			self->context,
+			self->scissor_enabled,
 			self->scissor_x,
 			self->scissor_y,
 			self->scissor_width,
@@ -979,10 +985,9 @@ int MGLFramebuffer_set_color_mask(MGLFramebuffer * self, PyObject * value, void
 	}
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-
 		for (int i = 0; i < self->draw_buffers_len; ++i) {
-			gl.ColorMaski(
+			MGLContext_color_mask(
+				self->context,
 				i,
 				self->color_mask[i * 4 + 0],
 				self->color_mask[i * 4 + 1],
@@ -1010,8 +1015,7 @@ int MGLFramebuffer_set_depth_mask(MGLFramebuffer * self, PyObject * value, void
 	}
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-		gl.DepthMask(self->depth_mask);
+		MGLContext_depth_mask(self->context, self->depth_mask);
 	}
 
 	return 0;
@@ -1032,14 +1036,14 @@ PyObject * MGLFramebuffer_get_bits(MGLFramebuffer * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE, &red_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE, &green_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE, &blue_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE, &alpha_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_DEPTH, GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE, &depth_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_STENCIL, GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE, &stencil_bits);
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 	PyObject * red_obj = PyLong_FromLong(red_bits);
 	PyObject * green_obj = PyLong_FromLong(green_bits);
@@ -1127,6 +1131,7 @@ void MGLFramebuffer_Invalidate(MGLFramebuffer * framebuffer) {
 
 	if (framebuffer->framebuffer_obj) {
 		framebuffer->context->gl.DeleteFramebuffers(1, (GLuint *)&framebuffer->framebuffer_obj);
+		MGLContext_forget_framebuffer(framebuffer->context, framebuffer->framebuffer_obj);
 		Py_DECREF(framebuffer->context);
 	}
 
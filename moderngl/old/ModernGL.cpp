@@ -256,11 +256,39 @@ PyObject * create_context(PyObject * self, PyObject * args) {
 	ctx->depth_func = GL_LEQUAL;
 	ctx->blend_func_src = GL_SRC_ALPHA;
 	ctx->blend_func_dst = GL_ONE_MINUS_SRC_ALPHA;
+	ctx->blend_func_src_alpha = GL_SRC_ALPHA;
+	ctx->blend_func_dst_alpha = GL_ONE_MINUS_SRC_ALPHA;
+	ctx->blend_equation_rgb = GL_FUNC_ADD;
+	ctx->blend_equation_alpha = GL_FUNC_ADD;
 
 	ctx->wireframe = false;
 	ctx->multisample = true;
 
 	ctx->provoking_vertex = GL_LAST_VERTEX_CONVENTION;
+
+	ctx->line_width = 1.0f;
+	gl.GetFloatv(GL_LINE_WIDTH, &ctx->line_width);
+
+	ctx->point_size = 1.0f;
+	gl.GetFloatv(GL_POINT_SIZE, &ctx->point_size);
+
+	ctx->patch_vertices = 3;
+	if (ctx->version_code >= 400) {
+		gl.GetIntegerv(GL_PATCH_VERTICES, &ctx->patch_vertices);
+	}
+
+	ctx->recorded_objects = 0;
+	ctx->recorded_index = 0;
+	ctx->record_data = 0;
+	ctx->record_size = 0;
+	ctx->record_capacity = 0;
+	ctx->recording = false;
+
+	ctx->parallel_shader_compile_checked = false;
+	ctx->parallel_shader_compile = false;
+
+	MGLContext_init_state_cache(ctx);
+
 	gl.GetError(); // clear errors
 
 	if (PyErr_Occurred()) {
@@ -470,6 +498,17 @@ bool MGL_InitializeModule(PyObject * module) {
 		PyModule_AddObject(module, "VertexArray", (PyObject *)&MGLVertexArray_Type);
 	}
 
+	{
+		if (PyType_Ready(&MGLVertexLayout_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register VertexLayout in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLVertexLayout_Type);
+
+		PyModule_AddObject(module, "VertexLayout", (PyObject *)&MGLVertexLayout_Type);
+	}
+
 	{
 		if (PyType_Ready(&MGLSampler_Type) < 0) {
 			PyErr_Format(PyExc_ImportError, "Cannot register Sampler in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
@@ -481,6 +520,39 @@ bool MGL_InitializeModule(PyObject * module) {
 		PyModule_AddObject(module, "Sampler", (PyObject *)&MGLSampler_Type);
 	}
 
+	{
+		if (PyType_Ready(&MGLTransformFeedback_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register TransformFeedback in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLTransformFeedback_Type);
+
+		PyModule_AddObject(module, "TransformFeedback", (PyObject *)&MGLTransformFeedback_Type);
+	}
+
+	{
+		if (PyType_Ready(&MGLPendingProgram_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register PendingProgram in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLPendingProgram_Type);
+
+		PyModule_AddObject(module, "PendingProgram", (PyObject *)&MGLPendingProgram_Type);
+	}
+
+	{
+		if (PyType_Ready(&MGLStorageBlock_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register StorageBlock in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLStorageBlock_Type);
+
+		PyModule_AddObject(module, "StorageBlock", (PyObject *)&MGLStorageBlock_Type);
+	}
+
 	return true;
 }
 
@@ -2160,3 +2160,17 @@ typedef void(GLAPI * PFNGLMULTIDRAWARRAYSINDIRECTCOUNTPROC)(GLenum mode, const v
 typedef void(GLAPI * PFNGLMULTIDRAWELEMENTSINDIRECTCOUNTPROC)(GLenum mode, GLenum type, const void * indirect, GLintptr drawcount, GLsizei maxdrawcount, GLsizei stride);
 typedef void(GLAPI * PFNGLPOLYGONOFFSETCLAMPPROC)(GLfloat factor, GLfloat units, GLfloat clamp);
 #endif
+
+#ifndef GL_KHR_parallel_shader_compile
+#define GL_KHR_parallel_shader_compile 1
+#define GL_MAX_SHADER_COMPILER_THREADS_KHR 0x91B0
+#define GL_COMPLETION_STATUS_KHR 0x91B1
+typedef void(GLAPI * PFNGLMAXSHADERCOMPILERTHREADSKHRPROC)(GLuint count);
+#endif
+
+#ifndef GL_ARB_parallel_shader_compile
+#define GL_ARB_parallel_shader_compile 1
+#define GL_MAX_SHADER_COMPILER_THREADS_ARB 0x91B0
+#define GL_COMPLETION_STATUS_ARB 0x91B1
+typedef void(GLAPI * PFNGLMAXSHADERCOMPILERTHREADSARBPROC)(GLuint count);
+#endif
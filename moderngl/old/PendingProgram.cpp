@@ -0,0 +1,209 @@
+#include "Types.hpp"
+
+// The pending program is a linked program whose status was not queried yet.
+// Querying the status waits for the compiler, submitting many programs first lets
+// the driver compile them in parallel when GL_KHR_parallel_shader_compile is supported.
+
+// The extension strings are checked, some drivers export the entry points without supporting the extension.
+bool MGLContext_enable_parallel_shader_compile(MGLContext * self) {
+	const GLMethods & gl = self->gl;
+
+	int num_extensions = 0;
+	gl.GetIntegerv(GL_NUM_EXTENSIONS, &num_extensions);
+
+	for (int i = 0; i < num_extensions; ++i) {
+		const char * extension = (const char *)gl.GetStringi(GL_EXTENSIONS, i);
+
+		if (!extension) {
+			continue;
+		}
+
+		if (!strcmp(extension, "GL_KHR_parallel_shader_compile") && gl.MaxShaderCompilerThreadsKHR) {
+			gl.MaxShaderCompilerThreadsKHR(0xFFFFFFFF);
+			return true;
+		}
+
+		if (!strcmp(extension, "GL_ARB_parallel_shader_compile") && gl.MaxShaderCompilerThreadsARB) {
+			gl.MaxShaderCompilerThreadsARB(0xFFFFFFFF);
+			return true;
+		}
+	}
+
+	return false;
+}
+
+PyObject * MGLContext_program_submit(MGLContext * self, PyObject * args) {
+	PyObject * shaders[5];
+	PyObject * outputs;
+	int separate;
+	int retrievable;
+	int lazy;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOOOOOppp",
+		&shaders[0],
+		&shaders[1],
+		&shaders[2],
+		&shaders[3],
+		&shaders[4],
+		&outputs,
+		&separate,
+		&retrievable,
+		&lazy
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (!MGLProgram_check_varyings(outputs)) {
+		return 0;
+	}
+
+	if (!self->parallel_shader_compile_checked) {
+		self->parallel_shader_compile = MGLContext_enable_parallel_shader_compile(self);
+		self->parallel_shader_compile_checked = true;
+	}
+
+	MGLPendingProgram * pending = (MGLPendingProgram *)MGLPendingProgram_Type.tp_alloc(&MGLPendingProgram_Type, 0);
+
+	pending->program_obj = MGLContext_submit_program(self, shaders, outputs, separate, retrievable, 0, pending->shader_objs);
+
+	if (!pending->program_obj) {
+		Py_DECREF(pending);
+		return 0;
+	}
+
+	pending->shaders = PyTuple_New(NUM_SHADER_SLOTS);
+
+	for (int i = 0; i < NUM_SHADER_SLOTS; ++i) {
+		Py_INCREF(shaders[i]);
+		PyTuple_SET_ITEM(pending->shaders, i, shaders[i]);
+	}
+
+	pending->separate = separate;
+	pending->retrievable = retrievable;
+	pending->lazy = lazy;
+	pending->resolved = false;
+
+	Py_INCREF(self);
+	pending->context = self;
+
+	return (PyObject *)pending;
+}
+
+PyObject * MGLPendingProgram_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLPendingProgram * self = (MGLPendingProgram *)type->tp_alloc(type, 0);
+
+	if (self) {
+	}
+
+	return (PyObject *)self;
+}
+
+// A program that was never resolved is deleted with the pending program.
+void MGLPendingProgram_tp_dealloc(MGLPendingProgram * self) {
+	if (self->context && !self->resolved) {
+		const GLMethods & gl = self->context->gl;
+
+		for (int i = 0; i < NUM_SHADER_SLOTS; ++i) {
+			if (self->shader_objs[i]) {
+				gl.DeleteShader(self->shader_objs[i]);
+			}
+		}
+
+		gl.DeleteProgram(self->program_obj);
+	}
+
+	Py_XDECREF(self->shaders);
+	Py_XDECREF(self->context);
+	MGLPendingProgram_Type.tp_free((PyObject *)self);
+}
+
+// Waits for the compiler and returns the same tuple as MGLContext_program.
+PyObject * MGLPendingProgram_resolve(MGLPendingProgram * self) {
+	if (self->resolved) {
+		MGLError_Set("the program was already resolved");
+		return 0;
+	}
+
+	self->resolved = true;
+
+	if (!MGLContext_check_program(self->context, self->program_obj, self->shader_objs)) {
+		return 0;
+	}
+
+	PyObject * shaders[NUM_SHADER_SLOTS];
+
+	for (int i = 0; i < NUM_SHADER_SLOTS; ++i) {
+		shaders[i] = PyTuple_GET_ITEM(self->shaders, i);
+	}
+
+	return MGLContext_finish_program(self->context, self->program_obj, shaders, self->separate, 0, self->retrievable, self->lazy);
+}
+
+PyMethodDef MGLPendingProgram_tp_methods[] = {
+	{"resolve", (PyCFunction)MGLPendingProgram_resolve, METH_NOARGS, 0},
+	{0},
+};
+
+// Without the parallel shader compile extensions the program is always reported as ready.
+PyObject * MGLPendingProgram_get_ready(MGLPendingProgram * self) {
+	const GLMethods & gl = self->context->gl;
+
+	if (self->resolved || !self->context->parallel_shader_compile) {
+		Py_RETURN_TRUE;
+	}
+
+	int completed = GL_TRUE;
+	gl.GetProgramiv(self->program_obj, GL_COMPLETION_STATUS_KHR, &completed);
+
+	return PyBool_FromLong(completed);
+}
+
+PyGetSetDef MGLPendingProgram_tp_getseters[] = {
+	{(char *)"ready", (getter)MGLPendingProgram_get_ready, 0, 0, 0},
+	{0},
+};
+
+PyTypeObject MGLPendingProgram_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.PendingProgram",                                   // tp_name
+	sizeof(MGLPendingProgram),                              // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLPendingProgram_tp_dealloc,               // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	0,                                                      // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	MGLPendingProgram_tp_methods,                           // tp_methods
+	0,                                                      // tp_members
+	MGLPendingProgram_tp_getseters,                         // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	MGLPendingProgram_tp_new,                               // tp_new
+};
@@ -2,41 +2,745 @@
 
 #include "InlineMethods.hpp"
 
-PyObject * MGLContext_program(MGLContext * self, PyObject * args) {
-	PyObject * shaders[5];
-	PyObject * outputs;
+// The reflection of a program is built from plain tuples that can be stored in the program cache.
+// The member objects are created from the reflection, the introspection queries are skipped for cached programs.
+
+PyObject * MGLProgram_query_uniforms(const GLMethods & gl, int program_obj) {
+	int num_uniforms = 0;
+	gl.GetProgramiv(program_obj, GL_ACTIVE_UNIFORMS, &num_uniforms);
+
+	PyObject * uniforms = PyTuple_New(num_uniforms);
+
+	int uniform_counter = 0;
+	for (int i = 0; i < num_uniforms; ++i) {
+		int type = 0;
+		int array_length = 0;
+		int name_len = 0;
+		char name[256];
+
+		gl.GetActiveUniform(program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
+		int location = gl.GetUniformLocation(program_obj, name);
+
+		clean_glsl_name(name, name_len);
+
+		if (location < 0) {
+			continue;
+		}
+
+		PyTuple_SET_ITEM(uniforms, uniform_counter, Py_BuildValue("(iiis#)", type, location, array_length, name, (Py_ssize_t)name_len));
+		++uniform_counter;
+	}
+
+	if (uniform_counter != num_uniforms) {
+		_PyTuple_Resize(&uniforms, uniform_counter);
+	}
+
+	return uniforms;
+}
+
+// The members of a uniform block with their offsets and strides.
+PyObject * MGLProgram_query_uniform_block_layout(const GLMethods & gl, int program_obj, int block_index) {
+	int num_members = 0;
+	gl.GetActiveUniformBlockiv(program_obj, block_index, GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS, &num_members);
+
+	PyObject * layout = PyTuple_New(num_members);
+
+	if (!num_members) {
+		return layout;
+	}
+
+	unsigned * indices = new unsigned[num_members];
+	int * properties = new int[num_members * 6];
+
+	gl.GetActiveUniformBlockiv(program_obj, block_index, GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES, (int *)indices);
+
+	const int pnames[] = {
+		GL_UNIFORM_TYPE,
+		GL_UNIFORM_SIZE,
+		GL_UNIFORM_OFFSET,
+		GL_UNIFORM_ARRAY_STRIDE,
+		GL_UNIFORM_MATRIX_STRIDE,
+		GL_UNIFORM_IS_ROW_MAJOR,
+	};
+
+	for (int p = 0; p < 6; ++p) {
+		gl.GetActiveUniformsiv(program_obj, num_members, indices, pnames[p], properties + p * num_members);
+	}
+
+	for (int i = 0; i < num_members; ++i) {
+		int name_len = 0;
+		char name[256];
+
+		gl.GetActiveUniformName(program_obj, indices[i], 256, &name_len, name);
+		clean_glsl_name(name, name_len);
+
+		int * member = properties + i;
+
+		PyTuple_SET_ITEM(layout, i, Py_BuildValue(
+			"(s#iiiiii)",
+			name,
+			(Py_ssize_t)name_len,
+			member[0],
+			member[num_members],
+			member[2 * num_members],
+			member[3 * num_members],
+			member[4 * num_members],
+			member[5 * num_members]
+		));
+	}
+
+	delete[] properties;
+	delete[] indices;
+	return layout;
+}
+
+PyObject * MGLProgram_query_uniform_blocks(const GLMethods & gl, int program_obj) {
+	int num_uniform_blocks = 0;
+	gl.GetProgramiv(program_obj, GL_ACTIVE_UNIFORM_BLOCKS, &num_uniform_blocks);
+
+	PyObject * uniform_blocks = PyTuple_New(num_uniform_blocks);
+
+	for (int i = 0; i < num_uniform_blocks; ++i) {
+		int size = 0;
+		int name_len = 0;
+		char name[256];
+
+		gl.GetActiveUniformBlockName(program_obj, i, 256, &name_len, name);
+		int index = gl.GetUniformBlockIndex(program_obj, name);
+		gl.GetActiveUniformBlockiv(program_obj, index, GL_UNIFORM_BLOCK_DATA_SIZE, &size);
+
+		clean_glsl_name(name, name_len);
+
+		PyObject * layout = MGLProgram_query_uniform_block_layout(gl, program_obj, index);
+		PyTuple_SET_ITEM(uniform_blocks, i, Py_BuildValue("(iis#N)", index, size, name, (Py_ssize_t)name_len, layout));
+	}
+
+	return uniform_blocks;
+}
+
+PyObject * MGLProgram_uniform_members(MGLContext * context, int program_obj, PyObject * uniforms) {
+	if (!PyTuple_Check(uniforms)) {
+		MGLError_Set("invalid reflection");
+		return 0;
+	}
+
+	int num_uniforms = (int)PyTuple_GET_SIZE(uniforms);
+	PyObject * uniforms_lst = PyTuple_New(num_uniforms);
+
+	for (int i = 0; i < num_uniforms; ++i) {
+		int type;
+		int location;
+		int array_length;
+		PyObject * name;
+
+		if (!PyArg_ParseTuple(PyTuple_GET_ITEM(uniforms, i), "iiiU", &type, &location, &array_length, &name)) {
+			Py_DECREF(uniforms_lst);
+			return 0;
+		}
+
+		MGLUniform * mglo = (MGLUniform *)MGLUniform_Type.tp_alloc(&MGLUniform_Type, 0);
+		mglo->type = type;
+		mglo->location = location;
+		mglo->array_length = array_length;
+		mglo->program_obj = program_obj;
+		MGLUniform_Complete(mglo, context->gl);
+
+		mglo->state = &context->state;
+		mglo->cache = new char[mglo->array_length * mglo->element_size + 1];
+		mglo->cache_generation = 0;
+
+		Py_INCREF(name);
+
+		PyObject * item = PyTuple_New(5);
+		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
+		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(location));
+		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(array_length));
+		PyTuple_SET_ITEM(item, 3, PyLong_FromLong(mglo->dimension));
+		PyTuple_SET_ITEM(item, 4, name);
+
+		PyTuple_SET_ITEM(uniforms_lst, i, item);
+	}
+
+	return uniforms_lst;
+}
+
+PyObject * MGLProgram_uniform_block_members(const GLMethods & gl, int program_obj, PyObject * uniform_blocks) {
+	if (!PyTuple_Check(uniform_blocks)) {
+		MGLError_Set("invalid reflection");
+		return 0;
+	}
+
+	int num_uniform_blocks = (int)PyTuple_GET_SIZE(uniform_blocks);
+	PyObject * uniform_blocks_lst = PyTuple_New(num_uniform_blocks);
+
+	for (int i = 0; i < num_uniform_blocks; ++i) {
+		int index;
+		int size;
+		PyObject * name;
+		PyObject * layout;
+
+		if (!PyArg_ParseTuple(PyTuple_GET_ITEM(uniform_blocks, i), "iiUO!", &index, &size, &name, &PyTuple_Type, &layout)) {
+			Py_DECREF(uniform_blocks_lst);
+			return 0;
+		}
+
+		MGLUniformBlock * mglo = (MGLUniformBlock *)MGLUniformBlock_Type.tp_alloc(&MGLUniformBlock_Type, 0);
+
+		mglo->index = index;
+		mglo->size = size;
+		mglo->program_obj = program_obj;
+		mglo->gl = &gl;
+
+		Py_INCREF(name);
+		Py_INCREF(layout);
+
+		PyObject * item = PyTuple_New(5);
+		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
+		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(index));
+		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(size));
+		PyTuple_SET_ITEM(item, 3, name);
+		PyTuple_SET_ITEM(item, 4, layout);
+
+		PyTuple_SET_ITEM(uniform_blocks_lst, i, item);
+	}
+
+	return uniform_blocks_lst;
+}
+
+// The members of a shader storage block with their offsets and strides.
+// Members of the trailing runtime-sized array report a top level array size of zero.
+PyObject * MGLProgram_query_storage_block_layout(const GLMethods & gl, int program_obj, int block_index) {
+	const int block_property = GL_NUM_ACTIVE_VARIABLES;
+	int num_members = 0;
+	gl.GetProgramResourceiv(program_obj, GL_SHADER_STORAGE_BLOCK, block_index, 1, (const GLenum *)&block_property, 1, 0, &num_members);
+
+	PyObject * layout = PyTuple_New(num_members);
+
+	if (!num_members) {
+		return layout;
+	}
+
+	int * indices = new int[num_members];
+
+	const int variables_property = GL_ACTIVE_VARIABLES;
+	gl.GetProgramResourceiv(program_obj, GL_SHADER_STORAGE_BLOCK, block_index, 1, (const GLenum *)&variables_property, num_members, 0, indices);
+
+	const int properties[] = {
+		GL_TYPE,
+		GL_ARRAY_SIZE,
+		GL_OFFSET,
+		GL_ARRAY_STRIDE,
+		GL_MATRIX_STRIDE,
+		GL_IS_ROW_MAJOR,
+		GL_TOP_LEVEL_ARRAY_SIZE,
+		GL_TOP_LEVEL_ARRAY_STRIDE,
+	};
+
+	for (int i = 0; i < num_members; ++i) {
+		int member[8] = {};
+		int name_len = 0;
+		char name[256];
+
+		gl.GetProgramResourceiv(program_obj, GL_BUFFER_VARIABLE, indices[i], 8, (const GLenum *)properties, 8, 0, member);
+		gl.GetProgramResourceName(program_obj, GL_BUFFER_VARIABLE, indices[i], 256, &name_len, name);
+
+		PyTuple_SET_ITEM(layout, i, Py_BuildValue(
+			"(s#iiiiiiii)",
+			name,
+			(Py_ssize_t)name_len,
+			member[0],
+			member[1],
+			member[2],
+			member[3],
+			member[4],
+			member[5],
+			member[6],
+			member[7]
+		));
+	}
+
+	delete[] indices;
+	return layout;
+}
+
+PyObject * MGLProgram_query_storage_blocks(const GLMethods & gl, int program_obj) {
+	int num_storage_blocks = 0;
+
+	if (gl.GetProgramResourceiv) {
+		gl.GetProgramInterfaceiv(program_obj, GL_SHADER_STORAGE_BLOCK, GL_ACTIVE_RESOURCES, &num_storage_blocks);
+	}
+
+	PyObject * storage_blocks = PyTuple_New(num_storage_blocks);
+
+	for (int i = 0; i < num_storage_blocks; ++i) {
+		const int property = GL_BUFFER_DATA_SIZE;
+		int size = 0;
+		int name_len = 0;
+		char name[256];
+
+		gl.GetProgramResourceName(program_obj, GL_SHADER_STORAGE_BLOCK, i, 256, &name_len, name);
+		gl.GetProgramResourceiv(program_obj, GL_SHADER_STORAGE_BLOCK, i, 1, (const GLenum *)&property, 1, 0, &size);
+
+		clean_glsl_name(name, name_len);
+
+		PyObject * layout = MGLProgram_query_storage_block_layout(gl, program_obj, i);
+		PyTuple_SET_ITEM(storage_blocks, i, Py_BuildValue("(iis#N)", i, size, name, (Py_ssize_t)name_len, layout));
+	}
+
+	return storage_blocks;
+}
+
+PyObject * MGLProgram_storage_block_members(const GLMethods & gl, int program_obj, PyObject * storage_blocks) {
+	if (!PyTuple_Check(storage_blocks)) {
+		MGLError_Set("invalid reflection");
+		return 0;
+	}
+
+	int num_storage_blocks = (int)PyTuple_GET_SIZE(storage_blocks);
+	PyObject * storage_blocks_lst = PyTuple_New(num_storage_blocks);
+
+	for (int i = 0; i < num_storage_blocks; ++i) {
+		int index;
+		int size;
+		PyObject * name;
+		PyObject * layout;
+
+		if (!PyArg_ParseTuple(PyTuple_GET_ITEM(storage_blocks, i), "iiUO!", &index, &size, &name, &PyTuple_Type, &layout)) {
+			Py_DECREF(storage_blocks_lst);
+			return 0;
+		}
+
+		MGLStorageBlock * mglo = (MGLStorageBlock *)MGLStorageBlock_Type.tp_alloc(&MGLStorageBlock_Type, 0);
+
+		mglo->index = index;
+		mglo->program_obj = program_obj;
+		mglo->gl = &gl;
+
+		Py_INCREF(name);
+		Py_INCREF(layout);
+
+		PyObject * item = PyTuple_New(5);
+		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
+		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(index));
+		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(size));
+		PyTuple_SET_ITEM(item, 3, name);
+		PyTuple_SET_ITEM(item, 4, layout);
+
+		PyTuple_SET_ITEM(storage_blocks_lst, i, item);
+	}
+
+	return storage_blocks_lst;
+}
+
+// Returns 0 when the driver rejects the binary, the program must be built from the source then.
+int MGLContext_load_program_binary(MGLContext * self, PyObject * binary, int separable) {
+	const GLMethods & gl = self->gl;
+
+	int binary_format;
+	const char * data;
+	Py_ssize_t size;
+
+	if (!gl.ProgramBinary || !PyArg_ParseTuple(binary, "iy#", &binary_format, &data, &size)) {
+		PyErr_Clear();
+		return 0;
+	}
+
+	int program_obj = gl.CreateProgram();
+
+	if (!program_obj) {
+		return 0;
+	}
+
+	if (separable) {
+		gl.ProgramParameteri(program_obj, GL_PROGRAM_SEPARABLE, GL_TRUE);
+	}
+
+	gl.ProgramBinary(program_obj, binary_format, data, (int)size);
+	gl.GetError(); // unsupported binary formats are reported as errors
+
+	int linked = GL_FALSE;
+	gl.GetProgramiv(program_obj, GL_LINK_STATUS, &linked);
+
+	if (!linked) {
+		gl.DeleteProgram(program_obj);
+		return 0;
+	}
+
+	return program_obj;
+}
+
+PyObject * MGLContext_get_program_binary(MGLContext * self, int program_obj) {
+	const GLMethods & gl = self->gl;
+
+	int size = 0;
+
+	if (gl.GetProgramBinary) {
+		gl.GetProgramiv(program_obj, GL_PROGRAM_BINARY_LENGTH, &size);
+	}
+
+	if (size <= 0) {
+		Py_RETURN_NONE;
+	}
+
+	PyObject * data = PyBytes_FromStringAndSize(0, size);
+	int binary_format = 0;
+	gl.GetProgramBinary(program_obj, size, &size, (GLenum *)&binary_format, PyBytes_AS_STRING(data));
+
+	if (!size) {
+		Py_DECREF(data);
+		Py_RETURN_NONE;
+	}
+
+	if (size != PyBytes_GET_SIZE(data)) {
+		_PyBytes_Resize(&data, size);
+	}
+
+	PyObject * result = PyTuple_New(2);
+	PyTuple_SET_ITEM(result, 0, PyLong_FromLong(binary_format));
+	PyTuple_SET_ITEM(result, 1, data);
+	return result;
+}
+
+int MGLProgram_geometry_primitive(int primitive) {
+	switch (primitive) {
+		case GL_TRIANGLES:
+		case GL_TRIANGLE_STRIP:
+		case GL_TRIANGLE_FAN:
+		case GL_LINES:
+		case GL_LINE_STRIP:
+		case GL_LINE_LOOP:
+		case GL_POINTS:
+		case GL_LINE_STRIP_ADJACENCY:
+		case GL_LINES_ADJACENCY:
+		case GL_TRIANGLE_STRIP_ADJACENCY:
+		case GL_TRIANGLES_ADJACENCY:
+			return primitive;
+
+		default:
+			return -1;
+	}
+}
+
+PyObject * MGLProgram_query_reflection(MGLProgram * program, PyObject ** shaders) {
+	const GLMethods & gl = program->context->gl;
+	int program_obj = program->program_obj;
+
+	const int shader_type[5] = {
+		GL_VERTEX_SHADER,
+		GL_FRAGMENT_SHADER,
+		GL_GEOMETRY_SHADER,
+		GL_TESS_EVALUATION_SHADER,
+		GL_TESS_CONTROL_SHADER,
+	};
+
+	int num_stage_subroutine_uniforms[5] = {};
+
+	if (program->context->version_code >= 400) {
+		for (int st = 0; st < 5; ++st) {
+			if (shaders[st] != Py_None) {
+				gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINE_UNIFORMS, &num_stage_subroutine_uniforms[st]);
+			}
+		}
+	}
+
+	int geometry_in = 0;
+	int geometry_out = 0;
+	int geometry_vertices = 0;
+
+	if (shaders[GEOMETRY_SHADER_SLOT] != Py_None) {
+		gl.GetProgramiv(program_obj, GL_GEOMETRY_INPUT_TYPE, &geometry_in);
+		gl.GetProgramiv(program_obj, GL_GEOMETRY_OUTPUT_TYPE, &geometry_out);
+		gl.GetProgramiv(program_obj, GL_GEOMETRY_VERTICES_OUT, &geometry_vertices);
+		geometry_in = MGLProgram_geometry_primitive(geometry_in);
+		geometry_out = MGLProgram_geometry_primitive(geometry_out);
+	} else {
+		geometry_in = -1;
+		geometry_out = -1;
+	}
+
+	int num_attributes = 0;
+	int num_varyings = 0;
+
+	gl.GetProgramiv(program_obj, GL_ACTIVE_ATTRIBUTES, &num_attributes);
+	gl.GetProgramiv(program_obj, GL_TRANSFORM_FEEDBACK_VARYINGS, &num_varyings);
+
+	PyObject * attributes = PyTuple_New(num_attributes);
+	PyObject * varyings = PyTuple_New(num_varyings);
+
+	for (int i = 0; i < num_attributes; ++i) {
+		int type = 0;
+		int array_length = 0;
+		int name_len = 0;
+		char name[256];
+
+		gl.GetActiveAttrib(program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
+		int location = gl.GetAttribLocation(program_obj, name);
+
+		clean_glsl_name(name, name_len);
+
+		PyTuple_SET_ITEM(attributes, i, Py_BuildValue("(iiis#)", type, location, array_length, name, (Py_ssize_t)name_len));
+	}
+
+	for (int i = 0; i < num_varyings; ++i) {
+		int type = 0;
+		int array_length = 0;
+		int dimension = 0;
+		int name_len = 0;
+		char name[256];
+
+		gl.GetTransformFeedbackVarying(program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
+
+		PyTuple_SET_ITEM(varyings, i, Py_BuildValue("(iiis#)", i, array_length, dimension, name, (Py_ssize_t)name_len));
+	}
+
+	PyObject * uniforms = MGLProgram_query_uniforms(gl, program_obj);
+	PyObject * uniform_blocks = MGLProgram_query_uniform_blocks(gl, program_obj);
+	PyObject * storage_blocks = MGLProgram_query_storage_blocks(gl, program_obj);
+
+	int num_subroutines = 0;
+	int num_subroutine_uniforms = 0;
+
+	if (program->context->version_code >= 400) {
+		for (int st = 0; st < 5; ++st) {
+			int num_stage_subroutines = 0;
+			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINES, &num_stage_subroutines);
+			num_subroutines += num_stage_subroutines;
+
+			int num_stage_uniforms = 0;
+			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINE_UNIFORMS, &num_stage_uniforms);
+			num_subroutine_uniforms += num_stage_uniforms;
+		}
+	}
+
+	PyObject * subroutines = PyTuple_New(num_subroutines);
+	PyObject * subroutine_uniforms = PyTuple_New(num_subroutine_uniforms);
+
+	int subroutine_uniforms_base = 0;
+	int subroutines_base = 0;
+
+	if (program->context->version_code >= 400) {
+		for (int st = 0; st < 5; ++st) {
+			int num_stage_subroutines = 0;
+			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINES, &num_stage_subroutines);
+
+			int num_stage_uniforms = 0;
+			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINE_UNIFORMS, &num_stage_uniforms);
+
+			for (int i = 0; i < num_stage_subroutines; ++i) {
+				int name_len = 0;
+				char name[256];
+
+				gl.GetActiveSubroutineName(program_obj, shader_type[st], i, 256, &name_len, name);
+				int index = gl.GetSubroutineIndex(program_obj, shader_type[st], name);
+
+				PyTuple_SET_ITEM(subroutines, subroutines_base + i, Py_BuildValue("(is#)", index, name, (Py_ssize_t)name_len));
+			}
+
+			for (int i = 0; i < num_stage_uniforms; ++i) {
+				int name_len = 0;
+				char name[256];
+
+				gl.GetActiveSubroutineUniformName(program_obj, shader_type[st], i, 256, &name_len, name);
+				int location = subroutine_uniforms_base + gl.GetSubroutineUniformLocation(program_obj, shader_type[st], name);
+				PyTuple_SET_ITEM(subroutine_uniforms, location, PyUnicode_FromStringAndSize(name, name_len));
+			}
+
+			subroutine_uniforms_base += num_stage_uniforms;
+			subroutines_base += num_stage_subroutines;
+		}
+	}
+
+	return Py_BuildValue(
+		"((iiiii)(iii)NNNNNNN)",
+		num_stage_subroutine_uniforms[0],
+		num_stage_subroutine_uniforms[1],
+		num_stage_subroutine_uniforms[2],
+		num_stage_subroutine_uniforms[3],
+		num_stage_subroutine_uniforms[4],
+		geometry_in,
+		geometry_out,
+		geometry_vertices,
+		attributes,
+		varyings,
+		uniforms,
+		uniform_blocks,
+		subroutines,
+		subroutine_uniforms,
+		storage_blocks
+	);
+}
+
+PyObject * MGLProgram_attribute_members(const GLMethods & gl, int program_obj, PyObject * attributes) {
+	int num_attributes = (int)PyTuple_GET_SIZE(attributes);
+	PyObject * attributes_lst = PyTuple_New(num_attributes);
+
+	for (int i = 0; i < num_attributes; ++i) {
+		int type;
+		int location;
+		int array_length;
+		PyObject * name;
+
+		if (!PyArg_ParseTuple(PyTuple_GET_ITEM(attributes, i), "iiiU", &type, &location, &array_length, &name)) {
+			Py_DECREF(attributes_lst);
+			return 0;
+		}
+
+		MGLAttribute * mglo = (MGLAttribute *)MGLAttribute_Type.tp_alloc(&MGLAttribute_Type, 0);
+		mglo->type = type;
+		mglo->location = location;
+		mglo->array_length = array_length;
+		mglo->program_obj = program_obj;
+		MGLAttribute_Complete(mglo, gl);
+
+		Py_INCREF(name);
+
+		PyObject * item = PyTuple_New(6);
+		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
+		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(location));
+		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(array_length));
+		PyTuple_SET_ITEM(item, 3, PyLong_FromLong(mglo->dimension));
+		PyTuple_SET_ITEM(item, 4, PyUnicode_FromFormat("%c", mglo->shape));
+		PyTuple_SET_ITEM(item, 5, name);
+
+		PyTuple_SET_ITEM(attributes_lst, i, item);
+	}
+
+	return attributes_lst;
+}
+
+// Returns the members of the program as the tuples expected by Context.program.
+// Lazy programs keep the reflection and return no attributes, uniforms, uniform blocks
+// or storage blocks, they are created one by one with MGLProgram_member.
+PyObject * MGLProgram_members(MGLProgram * program, PyObject * reflection, bool lazy) {
+	const GLMethods & gl = program->context->gl;
+
+	PyObject * attributes;
+	PyObject * varyings;
+	PyObject * uniforms;
+	PyObject * uniform_blocks;
+	PyObject * subroutines;
+	PyObject * subroutine_uniforms;
+	PyObject * storage_blocks;
 
 	int args_ok = PyArg_ParseTuple(
-		args,
-		"OOOOOO",
-		&shaders[0],
-		&shaders[1],
-		&shaders[2],
-		&shaders[3],
-		&shaders[4],
-		&outputs
+		reflection,
+		"(iiiii)(iii)O!O!OOO!O!O",
+		&program->num_vertex_shader_subroutines,
+		&program->num_fragment_shader_subroutines,
+		&program->num_geometry_shader_subroutines,
+		&program->num_tess_evaluation_shader_subroutines,
+		&program->num_tess_control_shader_subroutines,
+		&program->geometry_input,
+		&program->geometry_output,
+		&program->geometry_vertices,
+		&PyTuple_Type,
+		&attributes,
+		&PyTuple_Type,
+		&varyings,
+		&uniforms,
+		&uniform_blocks,
+		&PyTuple_Type,
+		&subroutines,
+		&PyTuple_Type,
+		&subroutine_uniforms,
+		&storage_blocks
 	);
 
 	if (!args_ok) {
 		return 0;
 	}
 
+	if (lazy) {
+		if (!PyTuple_Check(uniforms) || !PyTuple_Check(uniform_blocks) || !PyTuple_Check(storage_blocks)) {
+			MGLError_Set("invalid reflection");
+			return 0;
+		}
+
+		Py_INCREF(reflection);
+		program->reflection = reflection;
+	}
+
+	PyObject * attributes_lst = lazy ? PyTuple_New(0) : MGLProgram_attribute_members(gl, program->program_obj, attributes);
+
+	if (!attributes_lst) {
+		return 0;
+	}
+
+	PyObject * uniforms_lst = lazy ? PyTuple_New(0) : MGLProgram_uniform_members(program->context, program->program_obj, uniforms);
+
+	if (!uniforms_lst) {
+		Py_DECREF(attributes_lst);
+		return 0;
+	}
+
+	PyObject * uniform_blocks_lst = lazy ? PyTuple_New(0) : MGLProgram_uniform_block_members(gl, program->program_obj, uniform_blocks);
+
+	if (!uniform_blocks_lst) {
+		Py_DECREF(attributes_lst);
+		Py_DECREF(uniforms_lst);
+		return 0;
+	}
+
+	PyObject * storage_blocks_lst = lazy ? PyTuple_New(0) : MGLProgram_storage_block_members(gl, program->program_obj, storage_blocks);
+
+	if (!storage_blocks_lst) {
+		Py_DECREF(attributes_lst);
+		Py_DECREF(uniforms_lst);
+		Py_DECREF(uniform_blocks_lst);
+		return 0;
+	}
+
+	program->num_varyings = (int)PyTuple_GET_SIZE(varyings);
+
+	PyObject * geom_info = PyTuple_New(3);
+	if (program->geometry_input != -1) {
+		PyTuple_SET_ITEM(geom_info, 0, PyLong_FromLong(program->geometry_input));
+	} else {
+		Py_INCREF(Py_None);
+		PyTuple_SET_ITEM(geom_info, 0, Py_None);
+	}
+	if (program->geometry_output != -1) {
+		PyTuple_SET_ITEM(geom_info, 1, PyLong_FromLong(program->geometry_output));
+	} else {
+		Py_INCREF(Py_None);
+		PyTuple_SET_ITEM(geom_info, 1, Py_None);
+	}
+	PyTuple_SET_ITEM(geom_info, 2, PyLong_FromLong(program->geometry_vertices));
+
+	Py_INCREF(varyings);
+	Py_INCREF(subroutines);
+	Py_INCREF(subroutine_uniforms);
+
+	PyObject * result = PyTuple_New(8);
+	PyTuple_SET_ITEM(result, 0, attributes_lst);
+	PyTuple_SET_ITEM(result, 1, varyings);
+	PyTuple_SET_ITEM(result, 2, uniforms_lst);
+	PyTuple_SET_ITEM(result, 3, uniform_blocks_lst);
+	PyTuple_SET_ITEM(result, 4, subroutines);
+	PyTuple_SET_ITEM(result, 5, subroutine_uniforms);
+	PyTuple_SET_ITEM(result, 6, geom_info);
+	PyTuple_SET_ITEM(result, 7, storage_blocks_lst);
+	return result;
+}
+
+bool MGLProgram_check_varyings(PyObject * outputs) {
 	int num_outputs = (int)PyTuple_GET_SIZE(outputs);
 
 	for (int i = 0; i < num_outputs; ++i) {
 		PyObject * item = PyTuple_GET_ITEM(outputs, i);
 		if (Py_TYPE(item) != &PyUnicode_Type) {
 			MGLError_Set("varyings[%d] must be a string not %s", i, Py_TYPE(item)->tp_name);
-			return 0;
+			return false;
 		}
 	}
 
-	MGLProgram * program = (MGLProgram *)MGLProgram_Type.tp_alloc(&MGLProgram_Type, 0);
+	return true;
+}
 
-	Py_INCREF(self);
-	program->context = self;
-
-	const GLMethods & gl = program->context->gl;
+// Compiles the shaders and links the program without querying any status.
+// With GL_KHR_parallel_shader_compile the driver may still be working on it when this returns.
+int MGLContext_submit_program(MGLContext * self, PyObject ** shaders, PyObject * outputs, int separate, int retrievable, int separable, int * shader_objs) {
+	const GLMethods & gl = self->gl;
 
 	int program_obj = gl.CreateProgram();
 
@@ -46,6 +750,8 @@ PyObject * MGLContext_program(MGLContext * self, PyObject * args) {
 	}
 
 	for (int i = 0; i < NUM_SHADER_SLOTS; ++i) {
+		shader_objs[i] = 0;
+
 		if (shaders[i] == Py_None) {
 			continue;
 		}
@@ -55,15 +761,67 @@ PyObject * MGLContext_program(MGLContext * self, PyObject * args) {
 		int shader_obj = gl.CreateShader(SHADER_TYPE[i]);
 
 		if (!shader_obj) {
+			for (int j = 0; j < i; ++j) {
+				if (shader_objs[j]) {
+					gl.DeleteShader(shader_objs[j]);
+				}
+			}
+			gl.DeleteProgram(program_obj);
 			MGLError_Set("cannot create shader");
 			return 0;
 		}
 
 		gl.ShaderSource(shader_obj, 1, &source_str, 0);
 		gl.CompileShader(shader_obj);
+		gl.AttachShader(program_obj, shader_obj);
+		shader_objs[i] = shader_obj;
+	}
+
+	int num_outputs = (int)PyTuple_GET_SIZE(outputs);
+
+	if (num_outputs) {
+		const char ** varyings_array = new const char * [num_outputs];
+
+		for (int i = 0; i < num_outputs; ++i) {
+			varyings_array[i] = PyUnicode_AsUTF8(PyTuple_GET_ITEM(outputs, i));
+		}
+
+		int buffer_mode = separate ? GL_SEPARATE_ATTRIBS : GL_INTERLEAVED_ATTRIBS;
+		gl.TransformFeedbackVaryings(program_obj, num_outputs, varyings_array, buffer_mode);
+
+		delete[] varyings_array;
+	}
+
+	if (retrievable && gl.ProgramParameteri) {
+		gl.ProgramParameteri(program_obj, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE);
+	}
+
+	if (separable) {
+		gl.ProgramParameteri(program_obj, GL_PROGRAM_SEPARABLE, GL_TRUE);
+	}
+
+	gl.LinkProgram(program_obj);
+	return program_obj;
+}
+
+// Reports the first failing shader or the linker log, the objects are deleted on failure.
+bool MGLContext_check_program(MGLContext * self, int program_obj, const int * shader_objs) {
+	const GLMethods & gl = self->gl;
+
+	int linked = GL_FALSE;
+	gl.GetProgramiv(program_obj, GL_LINK_STATUS, &linked);
+
+	if (linked) {
+		return true;
+	}
+
+	for (int i = 0; i < NUM_SHADER_SLOTS; ++i) {
+		if (!shader_objs[i]) {
+			continue;
+		}
 
 		int compiled = GL_FALSE;
-		gl.GetShaderiv(shader_obj, GL_COMPILE_STATUS, &compiled);
+		gl.GetShaderiv(shader_objs[i], GL_COMPILE_STATUS, &compiled);
 
 		if (!compiled) {
 			const char * SHADER_NAME[] = {
@@ -87,40 +845,19 @@ PyObject * MGLContext_program(MGLContext * self, PyObject * args) {
 			const char * underline = SHADER_NAME_UNDERLINE[i];
 
 			int log_len = 0;
-			gl.GetShaderiv(shader_obj, GL_INFO_LOG_LENGTH, &log_len);
+			gl.GetShaderiv(shader_objs[i], GL_INFO_LOG_LENGTH, &log_len);
 
 			char * log = new char[log_len];
-			gl.GetShaderInfoLog(shader_obj, log_len, &log_len, log);
-
-			gl.DeleteShader(shader_obj);
+			gl.GetShaderInfoLog(shader_objs[i], log_len, &log_len, log);
 
 			MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
 
 			delete[] log;
-			return 0;
-		}
-
-		gl.AttachShader(program_obj, shader_obj);
-	}
-
-	if (num_outputs) {
-		const char ** varyings_array = new const char * [num_outputs];
-
-		for (int i = 0; i < num_outputs; ++i) {
-			varyings_array[i] = PyUnicode_AsUTF8(PyTuple_GET_ITEM(outputs, i));
+			break;
 		}
-
-		gl.TransformFeedbackVaryings(program_obj, num_outputs, varyings_array, GL_INTERLEAVED_ATTRIBS);
-
-		delete[] varyings_array;
 	}
 
-	gl.LinkProgram(program_obj);
-
-	int linked = GL_FALSE;
-	gl.GetProgramiv(program_obj, GL_LINK_STATUS, &linked);
-
-	if (!linked) {
+	if (!PyErr_Occurred()) {
 		const char * message = "GLSL Linker failed";
 		const char * title = "Program";
 		const char * underline = "=======";
@@ -131,498 +868,449 @@ PyObject * MGLContext_program(MGLContext * self, PyObject * args) {
 		char * log = new char[log_len];
 		gl.GetProgramInfoLog(program_obj, log_len, &log_len, log);
 
+		MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
+
+		delete[] log;
+	}
+
+	for (int i = 0; i < NUM_SHADER_SLOTS; ++i) {
+		if (shader_objs[i]) {
+			gl.DeleteShader(shader_objs[i]);
+		}
+	}
+
+	gl.DeleteProgram(program_obj);
+	return false;
+}
+
+// Wraps a linked program, the reflection is queried when it is not given.
+// Returns the same tuple as MGLContext_program.
+PyObject * MGLContext_finish_program(MGLContext * self, int program_obj, PyObject ** shaders, int separate, PyObject * reflection, int retrievable, int lazy) {
+	const GLMethods & gl = self->gl;
+
+	bool from_binary = reflection != 0;
+
+	MGLProgram * program = (MGLProgram *)MGLProgram_Type.tp_alloc(&MGLProgram_Type, 0);
+
+	Py_INCREF(self);
+	program->context = self;
+	program->program_obj = program_obj;
+
+	if (from_binary) {
+		Py_INCREF(reflection);
+	} else {
+		reflection = MGLProgram_query_reflection(program, shaders);
+	}
+
+	PyObject * members = MGLProgram_members(program, reflection, lazy);
+
+	if (!members) {
 		gl.DeleteProgram(program_obj);
+		Py_DECREF(reflection);
+		Py_DECREF(program);
+		return 0;
+	}
 
-		MGLError_Set("%s\n\n%s\n%s\n%s\n", message, title, underline, log);
+	program->separate_varyings = separate && program->num_varyings;
+
+	PyObject * cache_entry = Py_None;
 
-		delete[] log;
-		return 0;
+	if (retrievable && !from_binary) {
+		cache_entry = MGLContext_get_program_binary(self, program_obj);
+	} else {
+		Py_INCREF(Py_None);
 	}
 
-	program->program_obj = program_obj;
+	Py_INCREF(program);
 
-	// int num_vertex_shader_subroutine_locations = 0;
-	// int num_fragment_shader_subroutine_locations = 0;
-	// int num_geometry_shader_subroutine_locations = 0;
-	// int num_tess_evaluation_shader_subroutine_locations = 0;
-	// int num_tess_control_shader_subroutine_locations = 0;
+	PyObject * result = PyTuple_New(12);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)program);
+	for (int i = 0; i < 8; ++i) {
+		PyObject * item = PyTuple_GET_ITEM(members, i);
+		Py_INCREF(item);
+		PyTuple_SET_ITEM(result, i + 1, item);
+	}
+	PyTuple_SET_ITEM(result, 9, PyLong_FromLong(program->program_obj));
+	PyTuple_SET_ITEM(result, 10, reflection);
+	PyTuple_SET_ITEM(result, 11, cache_entry);
+	Py_DECREF(members);
+	return result;
+}
 
-	int num_vertex_shader_subroutines = 0;
-	int num_fragment_shader_subroutines = 0;
-	int num_geometry_shader_subroutines = 0;
-	int num_tess_evaluation_shader_subroutines = 0;
-	int num_tess_control_shader_subroutines = 0;
+PyObject * MGLContext_program(MGLContext * self, PyObject * args) {
+	PyObject * shaders[5];
+	PyObject * outputs;
+	int separate;
+	PyObject * binary;
+	PyObject * reflection;
+	int retrievable;
+	int lazy;
+	int separable;
 
-	int num_vertex_shader_subroutine_uniforms = 0;
-	int num_fragment_shader_subroutine_uniforms = 0;
-	int num_geometry_shader_subroutine_uniforms = 0;
-	int num_tess_evaluation_shader_subroutine_uniforms = 0;
-	int num_tess_control_shader_subroutine_uniforms = 0;
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOOOOOpOOppp",
+		&shaders[0],
+		&shaders[1],
+		&shaders[2],
+		&shaders[3],
+		&shaders[4],
+		&outputs,
+		&separate,
+		&binary,
+		&reflection,
+		&retrievable,
+		&lazy,
+		&separable
+	);
 
-	if (program->context->version_code >= 400) {
-		if (shaders[VERTEX_SHADER_SLOT] != Py_None) {
-			// gl.GetProgramStageiv(
-			// 	program_obj,
-			// 	GL_VERTEX_SHADER,
-			// 	GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS,
-			// 	&num_vertex_shader_subroutine_locations
-			// );
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_VERTEX_SHADER,
-				GL_ACTIVE_SUBROUTINES,
-				&num_vertex_shader_subroutines
-			);
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_VERTEX_SHADER,
-				GL_ACTIVE_SUBROUTINE_UNIFORMS,
-				&num_vertex_shader_subroutine_uniforms
-			);
-		}
+	if (!args_ok) {
+		return 0;
+	}
 
-		if (shaders[FRAGMENT_SHADER_SLOT] != Py_None) {
-			// gl.GetProgramStageiv(
-			// 	program_obj,
-			// 	GL_FRAGMENT_SHADER,
-			// 	GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS,
-			// 	&num_fragment_shader_subroutine_locations
-			// );
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_FRAGMENT_SHADER,
-				GL_ACTIVE_SUBROUTINES,
-				&num_fragment_shader_subroutines
-			);
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_FRAGMENT_SHADER,
-				GL_ACTIVE_SUBROUTINE_UNIFORMS,
-				&num_fragment_shader_subroutine_uniforms
-			);
-		}
+	if (!MGLProgram_check_varyings(outputs)) {
+		return 0;
+	}
 
-		if (shaders[GEOMETRY_SHADER_SLOT] != Py_None) {
-			// gl.GetProgramStageiv(
-			// 	program_obj,
-			// 	GL_GEOMETRY_SHADER,
-			// 	GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS,
-			// 	&num_geometry_shader_subroutine_locations
-			// );
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_GEOMETRY_SHADER,
-				GL_ACTIVE_SUBROUTINES,
-				&num_geometry_shader_subroutines
-			);
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_GEOMETRY_SHADER,
-				GL_ACTIVE_SUBROUTINE_UNIFORMS,
-				&num_geometry_shader_subroutine_uniforms
-			);
-		}
+	if (separable && !self->gl.UseProgramStages) {
+		MGLError_Set("separable programs are not supported");
+		return 0;
+	}
 
-		if (shaders[TESS_EVALUATION_SHADER_SLOT] != Py_None) {
-			// gl.GetProgramStageiv(
-			// 	program_obj,
-			// 	GL_TESS_EVALUATION_SHADER,
-			// 	GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS,
-			// 	&num_tess_evaluation_shader_subroutine_locations
-			// );
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_TESS_EVALUATION_SHADER,
-				GL_ACTIVE_SUBROUTINES,
-				&num_tess_evaluation_shader_subroutines
-			);
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_TESS_EVALUATION_SHADER,
-				GL_ACTIVE_SUBROUTINE_UNIFORMS,
-				&num_tess_evaluation_shader_subroutine_uniforms
-			);
-		}
+	if (binary != Py_None && reflection != Py_None) {
+		int program_obj = MGLContext_load_program_binary(self, binary, separable);
 
-		if (shaders[TESS_CONTROL_SHADER_SLOT] != Py_None) {
-			// gl.GetProgramStageiv(
-			// 	program_obj,
-			// 	GL_TESS_CONTROL_SHADER,
-			// 	GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS,
-			// 	&num_tess_control_shader_subroutine_locations
-			// );
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_TESS_CONTROL_SHADER,
-				GL_ACTIVE_SUBROUTINES,
-				&num_tess_control_shader_subroutines
-			);
-			gl.GetProgramStageiv(
-				program_obj,
-				GL_TESS_CONTROL_SHADER,
-				GL_ACTIVE_SUBROUTINE_UNIFORMS,
-				&num_tess_control_shader_subroutine_uniforms
-			);
+		if (program_obj) {
+			return MGLContext_finish_program(self, program_obj, shaders, separate, reflection, retrievable, lazy);
 		}
 	}
 
-	if (shaders[GEOMETRY_SHADER_SLOT] != Py_None) {
-
-		int geometry_in = 0;
-		int geometry_out = 0;
-		program->geometry_vertices = 0;
+	int shader_objs[NUM_SHADER_SLOTS];
+	int program_obj = MGLContext_submit_program(self, shaders, outputs, separate, retrievable, separable, shader_objs);
 
-		gl.GetProgramiv(program_obj, GL_GEOMETRY_INPUT_TYPE, &geometry_in);
-		gl.GetProgramiv(program_obj, GL_GEOMETRY_OUTPUT_TYPE, &geometry_out);
-		gl.GetProgramiv(program_obj, GL_GEOMETRY_VERTICES_OUT, &program->geometry_vertices);
+	if (!program_obj || !MGLContext_check_program(self, program_obj, shader_objs)) {
+		return 0;
+	}
 
-		switch (geometry_in) {
-			case GL_TRIANGLES:
-				program->geometry_input = GL_TRIANGLES;
-				break;
+	return MGLContext_finish_program(self, program_obj, shaders, separate, 0, retrievable, lazy);
+}
 
-			case GL_TRIANGLE_STRIP:
-				program->geometry_input = GL_TRIANGLE_STRIP;
-				break;
+// Combines separable programs into a program pipeline without linking them again.
+// The stages are given in the order of MGLContext_program, a stage can be None.
+PyObject * MGLContext_program_pipeline(MGLContext * self, PyObject * args) {
+	PyObject * stages[5];
 
-			case GL_TRIANGLE_FAN:
-				program->geometry_input = GL_TRIANGLE_FAN;
-				break;
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOOOO",
+		&stages[0],
+		&stages[1],
+		&stages[2],
+		&stages[3],
+		&stages[4]
+	);
 
-			case GL_LINES:
-				program->geometry_input = GL_LINES;
-				break;
+	if (!args_ok) {
+		return 0;
+	}
 
-			case GL_LINE_STRIP:
-				program->geometry_input = GL_LINE_STRIP;
-				break;
+	const GLMethods & gl = self->gl;
 
-			case GL_LINE_LOOP:
-				program->geometry_input = GL_LINE_LOOP;
-				break;
+	if (!gl.GenProgramPipelines) {
+		MGLError_Set("program pipelines are not supported");
+		return 0;
+	}
 
-			case GL_POINTS:
-				program->geometry_input = GL_POINTS;
-				break;
+	const char * STAGE_NAME[] = {
+		"vertex",
+		"fragment",
+		"geometry",
+		"tess_control",
+		"tess_evaluation",
+	};
+
+	const int STAGE_BIT[] = {
+		GL_VERTEX_SHADER_BIT,
+		GL_FRAGMENT_SHADER_BIT,
+		GL_GEOMETRY_SHADER_BIT,
+		GL_TESS_CONTROL_SHADER_BIT,
+		GL_TESS_EVALUATION_SHADER_BIT,
+	};
+
+	for (int i = 0; i < 5; ++i) {
+		if (stages[i] == Py_None) {
+			continue;
+		}
 
-			case GL_LINE_STRIP_ADJACENCY:
-				program->geometry_input = GL_LINE_STRIP_ADJACENCY;
-				break;
+		if (Py_TYPE(stages[i]) != &MGLProgram_Type) {
+			MGLError_Set("the %s stage must be a Program not %s", STAGE_NAME[i], Py_TYPE(stages[i])->tp_name);
+			return 0;
+		}
 
-			case GL_LINES_ADJACENCY:
-				program->geometry_input = GL_LINES_ADJACENCY;
-				break;
+		MGLProgram * stage = (MGLProgram *)stages[i];
 
-			case GL_TRIANGLE_STRIP_ADJACENCY:
-				program->geometry_input = GL_TRIANGLE_STRIP_ADJACENCY;
-				break;
+		if (stage->context != self) {
+			MGLError_Set("the %s stage belongs to a different context", STAGE_NAME[i]);
+			return 0;
+		}
 
-			case GL_TRIANGLES_ADJACENCY:
-				program->geometry_input = GL_TRIANGLES_ADJACENCY;
-				break;
+		int separable = GL_FALSE;
 
-			default:
-				program->geometry_input = -1;
-				break;
+		if (!stage->pipeline_obj) {
+			gl.GetProgramiv(stage->program_obj, GL_PROGRAM_SEPARABLE, &separable);
 		}
 
-		switch (geometry_out) {
-			case GL_TRIANGLES:
-				program->geometry_output = GL_TRIANGLES;
-				break;
+		if (!separable) {
+			MGLError_Set("the %s stage is not a separable program", STAGE_NAME[i]);
+			return 0;
+		}
+	}
 
-			case GL_TRIANGLE_STRIP:
-				program->geometry_output = GL_TRIANGLE_STRIP;
-				break;
+	int pipeline_obj = 0;
+	gl.GenProgramPipelines(1, (GLuint *)&pipeline_obj);
 
-			case GL_TRIANGLE_FAN:
-				program->geometry_output = GL_TRIANGLE_FAN;
-				break;
+	if (!pipeline_obj) {
+		MGLError_Set("cannot create program pipeline");
+		return 0;
+	}
 
-			case GL_LINES:
-				program->geometry_output = GL_LINES;
-				break;
+	MGLProgram * program = (MGLProgram *)MGLProgram_Type.tp_alloc(&MGLProgram_Type, 0);
 
-			case GL_LINE_STRIP:
-				program->geometry_output = GL_LINE_STRIP;
-				break;
+	Py_INCREF(self);
+	program->context = self;
+	program->program_obj = 0;
+	program->pipeline_obj = pipeline_obj;
+	program->geometry_input = -1;
+	program->geometry_output = -1;
 
-			case GL_LINE_LOOP:
-				program->geometry_output = GL_LINE_LOOP;
-				break;
+	for (int i = 0; i < 5; ++i) {
+		if (stages[i] == Py_None) {
+			continue;
+		}
 
-			case GL_POINTS:
-				program->geometry_output = GL_POINTS;
-				break;
+		MGLProgram * stage = (MGLProgram *)stages[i];
+		gl.UseProgramStages(pipeline_obj, STAGE_BIT[i], stage->program_obj);
 
-			case GL_LINE_STRIP_ADJACENCY:
-				program->geometry_output = GL_LINE_STRIP_ADJACENCY;
+		switch (i) {
+			case 0:
+				program->num_vertex_shader_subroutines = stage->num_vertex_shader_subroutines;
 				break;
 
-			case GL_LINES_ADJACENCY:
-				program->geometry_output = GL_LINES_ADJACENCY;
+			case 1:
+				program->num_fragment_shader_subroutines = stage->num_fragment_shader_subroutines;
 				break;
 
-			case GL_TRIANGLE_STRIP_ADJACENCY:
-				program->geometry_output = GL_TRIANGLE_STRIP_ADJACENCY;
+			case 2:
+				program->num_geometry_shader_subroutines = stage->num_geometry_shader_subroutines;
+				program->geometry_input = stage->geometry_input;
+				program->geometry_output = stage->geometry_output;
+				program->geometry_vertices = stage->geometry_vertices;
 				break;
 
-			case GL_TRIANGLES_ADJACENCY:
-				program->geometry_output = GL_TRIANGLES_ADJACENCY;
+			case 3:
+				program->num_tess_control_shader_subroutines = stage->num_tess_control_shader_subroutines;
 				break;
 
-			default:
-				program->geometry_output = -1;
+			case 4:
+				program->num_tess_evaluation_shader_subroutines = stage->num_tess_evaluation_shader_subroutines;
 				break;
 		}
-
-	} else {
-		program->geometry_input = -1;
-		program->geometry_output = -1;
-		program->geometry_vertices = 0;
-	}
-
-	if (PyErr_Occurred()) {
-		Py_DECREF(program);
-		return 0;
 	}
 
 	Py_INCREF(program);
 
-	int num_attributes = 0;
-	int num_varyings = 0;
-	int num_uniforms = 0;
-	int num_uniform_blocks = 0;
-
-	gl.GetProgramiv(program->program_obj, GL_ACTIVE_ATTRIBUTES, &num_attributes);
-	gl.GetProgramiv(program->program_obj, GL_TRANSFORM_FEEDBACK_VARYINGS, &num_varyings);
-	gl.GetProgramiv(program->program_obj, GL_ACTIVE_UNIFORMS, &num_uniforms);
-	gl.GetProgramiv(program->program_obj, GL_ACTIVE_UNIFORM_BLOCKS, &num_uniform_blocks);
-
-	int num_subroutines = num_vertex_shader_subroutines + num_fragment_shader_subroutines + num_geometry_shader_subroutines + num_tess_evaluation_shader_subroutines + num_tess_control_shader_subroutines;
-	int num_subroutine_uniforms = num_vertex_shader_subroutine_uniforms + num_fragment_shader_subroutine_uniforms + num_geometry_shader_subroutine_uniforms + num_tess_evaluation_shader_subroutine_uniforms + num_tess_control_shader_subroutine_uniforms;
+	PyObject * result = PyTuple_New(2);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)program);
+	PyTuple_SET_ITEM(result, 1, PyLong_FromLong(pipeline_obj));
+	return result;
+}
 
-	program->num_vertex_shader_subroutines = num_vertex_shader_subroutine_uniforms;
-	program->num_fragment_shader_subroutines = num_fragment_shader_subroutine_uniforms;
-	program->num_geometry_shader_subroutines = num_geometry_shader_subroutine_uniforms;
-	program->num_tess_evaluation_shader_subroutines = num_tess_evaluation_shader_subroutine_uniforms;
-	program->num_tess_control_shader_subroutines = num_tess_control_shader_subroutine_uniforms;
+// Program pipelines are bound with no program in use, UseProgram takes precedence over them.
+void MGLProgram_use(MGLProgram * program) {
+	if (program->pipeline_obj) {
+		MGLContext_use_program(program->context, 0);
+		MGLContext_bind_program_pipeline(program->context, program->pipeline_obj);
+	} else {
+		MGLContext_use_program(program->context, program->program_obj);
+	}
+}
 
-	program->num_varyings = num_varyings;
+PyObject * MGLProgram_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLProgram * self = (MGLProgram *)type->tp_alloc(type, 0);
 
-	PyObject * attributes_lst = PyTuple_New(num_attributes);
-	PyObject * varyings_lst = PyTuple_New(num_varyings);
-	PyObject * uniforms_lst = PyTuple_New(num_uniforms);
-	PyObject * uniform_blocks_lst = PyTuple_New(num_uniform_blocks);
-	PyObject * subroutines_lst = PyTuple_New(num_subroutines);
-	PyObject * subroutine_uniforms_lst = PyTuple_New(num_subroutine_uniforms);
+	if (self) {
+	}
 
-	for (int i = 0; i < num_attributes; ++i) {
-		int type = 0;
-		int array_length = 0;
-		int name_len = 0;
-		char name[256];
+	return (PyObject *)self;
+}
 
-		gl.GetActiveAttrib(program->program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
-		int location = gl.GetAttribLocation(program->program_obj, name);
+void MGLProgram_tp_dealloc(MGLProgram * self) {
+	Py_XDECREF(self->reflection);
+	MGLProgram_Type.tp_free((PyObject *)self);
+}
 
-		clean_glsl_name(name, name_len);
+PyObject * MGLProgram_release(MGLProgram * self) {
+	MGLProgram_Invalidate(self);
+	Py_RETURN_NONE;
+}
 
-		MGLAttribute * mglo = (MGLAttribute *)MGLAttribute_Type.tp_alloc(&MGLAttribute_Type, 0);
-		mglo->type = type;
-		mglo->location = location;
-		mglo->array_length = array_length;
-		mglo->program_obj = program->program_obj;
-		MGLAttribute_Complete(mglo, gl);
+// Sets many uniforms in a single call, the values are matched to the uniforms by position.
+PyObject * MGLProgram_set_uniforms(MGLProgram * self, PyObject * args) {
+	PyObject * uniforms;
+	PyObject * values;
 
-		PyObject * item = PyTuple_New(6);
-		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
-		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(location));
-		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(array_length));
-		PyTuple_SET_ITEM(item, 3, PyLong_FromLong(mglo->dimension));
-		PyTuple_SET_ITEM(item, 4, PyUnicode_FromFormat("%c", mglo->shape));
-		PyTuple_SET_ITEM(item, 5, PyUnicode_FromStringAndSize(name, name_len));
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O!O",
+		&PyTuple_Type,
+		&uniforms,
+		&values
+	);
 
-		PyTuple_SET_ITEM(attributes_lst, i, item);
+	if (!args_ok) {
+		return 0;
 	}
 
-	for (int i = 0; i < num_varyings; ++i) {
-		int type = 0;
-		int array_length = 0;
-		int dimension = 0;
-		int name_len = 0;
-		char name[256];
+	values = PySequence_Fast(values, "values must be a sequence");
 
-		gl.GetTransformFeedbackVarying(program->program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
+	if (!values) {
+		return 0;
+	}
 
-		PyObject * item = PyTuple_New(4);
-		PyTuple_SET_ITEM(item, 0, PyLong_FromLong(i));
-		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(array_length));
-		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(dimension));
-		PyTuple_SET_ITEM(item, 3, PyUnicode_FromStringAndSize(name, name_len));
+	int num_uniforms = (int)PyTuple_GET_SIZE(uniforms);
+	int num_values = (int)PySequence_Fast_GET_SIZE(values);
 
-		PyTuple_SET_ITEM(varyings_lst, i, item);
+	if (num_values != num_uniforms) {
+		MGLError_Set("%d values were given for %d uniforms", num_values, num_uniforms);
+		Py_DECREF(values);
+		return 0;
 	}
 
-	int uniform_counter = 0;
 	for (int i = 0; i < num_uniforms; ++i) {
-		int type = 0;
-		int array_length = 0;
-		int name_len = 0;
-		char name[256];
+		MGLUniform * uniform = (MGLUniform *)PyTuple_GET_ITEM(uniforms, i);
 
-		gl.GetActiveUniform(program->program_obj, i, 256, &name_len, &array_length, (GLenum *)&type, name);
-		int location = gl.GetUniformLocation(program->program_obj, name);
-
-		clean_glsl_name(name, name_len);
+		if (Py_TYPE(uniform) != &MGLUniform_Type) {
+			MGLError_Set("uniforms[%d] must be a Uniform not %s", i, Py_TYPE(uniform)->tp_name);
+			Py_DECREF(values);
+			return 0;
+		}
 
-		if (location < 0) {
-			continue;
+		if (MGLUniform_set_value(uniform, PySequence_Fast_GET_ITEM(values, i), 0) < 0) {
+			Py_DECREF(values);
+			return 0;
 		}
+	}
 
-		MGLUniform * mglo = (MGLUniform *)MGLUniform_Type.tp_alloc(&MGLUniform_Type, 0);
-		mglo->type = type;
-		mglo->location = location;
-		mglo->array_length = array_length;
-		mglo->program_obj = program->program_obj;
-		MGLUniform_Complete(mglo, gl);
+	Py_DECREF(values);
+	Py_RETURN_NONE;
+}
 
-		PyObject * item = PyTuple_New(5);
-		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
-		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(location));
-		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(array_length));
-		PyTuple_SET_ITEM(item, 3, PyLong_FromLong(mglo->dimension));
-		PyTuple_SET_ITEM(item, 4, PyUnicode_FromStringAndSize(name, name_len));
+// Creates a member of a lazy program from its reflection.
+// The kind is 'a' for attributes, 'u' for uniforms, 'b' for uniform blocks and 's' for storage blocks.
+PyObject * MGLProgram_member(MGLProgram * self, PyObject * args) {
+	int kind;
+	int index;
 
-		PyTuple_SET_ITEM(uniforms_lst, uniform_counter, item);
-		++uniform_counter;
-	}
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"Ci",
+		&kind,
+		&index
+	);
 
-	if (uniform_counter != num_uniforms) {
-		_PyTuple_Resize(&uniforms_lst, uniform_counter);
+	if (!args_ok) {
+		return 0;
 	}
 
-	for (int i = 0; i < num_uniform_blocks; ++i) {
-		int size = 0;
-		int name_len = 0;
-		char name[256];
+	if (!self->reflection) {
+		MGLError_Set("the program was not created with lazy reflection");
+		return 0;
+	}
 
-		gl.GetActiveUniformBlockName(program->program_obj, i, 256, &name_len, name);
-		int index = gl.GetUniformBlockIndex(program->program_obj, name);
-		gl.GetActiveUniformBlockiv(program->program_obj, index, GL_UNIFORM_BLOCK_DATA_SIZE, &size);
+	int position;
 
-		clean_glsl_name(name, name_len);
+	switch (kind) {
+		case 'a':
+			position = 2;
+			break;
 
-		MGLUniformBlock * mglo = (MGLUniformBlock *)MGLUniformBlock_Type.tp_alloc(&MGLUniformBlock_Type, 0);
+		case 'u':
+			position = 4;
+			break;
 
-		mglo->index = index;
-		mglo->size = size;
-		mglo->program_obj = program->program_obj;
-		mglo->gl = &gl;
+		case 'b':
+			position = 5;
+			break;
 
-		PyObject * item = PyTuple_New(4);
-		PyTuple_SET_ITEM(item, 0, (PyObject *)mglo);
-		PyTuple_SET_ITEM(item, 1, PyLong_FromLong(index));
-		PyTuple_SET_ITEM(item, 2, PyLong_FromLong(size));
-		PyTuple_SET_ITEM(item, 3, PyUnicode_FromStringAndSize(name, name_len));
+		case 's':
+			position = 8;
+			break;
 
-		PyTuple_SET_ITEM(uniform_blocks_lst, i, item);
+		default:
+			MGLError_Set("invalid member kind");
+			return 0;
 	}
 
-	int subroutine_uniforms_base = 0;
-	int subroutines_base = 0;
-
-	if (program->context->version_code >= 400) {
-		const int shader_type[5] = {
-			GL_VERTEX_SHADER,
-			GL_FRAGMENT_SHADER,
-			GL_GEOMETRY_SHADER,
-			GL_TESS_EVALUATION_SHADER,
-			GL_TESS_CONTROL_SHADER,
-		};
-
-		for (int st = 0; st < 5; ++st) {
-			int num_subroutines = 0;
-			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINES, &num_subroutines);
+	PyObject * items = PyTuple_GET_ITEM(self->reflection, position);
 
-			int num_subroutine_uniforms = 0;
-			gl.GetProgramStageiv(program_obj, shader_type[st], GL_ACTIVE_SUBROUTINE_UNIFORMS, &num_subroutine_uniforms);
+	if (index < 0 || index >= PyTuple_GET_SIZE(items)) {
+		MGLError_Set("invalid member index");
+		return 0;
+	}
 
-			for (int i = 0; i < num_subroutines; ++i) {
-				int name_len = 0;
-				char name[256];
+	const GLMethods & gl = self->context->gl;
 
-				gl.GetActiveSubroutineName(program_obj, shader_type[st], i, 256, &name_len, name);
-				int index = gl.GetSubroutineIndex(program_obj, shader_type[st], name);
+	PyObject * item = PyTuple_Pack(1, PyTuple_GET_ITEM(items, index));
+	PyObject * members;
 
-				PyObject * item = PyTuple_New(2);
-				PyTuple_SET_ITEM(item, 0, PyLong_FromLong(index));
-				PyTuple_SET_ITEM(item, 1, PyUnicode_FromStringAndSize(name, name_len));
-				PyTuple_SET_ITEM(subroutines_lst, subroutines_base + i, item);
-			}
+	switch (kind) {
+		case 'a':
+			members = MGLProgram_attribute_members(gl, self->program_obj, item);
+			break;
 
-			for (int i = 0; i < num_subroutine_uniforms; ++i) {
-				int name_len = 0;
-				char name[256];
+		case 'u':
+			members = MGLProgram_uniform_members(self->context, self->program_obj, item);
+			break;
 
-				gl.GetActiveSubroutineUniformName(program_obj, shader_type[st], i, 256, &name_len, name);
-				int location = subroutine_uniforms_base + gl.GetSubroutineUniformLocation(program_obj, shader_type[st], name);
-				PyTuple_SET_ITEM(subroutine_uniforms_lst, location, PyUnicode_FromStringAndSize(name, name_len));
-			}
+		case 'b':
+			members = MGLProgram_uniform_block_members(gl, self->program_obj, item);
+			break;
 
-			subroutine_uniforms_base += num_subroutine_uniforms;
-			subroutines_base += num_subroutines;
-		}
+		default:
+			members = MGLProgram_storage_block_members(gl, self->program_obj, item);
+			break;
 	}
 
-	PyObject * geom_info = PyTuple_New(3);
-	if (program->geometry_input != -1) {
-		PyTuple_SET_ITEM(geom_info, 0, PyLong_FromLong(program->geometry_input));
-	} else {
-		Py_INCREF(Py_None);
-		PyTuple_SET_ITEM(geom_info, 0, Py_None);
-	}
-	if (program->geometry_output != -1) {
-		PyTuple_SET_ITEM(geom_info, 1, PyLong_FromLong(program->geometry_output));
-	} else {
-		Py_INCREF(Py_None);
-		PyTuple_SET_ITEM(geom_info, 1, Py_None);
+	Py_DECREF(item);
+
+	if (!members) {
+		return 0;
 	}
-	PyTuple_SET_ITEM(geom_info, 2, PyLong_FromLong(program->geometry_vertices));
 
-	PyObject * result = PyTuple_New(9);
-	PyTuple_SET_ITEM(result, 0, (PyObject *)program);
-	PyTuple_SET_ITEM(result, 1, attributes_lst);
-	PyTuple_SET_ITEM(result, 2, varyings_lst);
-	PyTuple_SET_ITEM(result, 3, uniforms_lst);
-	PyTuple_SET_ITEM(result, 4, uniform_blocks_lst);
-	PyTuple_SET_ITEM(result, 5, subroutines_lst);
-	PyTuple_SET_ITEM(result, 6, subroutine_uniforms_lst);
-	PyTuple_SET_ITEM(result, 7, geom_info);
-	PyTuple_SET_ITEM(result, 8, PyLong_FromLong(program->program_obj));
-	return result;
+	PyObject * member = PyTuple_GET_ITEM(members, 0);
+	Py_INCREF(member);
+	Py_DECREF(members);
+	return member;
 }
 
-PyObject * MGLProgram_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
-	MGLProgram * self = (MGLProgram *)type->tp_alloc(type, 0);
+PyMethodDef MGLProgram_tp_methods[] = {
+	{"member", (PyCFunction)MGLProgram_member, METH_VARARGS, 0},
+	{"set_uniforms", (PyCFunction)MGLProgram_set_uniforms, METH_VARARGS, 0},
+	{"release", (PyCFunction)MGLProgram_release, METH_NOARGS, 0},
+	{0},
+};
 
-	if (self) {
+PyObject * MGLProgram_get_reflection(MGLProgram * self) {
+	if (!self->reflection) {
+		Py_RETURN_NONE;
 	}
 
-	return (PyObject *)self;
-}
-
-void MGLProgram_tp_dealloc(MGLProgram * self) {
-	MGLProgram_Type.tp_free((PyObject *)self);
-}
-
-PyObject * MGLProgram_release(MGLProgram * self) {
-	MGLProgram_Invalidate(self);
-	Py_RETURN_NONE;
+	Py_INCREF(self->reflection);
+	return self->reflection;
 }
 
-PyMethodDef MGLProgram_tp_methods[] = {
-	{"release", (PyCFunction)MGLProgram_release, METH_NOARGS, 0},
+PyGetSetDef MGLProgram_tp_getseters[] = {
+	{(char *)"reflection", (getter)MGLProgram_get_reflection, 0, 0, 0},
 	{0},
 };
 
@@ -656,7 +1344,7 @@ PyTypeObject MGLProgram_Type = {
 	0,                                                      // tp_iternext
 	MGLProgram_tp_methods,                                  // tp_methods
 	0,                                                      // tp_members
-	0,                                                      // tp_getset
+	MGLProgram_tp_getseters,                                // tp_getset
 	0,                                                      // tp_base
 	0,                                                      // tp_dict
 	0,                                                      // tp_descr_get
@@ -675,7 +1363,16 @@ void MGLProgram_Invalidate(MGLProgram * program) {
 	// TODO: decref
 
 	const GLMethods & gl = program->context->gl;
-	gl.DeleteProgram(program->program_obj);
+
+	if (program->pipeline_obj) {
+		gl.DeleteProgramPipelines(1, (GLuint *)&program->pipeline_obj);
+		MGLContext_forget_program_pipeline(program->context, program->pipeline_obj);
+	} else {
+		gl.DeleteProgram(program->program_obj);
+		MGLContext_forget_program(program->context, program->program_obj);
+	}
+
+	Py_CLEAR(program->reflection);
 
 	Py_TYPE(program) = &MGLInvalidObject_Type;
 	Py_DECREF(program);
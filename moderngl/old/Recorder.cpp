@@ -0,0 +1,277 @@
+#include "Types.hpp"
+
+// The number of int words following the header word of each command.
+static const int record_num_args[] = {0, 7, 1, 1, 1, 11, 3, 2, 7};
+static const int record_num_ops = (int)(sizeof(record_num_args) / sizeof(record_num_args[0]));
+
+void MGLContext_record_words(MGLContext * self, const int * words, Py_ssize_t count) {
+	if (self->record_size + count > self->record_capacity) {
+		Py_ssize_t capacity = self->record_capacity ? self->record_capacity : 256;
+		while (capacity < self->record_size + count) {
+			capacity *= 2;
+		}
+
+		int * data = new int[capacity];
+		memcpy(data, self->record_data, self->record_size * sizeof(int));
+		delete[] self->record_data;
+
+		self->record_data = data;
+		self->record_capacity = capacity;
+	}
+
+	memcpy(self->record_data + self->record_size, words, count * sizeof(int));
+	self->record_size += count;
+}
+
+void MGLContext_record(MGLContext * self, int op, const int * args, int num_args) {
+	int header = op | (num_args << 16);
+	MGLContext_record_words(self, &header, 1);
+	MGLContext_record_words(self, args, num_args);
+}
+
+// Objects are kept alive by the bytecode, it refers to them by their index in the object table.
+// The first entry of the table is the context.
+int MGLContext_record_object(MGLContext * self, PyObject * obj) {
+	PyObject * index = PyDict_GetItem(self->recorded_index, obj);
+
+	if (index) {
+		return (int)PyLong_AsLong(index);
+	}
+
+	int result = (int)PyList_GET_SIZE(self->recorded_objects);
+	PyList_Append(self->recorded_objects, obj);
+
+	index = PyLong_FromLong(result);
+	PyDict_SetItem(self->recorded_index, obj, index);
+	Py_DECREF(index);
+
+	return result;
+}
+
+// The type is checked to detect the released objects, texture bindings accept any texture type.
+PyObject * MGLContext_recorded_object(MGLContext * self, PyObject * objects, int index, int op) {
+	if (!PyTuple_GET_SIZE(objects) || PyTuple_GET_ITEM(objects, 0) != (PyObject *)self) {
+		MGLError_Set("the bytecode was not recorded by this context");
+		return 0;
+	}
+
+	if (index <= 0 || index >= PyTuple_GET_SIZE(objects)) {
+		MGLError_Set("invalid object index %d", index);
+		return 0;
+	}
+
+	PyObject * obj = PyTuple_GET_ITEM(objects, index);
+	PyTypeObject * type = Py_TYPE(obj);
+
+	bool valid = false;
+
+	switch (op) {
+		case MGL_RECORD_RENDER:
+			valid = type == &MGLVertexArray_Type;
+			break;
+
+		case MGL_RECORD_SCOPE_BEGIN:
+		case MGL_RECORD_SCOPE_END:
+			valid = type == &MGLScope_Type;
+			break;
+
+		case MGL_RECORD_FRAMEBUFFER_USE:
+		case MGL_RECORD_FRAMEBUFFER_CLEAR:
+			valid = type == &MGLFramebuffer_Type;
+			break;
+
+		case MGL_RECORD_BIND_TEXTURE:
+			valid = type == &MGLTexture_Type || type == &MGLTexture3D_Type || type == &MGLTextureArray_Type || type == &MGLTextureCube_Type;
+			break;
+
+		case MGL_RECORD_BIND_SAMPLER:
+			valid = type == &MGLSampler_Type;
+			break;
+
+		case MGL_RECORD_BIND_BUFFER_RANGE:
+			valid = type == &MGLBuffer_Type;
+			break;
+	}
+
+	if (!valid) {
+		MGLError_Set("the bytecode references a released object");
+		return 0;
+	}
+
+	return obj;
+}
+
+int MGLContext_recorded_texture_obj(PyObject * texture) {
+	PyTypeObject * type = Py_TYPE(texture);
+
+	if (type == &MGLTexture3D_Type) {
+		return ((MGLTexture3D *)texture)->texture_obj;
+	}
+
+	if (type == &MGLTextureArray_Type) {
+		return ((MGLTextureArray *)texture)->texture_obj;
+	}
+
+	if (type == &MGLTextureCube_Type) {
+		return ((MGLTextureCube *)texture)->texture_obj;
+	}
+
+	return ((MGLTexture *)texture)->texture_obj;
+}
+
+PyObject * MGLContext_record_begin(MGLContext * self) {
+	if (self->recording) {
+		MGLError_Set("the recorder is already recording");
+		return 0;
+	}
+
+	// every recording starts a new object table, it is handed over to the bytecode by record_end
+	Py_XDECREF(self->recorded_objects);
+	Py_XDECREF(self->recorded_index);
+
+	self->recorded_objects = PyList_New(0);
+	self->recorded_index = PyDict_New();
+	PyList_Append(self->recorded_objects, (PyObject *)self);
+
+	self->record_size = 0;
+	self->recording = true;
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_record_end(MGLContext * self) {
+	if (!self->recording) {
+		MGLError_Set("the recorder is not recording");
+		return 0;
+	}
+
+	self->recording = false;
+
+	PyObject * bytecode = PyBytes_FromStringAndSize((const char *)self->record_data, self->record_size * sizeof(int));
+	PyObject * objects = PyList_AsTuple(self->recorded_objects);
+
+	Py_CLEAR(self->recorded_objects);
+	Py_CLEAR(self->recorded_index);
+
+	PyObject * result = PyTuple_New(2);
+	PyTuple_SET_ITEM(result, 0, bytecode);
+	PyTuple_SET_ITEM(result, 1, objects);
+	return result;
+}
+
+PyObject * MGLContext_replay(MGLContext * self, PyObject * args) {
+	Py_buffer bytecode;
+	PyObject * objects;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"y*O!",
+		&bytecode,
+		&PyTuple_Type,
+		&objects
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (bytecode.len % sizeof(int)) {
+		MGLError_Set("invalid bytecode size %zd", bytecode.len);
+		PyBuffer_Release(&bytecode);
+		return 0;
+	}
+
+	Py_ssize_t count = bytecode.len / sizeof(int);
+	int * code = new int[count + 1];
+	memcpy(code, bytecode.buf, bytecode.len);
+	PyBuffer_Release(&bytecode);
+
+	// replaying inside a recording appends the commands with the indices of the current object table
+	bool recording = self->recording;
+	Py_ssize_t record_size = self->record_size;
+	self->recording = false;
+
+	bool ok = true;
+	Py_ssize_t i = 0;
+
+	while (ok && i < count) {
+		int op = code[i] & 0xFFFF;
+		int num_args = (code[i] >> 16) & 0xFFFF;
+		int * arg = code + i + 1;
+
+		if (op <= 0 || op >= record_num_ops || num_args != record_num_args[op] || i + 1 + num_args > count) {
+			MGLError_Set("invalid bytecode at offset %zd", i * (Py_ssize_t)sizeof(int));
+			ok = false;
+			break;
+		}
+
+		PyObject * obj = MGLContext_recorded_object(self, objects, arg[0], op);
+
+		if (!obj) {
+			ok = false;
+			break;
+		}
+
+		switch (op) {
+			case MGL_RECORD_RENDER:
+				ok = MGLVertexArray_draw((MGLVertexArray *)obj, arg[1], arg[2], arg[3], arg[4], arg[5], arg[6]);
+				break;
+
+			case MGL_RECORD_SCOPE_BEGIN:
+				ok = MGLScope_begin_core((MGLScope *)obj);
+				break;
+
+			case MGL_RECORD_SCOPE_END:
+				MGLScope_end_core((MGLScope *)obj);
+				break;
+
+			case MGL_RECORD_FRAMEBUFFER_USE:
+				MGLFramebuffer_use_core((MGLFramebuffer *)obj);
+				break;
+
+			case MGL_RECORD_FRAMEBUFFER_CLEAR: {
+				float color[4];
+				float depth;
+				memcpy(color, arg + 1, sizeof(color));
+				memcpy(&depth, arg + 5, sizeof(depth));
+				MGLFramebuffer_clear_core((MGLFramebuffer *)obj, color, depth, arg[6] ? arg + 7 : 0);
+				break;
+			}
+
+			case MGL_RECORD_BIND_TEXTURE:
+				MGLContext_bind_texture(self, arg[1], arg[2], MGLContext_recorded_texture_obj(obj));
+				break;
+
+			case MGL_RECORD_BIND_SAMPLER:
+				MGLContext_bind_sampler(self, arg[1], ((MGLSampler *)obj)->sampler_obj);
+				break;
+
+			case MGL_RECORD_BIND_BUFFER_RANGE: {
+				long long range[2];
+				memcpy(range, arg + 3, sizeof(range));
+				MGLContext_bind_buffer_range(self, arg[1], arg[2], ((MGLBuffer *)obj)->buffer_obj, (Py_ssize_t)range[0], (Py_ssize_t)range[1]);
+				break;
+			}
+		}
+
+		if (ok && recording) {
+			arg[0] = MGLContext_record_object(self, obj);
+			MGLContext_record(self, op, arg, num_args);
+		}
+
+		i += 1 + num_args;
+	}
+
+	self->recording = recording;
+
+	if (!ok && recording) {
+		self->record_size = record_size;
+	}
+
+	delete[] code;
+
+	if (!ok) {
+		return 0;
+	}
+
+	Py_RETURN_NONE;
+}
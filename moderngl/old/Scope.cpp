@@ -139,8 +139,6 @@ void MGLScope_tp_dealloc(MGLScope * self) {
 	MGLScope_Type.tp_free((PyObject *)self);
 }
 
-extern PyObject * MGLFramebuffer_use(MGLFramebuffer * self);
-
 PyObject * MGLScope_begin(MGLScope * self, PyObject * args) {
 	int args_ok = PyArg_ParseTuple(
 		args,
@@ -151,33 +149,52 @@ PyObject * MGLScope_begin(MGLScope * self, PyObject * args) {
 		return 0;
 	}
 
+	bool recording = self->context->recording;
+
+	if (recording) {
+		int record[1] = {MGLContext_record_object(self->context, (PyObject *)self)};
+		MGLContext_record(self->context, MGL_RECORD_SCOPE_BEGIN, record, 1);
+	}
+
+	// the framebuffer and the sampler binds are part of the recorded scope
+	self->context->recording = false;
+	bool ok = MGLScope_begin_core(self);
+	self->context->recording = recording;
+
+	if (!ok) {
+		return 0;
+	}
+
+	Py_RETURN_NONE;
+}
+
+bool MGLScope_begin_core(MGLScope * self) {
 	const GLMethods & gl = self->context->gl;
 	const int & flags = self->enable_flags;
 
 	self->old_enable_flags = self->context->enable_flags;
 	self->context->enable_flags = self->enable_flags;
 
-	MGLFramebuffer_use(self->framebuffer);
+	MGLFramebuffer_use_core(self->framebuffer);
 
 	for (int i = 0; i < self->num_textures; ++i) {
-		gl.ActiveTexture(self->textures[i * 3]);
-		gl.BindTexture(self->textures[i * 3 + 1], self->textures[i * 3 + 2]);
+		MGLContext_bind_texture(self->context, self->textures[i * 3] - GL_TEXTURE0, self->textures[i * 3 + 1], self->textures[i * 3 + 2]);
 	}
 
 	for (int i = 0; i < self->num_buffers; ++i) {
-		gl.BindBufferBase(self->buffers[i * 3], self->buffers[i * 3 + 2], self->buffers[i * 3 + 1]);
+		MGLContext_bind_buffer_range(self->context, self->buffers[i * 3], self->buffers[i * 3 + 2], self->buffers[i * 3 + 1], 0, -1);
 	}
 
 	int num_samplers = (int)PySequence_Fast_GET_SIZE(self->samplers);
 	for (int i = 0; i < num_samplers; ++i) {
 		PyObject * pair = PySequence_Fast(PySequence_Fast_GET_ITEM(self->samplers, i), "not iterable");
 		if (PySequence_Fast_GET_SIZE(pair) != 2) {
-			return NULL;
+			return false;
 		}
 		PyObject * call = PyObject_CallMethod(PySequence_Fast_GET_ITEM(pair, 0), "use", "O", PySequence_Fast_GET_ITEM(pair, 1));
 		Py_XDECREF(call);
 		if (!call) {
-			return NULL;
+			return false;
 		}
 	}
 
@@ -205,7 +222,7 @@ PyObject * MGLScope_begin(MGLScope * self, PyObject * args) {
 		gl.Disable(GL_RASTERIZER_DISCARD);
 	}
 
-	Py_RETURN_NONE;
+	return true;
 }
 
 PyObject * MGLScope_end(MGLScope * self, PyObject * args) {
@@ -218,12 +235,22 @@ PyObject * MGLScope_end(MGLScope * self, PyObject * args) {
 		return 0;
 	}
 
+	if (self->context->recording) {
+		int record[1] = {MGLContext_record_object(self->context, (PyObject *)self)};
+		MGLContext_record(self->context, MGL_RECORD_SCOPE_END, record, 1);
+	}
+
+	MGLScope_end_core(self);
+	Py_RETURN_NONE;
+}
+
+void MGLScope_end_core(MGLScope * self) {
 	const GLMethods & gl = self->context->gl;
 	const int & flags = self->old_enable_flags;
 
 	self->context->enable_flags = self->old_enable_flags;
 
-	MGLFramebuffer_use(self->old_framebuffer);
+	MGLFramebuffer_use_core(self->old_framebuffer);
 
 	if (flags & MGL_BLEND) {
 		gl.Enable(GL_BLEND);
@@ -248,8 +275,6 @@ PyObject * MGLScope_end(MGLScope * self, PyObject * args) {
 	} else {
 		gl.Disable(GL_RASTERIZER_DISCARD);
 	}
-
-	Py_RETURN_NONE;
 }
 
 PyMethodDef MGLScope_tp_methods[] = {
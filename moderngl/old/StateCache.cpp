@@ -0,0 +1,304 @@
+#include "Types.hpp"
+
+// The state cache mirrors the bindings made by moderngl to skip the redundant GL calls.
+// Unknown values are stored as -1, they always issue the GL call.
+
+void MGLContext_init_state_cache(MGLContext * self) {
+	const GLMethods & gl = self->gl;
+	MGLStateCache & state = self->state;
+
+	state.num_texture_units = 0;
+	gl.GetIntegerv(GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS, &state.num_texture_units);
+
+	state.num_uniform_buffers = 0;
+	gl.GetIntegerv(GL_MAX_UNIFORM_BUFFER_BINDINGS, &state.num_uniform_buffers);
+
+	state.num_storage_buffers = 0;
+	gl.GetIntegerv(GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS, &state.num_storage_buffers);
+
+	gl.GetError(); // shader storage buffers are optional
+
+	state.texture_targets = new int[state.num_texture_units + 1];
+	state.textures = new int[state.num_texture_units + 1];
+	state.samplers = new int[state.num_texture_units + 1];
+	state.uniform_buffers = new MGLBufferBinding[state.num_uniform_buffers + 1];
+	state.storage_buffers = new MGLBufferBinding[state.num_storage_buffers + 1];
+
+	state.uniform_generation = 0;
+	state.skipped_uniform_writes = 0;
+
+	MGLContext_reset_state_cache(self);
+}
+
+void MGLContext_reset_state_cache(MGLContext * self) {
+	MGLStateCache & state = self->state;
+
+	state.uniform_generation += 1;
+
+	state.program = -1;
+	state.program_pipeline = -1;
+	state.vertex_array = -1;
+	state.framebuffer = -1;
+	state.active_texture = -1;
+
+	for (int i = 0; i < state.num_texture_units; ++i) {
+		state.texture_targets[i] = -1;
+		state.textures[i] = -1;
+		state.samplers[i] = -1;
+	}
+
+	for (int i = 0; i < state.num_uniform_buffers; ++i) {
+		state.uniform_buffers[i].buffer = -1;
+	}
+
+	for (int i = 0; i < state.num_storage_buffers; ++i) {
+		state.storage_buffers[i].buffer = -1;
+	}
+
+	for (int i = 0; i < 4; ++i) {
+		state.viewport[i] = -1;
+		state.scissor[i] = -1;
+	}
+
+	state.scissor_test = -1;
+
+	for (int i = 0; i < MGL_MAX_CACHED_COLOR_MASKS; ++i) {
+		state.color_masks[i] = -1;
+	}
+
+	state.depth_mask = -1;
+}
+
+void MGLContext_use_program(MGLContext * self, int program) {
+	if (self->state.program != program) {
+		self->gl.UseProgram(program);
+		self->state.program = program;
+	}
+}
+
+void MGLContext_bind_program_pipeline(MGLContext * self, int program_pipeline) {
+	if (self->state.program_pipeline != program_pipeline) {
+		self->gl.BindProgramPipeline(program_pipeline);
+		self->state.program_pipeline = program_pipeline;
+	}
+}
+
+void MGLContext_bind_vertex_array(MGLContext * self, int vertex_array) {
+	if (self->state.vertex_array != vertex_array) {
+		self->gl.BindVertexArray(vertex_array);
+		self->state.vertex_array = vertex_array;
+	}
+}
+
+bool MGLContext_bind_framebuffer(MGLContext * self, int framebuffer) {
+	if (self->state.framebuffer == framebuffer) {
+		return false;
+	}
+
+	self->gl.BindFramebuffer(GL_FRAMEBUFFER, framebuffer);
+	self->state.framebuffer = framebuffer;
+	return true;
+}
+
+void MGLContext_bind_texture(MGLContext * self, int unit, int target, int texture) {
+	const GLMethods & gl = self->gl;
+	MGLStateCache & state = self->state;
+
+	if (unit < 0 || unit >= state.num_texture_units) {
+		gl.ActiveTexture(GL_TEXTURE0 + unit);
+		gl.BindTexture(target, texture);
+		state.active_texture = -1;
+		return;
+	}
+
+	if (state.texture_targets[unit] == target && state.textures[unit] == texture) {
+		return;
+	}
+
+	if (state.active_texture != unit) {
+		gl.ActiveTexture(GL_TEXTURE0 + unit);
+		state.active_texture = unit;
+	}
+
+	gl.BindTexture(target, texture);
+	state.texture_targets[unit] = target;
+	state.textures[unit] = texture;
+}
+
+void MGLContext_bind_sampler(MGLContext * self, int unit, int sampler) {
+	MGLStateCache & state = self->state;
+
+	if (unit < 0 || unit >= state.num_texture_units) {
+		self->gl.BindSampler(unit, sampler);
+		return;
+	}
+
+	if (state.samplers[unit] != sampler) {
+		self->gl.BindSampler(unit, sampler);
+		state.samplers[unit] = sampler;
+	}
+}
+
+void MGLContext_bind_buffer_range(MGLContext * self, int target, int binding, int buffer, Py_ssize_t offset, Py_ssize_t size) {
+	const GLMethods & gl = self->gl;
+	MGLStateCache & state = self->state;
+
+	MGLBufferBinding * cache = 0;
+
+	if (target == GL_UNIFORM_BUFFER && binding >= 0 && binding < state.num_uniform_buffers) {
+		cache = state.uniform_buffers + binding;
+	} else if (target == GL_SHADER_STORAGE_BUFFER && binding >= 0 && binding < state.num_storage_buffers) {
+		cache = state.storage_buffers + binding;
+	}
+
+	if (cache && cache->buffer == buffer && cache->offset == offset && cache->size == size) {
+		return;
+	}
+
+	// a negative size binds the whole buffer
+	if (size < 0) {
+		gl.BindBufferBase(target, binding, buffer);
+	} else {
+		gl.BindBufferRange(target, binding, buffer, (GLintptr)offset, (GLsizeiptr)size);
+	}
+
+	if (cache) {
+		cache->buffer = buffer;
+		cache->offset = offset;
+		cache->size = size;
+	}
+}
+
+void MGLContext_viewport(MGLContext * self, int x, int y, int width, int height) {
+	int * viewport = self->state.viewport;
+
+	if (viewport[0] != x || viewport[1] != y || viewport[2] != width || viewport[3] != height) {
+		self->gl.Viewport(x, y, width, height);
+		viewport[0] = x;
+		viewport[1] = y;
+		viewport[2] = width;
+		viewport[3] = height;
+	}
+}
+
+// The scissor box is only set when the scissor test is enabled.
+void MGLContext_scissor(MGLContext * self, bool enabled, int x, int y, int width, int height) {
+	const GLMethods & gl = self->gl;
+	MGLStateCache & state = self->state;
+
+	if (state.scissor_test != (int)enabled) {
+		if (enabled) {
+			gl.Enable(GL_SCISSOR_TEST);
+		} else {
+			gl.Disable(GL_SCISSOR_TEST);
+		}
+		state.scissor_test = enabled;
+	}
+
+	if (!enabled) {
+		return;
+	}
+
+	int * scissor = state.scissor;
+
+	if (scissor[0] != x || scissor[1] != y || scissor[2] != width || scissor[3] != height) {
+		gl.Scissor(x, y, width, height);
+		scissor[0] = x;
+		scissor[1] = y;
+		scissor[2] = width;
+		scissor[3] = height;
+	}
+}
+
+void MGLContext_color_mask(MGLContext * self, int index, bool r, bool g, bool b, bool a) {
+	int mask = (r ? 1 : 0) | (g ? 2 : 0) | (b ? 4 : 0) | (a ? 8 : 0);
+
+	if (index < 0 || index >= MGL_MAX_CACHED_COLOR_MASKS) {
+		self->gl.ColorMaski(index, r, g, b, a);
+		return;
+	}
+
+	if (self->state.color_masks[index] != mask) {
+		self->gl.ColorMaski(index, r, g, b, a);
+		self->state.color_masks[index] = mask;
+	}
+}
+
+void MGLContext_depth_mask(MGLContext * self, bool depth_mask) {
+	if (self->state.depth_mask != (int)depth_mask) {
+		self->gl.DepthMask(depth_mask);
+		self->state.depth_mask = depth_mask;
+	}
+}
+
+// The deleted names can be reused by the driver, the bindings referencing them become unknown.
+
+void MGLContext_forget_program(MGLContext * self, int program) {
+	if (self->state.program == program) {
+		self->state.program = -1;
+	}
+}
+
+void MGLContext_forget_program_pipeline(MGLContext * self, int program_pipeline) {
+	if (self->state.program_pipeline == program_pipeline) {
+		self->state.program_pipeline = -1;
+	}
+}
+
+void MGLContext_forget_vertex_array(MGLContext * self, int vertex_array) {
+	if (self->state.vertex_array == vertex_array) {
+		self->state.vertex_array = -1;
+	}
+}
+
+void MGLContext_forget_framebuffer(MGLContext * self, int framebuffer) {
+	if (self->state.framebuffer == framebuffer) {
+		self->state.framebuffer = -1;
+	}
+}
+
+void MGLContext_forget_texture(MGLContext * self, int texture) {
+	MGLStateCache & state = self->state;
+
+	for (int i = 0; i < state.num_texture_units; ++i) {
+		if (state.textures[i] == texture) {
+			state.texture_targets[i] = -1;
+			state.textures[i] = -1;
+		}
+	}
+}
+
+void MGLContext_forget_sampler(MGLContext * self, int sampler) {
+	MGLStateCache & state = self->state;
+
+	for (int i = 0; i < state.num_texture_units; ++i) {
+		if (state.samplers[i] == sampler) {
+			state.samplers[i] = -1;
+		}
+	}
+}
+
+void MGLContext_forget_buffer(MGLContext * self, int buffer) {
+	MGLStateCache & state = self->state;
+
+	for (int i = 0; i < state.num_uniform_buffers; ++i) {
+		if (state.uniform_buffers[i].buffer == buffer) {
+			state.uniform_buffers[i].buffer = -1;
+		}
+	}
+
+	for (int i = 0; i < state.num_storage_buffers; ++i) {
+		if (state.storage_buffers[i].buffer == buffer) {
+			state.storage_buffers[i].buffer = -1;
+		}
+	}
+}
+
+PyObject * MGLContext_invalidate_state_cache(MGLContext * self) {
+	MGLContext_reset_state_cache(self);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_get_skipped_uniform_writes(MGLContext * self) {
+	return PyLong_FromLongLong(self->state.skipped_uniform_writes);
+}
@@ -0,0 +1,85 @@
+#include "Types.hpp"
+
+PyObject * MGLStorageBlock_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLStorageBlock * self = (MGLStorageBlock *)type->tp_alloc(type, 0);
+
+	if (self) {
+	}
+
+	return (PyObject *)self;
+}
+
+void MGLStorageBlock_tp_dealloc(MGLStorageBlock * self) {
+
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+PyMethodDef MGLStorageBlock_tp_methods[] = {
+	{0},
+};
+
+PyObject * MGLStorageBlock_get_binding(MGLStorageBlock * self, void * closure) {
+	const int property = GL_BUFFER_BINDING;
+	int binding = 0;
+	self->gl->GetProgramResourceiv(self->program_obj, GL_SHADER_STORAGE_BLOCK, self->index, 1, (const GLenum *)&property, 1, 0, &binding);
+	return PyLong_FromLong(binding);
+}
+
+int MGLStorageBlock_set_binding(MGLStorageBlock * self, PyObject * value, void * closure) {
+	int binding = PyLong_AsUnsignedLong(value);
+
+	if (PyErr_Occurred()) {
+		MGLError_Set("invalid value for binding");
+		return -1;
+	}
+
+	self->gl->ShaderStorageBlockBinding(self->program_obj, self->index, binding);
+	return 0;
+}
+
+PyGetSetDef MGLStorageBlock_tp_getseters[] = {
+	{(char *)"binding", (getter)MGLStorageBlock_get_binding, (setter)MGLStorageBlock_set_binding, 0, 0},
+	{0},
+};
+
+PyTypeObject MGLStorageBlock_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.StorageBlock",                                     // tp_name
+	sizeof(MGLStorageBlock),                                // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLStorageBlock_tp_dealloc,                 // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	0,                                                      // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	MGLStorageBlock_tp_methods,                             // tp_methods
+	0,                                                      // tp_members
+	MGLStorageBlock_tp_getseters,                           // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	MGLStorageBlock_tp_new,                                 // tp_new
+};
+
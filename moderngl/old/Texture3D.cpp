@@ -97,8 +97,7 @@ PyObject * MGLContext_texture3d(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, texture->texture_obj);
+	MGLContext_bind_texture(self, self->default_texture_unit, GL_TEXTURE_3D, texture->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -178,8 +177,7 @@ PyObject * MGLTexture3D_read(MGLTexture3D * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -224,8 +222,7 @@ PyObject * MGLTexture3D_read_into(MGLTexture3D * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_3D, 0, format, pixel_type, (void *)write_offset);
@@ -250,8 +247,7 @@ PyObject * MGLTexture3D_read_into(MGLTexture3D * self, PyObject * args) {
 		char * ptr = (char *)buffer_view.buf + write_offset;
 
 		const GLMethods & gl = self->context->gl;
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_3D, 0, format, pixel_type, ptr);
@@ -343,8 +339,7 @@ PyObject * MGLTexture3D_write(MGLTexture3D * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage3D(GL_TEXTURE_3D, 0, x, y, z, width, height, depth, format, pixel_type, 0);
@@ -368,8 +363,7 @@ PyObject * MGLTexture3D_write(MGLTexture3D * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -395,9 +389,12 @@ PyObject * MGLTexture3D_use(MGLTexture3D * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + index);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, index, GL_TEXTURE_3D, self->texture_obj);
+
+	if (self->context->recording) {
+		int record[3] = {MGLContext_record_object(self->context, (PyObject *)self), index, GL_TEXTURE_3D};
+		MGLContext_record(self->context, MGL_RECORD_BIND_TEXTURE, record, 3);
+	}
 
 	Py_RETURN_NONE;
 }
@@ -424,8 +421,7 @@ PyObject * MGLTexture3D_build_mipmaps(MGLTexture3D * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_BASE_LEVEL, base);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAX_LEVEL, max);
@@ -465,8 +461,7 @@ int MGLTexture3D_set_repeat_x(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_S, GL_REPEAT);
@@ -490,8 +485,7 @@ int MGLTexture3D_set_repeat_y(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_T, GL_REPEAT);
@@ -515,8 +509,7 @@ int MGLTexture3D_set_repeat_z(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_R, GL_REPEAT);
@@ -550,8 +543,7 @@ int MGLTexture3D_set_filter(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MIN_FILTER, self->min_filter);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAG_FILTER, self->mag_filter);
 
@@ -562,8 +554,7 @@ PyObject * MGLTexture3D_get_swizzle(MGLTexture3D * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	int swizzle_r = 0;
 	int swizzle_g = 0;
@@ -613,8 +604,7 @@ int MGLTexture3D_set_swizzle(MGLTexture3D * self, PyObject * value, void * closu
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_SWIZZLE_R, tex_swizzle[0]);
 	if (tex_swizzle[1] != -1) {
@@ -689,6 +679,7 @@ void MGLTexture3D_Invalidate(MGLTexture3D * texture) {
 
 	const GLMethods & gl = texture->context->gl;
 	gl.DeleteTextures(1, (GLuint *)&texture->texture_obj);
+	MGLContext_forget_texture(texture->context, texture->texture_obj);
 
 	Py_DECREF(texture->context);
 	Py_TYPE(texture) = &MGLInvalidObject_Type;
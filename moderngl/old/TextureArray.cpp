@@ -86,8 +86,6 @@ PyObject * MGLContext_texture_array(MGLContext * self, PyObject * args) {
 
 	const GLMethods & gl = self->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
-
 	MGLTextureArray * texture = (MGLTextureArray *)MGLTextureArray_Type.tp_alloc(&MGLTextureArray_Type, 0);
 
 	texture->texture_obj = 0;
@@ -99,7 +97,7 @@ PyObject * MGLContext_texture_array(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, texture->texture_obj);
+	MGLContext_bind_texture(self, self->default_texture_unit, GL_TEXTURE_2D_ARRAY, texture->texture_obj);
 
     gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
     gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -178,8 +176,7 @@ PyObject * MGLTextureArray_read(MGLTextureArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -245,8 +242,7 @@ PyObject * MGLTextureArray_read_into(MGLTextureArray * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_2D_ARRAY, 0, format, pixel_type, (void *)write_offset);
@@ -272,8 +268,7 @@ PyObject * MGLTextureArray_read_into(MGLTextureArray * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_2D_ARRAY, 0, format, pixel_type, ptr);
@@ -365,8 +360,7 @@ PyObject * MGLTextureArray_write(MGLTextureArray * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, x, y, z, width, height, layers, format, pixel_type, 0);
@@ -390,8 +384,7 @@ PyObject * MGLTextureArray_write(MGLTextureArray * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, x, y, z, width, height, layers, format, pixel_type, buffer_view.buf);
@@ -417,9 +410,12 @@ PyObject * MGLTextureArray_use(MGLTextureArray * self, PyObject * args) {
 	}
 
 
-	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + index);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, index, GL_TEXTURE_2D_ARRAY, self->texture_obj);
+
+	if (self->context->recording) {
+		int record[3] = {MGLContext_record_object(self->context, (PyObject *)self), index, GL_TEXTURE_2D_ARRAY};
+		MGLContext_record(self->context, MGL_RECORD_BIND_TEXTURE, record, 3);
+	}
 
 	Py_RETURN_NONE;
 }
@@ -446,8 +442,7 @@ PyObject * MGLTextureArray_build_mipmaps(MGLTextureArray * self, PyObject * args
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_BASE_LEVEL, base);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAX_LEVEL, max);
@@ -487,8 +482,7 @@ int MGLTextureArray_set_repeat_x(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_S, GL_REPEAT);
@@ -512,8 +506,7 @@ int MGLTextureArray_set_repeat_y(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_T, GL_REPEAT);
@@ -548,8 +541,7 @@ int MGLTextureArray_set_filter(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 	gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, self->min_filter);
 	gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, self->mag_filter);
 
@@ -560,8 +552,7 @@ PyObject * MGLTextureArray_get_swizzle(MGLTextureArray * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	int swizzle_r = 0;
 	int swizzle_g = 0;
@@ -611,8 +602,7 @@ int MGLTextureArray_set_swizzle(MGLTextureArray * self, PyObject * value, void *
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_SWIZZLE_R, tex_swizzle[0]);
 	if (tex_swizzle[1] != -1) {
@@ -637,8 +627,7 @@ int MGLTextureArray_set_anisotropy(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_bind_texture(self->context, self->context->default_texture_unit, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 	gl.TexParameterf(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAX_ANISOTROPY, self->anisotropy);
 
 	return 0;
@@ -703,6 +692,7 @@ void MGLTextureArray_Invalidate(MGLTextureArray * texture) {
 
 	const GLMethods & gl = texture->context->gl;
 	gl.DeleteTextures(1, (GLuint *)&texture->texture_obj);
+	MGLContext_forget_texture(texture->context, texture->texture_obj);
 
 	Py_DECREF(texture->context);
 	Py_TYPE(texture) = &MGLInvalidObject_Type;
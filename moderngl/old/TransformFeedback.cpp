@@ -0,0 +1,341 @@
+#include "Types.hpp"
+
+#include "InlineMethods.hpp"
+
+PyObject * MGLContext_transform_feedback(MGLContext * self, PyObject * args) {
+	PyObject * buffers;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O!",
+		&PyTuple_Type,
+		&buffers
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	int num_buffers = (int)PyTuple_GET_SIZE(buffers);
+
+	if (!num_buffers) {
+		MGLError_Set("at least one buffer is required");
+		return 0;
+	}
+
+	for (int i = 0; i < num_buffers; ++i) {
+		PyObject * item = PyTuple_GET_ITEM(buffers, i);
+		if (Py_TYPE(item) != &MGLBuffer_Type) {
+			MGLError_Set("buffers[%d] must be a Buffer not %s", i, Py_TYPE(item)->tp_name);
+			return 0;
+		}
+	}
+
+	const GLMethods & gl = self->gl;
+
+	if (!gl.GenTransformFeedbacks) {
+		MGLError_Set("transform feedback objects are not supported");
+		return 0;
+	}
+
+	MGLTransformFeedback * transform_feedback = (MGLTransformFeedback *)MGLTransformFeedback_Type.tp_alloc(&MGLTransformFeedback_Type, 0);
+
+	transform_feedback->transform_feedback_obj = 0;
+	gl.GenTransformFeedbacks(1, (GLuint *)&transform_feedback->transform_feedback_obj);
+
+	if (!transform_feedback->transform_feedback_obj) {
+		MGLError_Set("cannot create transform feedback");
+		Py_DECREF(transform_feedback);
+		return 0;
+	}
+
+	transform_feedback->query_objs = 0;
+	transform_feedback->num_queries = 0;
+	transform_feedback->query_capacity = 0;
+
+	// the buffer bindings are part of the transform feedback object
+	gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, transform_feedback->transform_feedback_obj);
+
+	for (int i = 0; i < num_buffers; ++i) {
+		MGLBuffer * buffer = (MGLBuffer *)PyTuple_GET_ITEM(buffers, i);
+		gl.BindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, i, buffer->buffer_obj);
+	}
+
+	gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, 0);
+
+	Py_INCREF(buffers);
+	transform_feedback->buffers = buffers;
+
+	transform_feedback->active = false;
+	transform_feedback->paused = false;
+
+	Py_INCREF(self);
+	transform_feedback->context = self;
+
+	Py_INCREF(transform_feedback);
+
+	PyObject * result = PyTuple_New(2);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)transform_feedback);
+	PyTuple_SET_ITEM(result, 1, PyLong_FromLong(transform_feedback->transform_feedback_obj));
+	return result;
+}
+
+PyObject * MGLTransformFeedback_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLTransformFeedback * self = (MGLTransformFeedback *)type->tp_alloc(type, 0);
+
+	if (self) {
+	}
+
+	return (PyObject *)self;
+}
+
+void MGLTransformFeedback_tp_dealloc(MGLTransformFeedback * self) {
+	MGLTransformFeedback_Type.tp_free((PyObject *)self);
+}
+
+// The query only counts the current segment, the primitives are summed over the segments.
+// The query objects are reused by the next captures.
+void MGLTransformFeedback_begin_query(MGLTransformFeedback * self) {
+	const GLMethods & gl = self->context->gl;
+
+	if (self->num_queries == self->query_capacity) {
+		int capacity = self->query_capacity ? self->query_capacity * 2 : 4;
+		int * query_objs = new int[capacity];
+		memcpy(query_objs, self->query_objs, self->query_capacity * sizeof(int));
+		gl.GenQueries(capacity - self->query_capacity, (GLuint *)query_objs + self->query_capacity);
+		delete[] self->query_objs;
+
+		self->query_objs = query_objs;
+		self->query_capacity = capacity;
+	}
+
+	gl.BeginQuery(GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN, self->query_objs[self->num_queries++]);
+}
+
+// The program with the varyings must be in use.
+void MGLTransformFeedback_begin_core(MGLTransformFeedback * self, int mode) {
+	const GLMethods & gl = self->context->gl;
+
+	gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, self->transform_feedback_obj);
+	self->num_queries = 0;
+	MGLTransformFeedback_begin_query(self);
+	gl.BeginTransformFeedback(mode);
+
+	self->active = true;
+	self->paused = false;
+}
+
+// The query is ended so other captures can be counted while paused.
+void MGLTransformFeedback_pause_core(MGLTransformFeedback * self) {
+	const GLMethods & gl = self->context->gl;
+
+	gl.PauseTransformFeedback();
+	gl.EndQuery(GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN);
+	self->paused = true;
+}
+
+// Other transform feedback objects may be bound while paused.
+void MGLTransformFeedback_resume_core(MGLTransformFeedback * self) {
+	const GLMethods & gl = self->context->gl;
+
+	gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, self->transform_feedback_obj);
+	MGLTransformFeedback_begin_query(self);
+	gl.ResumeTransformFeedback();
+	self->paused = false;
+}
+
+void MGLTransformFeedback_end_core(MGLTransformFeedback * self) {
+	const GLMethods & gl = self->context->gl;
+
+	gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, self->transform_feedback_obj);
+	gl.EndTransformFeedback();
+
+	if (!self->paused) {
+		gl.EndQuery(GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN);
+	}
+
+	gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, 0);
+
+	self->active = false;
+	self->paused = false;
+}
+
+PyObject * MGLTransformFeedback_begin(MGLTransformFeedback * self, PyObject * args) {
+	MGLProgram * program;
+	int mode;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O!I",
+		&MGLProgram_Type,
+		&program,
+		&mode
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (self->active) {
+		MGLError_Set("the transform feedback is already active");
+		return 0;
+	}
+
+	if (!program->num_varyings) {
+		MGLError_Set("the program has no varyings");
+		return 0;
+	}
+
+	MGLProgram_use(program);
+	MGLTransformFeedback_begin_core(self, mode);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLTransformFeedback_pause(MGLTransformFeedback * self) {
+	if (!self->active || self->paused) {
+		MGLError_Set("the transform feedback is not running");
+		return 0;
+	}
+
+	MGLTransformFeedback_pause_core(self);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLTransformFeedback_resume(MGLTransformFeedback * self) {
+	if (!self->active || !self->paused) {
+		MGLError_Set("the transform feedback is not paused");
+		return 0;
+	}
+
+	MGLTransformFeedback_resume_core(self);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLTransformFeedback_end(MGLTransformFeedback * self) {
+	if (!self->active) {
+		MGLError_Set("the transform feedback is not active");
+		return 0;
+	}
+
+	MGLTransformFeedback_end_core(self);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLTransformFeedback_release(MGLTransformFeedback * self) {
+	MGLTransformFeedback_Invalidate(self);
+	Py_RETURN_NONE;
+}
+
+PyMethodDef MGLTransformFeedback_tp_methods[] = {
+	{"begin", (PyCFunction)MGLTransformFeedback_begin, METH_VARARGS, 0},
+	{"pause", (PyCFunction)MGLTransformFeedback_pause, METH_NOARGS, 0},
+	{"resume", (PyCFunction)MGLTransformFeedback_resume, METH_NOARGS, 0},
+	{"end", (PyCFunction)MGLTransformFeedback_end, METH_NOARGS, 0},
+	{"release", (PyCFunction)MGLTransformFeedback_release, METH_NOARGS, 0},
+	{0},
+};
+
+PyObject * MGLTransformFeedback_get_active(MGLTransformFeedback * self) {
+	return PyBool_FromLong(self->active);
+}
+
+PyObject * MGLTransformFeedback_get_paused(MGLTransformFeedback * self) {
+	return PyBool_FromLong(self->paused);
+}
+
+// Returns None while the result is not available, the GPU is never waited for.
+PyObject * MGLTransformFeedback_get_primitives(MGLTransformFeedback * self) {
+	if (self->active) {
+		Py_RETURN_NONE;
+	}
+
+	const GLMethods & gl = self->context->gl;
+
+	long long primitives = 0;
+
+	for (int i = 0; i < self->num_queries; ++i) {
+		int available = 0;
+		gl.GetQueryObjectiv(self->query_objs[i], GL_QUERY_RESULT_AVAILABLE, &available);
+
+		if (!available) {
+			Py_RETURN_NONE;
+		}
+
+		int written = 0;
+		gl.GetQueryObjectiv(self->query_objs[i], GL_QUERY_RESULT, &written);
+		primitives += written;
+	}
+
+	return PyLong_FromLongLong(primitives);
+}
+
+PyGetSetDef MGLTransformFeedback_tp_getseters[] = {
+	{(char *)"active", (getter)MGLTransformFeedback_get_active, 0, 0, 0},
+	{(char *)"paused", (getter)MGLTransformFeedback_get_paused, 0, 0, 0},
+	{(char *)"primitives", (getter)MGLTransformFeedback_get_primitives, 0, 0, 0},
+	{0},
+};
+
+PyTypeObject MGLTransformFeedback_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.TransformFeedback",                                // tp_name
+	sizeof(MGLTransformFeedback),                           // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLTransformFeedback_tp_dealloc,            // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	0,                                                      // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	MGLTransformFeedback_tp_methods,                        // tp_methods
+	0,                                                      // tp_members
+	MGLTransformFeedback_tp_getseters,                      // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	MGLTransformFeedback_tp_new,                            // tp_new
+};
+
+void MGLTransformFeedback_Invalidate(MGLTransformFeedback * transform_feedback) {
+	if (Py_TYPE(transform_feedback) == &MGLInvalidObject_Type) {
+		return;
+	}
+
+	const GLMethods & gl = transform_feedback->context->gl;
+
+	if (transform_feedback->active) {
+		MGLTransformFeedback_end_core(transform_feedback);
+	}
+
+	gl.DeleteTransformFeedbacks(1, (GLuint *)&transform_feedback->transform_feedback_obj);
+	if (transform_feedback->query_capacity) {
+		gl.DeleteQueries(transform_feedback->query_capacity, (GLuint *)transform_feedback->query_objs);
+		delete[] transform_feedback->query_objs;
+	}
+
+	Py_DECREF(transform_feedback->buffers);
+	Py_DECREF(transform_feedback->context);
+	Py_TYPE(transform_feedback) = &MGLInvalidObject_Type;
+	Py_DECREF(transform_feedback);
+}
@@ -47,7 +47,11 @@ struct MGLTextureCube;
 struct MGLUniform;
 struct MGLUniformBlock;
 struct MGLVertexArray;
+struct MGLVertexLayout;
 struct MGLSampler;
+struct MGLTransformFeedback;
+struct MGLPendingProgram;
+struct MGLStorageBlock;
 
 struct MGLDataType {
 	int * base_format;
@@ -88,6 +92,24 @@ struct MGLBuffer {
 
 	Py_ssize_t size;
 	bool dynamic;
+
+	// persistent mapping for stream buffers, zero for regular buffers
+	char * mapped;
+
+	GLsync * fences;
+	int frames;
+	int frame;
+	Py_ssize_t frame_size;
+	Py_ssize_t frame_head;
+
+	// range mapped by Buffer.map
+	char * map_ptr;
+	Py_ssize_t map_offset;
+	Py_ssize_t map_size;
+	int map_access;
+
+	// pending copy into a staging buffer created by read_async
+	GLsync fence;
 };
 
 struct MGLComputeShader {
@@ -99,6 +121,43 @@ struct MGLComputeShader {
 	int shader_obj;
 };
 
+struct MGLBufferBinding {
+	int buffer;
+	Py_ssize_t offset;
+	Py_ssize_t size;
+};
+
+#define MGL_MAX_CACHED_COLOR_MASKS 16
+
+// CPU side copy of the GL bindings, see StateCache.cpp
+struct MGLStateCache {
+	int program;
+	int program_pipeline;
+	int vertex_array;
+	int framebuffer;
+
+	int active_texture;
+	int num_texture_units;
+	int * texture_targets;
+	int * textures;
+	int * samplers;
+
+	int num_uniform_buffers;
+	MGLBufferBinding * uniform_buffers;
+	int num_storage_buffers;
+	MGLBufferBinding * storage_buffers;
+
+	int viewport[4];
+	int scissor_test;
+	int scissor[4];
+	int color_masks[MGL_MAX_CACHED_COLOR_MASKS];
+	int depth_mask;
+
+	// the uniform caches written in an older generation are stale
+	int uniform_generation;
+	long long skipped_uniform_writes;
+};
+
 struct MGLContext {
 	PyObject_HEAD
 
@@ -125,12 +184,34 @@ struct MGLContext {
 	int depth_func;
 	int blend_func_src;
 	int blend_func_dst;
+	int blend_func_src_alpha;
+	int blend_func_dst_alpha;
+	int blend_equation_rgb;
+	int blend_equation_alpha;
 
 	bool wireframe;
 	bool multisample;
 
 	int provoking_vertex;
 
+	float line_width;
+	float point_size;
+	int patch_vertices;
+
+	// ctx.recorder: the commands are recorded as int words, objects are referenced by their index
+	PyObject * recorded_objects;
+	PyObject * recorded_index;
+	int * record_data;
+	Py_ssize_t record_size;
+	Py_ssize_t record_capacity;
+	bool recording;
+
+	// the parallel shader compile extensions are looked up before the first pending program
+	bool parallel_shader_compile_checked;
+	bool parallel_shader_compile;
+
+	MGLStateCache state;
+
 	GLMethods gl;
 };
 
@@ -178,6 +259,9 @@ struct MGLProgram {
 
 	int program_obj;
 
+	// the program pipeline combining separable programs, zero for linked programs
+	int pipeline_obj;
+
 	int num_vertex_shader_subroutines;
 	int num_fragment_shader_subroutines;
 	int num_geometry_shader_subroutines;
@@ -186,6 +270,10 @@ struct MGLProgram {
 
 	int geometry_vertices;
 	int num_varyings;
+	bool separate_varyings;
+
+	// the reflection of lazy programs, the members are created on demand
+	PyObject * reflection;
 };
 
 enum MGLQueryKeys {
@@ -357,6 +445,14 @@ struct MGLUniform {
 	int array_length;
 
 	bool matrix;
+
+	// the buffer protocol format of the scalars: 'f', 'd', 'i' or 'I'
+	char scalar_format;
+
+	// the last written value, valid while the generation matches the state cache
+	MGLStateCache * state;
+	char * cache;
+	int cache_generation;
 };
 
 struct MGLUniformBlock {
@@ -370,12 +466,57 @@ struct MGLUniformBlock {
 	int size;
 };
 
+struct MGLStorageBlock {
+	PyObject_HEAD
+
+	const GLMethods * gl;
+
+	int program_obj;
+
+	int index;
+};
+
+struct MGLVertexLayoutAttribute {
+	void * gl_attrib_ptr_proc;
+	bool normalizable;
+	char shape;
+
+	int binding;
+	int location;
+	int count;
+	int type;
+	bool normalize;
+	int offset;
+};
+
+struct MGLVertexLayoutBinding {
+	int stride;
+	int divisor;
+};
+
+struct MGLVertexLayout {
+	PyObject_HEAD
+
+	MGLContext * context;
+	MGLProgram * program;
+
+	MGLVertexLayoutBinding * bindings;
+	int num_bindings;
+
+	MGLVertexLayoutAttribute * attributes;
+	int num_attributes;
+
+	bool separate_format;
+};
+
 struct MGLVertexArray {
 	PyObject_HEAD
 
 	MGLContext * context;
 
 	MGLProgram * program;
+	MGLVertexLayout * layout;
+	int * binding_vertices;
 	MGLBuffer * index_buffer;
 	int index_element_size;
 	int index_element_type;
@@ -410,6 +551,38 @@ struct MGLSampler {
 	float max_lod;
 };
 
+struct MGLTransformFeedback {
+	PyObject_HEAD
+
+	MGLContext * context;
+	PyObject * buffers;
+
+	int transform_feedback_obj;
+
+	// one primitives written query per segment between pauses
+	int * query_objs;
+	int num_queries;
+	int query_capacity;
+
+	bool active;
+	bool paused;
+};
+
+struct MGLPendingProgram {
+	PyObject_HEAD
+
+	MGLContext * context;
+	PyObject * shaders;
+
+	int program_obj;
+	int shader_objs[NUM_SHADER_SLOTS];
+
+	bool separate;
+	bool retrievable;
+	bool lazy;
+	bool resolved;
+};
+
 MGLDataType * from_dtype(const char * dtype);
 
 void MGLAttribute_Invalidate(MGLAttribute * attribute);
@@ -426,14 +599,79 @@ void MGLTextureArray_Invalidate(MGLTextureArray * texture);
 void MGLUniform_Invalidate(MGLUniform * uniform);
 void MGLVertexArray_Invalidate(MGLVertexArray * vertex_array);
 void MGLSampler_Invalidate(MGLSampler * sampler);
+void MGLTransformFeedback_Invalidate(MGLTransformFeedback * transform_feedback);
 
 void MGLAttribute_Complete(MGLAttribute * attribute, const GLMethods & gl);
 void MGLUniform_Complete(MGLUniform * self, const GLMethods & gl);
+int MGLUniform_set_value(MGLUniform * self, PyObject * value, void * closure);
+void MGLUniform_write(MGLUniform * self, const void * data);
+void MGLUniform_read(MGLUniform * self, int index, void * data);
 void MGLUniformBlock_Complete(MGLUniformBlock * uniform_block, const GLMethods & gl);
 void MGLVertexArray_Complete(MGLVertexArray * vertex_array);
+void MGLVertexArray_bind_buffer(MGLVertexArray * self, int binding, MGLBuffer * buffer, Py_ssize_t offset, Py_ssize_t size, int stride);
 
 void MGLContext_Initialize(MGLContext * self);
 
+enum MGLRecordOp {
+	MGL_RECORD_RENDER = 1,
+	MGL_RECORD_SCOPE_BEGIN,
+	MGL_RECORD_SCOPE_END,
+	MGL_RECORD_FRAMEBUFFER_USE,
+	MGL_RECORD_FRAMEBUFFER_CLEAR,
+	MGL_RECORD_BIND_TEXTURE,
+	MGL_RECORD_BIND_SAMPLER,
+	MGL_RECORD_BIND_BUFFER_RANGE,
+};
+
+void MGLContext_record(MGLContext * self, int op, const int * args, int num_args);
+int MGLContext_record_object(MGLContext * self, PyObject * obj);
+
+bool MGLVertexArray_draw(MGLVertexArray * self, int mode, int vertices, int first, int instances, int base_vertex, int base_instance);
+bool MGLScope_begin_core(MGLScope * self);
+void MGLScope_end_core(MGLScope * self);
+void MGLFramebuffer_use_core(MGLFramebuffer * self);
+void MGLFramebuffer_clear_core(MGLFramebuffer * self, const float * color, float depth, const int * viewport);
+
+void MGLTransformFeedback_begin_core(MGLTransformFeedback * self, int mode);
+void MGLTransformFeedback_pause_core(MGLTransformFeedback * self);
+void MGLTransformFeedback_resume_core(MGLTransformFeedback * self);
+void MGLTransformFeedback_end_core(MGLTransformFeedback * self);
+
+PyObject * MGLProgram_query_uniforms(const GLMethods & gl, int program_obj);
+PyObject * MGLProgram_query_uniform_blocks(const GLMethods & gl, int program_obj);
+PyObject * MGLProgram_uniform_members(MGLContext * context, int program_obj, PyObject * uniforms);
+PyObject * MGLProgram_uniform_block_members(const GLMethods & gl, int program_obj, PyObject * uniform_blocks);
+PyObject * MGLProgram_query_storage_blocks(const GLMethods & gl, int program_obj);
+PyObject * MGLProgram_storage_block_members(const GLMethods & gl, int program_obj, PyObject * storage_blocks);
+int MGLContext_load_program_binary(MGLContext * self, PyObject * binary, int separable);
+PyObject * MGLContext_get_program_binary(MGLContext * self, int program_obj);
+bool MGLProgram_check_varyings(PyObject * outputs);
+int MGLContext_submit_program(MGLContext * self, PyObject ** shaders, PyObject * outputs, int separate, int retrievable, int separable, int * shader_objs);
+bool MGLContext_check_program(MGLContext * self, int program_obj, const int * shader_objs);
+PyObject * MGLContext_finish_program(MGLContext * self, int program_obj, PyObject ** shaders, int separate, PyObject * reflection, int retrievable, int lazy);
+void MGLProgram_use(MGLProgram * program);
+
+void MGLContext_init_state_cache(MGLContext * self);
+void MGLContext_reset_state_cache(MGLContext * self);
+void MGLContext_use_program(MGLContext * self, int program);
+void MGLContext_bind_program_pipeline(MGLContext * self, int program_pipeline);
+void MGLContext_bind_vertex_array(MGLContext * self, int vertex_array);
+bool MGLContext_bind_framebuffer(MGLContext * self, int framebuffer);
+void MGLContext_bind_texture(MGLContext * self, int unit, int target, int texture);
+void MGLContext_bind_sampler(MGLContext * self, int unit, int sampler);
+void MGLContext_bind_buffer_range(MGLContext * self, int target, int binding, int buffer, Py_ssize_t offset, Py_ssize_t size);
+void MGLContext_viewport(MGLContext * self, int x, int y, int width, int height);
+void MGLContext_scissor(MGLContext * self, bool enabled, int x, int y, int width, int height);
+void MGLContext_color_mask(MGLContext * self, int index, bool r, bool g, bool b, bool a);
+void MGLContext_depth_mask(MGLContext * self, bool depth_mask);
+void MGLContext_forget_program(MGLContext * self, int program);
+void MGLContext_forget_program_pipeline(MGLContext * self, int program_pipeline);
+void MGLContext_forget_vertex_array(MGLContext * self, int vertex_array);
+void MGLContext_forget_framebuffer(MGLContext * self, int framebuffer);
+void MGLContext_forget_texture(MGLContext * self, int texture);
+void MGLContext_forget_sampler(MGLContext * self, int sampler);
+void MGLContext_forget_buffer(MGLContext * self, int buffer);
+
 extern PyTypeObject MGLAttribute_Type;
 extern PyTypeObject MGLBuffer_Type;
 extern PyTypeObject MGLComputeShader_Type;
@@ -451,4 +689,8 @@ extern PyTypeObject MGLTextureArray_Type;
 extern PyTypeObject MGLUniformBlock_Type;
 extern PyTypeObject MGLUniform_Type;
 extern PyTypeObject MGLVertexArray_Type;
+extern PyTypeObject MGLVertexLayout_Type;
 extern PyTypeObject MGLSampler_Type;
+extern PyTypeObject MGLTransformFeedback_Type;
+extern PyTypeObject MGLPendingProgram_Type;
+extern PyTypeObject MGLStorageBlock_Type;
@@ -12,49 +12,144 @@ PyObject * MGLUniform_tp_new(PyTypeObject * type, PyObject * args, PyObject * kw
 }
 
 void MGLUniform_tp_dealloc(MGLUniform * self) {
+	delete[] self->cache;
 	MGLUniform_Type.tp_free((PyObject *)self);
 }
 
+// Every value written by moderngl is kept, writing the same bytes again skips the GL call.
+void MGLUniform_write(MGLUniform * self, const void * data) {
+	int size = self->array_length * self->element_size;
+	bool cached = self->cache_generation == self->state->uniform_generation;
+
+	if (cached && !memcmp(self->cache, data, size)) {
+		self->state->skipped_uniform_writes += 1;
+		return;
+	}
+
+	if (self->matrix) {
+		((gl_uniform_matrix_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, self->array_length, false, data);
+	} else {
+		((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, self->array_length, data);
+	}
+
+	memcpy(self->cache, data, size);
+	self->cache_generation = self->state->uniform_generation;
+}
+
+// Reads a single array element, only values never written by moderngl are queried.
+void MGLUniform_read(MGLUniform * self, int index, void * data) {
+	if (self->cache_generation == self->state->uniform_generation) {
+		memcpy(data, self->cache + index * self->element_size, self->element_size);
+		return;
+	}
+
+	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + index, data);
+}
+
 PyObject * MGLUniform_get_value(MGLUniform * self, void * closure) {
 	return ((MGLUniform_Getter)self->value_getter)(self);
 }
 
-int MGLUniform_set_value(MGLUniform * self, PyObject * value, void * closure) {
-	return ((MGLUniform_Setter)self->value_setter)(self, value);
-}
+// Typed buffers must hold the scalar type of the uniform, untyped bytes are always accepted.
+bool MGLUniform_check_format(MGLUniform * self, const Py_buffer & buffer_view) {
+	const char * format = buffer_view.format ? buffer_view.format : "B";
 
-PyObject * MGLUniform_get_data(MGLUniform * self, void * closure) {
-	PyObject * result = PyBytes_FromStringAndSize(0, self->element_size);
-	char * data = PyBytes_AS_STRING(result);
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, data);
-	return result;
+	if (format[0] == '@' || format[0] == '=' || format[0] == (PY_LITTLE_ENDIAN ? '<' : '>')) {
+		format += 1;
+	}
+
+	if (!strcmp(format, "B")) {
+		return true;
+	}
+
+	if (!format[0] || format[1]) {
+		return false;
+	}
+
+	int itemsize = self->scalar_format == 'd' ? 8 : 4;
+
+	if (buffer_view.itemsize != itemsize) {
+		return false;
+	}
+
+	switch (self->scalar_format) {
+		case 'i':
+			return format[0] == 'i' || format[0] == 'l';
+
+		case 'I':
+			return format[0] == 'I' || format[0] == 'L';
+
+		default:
+			return format[0] == self->scalar_format;
+	}
 }
 
-int MGLUniform_set_data(MGLUniform * self, PyObject * value, void * closure) {
+// Writes the raw bytes of a buffer protocol object, strided sources are gathered first.
+// The values are checked to match the scalar type of the uniform, the data setter writes any bytes.
+int MGLUniform_write_buffer(MGLUniform * self, PyObject * value, bool check_format) {
 	Py_buffer buffer_view;
 
-	int get_buffer = PyObject_GetBuffer(value, &buffer_view, PyBUF_SIMPLE);
+	int get_buffer = PyObject_GetBuffer(value, &buffer_view, PyBUF_STRIDED_RO | PyBUF_FORMAT);
 	if (get_buffer < 0) {
 		MGLError_Set("data (%s) does not support buffer interface", Py_TYPE(value)->tp_name);
 		return -1;
 	}
 
+	if (check_format && !MGLUniform_check_format(self, buffer_view)) {
+		MGLError_Set("data type mismatch, the uniform expects the '%c' format not '%s'", self->scalar_format, buffer_view.format ? buffer_view.format : "B");
+		PyBuffer_Release(&buffer_view);
+		return -1;
+	}
+
 	if (buffer_view.len != self->array_length * self->element_size) {
 		MGLError_Set("data size mismatch %d != %d", buffer_view.len, self->array_length * self->element_size);
 		PyBuffer_Release(&buffer_view);
 		return -1;
 	}
 
-	if (self->matrix) {
-		((gl_uniform_matrix_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, self->array_length, false, buffer_view.buf);
-	} else {
-		((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, self->array_length, buffer_view.buf);
+	const void * data = buffer_view.buf;
+	char * contiguous = 0;
+
+	if (!PyBuffer_IsContiguous(&buffer_view, 'C')) {
+		contiguous = new char[buffer_view.len];
+		PyBuffer_ToContiguous(contiguous, &buffer_view, buffer_view.len, 'C');
+		data = contiguous;
 	}
 
+	MGLUniform_write(self, data);
+
+	delete[] contiguous;
 	PyBuffer_Release(&buffer_view);
 	return 0;
 }
 
+// Vectors, matrices and arrays also accept buffer protocol objects holding the raw values.
+// Scalars only accept bytes, NumPy scalars of other types are converted by the setters.
+int MGLUniform_set_value(MGLUniform * self, PyObject * value, void * closure) {
+	if (Py_TYPE(value) == &PyBytes_Type) {
+		return MGLUniform_write_buffer(self, value, true);
+	}
+
+	if (self->array_length > 1 || self->dimension > 1) {
+		if (Py_TYPE(value) != &PyList_Type && Py_TYPE(value) != &PyTuple_Type && PyObject_CheckBuffer(value)) {
+			return MGLUniform_write_buffer(self, value, true);
+		}
+	}
+
+	return ((MGLUniform_Setter)self->value_setter)(self, value);
+}
+
+PyObject * MGLUniform_get_data(MGLUniform * self, void * closure) {
+	PyObject * result = PyBytes_FromStringAndSize(0, self->element_size);
+	char * data = PyBytes_AS_STRING(result);
+	MGLUniform_read(self, 0, data);
+	return result;
+}
+
+int MGLUniform_set_data(MGLUniform * self, PyObject * value, void * closure) {
+	return MGLUniform_write_buffer(self, value, false);
+}
+
 PyGetSetDef MGLUniform_tp_getseters[] = {
 	{(char *)"value", (getter)MGLUniform_get_value, (setter)MGLUniform_set_value, 0, 0},
 	{(char *)"data", (getter)MGLUniform_get_data, (setter)MGLUniform_set_data, 0, 0},
@@ -800,4 +895,16 @@ void MGLUniform_Complete(MGLUniform * self, const GLMethods & gl) {
 			self->value_setter = (MGLProc)MGLUniform_invalid_setter;
 			break;
 	}
+
+	const MGLProc reader = self->gl_value_reader_proc;
+
+	if (reader == (MGLProc)gl.GetUniformfv) {
+		self->scalar_format = 'f';
+	} else if (reader == (MGLProc)gl.GetUniformdv) {
+		self->scalar_format = 'd';
+	} else if (reader == (MGLProc)gl.GetUniformuiv) {
+		self->scalar_format = 'I';
+	} else {
+		self->scalar_format = 'i';
+	}
 }
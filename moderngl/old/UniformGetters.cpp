@@ -9,37 +9,37 @@ PyObject * MGLUniform_invalid_getter(MGLUniform * self) {
 
 PyObject * MGLUniform_bool_value_getter(MGLUniform * self) {
 	int value = 0;
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, &value);
+	MGLUniform_read(self, 0, &value);
 	return PyBool_FromLong(value);
 }
 
 PyObject * MGLUniform_int_value_getter(MGLUniform * self) {
 	int value = 0;
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, &value);
+	MGLUniform_read(self, 0, &value);
 	return PyLong_FromLong(value);
 }
 
 PyObject * MGLUniform_uint_value_getter(MGLUniform * self) {
 	unsigned value = 0;
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, &value);
+	MGLUniform_read(self, 0, &value);
 	return PyLong_FromUnsignedLong(value);
 }
 
 PyObject * MGLUniform_float_value_getter(MGLUniform * self) {
 	float value = 0;
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, &value);
+	MGLUniform_read(self, 0, &value);
 	return PyFloat_FromDouble(value);
 }
 
 PyObject * MGLUniform_double_value_getter(MGLUniform * self) {
 	double value = 0;
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, &value);
+	MGLUniform_read(self, 0, &value);
 	return PyFloat_FromDouble(value);
 }
 
 PyObject * MGLUniform_sampler_value_getter(MGLUniform * self) {
 	int value = 0;
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, &value);
+	MGLUniform_read(self, 0, &value);
 	return PyLong_FromLong(value);
 }
 
@@ -49,7 +49,7 @@ PyObject * MGLUniform_bool_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		int value = 0;
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, &value);
+		MGLUniform_read(self, i, &value);
 		PyList_SET_ITEM(lst, i, PyBool_FromLong(value));
 	}
 
@@ -62,7 +62,7 @@ PyObject * MGLUniform_int_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		int value = 0;
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, &value);
+		MGLUniform_read(self, i, &value);
 		PyList_SET_ITEM(lst, i, PyLong_FromLong(value));
 	}
 
@@ -75,7 +75,7 @@ PyObject * MGLUniform_uint_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		unsigned value = 0;
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, &value);
+		MGLUniform_read(self, i, &value);
 		PyList_SET_ITEM(lst, i, PyLong_FromUnsignedLong(value));
 	}
 
@@ -88,7 +88,7 @@ PyObject * MGLUniform_float_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		float value = 0;
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, &value);
+		MGLUniform_read(self, i, &value);
 		PyList_SET_ITEM(lst, i, PyFloat_FromDouble(value));
 	}
 
@@ -101,7 +101,7 @@ PyObject * MGLUniform_double_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		double value = 0;
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, &value);
+		MGLUniform_read(self, i, &value);
 		PyList_SET_ITEM(lst, i, PyFloat_FromDouble(value));
 	}
 
@@ -114,7 +114,7 @@ PyObject * MGLUniform_sampler_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		int value = 0;
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, &value);
+		MGLUniform_read(self, i, &value);
 		PyList_SET_ITEM(lst, i, PyLong_FromLong(value));
 	}
 
@@ -125,7 +125,7 @@ template <int N>
 PyObject * MGLUniform_bvec_value_getter(MGLUniform * self) {
 	int values[N] = {};
 
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, values);
+	MGLUniform_read(self, 0, values);
 
 	PyObject * res = PyTuple_New(N);
 
@@ -140,7 +140,7 @@ template <int N>
 PyObject * MGLUniform_ivec_value_getter(MGLUniform * self) {
 	int values[N] = {};
 
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, values);
+	MGLUniform_read(self, 0, values);
 
 	PyObject * res = PyTuple_New(N);
 
@@ -155,7 +155,7 @@ template <int N>
 PyObject * MGLUniform_uvec_value_getter(MGLUniform * self) {
 	unsigned values[N] = {};
 
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, values);
+	MGLUniform_read(self, 0, values);
 
 	PyObject * res = PyTuple_New(N);
 
@@ -170,7 +170,7 @@ template <int N>
 PyObject * MGLUniform_vec_value_getter(MGLUniform * self) {
 	float values[N] = {};
 
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, values);
+	MGLUniform_read(self, 0, values);
 
 	PyObject * res = PyTuple_New(N);
 
@@ -185,7 +185,7 @@ template <int N>
 PyObject * MGLUniform_dvec_value_getter(MGLUniform * self) {
 	double values[N] = {};
 
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, values);
+	MGLUniform_read(self, 0, values);
 
 	PyObject * res = PyTuple_New(N);
 
@@ -203,7 +203,7 @@ PyObject * MGLUniform_bvec_array_value_getter(MGLUniform * self) {
 	PyObject * lst = PyList_New(size);
 	for (int i = 0; i < size; ++i) {
 		int values[N] = {};
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, values);
+		MGLUniform_read(self, i, values);
 
 		PyObject * tuple = PyTuple_New(N);
 
@@ -226,7 +226,7 @@ PyObject * MGLUniform_ivec_array_value_getter(MGLUniform * self) {
 
 		int values[N] = {};
 
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, values);
+		MGLUniform_read(self, i, values);
 
 		PyObject * tuple = PyTuple_New(N);
 
@@ -249,7 +249,7 @@ PyObject * MGLUniform_uvec_array_value_getter(MGLUniform * self) {
 
 		unsigned values[N] = {};
 
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, values);
+		MGLUniform_read(self, i, values);
 
 		PyObject * tuple = PyTuple_New(N);
 
@@ -272,7 +272,7 @@ PyObject * MGLUniform_vec_array_value_getter(MGLUniform * self) {
 
 		float values[N] = {};
 
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, values);
+		MGLUniform_read(self, i, values);
 
 		PyObject * tuple = PyTuple_New(N);
 
@@ -295,7 +295,7 @@ PyObject * MGLUniform_dvec_array_value_getter(MGLUniform * self) {
 
 		double values[N] = {};
 
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, values);
+		MGLUniform_read(self, i, values);
 
 		PyObject * tuple = PyTuple_New(N);
 
@@ -313,7 +313,7 @@ template <typename T, int N, int M>
 PyObject * MGLUniform_matrix_value_getter(MGLUniform * self) {
 	T values[N * M] = {};
 
-	((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location, values);
+	MGLUniform_read(self, 0, values);
 
 	PyObject * tuple = PyTuple_New(N * M);
 
@@ -332,7 +332,7 @@ PyObject * MGLUniform_matrix_array_value_getter(MGLUniform * self) {
 	for (int i = 0; i < size; ++i) {
 		T values[N * M] = {};
 
-		((gl_uniform_reader_proc)self->gl_value_reader_proc)(self->program_obj, self->location + i, values);
+		MGLUniform_read(self, i, values);
 
 		PyObject * tuple = PyTuple_New(N * M);
 
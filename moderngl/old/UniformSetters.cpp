@@ -19,7 +19,7 @@ int MGLUniform_bool_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, &c_value);
+	MGLUniform_write(self, &c_value);
 
 	return 0;
 }
@@ -32,7 +32,7 @@ int MGLUniform_int_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, &c_value);
+	MGLUniform_write(self, &c_value);
 
 	return 0;
 }
@@ -45,7 +45,7 @@ int MGLUniform_uint_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, &c_value);
+	MGLUniform_write(self, &c_value);
 
 	return 0;
 }
@@ -58,7 +58,7 @@ int MGLUniform_float_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, &c_value);
+	MGLUniform_write(self, &c_value);
 
 	return 0;
 }
@@ -71,7 +71,7 @@ int MGLUniform_double_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, &c_value);
+	MGLUniform_write(self, &c_value);
 
 	return 0;
 }
@@ -84,7 +84,7 @@ int MGLUniform_sampler_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, &c_value);
+	MGLUniform_write(self, &c_value);
 
 	return 0;
 }
@@ -119,7 +119,7 @@ int MGLUniform_bool_array_value_setter(MGLUniform * self, PyObject * value) {
 		}
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -151,7 +151,7 @@ int MGLUniform_int_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -183,7 +183,7 @@ int MGLUniform_uint_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -215,7 +215,7 @@ int MGLUniform_float_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -247,7 +247,7 @@ int MGLUniform_double_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -279,7 +279,7 @@ int MGLUniform_sampler_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -314,7 +314,7 @@ int MGLUniform_bvec_value_setter(MGLUniform * self, PyObject * value) {
 		}
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, c_values);
+	MGLUniform_write(self, c_values);
 
 	return 0;
 }
@@ -344,7 +344,7 @@ int MGLUniform_ivec_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, c_values);
+	MGLUniform_write(self, c_values);
 
 	return 0;
 }
@@ -374,7 +374,7 @@ int MGLUniform_uvec_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, c_values);
+	MGLUniform_write(self, c_values);
 
 	return 0;
 }
@@ -404,7 +404,7 @@ int MGLUniform_vec_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, c_values);
+	MGLUniform_write(self, c_values);
 
 	return 0;
 }
@@ -434,7 +434,7 @@ int MGLUniform_dvec_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, c_values);
+	MGLUniform_write(self, c_values);
 
 	return 0;
 }
@@ -489,7 +489,7 @@ int MGLUniform_bvec_array_value_setter(MGLUniform * self, PyObject * value) {
 		}
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size * N, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -541,7 +541,7 @@ int MGLUniform_ivec_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size * N, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -593,7 +593,7 @@ int MGLUniform_uvec_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size * N, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -645,7 +645,7 @@ int MGLUniform_vec_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size * N, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -697,7 +697,7 @@ int MGLUniform_dvec_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size * N, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -728,7 +728,7 @@ int MGLUniform_matrix_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_matrix_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, 1, false, c_values);
+	MGLUniform_write(self, c_values);
 
 	return 0;
 }
@@ -779,7 +779,7 @@ int MGLUniform_matrix_array_value_setter(MGLUniform * self, PyObject * value) {
 		return -1;
 	}
 
-	((gl_uniform_matrix_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, size, false, c_values);
+	MGLUniform_write(self, c_values);
 
 	delete[] c_values;
 	return 0;
@@ -7,20 +7,22 @@ typedef void (GLAPI * gl_attribute_ptr_proc)(GLuint index, GLint size, GLenum ty
 
 PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 	MGLProgram * program;
-	PyObject * content;
+	MGLVertexLayout * layout;
+	PyObject * buffers;
 	MGLBuffer * index_buffer;
 	int index_element_size;
-	int skip_errors;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"O!OOIp",
+		"O!O!O!OI",
 		&MGLProgram_Type,
 		&program,
-		&content,
+		&MGLVertexLayout_Type,
+		&layout,
+		&PyTuple_Type,
+		&buffers,
 		&index_buffer,
-		&index_element_size,
-		&skip_errors
+		&index_element_size
 	);
 
 	if (!args_ok) {
@@ -32,85 +34,54 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
+	if (layout->program != program) {
+		MGLError_Set("the vertex layout belongs to a different program");
+		return 0;
+	}
+
 	if (index_buffer != (MGLBuffer *)Py_None && index_buffer->context != self) {
 		MGLError_Set("the index_buffer belongs to a different context");
 		return 0;
 	}
 
-	int content_len = (int)PyTuple_GET_SIZE(content);
+	int num_buffers = (int)PyTuple_GET_SIZE(buffers);
 
-	// Allow empty vertextbuffers: https://github.com/moderngl/moderngl/issues/321
-	// if (!content_len) {
-	// 	MGLError_Set("the content must not be emtpy");
-	// 	return 0;
-	// }
+	if (num_buffers != layout->num_bindings) {
+		MGLError_Set("the vertex layout has %d bindings, got %d buffers", layout->num_bindings, num_buffers);
+		return 0;
+	}
 
-	for (int i = 0; i < content_len; ++i) {
-		PyObject * tuple = PyTuple_GET_ITEM(content, i);
+	for (int i = 0; i < num_buffers; ++i) {
+		PyObject * tuple = PyTuple_GET_ITEM(buffers, i);
 		PyObject * buffer = PyTuple_GET_ITEM(tuple, 0);
-		PyObject * format = PyTuple_GET_ITEM(tuple, 1);
+		PyObject * offset = PyTuple_GET_ITEM(tuple, 1);
+		PyObject * size = PyTuple_GET_ITEM(tuple, 2);
 
 		if (Py_TYPE(buffer) != &MGLBuffer_Type) {
 			MGLError_Set("content[%d][0] must be a Buffer not %s", i, Py_TYPE(buffer)->tp_name);
 			return 0;
 		}
 
-		if (Py_TYPE(format) != &PyUnicode_Type) {
-			MGLError_Set("content[%d][1] must be a string not %s", i, Py_TYPE(format)->tp_name);
-			return 0;
-		}
+		Py_ssize_t base_offset = PyLong_AsSsize_t(offset);
 
-		if (((MGLBuffer *)buffer)->context != self) {
-			MGLError_Set("content[%d][0] belongs to a different context", i);
+		if (PyErr_Occurred() || base_offset < 0 || base_offset > ((MGLBuffer *)buffer)->size) {
+			PyErr_Clear();
+			MGLError_Set("content[%d] has an invalid offset", i);
 			return 0;
 		}
 
-		FormatIterator it = FormatIterator(PyUnicode_AsUTF8(format));
-		FormatInfo format_info = it.info();
+		Py_ssize_t range_size = PyLong_AsSsize_t(size);
 
-		if (!format_info.valid) {
-			MGLError_Set("content[%d][1] is an invalid format", i);
+		if (PyErr_Occurred() || base_offset + range_size > ((MGLBuffer *)buffer)->size) {
+			PyErr_Clear();
+			MGLError_Set("content[%d] has an invalid size", i);
 			return 0;
 		}
 
-		if (i == 0 && format_info.divisor) {
-			MGLError_Set("the first vertex attribute must not be a per instance attribute");
-			return 0;
-		}
-
-		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 2;
-
-		if (!attributes_len) {
-			MGLError_Set("content[%d][2] must not be empty", i);
-			return 0;
-		}
-
-		if (attributes_len != format_info.nodes) {
-			MGLError_Set("content[%d][1] and content[%d][2] size mismatch %d != %d", i, i, format_info.nodes, attributes_len);
+		if (((MGLBuffer *)buffer)->context != self) {
+			MGLError_Set("content[%d][0] belongs to a different context", i);
 			return 0;
 		}
-
-		for (int j = 0; j < attributes_len; ++j) {
-			FormatNode * node = it.next();
-
-			while (!node->type) {
-				node = it.next();
-			}
-
-			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 2);
-
-			if (!skip_errors) {
-				if (Py_TYPE(attribute) != &MGLAttribute_Type) {
-					MGLError_Set("content[%d][%d] must be an attribute not %s", i, j + 2, Py_TYPE(attribute)->tp_name);
-					return 0;
-				}
-
-				if (node->count % attribute->rows_length) {
-					MGLError_Set("invalid format");
-					return 0;
-				}
-			}
-		}
 	}
 
 	if (index_buffer != (MGLBuffer *)Py_None && Py_TYPE(index_buffer) != &MGLBuffer_Type) {
@@ -133,6 +104,9 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 	Py_INCREF(program);
 	array->program = program;
 
+	Py_INCREF(self);
+	array->context = self;
+
 	array->vertex_array_obj = 0;
 	gl.GenVertexArrays(1, (GLuint *)&array->vertex_array_obj);
 
@@ -142,7 +116,15 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindVertexArray(array->vertex_array_obj);
+	MGLContext_bind_vertex_array(self, array->vertex_array_obj);
+
+	Py_INCREF(layout);
+	array->layout = layout;
+	array->binding_vertices = new int[num_buffers + 1];
+
+	for (int i = 0; i < num_buffers; ++i) {
+		array->binding_vertices[i] = 0;
+	}
 
 	Py_INCREF(index_buffer);
 	array->index_buffer = index_buffer;
@@ -158,72 +140,100 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 		array->num_vertices = -1;
 	}
 
-	for (int i = 0; i < content_len; ++i) {
-		PyObject * tuple = PyTuple_GET_ITEM(content, i);
-
-		MGLBuffer * buffer = (MGLBuffer *)PyTuple_GET_ITEM(tuple, 0);
-		const char * format = PyUnicode_AsUTF8(PyTuple_GET_ITEM(tuple, 1));
+	// with separate formats the attributes are set up once, the buffers are bound to the bindings
+	if (layout->separate_format) {
+		for (int i = 0; i < layout->num_attributes; ++i) {
+			MGLVertexLayoutAttribute & attribute = layout->attributes[i];
 
-		FormatIterator it = FormatIterator(format);
-		FormatInfo format_info = it.info();
+			if (attribute.shape == 'i' || attribute.shape == 'I') {
+				gl.VertexAttribIFormat(attribute.location, attribute.count, attribute.type, attribute.offset);
+			} else if (attribute.shape == 'd') {
+				gl.VertexAttribLFormat(attribute.location, attribute.count, attribute.type, attribute.offset);
+			} else {
+				gl.VertexAttribFormat(attribute.location, attribute.count, attribute.type, attribute.normalize, attribute.offset);
+			}
 
-		int buf_vertices = (int)(buffer->size / format_info.size);
+			gl.VertexAttribBinding(attribute.location, attribute.binding);
+			gl.EnableVertexAttribArray(attribute.location);
+		}
 
-		if (!format_info.divisor && array->index_buffer == (MGLBuffer *)Py_None && (!i || array->num_vertices > buf_vertices)) {
-			array->num_vertices = buf_vertices;
+		for (int i = 0; i < layout->num_bindings; ++i) {
+			gl.VertexBindingDivisor(i, layout->bindings[i].divisor);
+		}
+	} else {
+		for (int i = 0; i < layout->num_attributes; ++i) {
+			MGLVertexLayoutAttribute & attribute = layout->attributes[i];
+			gl.VertexAttribDivisor(attribute.location, layout->bindings[attribute.binding].divisor);
+			gl.EnableVertexAttribArray(attribute.location);
 		}
+	}
 
-		gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
+	for (int i = 0; i < num_buffers; ++i) {
+		PyObject * tuple = PyTuple_GET_ITEM(buffers, i);
+		MGLBuffer * buffer = (MGLBuffer *)PyTuple_GET_ITEM(tuple, 0);
+		Py_ssize_t base_offset = PyLong_AsSsize_t(PyTuple_GET_ITEM(tuple, 1));
+		Py_ssize_t range_size = PyLong_AsSsize_t(PyTuple_GET_ITEM(tuple, 2));
+		MGLVertexArray_bind_buffer(array, i, buffer, base_offset, range_size, layout->bindings[i].stride);
+	}
 
-		char * ptr = 0;
+	MGLVertexArray_Complete(array);
 
-		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 2;
+	Py_INCREF(array);
 
-		for (int j = 0; j < attributes_len; ++j) {
-			FormatNode * node = it.next();
+	PyObject * result = PyTuple_New(2);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)array);
+	PyTuple_SET_ITEM(result, 1, PyLong_FromLong(array->vertex_array_obj));
+	return result;
+}
 
-			while (!node->type) {
-				ptr += node->size;
-				node = it.next();
-			}
+// The vertex array must be bound.
+// A negative size uses the buffer up to its end, buffer ranges limit the number of vertices to their size.
+void MGLVertexArray_bind_buffer(MGLVertexArray * self, int binding, MGLBuffer * buffer, Py_ssize_t offset, Py_ssize_t size, int stride) {
+	const GLMethods & gl = self->context->gl;
+	MGLVertexLayout * layout = self->layout;
 
-			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 2);
+	if (layout->separate_format) {
+		gl.BindVertexBuffer(binding, buffer->buffer_obj, (GLintptr)offset, stride);
+	} else {
+		gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
 
-			if (attribute == (MGLAttribute *)Py_None) {
-				ptr += node->size;
+		for (int i = 0; i < layout->num_attributes; ++i) {
+			MGLVertexLayoutAttribute & attribute = layout->attributes[i];
+
+			if (attribute.binding != binding) {
 				continue;
 			}
 
-			for (int r = 0; r < attribute->rows_length; ++r) {
-				int location = attribute->location + r;
-				int count = node->count / attribute->rows_length;
-
-				if (attribute->normalizable) {
-					((gl_attribute_normal_ptr_proc)attribute->gl_attrib_ptr_proc)(location, count, node->type, node->normalize, format_info.size, ptr);
-				} else {
-					((gl_attribute_ptr_proc)attribute->gl_attrib_ptr_proc)(location, count, node->type, format_info.size, ptr);
-				}
-
-				gl.VertexAttribDivisor(location, format_info.divisor);
-
-				gl.EnableVertexAttribArray(location);
+			// attribute pointers start at the base offset of the content
+			char * ptr = (char *)offset + attribute.offset;
 
-				ptr += node->size / attribute->rows_length;
+			if (attribute.normalizable) {
+				((gl_attribute_normal_ptr_proc)attribute.gl_attrib_ptr_proc)(attribute.location, attribute.count, attribute.type, attribute.normalize, stride, ptr);
+			} else {
+				((gl_attribute_ptr_proc)attribute.gl_attrib_ptr_proc)(attribute.location, attribute.count, attribute.type, stride, ptr);
 			}
 		}
 	}
 
-	Py_INCREF(self);
-	array->context = self;
+	if (size < 0) {
+		size = buffer->size - offset;
+	}
 
-	MGLVertexArray_Complete(array);
+	int buf_vertices = stride ? (int)(size / stride) : 0;
+	self->binding_vertices[binding] = buf_vertices;
 
-	Py_INCREF(array);
+	if (self->index_buffer != (MGLBuffer *)Py_None) {
+		return;
+	}
 
-	PyObject * result = PyTuple_New(2);
-	PyTuple_SET_ITEM(result, 0, (PyObject *)array);
-	PyTuple_SET_ITEM(result, 1, PyLong_FromLong(array->vertex_array_obj));
-	return result;
+	// the number of vertices is limited by the shortest per vertex buffer
+	self->num_vertices = -1;
+
+	for (int i = 0; i < layout->num_bindings; ++i) {
+		if (!layout->bindings[i].divisor && (self->num_vertices < 0 || self->num_vertices > self->binding_vertices[i])) {
+			self->num_vertices = self->binding_vertices[i];
+		}
+	}
 }
 
 PyObject * MGLVertexArray_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
@@ -246,24 +256,41 @@ PyObject * MGLVertexArray_render(MGLVertexArray * self, PyObject * args) {
 	int vertices;
 	int first;
 	int instances;
+	int base_vertex;
+	int base_instance;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"IIII",
+		"IIIIiI",
 		&mode,
 		&vertices,
 		&first,
-		&instances
+		&instances,
+		&base_vertex,
+		&base_instance
 	);
 
 	if (!args_ok) {
 		return 0;
 	}
 
+	if (self->context->recording) {
+		int record[7] = {MGLContext_record_object(self->context, (PyObject *)self), mode, vertices, first, instances, base_vertex, base_instance};
+		MGLContext_record(self->context, MGL_RECORD_RENDER, record, 7);
+	}
+
+	if (!MGLVertexArray_draw(self, mode, vertices, first, instances, base_vertex, base_instance)) {
+		return 0;
+	}
+
+	Py_RETURN_NONE;
+}
+
+bool MGLVertexArray_draw(MGLVertexArray * self, int mode, int vertices, int first, int instances, int base_vertex, int base_instance) {
 	if (vertices < 0) {
 		if (self->num_vertices < 0) {
 			MGLError_Set("cannot detect the number of vertices");
-			return 0;
+			return false;
 		}
 
 		vertices = self->num_vertices;
@@ -275,16 +302,161 @@ PyObject * MGLVertexArray_render(MGLVertexArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program->program_obj);
-	gl.BindVertexArray(self->vertex_array_obj);
+	MGLProgram_use(self->program);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
 
 	MGLVertexArray_SET_SUBROUTINES(self, gl);
 
 	if (self->index_buffer != (MGLBuffer *)Py_None) {
 		const void * ptr = (const void *)((GLintptr)first * self->index_element_size);
-		gl.DrawElementsInstanced(mode, vertices, self->index_element_type, ptr, instances);
+		if (base_instance) {
+			if (!gl.DrawElementsInstancedBaseVertexBaseInstance) {
+				MGLError_Set("base_instance requires OpenGL 4.2 or ARB_base_instance");
+				return false;
+			}
+			gl.DrawElementsInstancedBaseVertexBaseInstance(mode, vertices, self->index_element_type, ptr, instances, base_vertex, base_instance);
+		} else if (base_vertex) {
+			gl.DrawElementsInstancedBaseVertex(mode, vertices, self->index_element_type, ptr, instances, base_vertex);
+		} else {
+			gl.DrawElementsInstanced(mode, vertices, self->index_element_type, ptr, instances);
+		}
 	} else {
-		gl.DrawArraysInstanced(mode, first, vertices, instances);
+		// non-indexed draws have no base vertex, it is equivalent to an offset of the first vertex
+		if (base_instance) {
+			if (!gl.DrawArraysInstancedBaseInstance) {
+				MGLError_Set("base_instance requires OpenGL 4.2 or ARB_base_instance");
+				return false;
+			}
+			gl.DrawArraysInstancedBaseInstance(mode, first + base_vertex, vertices, instances, base_instance);
+		} else {
+			gl.DrawArraysInstanced(mode, first + base_vertex, vertices, instances);
+		}
+	}
+
+	return true;
+}
+
+// Gets a contiguous view of 32 bit integers.
+bool MGLVertexArray_int_view(PyObject * obj, Py_buffer * view, const char * name) {
+	if (PyObject_GetBuffer(obj, view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+		PyErr_Clear();
+		MGLError_Set("the %s (%s) does not support buffer interface", name, Py_TYPE(obj)->tp_name);
+		return false;
+	}
+
+	const char * fmt = view->format ? view->format : "B";
+	if (*fmt == '@' || *fmt == '=' || *fmt == '<') {
+		fmt += 1;
+	}
+
+	if (view->itemsize != 4 || !fmt[0] || fmt[1] || !strchr("iIlL", fmt[0])) {
+		MGLError_Set("the %s must be 32 bit integers", name);
+		PyBuffer_Release(view);
+		return false;
+	}
+
+	return true;
+}
+
+PyObject * MGLVertexArray_render_multi(MGLVertexArray * self, PyObject * args) {
+	PyObject * firsts;
+	PyObject * counts;
+	PyObject * base_vertices;
+	int mode;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOOI",
+		&firsts,
+		&counts,
+		&base_vertices,
+		&mode
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	Py_buffer firsts_view;
+	Py_buffer counts_view;
+	Py_buffer base_vertices_view = {};
+
+	if (!MGLVertexArray_int_view(firsts, &firsts_view, "firsts")) {
+		return 0;
+	}
+
+	if (!MGLVertexArray_int_view(counts, &counts_view, "counts")) {
+		PyBuffer_Release(&firsts_view);
+		return 0;
+	}
+
+	if (base_vertices != Py_None && !MGLVertexArray_int_view(base_vertices, &base_vertices_view, "base_vertices")) {
+		PyBuffer_Release(&firsts_view);
+		PyBuffer_Release(&counts_view);
+		return 0;
+	}
+
+	Py_ssize_t draws = firsts_view.len / 4;
+	bool size_mismatch = counts_view.len / 4 != draws;
+
+	if (base_vertices != Py_None) {
+		size_mismatch = size_mismatch || base_vertices_view.len / 4 != draws;
+	}
+
+	if (size_mismatch) {
+		MGLError_Set("the firsts, counts and base_vertices must have the same length");
+		PyBuffer_Release(&firsts_view);
+		PyBuffer_Release(&counts_view);
+		if (base_vertices != Py_None) {
+			PyBuffer_Release(&base_vertices_view);
+		}
+		return 0;
+	}
+
+	const int * first_array = (const int *)firsts_view.buf;
+	const int * count_array = (const int *)counts_view.buf;
+	const int * base_vertex_array = (const int *)base_vertices_view.buf;
+
+	const GLMethods & gl = self->context->gl;
+
+	if (draws) {
+		MGLProgram_use(self->program);
+		MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+		MGLVertexArray_SET_SUBROUTINES(self, gl);
+	}
+
+	if (draws && self->index_buffer != (MGLBuffer *)Py_None) {
+		const void ** indices = new const void * [draws];
+		for (Py_ssize_t i = 0; i < draws; ++i) {
+			indices[i] = (const void *)((GLintptr)first_array[i] * self->index_element_size);
+		}
+
+		if (base_vertex_array) {
+			gl.MultiDrawElementsBaseVertex(mode, count_array, self->index_element_type, indices, (int)draws, base_vertex_array);
+		} else {
+			gl.MultiDrawElements(mode, count_array, self->index_element_type, indices, (int)draws);
+		}
+
+		delete[] indices;
+	} else if (draws) {
+		// non-indexed draws have no base vertex, it is equivalent to an offset of the first vertex
+		if (base_vertex_array) {
+			int * shifted = new int[draws];
+			for (Py_ssize_t i = 0; i < draws; ++i) {
+				shifted[i] = first_array[i] + base_vertex_array[i];
+			}
+			gl.MultiDrawArrays(mode, shifted, count_array, (int)draws);
+			delete[] shifted;
+		} else {
+			gl.MultiDrawArrays(mode, first_array, count_array, (int)draws);
+		}
+	}
+
+	PyBuffer_Release(&firsts_view);
+	PyBuffer_Release(&counts_view);
+	if (base_vertices != Py_None) {
+		PyBuffer_Release(&base_vertices_view);
 	}
 
 	Py_RETURN_NONE;
@@ -295,35 +467,56 @@ PyObject * MGLVertexArray_render_indirect(MGLVertexArray * self, PyObject * args
 	int mode;
 	int count;
 	int first;
+	PyObject * count_buffer;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"O!III",
+		"O!IIIO",
 		&MGLBuffer_Type,
 		&buffer,
 		&mode,
 		&count,
-		&first
+		&first,
+		&count_buffer
 	);
 
 	if (!args_ok) {
 		return 0;
 	}
 
+	if (count_buffer != Py_None && Py_TYPE(count_buffer) != &MGLBuffer_Type) {
+		MGLError_Set("the count_buffer must be a Buffer not %s", Py_TYPE(count_buffer)->tp_name);
+		return 0;
+	}
+
 	if (count < 0) {
 		count = (int)(buffer->size / 20 - first);
 	}
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program->program_obj);
-	gl.BindVertexArray(self->vertex_array_obj);
+	MGLProgram_use(self->program);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
 	gl.BindBuffer(GL_DRAW_INDIRECT_BUFFER, buffer->buffer_obj);
 
 	MGLVertexArray_SET_SUBROUTINES(self, gl);
 
 	const void * ptr = (const void *)((GLintptr)first * 20);
 
+	// The draw count is read from the first integer of the count buffer, count is the upper limit.
+	// Without ARB_indirect_parameters all the commands are issued.
+	if (count_buffer != Py_None && gl.MultiDrawArraysIndirectCount && gl.MultiDrawElementsIndirectCount) {
+		gl.BindBuffer(GL_PARAMETER_BUFFER, ((MGLBuffer *)count_buffer)->buffer_obj);
+
+		if (self->index_buffer != (MGLBuffer *)Py_None) {
+			gl.MultiDrawElementsIndirectCount(mode, self->index_element_type, ptr, 0, count, 20);
+		} else {
+			gl.MultiDrawArraysIndirectCount(mode, ptr, 0, count, 20);
+		}
+
+		Py_RETURN_NONE;
+	}
+
 	if (self->index_buffer != (MGLBuffer *)Py_None) {
 		gl.MultiDrawElementsIndirect(mode, self->index_element_type, ptr, count, 20);
 	} else {
@@ -334,7 +527,7 @@ PyObject * MGLVertexArray_render_indirect(MGLVertexArray * self, PyObject * args
 }
 
 PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
-	MGLBuffer * output;
+	PyObject * output;
 	int mode;
 	int vertices;
 	int first;
@@ -342,8 +535,7 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"O!IIII",
-		&MGLBuffer_Type,
+		"OIIII",
 		&output,
 		&mode,
 		&vertices,
@@ -360,6 +552,31 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 		return 0;
 	}
 
+	MGLTransformFeedback * transform_feedback = 0;
+	int num_buffers = 1;
+
+	if (Py_TYPE(output) == &MGLTransformFeedback_Type) {
+		transform_feedback = (MGLTransformFeedback *)output;
+	} else if (Py_TYPE(output) == &PyTuple_Type) {
+		num_buffers = (int)PyTuple_GET_SIZE(output);
+
+		for (int i = 0; i < num_buffers; ++i) {
+			PyObject * item = PyTuple_GET_ITEM(output, i);
+			if (Py_TYPE(item) != &MGLBuffer_Type) {
+				MGLError_Set("buffers[%d] must be a Buffer not %s", i, Py_TYPE(item)->tp_name);
+				return 0;
+			}
+		}
+	} else if (Py_TYPE(output) != &MGLBuffer_Type) {
+		MGLError_Set("the output must be a Buffer, a tuple of Buffers or a TransformFeedback not %s", Py_TYPE(output)->tp_name);
+		return 0;
+	}
+
+	if (!transform_feedback && self->program->separate_varyings && num_buffers < self->program->num_varyings) {
+		MGLError_Set("the program captures %d varyings into separate buffers, only %d buffers were given", self->program->num_varyings, num_buffers);
+		return 0;
+	}
+
 	if (vertices < 0) {
 		if (self->num_vertices < 0) {
 			MGLError_Set("cannot detect the number of vertices");
@@ -375,13 +592,37 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program->program_obj);
-	gl.BindVertexArray(self->vertex_array_obj);
+	MGLProgram_use(self->program);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+	if (!transform_feedback) {
+		// the buffers are bound to the default transform feedback object
+		if (gl.BindTransformFeedback) {
+			gl.BindTransformFeedback(GL_TRANSFORM_FEEDBACK, 0);
+		}
+
+		if (Py_TYPE(output) == &MGLBuffer_Type) {
+			gl.BindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, 0, ((MGLBuffer *)output)->buffer_obj);
+		} else {
+			for (int i = 0; i < num_buffers; ++i) {
+				MGLBuffer * buffer = (MGLBuffer *)PyTuple_GET_ITEM(output, i);
+				gl.BindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, i, buffer->buffer_obj);
+			}
+		}
+	}
 
-	gl.BindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, 0, output->buffer_obj);
+	bool was_active = transform_feedback && transform_feedback->active;
+	bool was_paused = transform_feedback && transform_feedback->paused;
 
 	gl.Enable(GL_RASTERIZER_DISCARD);
-	gl.BeginTransformFeedback(mode);
+
+	if (!transform_feedback) {
+		gl.BeginTransformFeedback(mode);
+	} else if (!was_active) {
+		MGLTransformFeedback_begin_core(transform_feedback, mode);
+	} else if (was_paused) {
+		MGLTransformFeedback_resume_core(transform_feedback);
+	}
 
 	MGLVertexArray_SET_SUBROUTINES(self, gl);
 
@@ -392,15 +633,73 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 		gl.DrawArraysInstanced(mode, first, vertices, instances);
 	}
 
-	gl.EndTransformFeedback();
+	// an active transform feedback is left the same way it was found
+	if (!transform_feedback) {
+		gl.EndTransformFeedback();
+	} else if (!was_active) {
+		MGLTransformFeedback_end_core(transform_feedback);
+	} else if (was_paused) {
+		MGLTransformFeedback_pause_core(transform_feedback);
+	}
+
 	if (~self->context->enable_flags & MGL_RASTERIZER_DISCARD) {
 		gl.Disable(GL_RASTERIZER_DISCARD);
 	}
-	gl.Flush();
 
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLVertexArray_set_buffer(MGLVertexArray * self, PyObject * args) {
+	int binding;
+	MGLBuffer * buffer;
+	Py_ssize_t offset;
+	Py_ssize_t size;
+	int stride;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"IO!nni",
+		&binding,
+		&MGLBuffer_Type,
+		&buffer,
+		&offset,
+		&size,
+		&stride
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (binding < 0 || binding >= self->layout->num_bindings) {
+		MGLError_Set("the vertex array has %d bindings, binding %d is out of range", self->layout->num_bindings, binding);
+		return 0;
+	}
+
+	if (buffer->context != self->context) {
+		MGLError_Set("the buffer belongs to a different context");
+		return 0;
+	}
+
+	if (offset < 0 || offset > buffer->size) {
+		MGLError_Set("invalid offset");
+		return 0;
+	}
+
+	if (offset + size > buffer->size) {
+		MGLError_Set("invalid size");
+		return 0;
+	}
+
+	if (stride < 0) {
+		stride = self->layout->bindings[binding].stride;
+	}
+
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+	MGLVertexArray_bind_buffer(self, binding, buffer, offset, size, stride);
+	Py_RETURN_NONE;
+}
+
 PyObject * MGLVertexArray_bind(MGLVertexArray * self, PyObject * args) {
 	int location;
 	const char * type;
@@ -453,7 +752,7 @@ PyObject * MGLVertexArray_bind(MGLVertexArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindVertexArray(self->vertex_array_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
 	gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
 
 	switch (type[0]) {
@@ -485,8 +784,10 @@ PyObject * MGLVertexArray_release(MGLVertexArray * self) {
 
 PyMethodDef MGLVertexArray_tp_methods[] = {
 	{"render", (PyCFunction)MGLVertexArray_render, METH_VARARGS, 0},
+	{"render_multi", (PyCFunction)MGLVertexArray_render_multi, METH_VARARGS, 0},
 	{"render_indirect", (PyCFunction)MGLVertexArray_render_indirect, METH_VARARGS, 0},
 	{"transform", (PyCFunction)MGLVertexArray_transform, METH_VARARGS, 0},
+	{"set_buffer", (PyCFunction)MGLVertexArray_set_buffer, METH_VARARGS, 0},
 	{"bind", (PyCFunction)MGLVertexArray_bind, METH_VARARGS, 0},
 	{"release", (PyCFunction)MGLVertexArray_release, METH_NOARGS, 0},
 	{0},
@@ -627,6 +928,10 @@ void MGLVertexArray_Invalidate(MGLVertexArray * array) {
 
 	const GLMethods & gl = array->context->gl;
 	gl.DeleteVertexArrays(1, (GLuint *)&array->vertex_array_obj);
+	MGLContext_forget_vertex_array(array->context, array->vertex_array_obj);
+
+	delete[] array->binding_vertices;
+	Py_DECREF(array->layout);
 
 	Py_TYPE(array) = &MGLInvalidObject_Type;
 	Py_DECREF(array);
@@ -0,0 +1,252 @@
+#include "Types.hpp"
+
+#include "BufferFormat.hpp"
+
+// The vertex layout is the parsed form of the VertexArray content without the buffers.
+// Every attribute row is resolved to a binding, a location and a relative offset once.
+
+PyObject * MGLContext_vertex_layout(MGLContext * self, PyObject * args) {
+	MGLProgram * program;
+	PyObject * content;
+	int skip_errors;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O!O!p",
+		&MGLProgram_Type,
+		&program,
+		&PyTuple_Type,
+		&content,
+		&skip_errors
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (program->context != self) {
+		MGLError_Set("the program belongs to a different context");
+		return 0;
+	}
+
+	int content_len = (int)PyTuple_GET_SIZE(content);
+	int num_attributes = 0;
+
+	for (int i = 0; i < content_len; ++i) {
+		PyObject * tuple = PyTuple_GET_ITEM(content, i);
+		PyObject * format = PyTuple_GET_ITEM(tuple, 0);
+
+		if (Py_TYPE(format) != &PyUnicode_Type) {
+			MGLError_Set("content[%d][1] must be a string not %s", i, Py_TYPE(format)->tp_name);
+			return 0;
+		}
+
+		FormatIterator it = FormatIterator(PyUnicode_AsUTF8(format));
+		FormatInfo format_info = it.info();
+
+		if (!format_info.valid) {
+			MGLError_Set("content[%d][1] is an invalid format", i);
+			return 0;
+		}
+
+		if (i == 0 && format_info.divisor) {
+			MGLError_Set("the first vertex attribute must not be a per instance attribute");
+			return 0;
+		}
+
+		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 1;
+
+		if (!attributes_len) {
+			MGLError_Set("content[%d][2] must not be empty", i);
+			return 0;
+		}
+
+		if (attributes_len != format_info.nodes) {
+			MGLError_Set("content[%d][1] and content[%d][2] size mismatch %d != %d", i, i, format_info.nodes, attributes_len);
+			return 0;
+		}
+
+		for (int j = 0; j < attributes_len; ++j) {
+			FormatNode * node = it.next();
+
+			while (!node->type) {
+				node = it.next();
+			}
+
+			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 1);
+
+			if (attribute == (MGLAttribute *)Py_None && skip_errors) {
+				continue;
+			}
+
+			if (Py_TYPE(attribute) != &MGLAttribute_Type) {
+				MGLError_Set("content[%d][%d] must be an attribute not %s", i, j + 2, Py_TYPE(attribute)->tp_name);
+				return 0;
+			}
+
+			if (node->count % attribute->rows_length) {
+				MGLError_Set("invalid format");
+				return 0;
+			}
+
+			num_attributes += attribute->rows_length;
+		}
+	}
+
+	const GLMethods & gl = self->gl;
+
+	MGLVertexLayout * layout = (MGLVertexLayout *)MGLVertexLayout_Type.tp_alloc(&MGLVertexLayout_Type, 0);
+
+	layout->num_bindings = content_len;
+	layout->bindings = new MGLVertexLayoutBinding[content_len + 1];
+
+	layout->num_attributes = num_attributes;
+	layout->attributes = new MGLVertexLayoutAttribute[num_attributes + 1];
+
+	int max_relative_offset = 0;
+
+	if (gl.VertexAttribFormat && gl.VertexAttribBinding && gl.BindVertexBuffer && gl.VertexBindingDivisor) {
+		gl.GetIntegerv(GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET, &max_relative_offset);
+	}
+
+	layout->separate_format = max_relative_offset > 0;
+
+	MGLVertexLayoutAttribute * entry = layout->attributes;
+
+	for (int i = 0; i < content_len; ++i) {
+		PyObject * tuple = PyTuple_GET_ITEM(content, i);
+
+		FormatIterator it = FormatIterator(PyUnicode_AsUTF8(PyTuple_GET_ITEM(tuple, 0)));
+		FormatInfo format_info = it.info();
+
+		layout->bindings[i].stride = format_info.size;
+		layout->bindings[i].divisor = format_info.divisor;
+
+		int offset = 0;
+
+		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 1;
+
+		for (int j = 0; j < attributes_len; ++j) {
+			FormatNode * node = it.next();
+
+			while (!node->type) {
+				offset += node->size;
+				node = it.next();
+			}
+
+			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 1);
+
+			if (attribute == (MGLAttribute *)Py_None) {
+				offset += node->size;
+				continue;
+			}
+
+			for (int r = 0; r < attribute->rows_length; ++r) {
+				entry->gl_attrib_ptr_proc = attribute->gl_attrib_ptr_proc;
+				entry->normalizable = attribute->normalizable;
+				entry->shape = attribute->shape;
+
+				entry->binding = i;
+				entry->location = attribute->location + r;
+				entry->count = node->count / attribute->rows_length;
+				entry->type = node->type;
+				entry->normalize = node->normalize;
+				entry->offset = offset;
+
+				if (offset > max_relative_offset) {
+					layout->separate_format = false;
+				}
+
+				offset += node->size / attribute->rows_length;
+				entry += 1;
+			}
+		}
+	}
+
+	Py_INCREF(program);
+	layout->program = program;
+
+	Py_INCREF(self);
+	layout->context = self;
+
+	return (PyObject *)layout;
+}
+
+PyObject * MGLVertexLayout_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLVertexLayout * self = (MGLVertexLayout *)type->tp_alloc(type, 0);
+
+	if (self) {
+	}
+
+	return (PyObject *)self;
+}
+
+// The vertex layout owns no OpenGL objects, it is released with the last reference.
+void MGLVertexLayout_tp_dealloc(MGLVertexLayout * self) {
+	delete[] self->bindings;
+	delete[] self->attributes;
+	Py_XDECREF(self->program);
+	Py_XDECREF(self->context);
+	MGLVertexLayout_Type.tp_free((PyObject *)self);
+}
+
+PyObject * MGLVertexLayout_get_bindings(MGLVertexLayout * self) {
+	return PyLong_FromLong(self->num_bindings);
+}
+
+PyObject * MGLVertexLayout_get_strides(MGLVertexLayout * self) {
+	PyObject * strides = PyTuple_New(self->num_bindings);
+
+	for (int i = 0; i < self->num_bindings; ++i) {
+		PyTuple_SET_ITEM(strides, i, PyLong_FromLong(self->bindings[i].stride));
+	}
+
+	return strides;
+}
+
+PyGetSetDef MGLVertexLayout_tp_getseters[] = {
+	{(char *)"bindings", (getter)MGLVertexLayout_get_bindings, 0, 0, 0},
+	{(char *)"strides", (getter)MGLVertexLayout_get_strides, 0, 0, 0},
+	{0},
+};
+
+PyTypeObject MGLVertexLayout_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.VertexLayout",                                     // tp_name
+	sizeof(MGLVertexLayout),                                // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLVertexLayout_tp_dealloc,                 // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	0,                                                      // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	0,                                                      // tp_methods
+	0,                                                      // tp_members
+	MGLVertexLayout_tp_getseters,                           // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	MGLVertexLayout_tp_new,                                 // tp_new
+};
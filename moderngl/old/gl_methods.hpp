@@ -659,6 +659,8 @@ struct GLMethods {
     PFNGLMULTIDRAWARRAYSINDIRECTCOUNTPROC MultiDrawArraysIndirectCount;
     PFNGLMULTIDRAWELEMENTSINDIRECTCOUNTPROC MultiDrawElementsIndirectCount;
     PFNGLPOLYGONOFFSETCLAMPPROC PolygonOffsetClamp;
+    PFNGLMAXSHADERCOMPILERTHREADSKHRPROC MaxShaderCompilerThreadsKHR;
+    PFNGLMAXSHADERCOMPILERTHREADSARBPROC MaxShaderCompilerThreadsARB;
 };
 
 const char * const GL_FUNCTIONS[] = {
@@ -1319,5 +1321,7 @@ const char * const GL_FUNCTIONS[] = {
     "glMultiDrawArraysIndirectCount",
     "glMultiDrawElementsIndirectCount",
     "glPolygonOffsetClamp",
+    "glMaxShaderCompilerThreadsKHR",
+    "glMaxShaderCompilerThreadsARB",
     NULL,
 };
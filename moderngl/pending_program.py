@@ -0,0 +1,56 @@
+__all__ = ['PendingProgram']
+
+
+class PendingProgram:
+    '''
+        A PendingProgram is a program that was compiled and linked without waiting for the driver.
+
+        Querying the compile or link status of a program blocks until the driver is done with it.
+        Submitting many programs before resolving any of them lets drivers supporting
+        ``GL_KHR_parallel_shader_compile`` or ``GL_ARB_parallel_shader_compile``
+        compile them on background threads.
+        Other drivers compile the programs when they are submitted or resolved.
+
+        A PendingProgram object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.program_async` or :py:meth:`Context.compile_many` to create one.
+    '''
+
+    __slots__ = ['mglo', '_program', '_finish', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self._program = None
+        self._finish = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<PendingProgram>'
+
+    @property
+    def ready(self) -> bool:
+        '''
+            bool: The driver finished compiling and linking the program.
+
+            :py:meth:`result` does not block once the program is ready.
+            Without a parallel shader compile extension the program is always reported as ready.
+        '''
+
+        return self._program is not None or self.mglo.ready
+
+    def result(self) -> 'Program':
+        '''
+            Wait for the driver and return the linked program.
+            The compiler and linker errors are raised here.
+            Later calls return the same program.
+
+            Returns:
+                :py:class:`Program` object
+        '''
+
+        if self._program is None:
+            self._program = self._finish(self.mglo.resolve())
+            self.mglo = None
+
+        return self._program
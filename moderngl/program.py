@@ -1,9 +1,93 @@
 from typing import Tuple, Union, Generator
 
-from .program_members import (Attribute, Subroutine, Uniform, UniformBlock,
-                              Varying)
+from .error import Error
+from .program_members import (Attribute, StorageBlock, Subroutine, Uniform,
+                              UniformBatch, UniformBlock, Varying)
 
-__all__ = ['Program', 'detect_format']
+__all__ = ['Program', 'detect_format', 'dtype_format']
+
+
+def _program_member(kind, item):
+    '''
+        Create a member object from the tuple returned by the extension.
+        The kind is ``'a'``, ``'v'``, ``'u'``, ``'b'``, ``'r'`` or ``'s'``
+        for attributes, varyings, uniforms, uniform blocks, subroutines and storage blocks.
+    '''
+
+    if kind == 'a':
+        obj = Attribute.__new__(Attribute)
+        obj.mglo, obj._location, obj._array_length, obj._dimension, obj._shape, obj._name = item
+    elif kind == 'v':
+        obj = Varying.__new__(Varying)
+        obj._number, obj._array_length, obj._dimension, obj._name = item
+    elif kind == 'u':
+        obj = Uniform.__new__(Uniform)
+        obj.mglo, obj._location, obj._array_length, obj._dimension, obj._name = item
+    elif kind == 'b':
+        obj = UniformBlock.__new__(UniformBlock)
+        obj.mglo, obj._index, obj._size, obj._name, obj._layout = item
+    elif kind == 'r':
+        obj = Subroutine.__new__(Subroutine)
+        obj._index, obj._name = item
+    else:
+        obj = StorageBlock.__new__(StorageBlock)
+        obj.mglo, obj._index, obj._size, obj._name, obj._layout = item
+
+    return obj
+
+
+class _LazyMembers:
+    '''
+        The members of a program created with lazy reflection.
+
+        The names are indexed once from the reflection of the program,
+        the member objects are created on the first access.
+    '''
+
+    __slots__ = ['_mglo', '_reflection', '_index', '_members']
+
+    # the position of the members in the reflection, the position of their name and their kind
+    _KINDS = ((2, 3, 'a'), (3, 3, 'v'), (4, 3, 'u'), (5, 2, 'b'), (6, 1, 'r'), (8, 2, 's'))
+
+    def __init__(self, mglo, reflection):
+        self._mglo = mglo
+        self._reflection = reflection
+        self._index = {}
+        self._members = {}
+
+        for position, name, kind in self._KINDS:
+            for index, item in enumerate(reflection[position]):
+                self._index[item[name]] = (kind, index)
+
+    def __getitem__(self, key):
+        member = self._members.get(key)
+
+        if member is None:
+            kind, index = self._index[key]
+
+            if kind in 'vr':
+                item = self._reflection[3 if kind == 'v' else 6][index]
+            else:
+                item = self._mglo.member(kind, index)
+
+            member = self._members[key] = _program_member(kind, item)
+
+        return member
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, key, default=None):
+        if key not in self._index:
+            return default
+
+        return self[key]
 
 
 class Program:
@@ -21,13 +105,14 @@ class Program:
         Use :py:meth:`Context.program` to create one.
     '''
 
-    __slots__ = ['mglo', '_members', '_subroutines', '_geom', '_glo', 'ctx', 'extra']
+    __slots__ = ['mglo', '_members', '_subroutines', '_geom', '_layouts', '_glo', 'ctx', 'extra']
 
     def __init__(self):
         self.mglo = None  #: Internal representation for debug purposes only.
         self._members = {}
         self._subroutines = None
         self._geom = (None, None, None)
+        self._layouts = {}
         self._glo = None
         self.ctx = None  #: The context this object belongs to
         self.extra = None  #: Any - Attribute for storing user defined objects
@@ -50,7 +135,7 @@ class Program:
         """
         return type(self) is type(other) and self.mglo is other.mglo
 
-    def __getitem__(self, key) -> Union[Uniform, UniformBlock, Subroutine, Attribute, Varying]:
+    def __getitem__(self, key) -> Union[Uniform, UniformBlock, StorageBlock, Subroutine, Attribute, Varying]:
         """Get a member such as uniforms, uniform blocks, subroutines,
         attributes and varyings by name.
 
@@ -162,20 +247,59 @@ class Program:
 
         return self._glo
 
-    def get(self, key, default) -> Union[Uniform, UniformBlock, Subroutine, Attribute, Varying]:
+    def get(self, key, default) -> Union[Uniform, UniformBlock, StorageBlock, Subroutine, Attribute, Varying]:
         '''
-            Returns a Uniform, UniformBlock, Subroutine, Attribute or Varying.
+            Returns a Uniform, UniformBlock, StorageBlock, Subroutine, Attribute or Varying.
 
             Args:
                 default: This is the value to be returned in case key does not exist.
 
             Returns:
-                :py:class:`Uniform`, :py:class:`UniformBlock`, :py:class:`Subroutine`,
-                :py:class:`Attribute` or :py:class:`Varying`
+                :py:class:`Uniform`, :py:class:`UniformBlock`, :py:class:`StorageBlock`,
+                :py:class:`Subroutine`, :py:class:`Attribute` or :py:class:`Varying`
         '''
 
         return self._members.get(key, default)
 
+    def set_uniforms(self, mapping) -> None:
+        '''
+            Set the value of many uniforms in a single call.
+
+            Vectors, matrices and arrays can be given as buffer protocol objects
+            such as NumPy arrays holding the raw values in column-major order.
+            Typed arrays must match the scalar type of the uniform, such as ``f4`` for ``float`` uniforms.
+
+            Args:
+                mapping (dict): The values of the uniforms by name.
+        '''
+
+        members = self._members
+        self.mglo.set_uniforms(tuple(members[name].mglo for name in mapping), tuple(mapping.values()))
+
+    def uniform_batch(self, names) -> 'UniformBatch':
+        '''
+            Create a :py:class:`UniformBatch` setting the given uniforms in a single call.
+
+            Args:
+                names (list): The names of the uniforms.
+
+            Returns:
+                :py:class:`UniformBatch` object
+        '''
+
+        names = tuple(names)
+
+        for name in names:
+            if type(self._members[name]) is not Uniform:
+                raise Error('%s is not a uniform' % name)
+
+        res = UniformBatch.__new__(UniformBatch)
+        res.program = self
+        res._names = names
+        res._uniforms = tuple(self._members[name].mglo for name in names)
+        res.extra = None
+        return res
+
     def release(self) -> None:
         '''
             Release the ModernGL object.
@@ -205,3 +329,83 @@ def detect_format(program, attributes) -> str:
         return attr.array_length * attr.dimension, attr.shape
 
     return ' '.join('%d%s' % fmt(program[a]) for a in attributes)
+
+
+def dtype_format(dtype) -> str:
+    '''
+        Detect format for a NumPy dtype.
+        Gaps between the fields and at the end of the dtype are padded with ``x`` bytes.
+        Nested structures and subarrays are flattened.
+
+        Args:
+            dtype (numpy.dtype): The dtype or a NumPy array.
+
+        Returns:
+            str
+    '''
+
+    return ' '.join(part for part, _ in _dtype_parts(dtype))
+
+
+def _dtype_parts(dtype) -> list:
+    '''
+        Flatten a NumPy dtype into (format, name) pairs ordered by offset.
+        The name is ``None`` for the padding, the names of nested fields are joined with ``_``.
+    '''
+
+    import numpy as np
+
+    codes = {
+        'f2': 'f2', 'f4': 'f', 'f8': 'f8',
+        'i1': 'i1', 'i2': 'i2', 'i4': 'i',
+        'u1': 'u1', 'u2': 'u2', 'u4': 'u',
+        'b1': 'u1',
+    }
+
+    def fmt(dt, name):
+        '''
+            For internal use only.
+        '''
+
+        count = 1
+        for n in dt.shape:
+            count *= n
+        base = dt.base
+
+        if base.names is not None:
+            if count == 1:
+                return fmt_struct(base, name)
+            return [x for i in range(count) for x in fmt_struct(base, '%s_%d' % (name, i))]
+
+        if not base.isnative:
+            raise Error('non-native byte order is not supported: %s' % base)
+
+        code = codes.get('%s%d' % (base.kind, base.itemsize))
+        if code is None:
+            raise Error('unsupported dtype: %s' % base)
+
+        return [('%d%s' % (count, code), name)]
+
+    def fmt_struct(dt, prefix):
+        '''
+            For internal use only.
+        '''
+
+        parts = []
+        position = 0
+        fields = sorted(((name,) + dt.fields[name][:2] for name in dt.names), key=lambda x: x[2])
+        for name, field, offset in fields:
+            if offset < position:
+                raise Error('overlapping fields are not supported')
+            if offset > position:
+                parts.append(('%dx' % (offset - position), None))
+            parts.extend(fmt(field, name if prefix is None else '%s_%s' % (prefix, name)))
+            position = offset + field.itemsize
+
+        if dt.itemsize > position:
+            parts.append(('%dx' % (dt.itemsize - position), None))
+
+        return parts
+
+    dtype = np.dtype(getattr(dtype, 'dtype', dtype))
+    return fmt_struct(dtype, None) if dtype.names is not None else fmt(dtype, None)
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import struct
+
+from .error import Error
+
+__all__ = ['set_program_cache']
+
+_HEADER = struct.Struct('<4sIII')
+_MAGIC = b'MGLP'
+_VERSION = 3
+
+_cache_path = None
+
+
+def set_program_cache(path) -> None:
+    '''
+        Store the linked programs and compute shaders in a directory.
+
+        The programs are stored with ``glGetProgramBinary`` together with their reflection data.
+        The next time the same sources are used on the same renderer and driver
+        the program is loaded with ``glProgramBinary`` and no introspection queries are made.
+        Binaries rejected by the driver are rebuilt from the source and replaced.
+
+        The cache can be disabled for a single program with ``cache=False``.
+
+        Args:
+            path (str): The cache directory, ``None`` disables the cache.
+    '''
+
+    global _cache_path
+    _cache_path = None if path is None else os.fspath(path)
+
+
+def _cache_directory(cache):
+    if cache is False:
+        return None
+
+    if _cache_path is not None:
+        return _cache_path
+
+    if cache:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'moderngl', 'programs')
+
+    return None
+
+
+def _cache_key(ctx, *parts) -> str:
+    info = ctx.info
+    key = hashlib.sha256()
+    key.update(repr((_VERSION, info['GL_VENDOR'], info['GL_RENDERER'], info['GL_VERSION'])).encode())
+    key.update(repr(parts).encode())
+    return key.hexdigest()
+
+
+def _as_tuple(value):
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+def _cache_load(directory, key):
+    try:
+        with open(os.path.join(directory, key), 'rb') as f:
+            data = f.read()
+        magic, version, binary_format, size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            return None, None
+        start = _HEADER.size
+        binary = data[start:start + size]
+        reflection = _as_tuple(json.loads(data[start + size:].decode()))
+        return (binary_format, binary), reflection
+    except (OSError, ValueError, struct.error):
+        return None, None
+
+
+def _cache_store(directory, key, binary, reflection) -> None:
+    binary_format, data = binary
+    filename = os.path.join(directory, key)
+    temp = '%s.%d.tmp' % (filename, os.getpid())
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(temp, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, binary_format, len(data)))
+            f.write(data)
+            f.write(json.dumps(reflection).encode())
+        os.replace(temp, filename)
+    except OSError:
+        pass
+
+
+def _cache_discard(directory, key) -> None:
+    try:
+        os.remove(os.path.join(directory, key))
+    except OSError:
+        pass
+
+
+def _cache_lookup(ctx, cache, *parts) -> tuple:
+    '''
+        Returns the cache directory, the key and the cached binary and reflection.
+        The directory is ``None`` when the cache is not used.
+    '''
+
+    directory = _cache_directory(cache)
+
+    if directory is None:
+        return None, None, None, None
+
+    key = _cache_key(ctx, *parts)
+    binary, reflection = _cache_load(directory, key)
+    return directory, key, binary, reflection
+
+
+def _cache_result(directory, key, result) -> tuple:
+    '''
+        Store the reflection and the binary from the last two items of the result
+        and return the rest of the result.
+    '''
+
+    *result, reflection, binary = result
+
+    if directory is not None and binary is not None:
+        _cache_store(directory, key, binary, reflection)
+
+    return tuple(result)
+
+
+def _cached_build(ctx, cache, build, *parts) -> tuple:
+    '''
+        Call ``build(binary, reflection, retrievable)`` with the cached program when there is one.
+        The build returns the reflection and the binary to store as its last two items,
+        they are not part of the result.
+    '''
+
+    directory, key, binary, reflection = _cache_lookup(ctx, cache, *parts)
+
+    if directory is None:
+        return build(None, None, False)[:-2]
+
+    result = None
+
+    if binary is not None:
+        try:
+            result = build(binary, reflection, True)
+        except (TypeError, Error):
+            _cache_discard(directory, key)
+
+    if result is None:
+        result = build(None, None, True)
+
+    return _cache_result(directory, key, result)
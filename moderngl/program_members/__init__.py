@@ -1,5 +1,7 @@
 from .attribute import *
+from .storage_block import *
 from .subroutine import *
 from .uniform import *
 from .uniform_block import *
+from .uniform_batch import *
 from .varying import *
@@ -0,0 +1,252 @@
+import re
+from typing import Dict
+
+from ..error import Error
+from ..uniform_struct import _GLSL_SHAPES, _GLSL_TYPES
+
+__all__ = ['StorageBlock']
+
+_MEMBER_NAME = re.compile(r'^([^\[.]+)(?:\[(\d+)\])?\.?(.*)$')
+
+
+def _member_format(name, member, array_length) -> tuple:
+    '''
+        The NumPy format of a member with the padding of the layout.
+        Arrays are given ``array_length`` elements.
+    '''
+
+    import numpy as np
+
+    if member['type'] not in _GLSL_SHAPES:
+        raise Error('%s has an unsupported type' % name)
+
+    base, rows, columns = _GLSL_SHAPES[member['type']]
+    itemsize = np.dtype(base).itemsize
+
+    if columns > 1:
+        major = rows if member['row_major'] else columns
+        shape = (major, member['matrix_stride'] // itemsize)
+    elif array_length is not None and member['array_stride'] != itemsize:
+        shape = (member['array_stride'] // itemsize,)
+    else:
+        shape = (rows,) if rows > 1 else ()
+
+    if array_length is not None:
+        shape = (array_length,) + shape
+
+    return (base, shape) if shape else base
+
+
+def _members_dtype(members, count, itemsize=None, top_level=True):
+    '''
+        The structured NumPy dtype of the members.
+        The members of an array of structures are grouped into a single field,
+        the runtime-sized array is given ``count`` elements.
+    '''
+
+    import numpy as np
+
+    groups = {}
+
+    for name, member in members:
+        top, index, rest = _MEMBER_NAME.match(name).groups()
+        groups.setdefault(top, []).append((index, rest, member))
+
+    names, formats, offsets = [], [], []
+
+    for top, group in groups.items():
+        index, rest, member = group[0]
+        start = min(member['offset'] for index, rest, member in group)
+
+        if not rest:
+            # a basic type or an array of basic types
+            fmt = _member_format(top, member, None if index is None else member['array_length'] or count)
+
+        elif rest.startswith('['):
+            # an array of arrays of basic types, the inner arrays are reported by their first element
+            fmt = (_member_format(top, member, member['array_length']), (member['top_level_array_length'] or count,))
+
+        elif index is None:
+            # a structure
+            element = [(rest, dict(member, offset=member['offset'] - start)) for index, rest, member in group]
+            fmt = _members_dtype(element, count, None, False)
+
+        else:
+            # an array of structures, only the first element is reported for top level arrays
+            first = [(rest, member) for index, rest, member in group if index == '0']
+            element = [(rest, dict(member, offset=member['offset'] - start)) for rest, member in first]
+
+            if top_level:
+                length = member['top_level_array_length'] or count
+                stride = member['top_level_array_stride']
+            else:
+                length = max(int(index) for index, rest, member in group) + 1
+                stride = 0
+
+                if length > 1:
+                    stride = min(member['offset'] for index, rest, member in group if index == '1') - start
+
+            fmt = (_members_dtype(element, count, stride or None, False), (length,))
+
+        names.append(top)
+        formats.append(fmt)
+        offsets.append(start)
+
+    dtype = {'names': names, 'formats': formats, 'offsets': offsets}
+
+    if itemsize is not None:
+        dtype['itemsize'] = itemsize
+
+    return np.dtype(dtype)
+
+
+class StorageBlock:
+    '''
+        StorageBlock
+
+        A shader storage block of a :py:class:`Program` or a :py:class:`ComputeShader`.
+        The layout is reflected with ``glGetProgramResourceiv``.
+    '''
+
+    __slots__ = ['mglo', '_index', '_size', '_name', '_layout', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self._index = None
+        self._size = None
+        self._name = None
+        self._layout = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<StorageBlock: %d>' % self._index
+
+    @property
+    def binding(self) -> int:
+        '''
+            int: The binding of the storage block.
+        '''
+
+        return self.mglo.binding
+
+    @binding.setter
+    def binding(self, binding):
+        self.mglo.binding = binding
+
+    @property
+    def name(self) -> str:
+        '''
+            str: The name of the storage block.
+        '''
+
+        return self._name
+
+    @property
+    def index(self) -> int:
+        '''
+            int: The index of the storage block.
+        '''
+
+        return self._index
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of the storage block as reported by OpenGL.
+
+            The size of blocks ending with a runtime-sized array depends on the driver,
+            use :py:meth:`buffer_size` to get the size for a number of elements.
+        '''
+
+        return self._size
+
+    @property
+    def layout(self) -> Dict[str, dict]:
+        '''
+            dict: The members of the storage block ordered by their offset.
+
+            Every member is described by a dict with the ``type``, ``offset``, ``array_length``,
+            ``array_stride``, ``matrix_stride``, ``row_major``, ``top_level_array_length`` and
+            ``top_level_array_stride`` keys as reported by OpenGL.
+            Arrays of structures are reported by the members of their first element.
+            The members of the runtime-sized array have a ``top_level_array_length`` of zero.
+        '''
+
+        prefix = self._name + '.'
+        layout = {}
+
+        for member in sorted(self._layout, key=lambda member: member[3]):
+            name, gl_type, array_length, offset, array_stride, matrix_stride, row_major, \
+                top_level_array_length, top_level_array_stride = member
+
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+
+            layout[name] = {
+                'type': _GLSL_TYPES.get(gl_type, 'unknown'),
+                'offset': offset,
+                'array_length': array_length,
+                'array_stride': array_stride,
+                'matrix_stride': matrix_stride,
+                'row_major': bool(row_major),
+                'top_level_array_length': top_level_array_length,
+                'top_level_array_stride': top_level_array_stride,
+            }
+
+        return layout
+
+    @property
+    def array_offset(self) -> int:
+        '''
+            int: The offset of the runtime-sized array.
+            The size of the block when there is no runtime-sized array.
+        '''
+
+        offsets = [member[3] for member in self._layout if member[7] == 0]
+        return min(offsets) if offsets else self._size
+
+    @property
+    def array_stride(self) -> int:
+        '''
+            int: The stride of the runtime-sized array, zero when there is none.
+        '''
+
+        for member in self._layout:
+            if member[7] == 0:
+                return member[8]
+
+        return 0
+
+    def buffer_size(self, count=0) -> int:
+        '''
+            The size of the block with ``count`` elements in the runtime-sized array.
+
+            Args:
+                count (int): The number of elements.
+
+            Returns:
+                int: The size in bytes.
+        '''
+
+        if not self.array_stride:
+            return self._size
+
+        return self.array_offset + self.array_stride * count
+
+    def dtype(self, count=0) -> 'numpy.dtype':
+        '''
+            The structured NumPy dtype of the block with ``count`` elements in the runtime-sized array.
+
+            Arrays of structures are nested structured fields.
+            The fields keep the std430 padding, vectors padded in arrays and
+            matrices have the padded size of their columns or rows.
+
+            Args:
+                count (int): The number of elements.
+
+            Returns:
+                numpy.dtype: The dtype of the whole block.
+        '''
+
+        return _members_dtype(self.layout.items(), count, self.buffer_size(count))
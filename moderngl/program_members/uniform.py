@@ -151,7 +151,9 @@ class Uniform:
     def value(self):
         '''
             The value of the uniform.
-            Reading the value of the uniform may force the GPU to sync.
+            Values written by moderngl are read from a copy kept on the CPU,
+            reading other values may force the GPU to sync.
+            Writing the current value again is skipped.
 
             The value must be a tuple for non array uniforms.
             The value must be a list of tuples for array uniforms.
@@ -0,0 +1,47 @@
+from typing import Tuple
+
+__all__ = ['UniformBatch']
+
+
+class UniformBatch:
+    '''
+        A UniformBatch sets a fixed list of uniforms in a single call.
+
+        The uniforms are looked up once when the batch is created.
+        Vectors, matrices and arrays can be given as buffer protocol objects
+        such as NumPy arrays holding the raw values in column-major order.
+        Typed arrays must match the scalar type of the uniform, such as ``f4`` for ``float`` uniforms.
+
+        A UniformBatch object cannot be instantiated directly, it requires a program.
+        Use :py:meth:`Program.uniform_batch` to create one.
+    '''
+
+    __slots__ = ['program', '_names', '_uniforms', 'extra']
+
+    def __init__(self):
+        self.program = None  #: Program: The program the uniforms belong to.
+        self._names = None
+        self._uniforms = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<UniformBatch: %d>' % len(self._names)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        '''
+            tuple: The names of the uniforms in the order of the values.
+        '''
+
+        return self._names
+
+    def set(self, values) -> None:
+        '''
+            Set the value of every uniform in the batch.
+
+            Args:
+                values (list): The values in the order of :py:attr:`names`.
+        '''
+
+        self.program.mglo.set_uniforms(self._uniforms, values)
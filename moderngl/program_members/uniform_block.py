@@ -1,3 +1,7 @@
+from typing import Dict
+
+from ..uniform_struct import _GLSL_TYPES
+
 __all__ = ['UniformBlock']
 
 
@@ -6,13 +10,14 @@ class UniformBlock:
         UniformBlock
     '''
 
-    __slots__ = ['mglo', '_index', '_size', '_name', 'extra']
+    __slots__ = ['mglo', '_index', '_size', '_name', '_layout', 'extra']
 
     def __init__(self):
         self.mglo = None  #: Internal representation for debug purposes only.
         self._index = None
         self._size = None
         self._name = None
+        self._layout = None
         self.extra = None  #: Any - Attribute for storing user defined objects
         raise TypeError()
 
@@ -66,3 +71,39 @@ class UniformBlock:
         '''
 
         return self._size
+
+    @property
+    def layout(self) -> Dict[str, dict]:
+        '''
+            dict: The members of the uniform block ordered by their offset.
+
+            Every member is described by a dict with the ``type``, ``offset``, ``array_length``,
+            ``array_stride``, ``matrix_stride`` and ``row_major`` keys as reported by OpenGL.
+            The ``type`` is the name of the GLSL type such as ``'vec4'`` or ``'mat3'``.
+            The name of the block instance is not part of the member names.
+
+            .. code-block:: python
+
+                >>> prog['Light'].layout['color']
+                {'type': 'vec3', 'offset': 16, 'array_length': 1, 'array_stride': 0, 'matrix_stride': 0, 'row_major': False}
+        '''
+
+        prefix = self._name + '.'
+        layout = {}
+
+        for member in sorted(self._layout, key=lambda member: member[3]):
+            name, gl_type, array_length, offset, array_stride, matrix_stride, row_major = member
+
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+
+            layout[name] = {
+                'type': _GLSL_TYPES.get(gl_type, 'unknown'),
+                'offset': offset,
+                'array_length': array_length,
+                'array_stride': array_stride,
+                'matrix_stride': matrix_stride,
+                'row_major': bool(row_major),
+            }
+
+        return layout
@@ -0,0 +1,73 @@
+from typing import Dict
+
+from .program import Program
+
+__all__ = ['ProgramPipeline']
+
+
+class ProgramPipeline(Program):
+    '''
+        A ProgramPipeline combines separable programs into the stages of a single pipeline.
+
+        Every stage is compiled and linked once with :py:meth:`Context.shader_stage`,
+        combining the stages into a pipeline does not link them again.
+        A ProgramPipeline can be used wherever a :py:class:`Program` is accepted by a :py:class:`VertexArray`.
+
+        The members are looked up in the vertex, tessellation, geometry and fragment stages in this order.
+        Uniforms declared in many stages are set in each of them.
+
+        A ProgramPipeline object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.program_pipeline` to create one.
+    '''
+
+    __slots__ = ['_stages']
+
+    def __init__(self):
+        self._stages = None
+        super().__init__()
+
+    def __repr__(self):
+        return '<ProgramPipeline: %d>' % self._glo
+
+    def __setitem__(self, key, value):
+        stages = [stage for stage in self._stages.values() if key in stage._members]
+
+        if not stages:
+            raise KeyError(key)
+
+        for stage in stages:
+            stage[key] = value
+
+    @property
+    def stages(self) -> Dict[str, Program]:
+        '''
+            dict: The separable programs by stage.
+        '''
+
+        return dict(self._stages)
+
+    def set_uniforms(self, mapping) -> None:
+        '''
+            Set the value of many uniforms in a single call for each stage.
+
+            Args:
+                mapping (dict): The values of the uniforms by name.
+        '''
+
+        for name in mapping:
+            if name not in self._members:
+                raise KeyError(name)
+
+        for stage in self._stages.values():
+            values = {name: value for name, value in mapping.items() if name in stage._members}
+
+            if values:
+                stage.set_uniforms(values)
+
+    def release(self) -> None:
+        '''
+            Release the ModernGL object.
+            The separable programs of the stages are not released.
+        '''
+
+        self.mglo.release()
@@ -0,0 +1,125 @@
+from .error import Error
+
+__all__ = ['Readback']
+
+
+class Readback:
+    '''
+        A Readback is the handle of an asynchronous buffer read.
+
+        The requested range is copied into a staging buffer on the GPU and
+        a fence is inserted after the copy. The result can be collected
+        later without blocking the Python thread until the GPU drains.
+        The staging buffer is released once the result is read,
+        the content returned by :py:meth:`result` is kept for later calls.
+
+        A Readback object cannot be instantiated directly.
+        Use :py:meth:`Buffer.read_async` to create one.
+    '''
+
+    __slots__ = ['mglo', '_size', '_data', '_released', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self._size = None
+        self._data = None
+        self._released = False
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<Readback: %d bytes>' % self._size
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The number of bytes being read.
+        '''
+
+        return self._size
+
+    def done(self) -> bool:
+        '''
+            Check if the copy has finished without blocking.
+
+            Returns:
+                bool
+        '''
+
+        if self._released:
+            return True
+
+        return self.mglo.fence_wait(0)
+
+    def wait(self, timeout=None) -> bool:
+        '''
+            Wait for the copy to finish.
+
+            Args:
+                timeout (float): The timeout in seconds. Value ``None`` means no timeout.
+
+            Returns:
+                bool: ``False`` if the timeout expired.
+        '''
+
+        if self._released:
+            return True
+
+        if timeout is not None:
+            return self.mglo.fence_wait(int(timeout * 1e9))
+
+        while not self.mglo.fence_wait(1000000000):
+            pass
+
+        return True
+
+    def result(self) -> bytes:
+        '''
+            Wait for the copy to finish and return the content.
+
+            Returns:
+                bytes
+        '''
+
+        if self._data is None:
+            if self._released:
+                raise Error('the readback was released')
+
+            self.wait()
+            self._data = self.mglo.read(-1, 0)
+            self.release()
+
+        return self._data
+
+    def result_into(self, buffer, *, write_offset=0) -> None:
+        '''
+            Wait for the copy to finish and read the content into a buffer.
+
+            Args:
+                buffer (bytearray): The buffer that will receive the content.
+
+            Keyword Args:
+                write_offset (int): The write offset.
+        '''
+
+        if self._data is not None:
+            view = memoryview(buffer).cast('B')
+            view[write_offset:write_offset + self._size] = self._data
+            return
+
+        if self._released:
+            raise Error('the readback was released')
+
+        self.wait()
+        self.mglo.read_into(buffer, -1, 0, write_offset)
+        self.release()
+
+    def release(self) -> None:
+        '''
+            Release the staging buffer without reading the content.
+        '''
+
+        if not self._released:
+            self._released = True
+            self.mglo.release()
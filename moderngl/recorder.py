@@ -0,0 +1,88 @@
+__all__ = ['Recorder']
+
+
+class Recorder:
+    '''
+        A Recorder captures rendering commands into a compact bytecode
+        that can be replayed with a single :py:meth:`Context.replay` call.
+
+        The following calls are recorded: :py:meth:`VertexArray.render`,
+        entering and exiting a :py:class:`Scope`, :py:meth:`Framebuffer.use`,
+        :py:meth:`Framebuffer.clear`, the ``use`` method of the textures and samplers,
+        :py:meth:`Buffer.bind_to_uniform_block` and :py:meth:`Buffer.bind_to_storage_buffer`.
+        The commands are executed while recording too.
+
+        Uniform values and buffer contents are not part of the bytecode,
+        they can be changed freely between replays. The recorded objects are
+        referenced by the bytecode and stay alive as long as the bytecode does.
+        Replaying a bytecode that references a released object raises an error.
+
+        A Recorder object cannot be instantiated directly.
+        Use :py:attr:`Context.recorder` to access it.
+    '''
+
+    __slots__ = ['mglo', '_bytecode', '_recording', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self._bytecode = None
+        self._recording = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<Recorder>'
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, *args):
+        self.end()
+
+    @property
+    def recording(self) -> bool:
+        '''
+            bool: The recorder is recording.
+        '''
+
+        return self._recording
+
+    def begin(self) -> None:
+        '''
+            Start recording.
+        '''
+
+        self.mglo.record_begin()
+        self._recording = True
+
+    def end(self) -> bytes:
+        '''
+            Stop recording.
+
+            Returns:
+                bytes: The bytecode.
+        '''
+
+        data, objects = self.mglo.record_end()
+        self._bytecode = _Bytecode(data)
+        self._bytecode._objects = objects
+        self._recording = False
+        return self._bytecode
+
+    def dump(self) -> bytes:
+        '''
+            The bytecode of the last recording.
+
+            Returns:
+                bytes
+        '''
+
+        return self._bytecode
+
+
+class _Bytecode(bytes):
+    '''
+        The bytecode of a recording with the table of the objects it references.
+    '''
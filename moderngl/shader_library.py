@@ -0,0 +1,242 @@
+import re
+
+from .error import Error
+
+__all__ = ['ShaderLibrary']
+
+_INCLUDE = re.compile(r'^[ \t]*#[ \t]*include[ \t]+(?:"([^"]+)"|<([^>]+)>)[ \t]*$', re.MULTILINE)
+_VERSION = re.compile(r'^[ \t]*#[ \t]*version[^\n]*\n?', re.MULTILINE)
+
+_SHADER_KEYWORDS = (
+    'vertex_shader', 'fragment_shader', 'geometry_shader', 'tess_control_shader', 'tess_evaluation_shader',
+)
+
+
+class ShaderLibrary:
+    '''
+        A ShaderLibrary preprocesses shader sources and keeps the linked variants.
+
+        Sources can ``#include`` the virtual files registered with :py:meth:`add_file`.
+        The ``defines`` are injected after the ``#version`` directive.
+        Programs with the same sources, defines and varyings are linked once,
+        the least recently used variants are dropped when the library is full.
+        Dropped variants are not released, they remain valid for the callers holding them.
+        Use :py:meth:`release` to release the kept variants.
+
+        A ShaderLibrary object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.shader_library` to create one.
+    '''
+
+    __slots__ = ['_files', '_variants', '_capacity', '_compiles', '_hits', 'ctx', 'extra']
+
+    def __init__(self):
+        self._files = None
+        self._variants = None
+        self._capacity = None
+        self._compiles = None
+        self._hits = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<ShaderLibrary: %d/%d>' % (len(self._variants), self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        '''
+            int: The maximum number of variants kept.
+        '''
+
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The number of variants kept.
+        '''
+
+        return len(self._variants)
+
+    @property
+    def compiles(self) -> int:
+        '''
+            int: The number of variants compiled by the library.
+        '''
+
+        return self._compiles
+
+    @property
+    def hits(self) -> int:
+        '''
+            int: The number of variants returned from the library without compiling.
+        '''
+
+        return self._hits
+
+    def add_file(self, name, source) -> None:
+        '''
+            Register a virtual file for ``#include "name"`` and ``#include <name>``.
+            Replacing a file with a different source drops the kept variants.
+
+            Args:
+                name (str): The name used in the include directive.
+                source (str): The content of the file.
+        '''
+
+        if self._files.get(name, source) != source:
+            self.clear()
+
+        self._files[name] = source
+
+    def preprocess(self, source, *, defines=None) -> str:
+        '''
+            Resolve the includes and inject the defines.
+
+            Args:
+                source (str): The shader source.
+
+            Keyword Args:
+                defines (dict): The macros to define. ``True`` or ``None`` values define an empty macro.
+
+            Returns:
+                str: The preprocessed source.
+        '''
+
+        source = self._resolve(source, ())
+
+        if not defines:
+            return source
+
+        lines = []
+
+        for name, value in sorted(defines.items()):
+            if value is None or value is True:
+                lines.append('#define %s\n' % name)
+            else:
+                lines.append('#define %s %s\n' % (name, value))
+
+        header = ''.join(lines)
+        version = _VERSION.search(source)
+
+        if version is None:
+            return header + source
+
+        end = version.end()
+        if source[end - 1:end] != '\n':
+            header = '\n' + header
+
+        return source[:end] + header + source[end:]
+
+    def program(self, *, vertex_shader, fragment_shader=None, geometry_shader=None,
+                tess_control_shader=None, tess_evaluation_shader=None, varyings=(),
+                varyings_capture_mode='interleaved', defines=None, cache=None) -> 'Program':
+        '''
+            Return the program variant for the sources and defines.
+            The variant is compiled with :py:meth:`Context.program` when it is not kept yet.
+            The other parameters are the same as for :py:meth:`Context.program`.
+
+            Args:
+                defines (dict): The macros to define in every shader.
+
+            Returns:
+                :py:class:`Program` object
+        '''
+
+        shaders = (vertex_shader, fragment_shader, geometry_shader, tess_control_shader, tess_evaluation_shader)
+
+        if type(varyings) is str:
+            varyings = (varyings,)
+
+        varyings = tuple(varyings)
+        key = ('program', shaders, self._defines_key(defines), varyings, varyings_capture_mode)
+        program = self._lookup(key)
+
+        if program is None:
+            sources = {
+                keyword: self.preprocess(shader, defines=defines)
+                for keyword, shader in zip(_SHADER_KEYWORDS, shaders) if shader is not None
+            }
+
+            program = self.ctx.program(
+                **sources, varyings=varyings, varyings_capture_mode=varyings_capture_mode, cache=cache,
+            )
+            self._store(key, program)
+
+        return program
+
+    def compute_shader(self, source, *, defines=None, cache=None) -> 'ComputeShader':
+        '''
+            Return the compute shader variant for the source and defines.
+            The variant is compiled with :py:meth:`Context.compute_shader` when it is not kept yet.
+
+            Args:
+                source (str): The source of the compute shader.
+
+            Keyword Args:
+                defines (dict): The macros to define.
+
+            Returns:
+                :py:class:`ComputeShader` object
+        '''
+
+        key = ('compute_shader', source, self._defines_key(defines))
+        compute_shader = self._lookup(key)
+
+        if compute_shader is None:
+            compute_shader = self.ctx.compute_shader(self.preprocess(source, defines=defines), cache=cache)
+            self._store(key, compute_shader)
+
+        return compute_shader
+
+    def clear(self) -> None:
+        '''
+            Drop the kept variants without releasing them.
+        '''
+
+        self._variants.clear()
+
+    def release(self) -> None:
+        '''
+            Release the kept variants and drop them.
+            The variants returned by the library earlier must not be used afterwards.
+        '''
+
+        while self._variants:
+            self._variants.popitem()[1].release()
+
+    def _resolve(self, source, stack) -> str:
+        def include(match):
+            name = match.group(1) or match.group(2)
+
+            if name in stack:
+                raise Error('recursive include: %s' % ' -> '.join(stack + (name,)))
+
+            if name not in self._files:
+                raise Error('cannot include %s' % name)
+
+            return self._resolve(self._files[name], stack + (name,))
+
+        return _INCLUDE.sub(include, source)
+
+    def _defines_key(self, defines) -> tuple:
+        if not defines:
+            return ()
+
+        return tuple(sorted((name, None if value is True else value) for name, value in defines.items()))
+
+    def _lookup(self, key):
+        variant = self._variants.get(key)
+
+        if variant is not None:
+            self._variants.move_to_end(key)
+            self._hits += 1
+
+        return variant
+
+    def _store(self, key, variant) -> None:
+        self._compiles += 1
+        self._variants[key] = variant
+
+        while len(self._variants) > self._capacity:
+            self._variants.popitem(last=False)
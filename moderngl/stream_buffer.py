@@ -0,0 +1,128 @@
+__all__ = ['StreamBuffer']
+
+
+class StreamBuffer:
+    '''
+        A StreamBuffer is a persistently and coherently mapped :py:class:`Buffer`
+        split into a ring of equally sized frames.
+
+        Per-frame vertex or uniform data is written directly into the mapped
+        memory and sub-allocations are handed out from the current frame.
+        Calling :py:meth:`next_frame` fences the commands issued so far and
+        moves to the next frame, waiting only if the GPU is still reading it.
+        This avoids the driver stalls and copies caused by
+        :py:meth:`Buffer.write` and :py:meth:`Buffer.orphan` on every frame.
+
+        A StreamBuffer object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.stream_buffer` to create one.
+    '''
+
+    __slots__ = ['mglo', 'buffer', '_frames', '_frame', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self.buffer = None  #: Buffer: The underlying buffer. Use it in vertex arrays and scopes.
+        self._frames = None
+        self._frame = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<StreamBuffer: %d>' % self.glo
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.mglo is other.mglo
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of the buffer.
+        '''
+
+        return self.buffer.size
+
+    @property
+    def frames(self) -> int:
+        '''
+            int: The number of frames in the ring.
+        '''
+
+        return self._frames
+
+    @property
+    def frame(self) -> int:
+        '''
+            int: The index of the current frame.
+        '''
+
+        return self._frame
+
+    @property
+    def frame_size(self) -> int:
+        '''
+            int: The number of bytes available in a single frame.
+        '''
+
+        return self.buffer.size // self._frames
+
+    @property
+    def glo(self) -> int:
+        '''
+            int: The internal OpenGL object.
+            This values is provided for debug purposes only.
+        '''
+
+        return self.buffer.glo
+
+    def allocate(self, size, *, alignment=16) -> int:
+        '''
+            Reserve a range from the current frame.
+
+            The range can be filled with :py:meth:`Buffer.write`
+            which copies directly into the mapped memory.
+
+            Args:
+                size (int): The number of bytes to reserve.
+
+            Keyword Args:
+                alignment (int): The alignment of the returned offset.
+
+            Returns:
+                int: The offset of the range in the buffer.
+        '''
+
+        return self.mglo.stream_allocate(size, alignment)
+
+    def write(self, data, *, alignment=16) -> int:
+        '''
+            Copy the data into a new range of the current frame.
+
+            Args:
+                data (bytes): The data.
+
+            Keyword Args:
+                alignment (int): The alignment of the returned offset.
+
+            Returns:
+                int: The offset of the data in the buffer.
+        '''
+
+        return self.mglo.stream_write(data, alignment)
+
+    def next_frame(self) -> None:
+        '''
+            Fence the current frame and move to the next one.
+
+            Blocks only if the GPU is still reading the next frame.
+            All the ranges allocated from the next frame become invalid.
+        '''
+
+        self._frame = self.mglo.stream_next_frame()
+
+    def release(self) -> None:
+        '''
+            Release the ModernGL object.
+        '''
+
+        self.mglo.release()
@@ -0,0 +1,121 @@
+from typing import Tuple
+
+from .buffer import Buffer
+from .vertex_array import POINTS
+
+__all__ = ['TransformFeedback']
+
+
+class TransformFeedback:
+    '''
+        A TransformFeedback object owns the buffer bindings of a transform feedback.
+
+        It can be passed to :py:meth:`VertexArray.transform` in place of the buffers.
+        Between :py:meth:`begin` and :py:meth:`end` every transform appends
+        to the captured output instead of restarting at the beginning of the buffers.
+        The capture can be paused to transform into other buffers in the meantime.
+
+        A TransformFeedback object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.transform_feedback` to create one.
+    '''
+
+    __slots__ = ['mglo', '_buffers', '_glo', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self._buffers = None
+        self._glo = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<TransformFeedback: %d>' % self.glo
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.mglo is other.mglo
+
+    @property
+    def buffers(self) -> Tuple[Buffer, ...]:
+        '''
+            tuple: The buffers capturing the varyings.
+        '''
+
+        return self._buffers
+
+    @property
+    def active(self) -> bool:
+        '''
+            bool: The transform feedback was started and not yet ended.
+        '''
+
+        return self.mglo.active
+
+    @property
+    def paused(self) -> bool:
+        '''
+            bool: The transform feedback is paused.
+        '''
+
+        return self.mglo.paused
+
+    @property
+    def primitives(self) -> int:
+        '''
+            int: The number of primitives written by the last capture, excluding the paused periods.
+            ``None`` while the result is not available yet,
+            reading this property never waits for the GPU.
+        '''
+
+        return self.mglo.primitives
+
+    @property
+    def glo(self) -> int:
+        '''
+            int: The internal OpenGL object.
+            This values is provided for debug purposes only.
+        '''
+
+        return self._glo
+
+    def begin(self, program, mode=None) -> None:
+        '''
+            Start capturing the varyings of the program.
+
+            Args:
+                program (Program): A program with varyings.
+                mode (int): By default :py:data:`POINTS` will be used.
+        '''
+
+        if mode is None:
+            mode = POINTS
+
+        self.mglo.begin(program.mglo, mode)
+
+    def pause(self) -> None:
+        '''
+            Pause the capture.
+        '''
+
+        self.mglo.pause()
+
+    def resume(self) -> None:
+        '''
+            Resume the capture.
+        '''
+
+        self.mglo.resume()
+
+    def end(self) -> None:
+        '''
+            Stop capturing the varyings.
+        '''
+
+        self.mglo.end()
+
+    def release(self) -> None:
+        '''
+            Release the ModernGL object.
+        '''
+
+        self.mglo.release()
@@ -0,0 +1,196 @@
+from .error import Error
+
+__all__ = ['UniformStruct']
+
+_GLSL_TYPES = {
+    0x1406: 'float', 0x8B50: 'vec2', 0x8B51: 'vec3', 0x8B52: 'vec4',
+    0x140A: 'double', 0x8FFC: 'dvec2', 0x8FFD: 'dvec3', 0x8FFE: 'dvec4',
+    0x1404: 'int', 0x8B53: 'ivec2', 0x8B54: 'ivec3', 0x8B55: 'ivec4',
+    0x1405: 'uint', 0x8DC6: 'uvec2', 0x8DC7: 'uvec3', 0x8DC8: 'uvec4',
+    0x8B56: 'bool', 0x8B57: 'bvec2', 0x8B58: 'bvec3', 0x8B59: 'bvec4',
+    0x8B5A: 'mat2', 0x8B5B: 'mat3', 0x8B5C: 'mat4',
+    0x8B65: 'mat2x3', 0x8B66: 'mat2x4', 0x8B67: 'mat3x2',
+    0x8B68: 'mat3x4', 0x8B69: 'mat4x2', 0x8B6A: 'mat4x3',
+    0x8F46: 'dmat2', 0x8F47: 'dmat3', 0x8F48: 'dmat4',
+    0x8F49: 'dmat2x3', 0x8F4A: 'dmat2x4', 0x8F4B: 'dmat3x2',
+    0x8F4C: 'dmat3x4', 0x8F4D: 'dmat4x2', 0x8F4E: 'dmat4x3',
+}
+
+# base type, rows, columns
+_GLSL_SHAPES = {
+    'float': ('f4', 1, 1), 'vec2': ('f4', 2, 1), 'vec3': ('f4', 3, 1), 'vec4': ('f4', 4, 1),
+    'double': ('f8', 1, 1), 'dvec2': ('f8', 2, 1), 'dvec3': ('f8', 3, 1), 'dvec4': ('f8', 4, 1),
+    'int': ('i4', 1, 1), 'ivec2': ('i4', 2, 1), 'ivec3': ('i4', 3, 1), 'ivec4': ('i4', 4, 1),
+    'uint': ('u4', 1, 1), 'uvec2': ('u4', 2, 1), 'uvec3': ('u4', 3, 1), 'uvec4': ('u4', 4, 1),
+    'bool': ('u4', 1, 1), 'bvec2': ('u4', 2, 1), 'bvec3': ('u4', 3, 1), 'bvec4': ('u4', 4, 1),
+    'mat2': ('f4', 2, 2), 'mat3': ('f4', 3, 3), 'mat4': ('f4', 4, 4),
+    'mat2x3': ('f4', 3, 2), 'mat2x4': ('f4', 4, 2), 'mat3x2': ('f4', 2, 3),
+    'mat3x4': ('f4', 4, 3), 'mat4x2': ('f4', 2, 4), 'mat4x3': ('f4', 3, 4),
+    'dmat2': ('f8', 2, 2), 'dmat3': ('f8', 3, 3), 'dmat4': ('f8', 4, 4),
+    'dmat2x3': ('f8', 3, 2), 'dmat2x4': ('f8', 4, 2), 'dmat3x2': ('f8', 2, 3),
+    'dmat3x4': ('f8', 4, 3), 'dmat4x2': ('f8', 2, 4), 'dmat4x3': ('f8', 3, 4),
+}
+
+
+def _layout_dtype(layout, size) -> tuple:
+    '''
+        Build a structured NumPy dtype from a block layout.
+        The fields keep the padding of the layout, the second item holds
+        the index selecting the values and whether the last two axes are swapped.
+    '''
+
+    import numpy as np
+
+    names, formats, offsets, fields = [], [], [], {}
+
+    for name, member in layout.items():
+        if member['type'] not in _GLSL_SHAPES:
+            raise Error('%s has an unsupported type' % name)
+
+        base, rows, columns = _GLSL_SHAPES[member['type']]
+        itemsize = np.dtype(base).itemsize
+        array_length = member['array_length']
+        array_stride = member['array_stride']
+        row_major = member['row_major'] and columns > 1
+
+        if columns == 1:
+            shape = (array_stride // itemsize,) if array_length > 1 else (rows,)
+            index = (0,) if rows == 1 else (slice(0, rows),)
+        else:
+            major, minor = (rows, columns) if row_major else (columns, rows)
+            shape = (major, member['matrix_stride'] // itemsize)
+            index = (slice(None), slice(0, minor))
+
+            if array_length > 1 and array_stride != major * member['matrix_stride']:
+                raise Error('%s has an unsupported array stride' % name)
+
+        if array_length > 1:
+            shape = (array_length,) + shape
+            index = (slice(None),) + index
+        elif rows == 1 and columns == 1:
+            index = (slice(0, 1),)
+
+        names.append(name)
+        formats.append((base, shape))
+        offsets.append(member['offset'])
+        fields[name] = (index, row_major, array_length == 1 and rows == 1 and columns == 1)
+
+    dtype = np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': size})
+    return dtype, fields
+
+
+class UniformStruct:
+    '''
+        A UniformStruct keeps the content of a uniform block in a NumPy structured array.
+
+        The values are set by member name and only the changed byte ranges of the
+        buffer are written by :py:meth:`flush`, replacing many uniform calls with a single update.
+        Matrices are indexed by column unless the member is declared ``row_major``.
+
+        A UniformStruct object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.uniform_struct` to create one.
+    '''
+
+    __slots__ = ['buffer', 'offset', 'size', '_array', '_fields', '_dirty', 'ctx', 'extra']
+
+    def __init__(self):
+        self.buffer = None  #: Buffer: The buffer holding the uniform block.
+        self.offset = None  #: int: The offset of the uniform block in the buffer.
+        self.size = None  #: int: The size of the uniform block.
+        self._array = None
+        self._fields = None
+        self._dirty = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<UniformStruct: %d>' % self.size
+
+    def __getitem__(self, key):
+        '''
+            Get the value of a member. Arrays, vectors and matrices are returned as read-only NumPy arrays.
+        '''
+
+        index, row_major, scalar = self._fields[key]
+        value = self._array[key][0][index]
+
+        if scalar:
+            return value[0]
+
+        if row_major:
+            value = value.swapaxes(-1, -2)
+
+        value = value.view()
+        value.flags.writeable = False
+        return value
+
+    def __setitem__(self, key, value):
+        '''
+            Set the value of a member and mark it for the next :py:meth:`flush`.
+        '''
+
+        index, row_major, scalar = self._fields[key]
+        view = self._array[key][0][index]
+
+        if row_major:
+            view = view.swapaxes(-1, -2)
+
+        view[...] = value
+        self._dirty.add(key)
+
+    @property
+    def dirty(self) -> bool:
+        '''
+            bool: Some members were changed since the last :py:meth:`flush`.
+        '''
+
+        return bool(self._dirty)
+
+    @property
+    def array(self) -> 'numpy.ndarray':
+        '''
+            numpy.ndarray: A read-only view of the structured array with the padding of the layout.
+        '''
+
+        array = self._array.view()
+        array.flags.writeable = False
+        return array
+
+    def flush(self) -> None:
+        '''
+            Write the changed members to the buffer.
+            Adjacent members are merged into a single range.
+        '''
+
+        if not self._dirty:
+            return
+
+        fields = self._array.dtype.fields
+        ranges = sorted((fields[name][1], fields[name][1] + fields[name][0].itemsize) for name in self._dirty)
+        merged = [list(ranges[0])]
+
+        for start, end in ranges[1:]:
+            if start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        data = self._array.view('u1')
+        self.buffer.write_many(
+            [self.offset + start for start, end in merged],
+            [data[start:end] for start, end in merged],
+        )
+        self._dirty.clear()
+
+    def bind(self, binding=0) -> None:
+        '''
+            Bind the range of the uniform block to a uniform buffer binding.
+            Pending changes are flushed first.
+
+            Args:
+                binding (int): The uniform block binding.
+        '''
+
+        self.flush()
+        self.buffer.bind_to_uniform_block(binding, offset=self.offset, size=self.size)
@@ -1,5 +1,9 @@
+import array
 from typing import Tuple
 
+from .buffer_pool import BufferRange
+from .error import Error
+
 __all__ = ['VertexArray',
            'POINTS', 'LINES', 'LINE_LOOP', 'LINE_STRIP', 'TRIANGLES', 'TRIANGLE_STRIP', 'TRIANGLE_FAN',
            'LINES_ADJACENCY', 'LINE_STRIP_ADJACENCY', 'TRIANGLES_ADJACENCY', 'TRIANGLE_STRIP_ADJACENCY', 'PATCHES']
@@ -33,11 +37,12 @@ class VertexArray:
         to create one.
     '''
 
-    __slots__ = ['mglo', '_program', '_index_buffer', '_index_element_size', '_glo', 'ctx', 'extra', 'scope']
+    __slots__ = ['mglo', '_program', '_layout', '_index_buffer', '_index_element_size', '_glo', 'ctx', 'extra', 'scope']
 
     def __init__(self):
         self.mglo = None  #: Internal representation for debug purposes only.
         self._program = None
+        self._layout = None
         self._index_buffer = None
         self._index_element_size = None
         self._glo = None
@@ -61,6 +66,14 @@ class VertexArray:
 
         return self._program
 
+    @property
+    def layout(self) -> 'VertexLayout':
+        '''
+            VertexLayout: The vertex layout of the content.
+        '''
+
+        return self._layout
+
     @property
     def index_buffer(self) -> 'Buffer':
         '''
@@ -122,7 +135,8 @@ class VertexArray:
 
         return self._glo
 
-    def render(self, mode=None, vertices=-1, *, first=0, instances=-1) -> None:
+    def render(self, mode=None, vertices=-1, *, first=0, instances=-1,
+               base_vertex=0, base_instance=0) -> None:
         '''
             The render primitive (mode) must be the same as
             the input primitive of the GeometryShader.
@@ -134,18 +148,60 @@ class VertexArray:
             Keyword Args:
                 first (int): The index of the first vertex to start with.
                 instances (int): The number of instances.
+                base_vertex (int): The value added to the indices. Offsets the first vertex when not indexed.
+                base_instance (int): The first instance used by per instance attributes.
+        '''
+
+        if mode is None:
+            mode = TRIANGLES
+
+        if self.scope:
+            with self.scope:
+                self.mglo.render(mode, vertices, first, instances, base_vertex, base_instance)
+        else:
+            self.mglo.render(mode, vertices, first, instances, base_vertex, base_instance)
+
+    def render_multi(self, firsts, counts, *, base_vertices=None, mode=None) -> None:
+        '''
+            Render many ranges of the vertex array with a single call.
+
+            Maps to ``glMultiDrawArrays`` or to ``glMultiDrawElementsBaseVertex``
+            when an index buffer is used. The arrays are passed to OpenGL without copies.
+
+            Args:
+                firsts (array): The first vertex or index of each draw as 32 bit integers.
+                counts (array): The number of vertices of each draw as 32 bit integers.
+
+            Keyword Args:
+                base_vertices (array): The value added to the indices of each draw as 32 bit integers.
+                mode (int): By default :py:data:`TRIANGLES` will be used.
+
+            .. rubric:: Example
+
+            .. code-block:: python
+
+                >>> vao.render_multi(np.array([0, 300, 900], 'i4'), np.array([300, 600, 150], 'i4'))
         '''
 
         if mode is None:
             mode = TRIANGLES
 
+        if isinstance(firsts, (list, tuple)):
+            firsts = array.array('i', firsts)
+
+        if isinstance(counts, (list, tuple)):
+            counts = array.array('i', counts)
+
+        if isinstance(base_vertices, (list, tuple)):
+            base_vertices = array.array('i', base_vertices)
+
         if self.scope:
             with self.scope:
-                self.mglo.render(mode, vertices, first, instances)
+                self.mglo.render_multi(firsts, counts, base_vertices, mode)
         else:
-            self.mglo.render(mode, vertices, first, instances)
+            self.mglo.render_multi(firsts, counts, base_vertices, mode)
 
-    def render_indirect(self, buffer, mode=None, count=-1, *, first=0) -> None:
+    def render_indirect(self, buffer, mode=None, count=-1, *, first=0, count_buffer=None) -> None:
         '''
             The render primitive (mode) must be the same as
             the input primitive of the GeometryShader.
@@ -159,26 +215,38 @@ class VertexArray:
 
             Keyword Args:
                 first (int): The index of the first indirect draw command.
+                count_buffer (Buffer): A buffer holding the number of draws as its first integer.
+                                       The count is used as the upper limit.
+                                       Without ``ARB_indirect_parameters`` all the commands are drawn.
         '''
 
         if mode is None:
             mode = TRIANGLES
 
+        if count_buffer is not None:
+            count_buffer = count_buffer.mglo
+
         if self.scope:
             with self.scope:
-                self.mglo.render_indirect(buffer.mglo, mode, count, first)
+                self.mglo.render_indirect(buffer.mglo, mode, count, first, count_buffer)
         else:
-            self.mglo.render_indirect(buffer.mglo, mode, count, first)
+            self.mglo.render_indirect(buffer.mglo, mode, count, first, count_buffer)
 
     def transform(self, buffer, mode=None, vertices=-1, *, first=0, instances=-1) -> None:
         '''
             Transform vertices.
-            Stores the output in a single buffer.
+            Stores the output in a single buffer, in a list of buffers
+            or in the buffers of a :py:class:`TransformFeedback`.
             The transform primitive (mode) must be the same as
             the input primitive of the GeometryShader.
 
+            Programs created with ``varyings_capture_mode='separate'``
+            require a buffer for every varying.
+            An active :py:class:`TransformFeedback` keeps appending to its buffers,
+            otherwise a single capture is made.
+
             Args:
-                buffer (Buffer): The buffer to store the output.
+                buffer (Buffer): The buffer, buffers or transform feedback to store the output.
                 mode (int): By default :py:data:`POINTS` will be used.
                 vertices (int): The number of vertices to transform.
 
@@ -190,11 +258,44 @@ class VertexArray:
         if mode is None:
             mode = POINTS
 
+        if type(buffer) in (list, tuple):
+            output = tuple(item.mglo for item in buffer)
+        else:
+            output = buffer.mglo
+
         if self.scope:
             with self.scope:
-                self.mglo.transform(buffer.mglo, mode, vertices, first, instances)
+                self.mglo.transform(output, mode, vertices, first, instances)
         else:
-            self.mglo.transform(buffer.mglo, mode, vertices, first, instances)
+            self.mglo.transform(output, mode, vertices, first, instances)
+
+    def set_buffer(self, binding, buffer, offset=0, stride=None) -> None:
+        '''
+            Replace the buffer of a content entry without recreating the VertexArray.
+            The binding is the index of the entry in the content.
+            The number of vertices is detected again when there is no index buffer.
+
+            Args:
+                binding (int): The binding.
+                buffer (Buffer): The buffer, a :py:class:`BufferRange` is also accepted.
+                offset (int): The offset of the first vertex.
+                stride (int): By default the size of the format is used.
+        '''
+
+        size = -1
+
+        if type(buffer) is BufferRange:
+            if offset > buffer.size:
+                raise Error('the offset is out of the range')
+
+            size = buffer.size - offset
+            offset += buffer.offset
+            buffer = buffer.buffer
+
+        if stride is None:
+            stride = -1
+
+        self.mglo.set_buffer(binding, buffer.mglo, offset, size, stride)
 
     def bind(self, attribute, cls, buffer, fmt, *, offset=0, stride=0, divisor=0, normalize=False) -> None:
         '''
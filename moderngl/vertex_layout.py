@@ -0,0 +1,62 @@
+from typing import Tuple
+
+__all__ = ['VertexLayout']
+
+
+class VertexLayout:
+    '''
+        A VertexLayout is the compiled form of a VertexArray content without the buffers.
+        The formats are parsed and the attributes are resolved to locations once,
+        the VertexArrays created with the same program and formats share it.
+
+        The index of a content entry is its binding,
+        see :py:meth:`VertexArray.set_buffer`.
+
+        A VertexLayout object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.vertex_layout` to create one.
+    '''
+
+    __slots__ = ['mglo', '_program', '_content', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None  #: Internal representation for debug purposes only.
+        self._program = None
+        self._content = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<VertexLayout: %d bindings>' % self.bindings
+
+    @property
+    def program(self) -> 'Program':
+        '''
+            Program: The program the attribute locations belong to.
+        '''
+
+        return self._program
+
+    @property
+    def content(self) -> Tuple[tuple, ...]:
+        '''
+            tuple: The (format, attributes) of every binding.
+        '''
+
+        return self._content
+
+    @property
+    def bindings(self) -> int:
+        '''
+            int: The number of buffer bindings.
+        '''
+
+        return self.mglo.bindings
+
+    @property
+    def strides(self) -> Tuple[int, ...]:
+        '''
+            tuple: The stride of every binding.
+        '''
+
+        return self.mglo.strides
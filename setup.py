@@ -93,8 +93,13 @@ mgl = Extension(
         'moderngl/old/Framebuffer.cpp',
         'moderngl/old/InvalidObject.cpp',
         'moderngl/old/ModernGL.cpp',
+        'moderngl/old/PendingProgram.cpp',
         'moderngl/old/Program.cpp',
         'moderngl/old/Query.cpp',
+        'moderngl/old/Recorder.cpp',
+        'moderngl/old/StateCache.cpp',
+        'moderngl/old/StorageBlock.cpp',
+        'moderngl/old/TransformFeedback.cpp',
         'moderngl/old/Renderbuffer.cpp',
         'moderngl/old/Scope.cpp',
         'moderngl/old/Texture.cpp',
@@ -106,6 +111,7 @@ mgl = Extension(
         'moderngl/old/UniformGetters.cpp',
         'moderngl/old/UniformSetters.cpp',
         'moderngl/old/VertexArray.cpp',
+        'moderngl/old/VertexLayout.cpp',
     ],
     depends=[
         'moderngl/old/gl_methods.hpp',
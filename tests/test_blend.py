@@ -277,8 +277,21 @@ class TestBlend(unittest.TestCase):
         self.ctx.blend_equation = moderngl.MAX, moderngl.MAX
 
     def test_get_values(self):
-        with self.assertRaises(NotImplementedError):
-            self.ctx.blend_func
+        # the other tests change the blend state, start from the defaults
+        self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self.ctx.blend_equation = moderngl.FUNC_ADD
+
+        self.assertEqual(self.ctx.blend_func, (
+            moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA,
+            moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA,
+        ))
+        self.assertEqual(self.ctx.blend_equation, (moderngl.FUNC_ADD, moderngl.FUNC_ADD))
 
-        with self.assertRaises(NotImplementedError):
-            self.ctx.blend_equation
+        self.ctx.blend_func = moderngl.ONE, moderngl.ZERO, moderngl.SRC_COLOR, moderngl.DST_ALPHA
+        self.ctx.blend_equation = moderngl.FUNC_SUBTRACT, moderngl.MAX
+
+        self.assertEqual(self.ctx.blend_func, (moderngl.ONE, moderngl.ZERO, moderngl.SRC_COLOR, moderngl.DST_ALPHA))
+        self.assertEqual(self.ctx.blend_equation, (moderngl.FUNC_SUBTRACT, moderngl.MAX))
+
+        self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self.ctx.blend_equation = moderngl.FUNC_ADD
@@ -1,3 +1,5 @@
+import array
+import struct
 import unittest
 
 import moderngl
@@ -71,6 +73,150 @@ class TestBuffer(unittest.TestCase):
         self.assertEqual(buf.size, 100)
         self.assertEqual(len(buf.read()), 100)
 
+    def test_buffer_map_write(self):
+        buf = self.ctx.buffer(data=b'\x00' * 16)
+        with buf.map(4, 8) as view:
+            self.assertEqual(len(view), 8)
+            view[:] = b'abcdefgh'
+        self.assertEqual(buf.read(), b'\x00' * 4 + b'abcdefgh' + b'\x00' * 4)
+
+    def test_buffer_map_read(self):
+        buf = self.ctx.buffer(data=b'Hello World!')
+        with buf.map(6, 5, read=True, write=False) as view:
+            self.assertTrue(view.readonly)
+            self.assertEqual(bytes(view), b'World')
+
+    def test_buffer_map_flush_explicit(self):
+        buf = self.ctx.buffer(data=b'\x00' * 16)
+        with buf.map(invalidate=True, flush_explicit=True) as view:
+            view[0:4] = b'abcd'
+            buf.flush_range(0, 4)
+        self.assertEqual(buf.read(4), b'abcd')
+
+    def test_buffer_map_released(self):
+        buf = self.ctx.buffer(reserve=16)
+        with buf.map() as view:
+            pass
+        with self.assertRaises(ValueError):
+            view[0]
+
+    def test_buffer_map_errors(self):
+        buf = self.ctx.buffer(reserve=16)
+        with self.assertRaises(moderngl.Error):
+            with buf.map(8, 16):
+                pass
+        with self.assertRaises(moderngl.Error):
+            with buf.map(read=True, invalidate=True):
+                pass
+        with buf.map():
+            with self.assertRaises(moderngl.Error):
+                with buf.map():
+                    pass
+
+    def test_buffer_mapped_operations(self):
+        buf = self.ctx.buffer(reserve=16)
+        with buf.map():
+            for call in (buf.read, buf.clear, lambda: buf.write(b'\x00' * 4), lambda: buf.orphan(32),
+                         lambda: buf.write_chunks(b'\x00' * 8, 0, 8, 1)):
+                with self.assertRaises(moderngl.Error):
+                    call()
+        buf.orphan(32)
+        self.assertEqual(buf.size, 32)
+
+    def test_buffer_clear_zero_offset(self):
+        buf = self.ctx.buffer(data=b'\xAA' * 8)
+        buf.clear(size=4, offset=4)
+        self.assertEqual(buf.read(), b'\xAA' * 4 + b'\x00' * 4)
+
+    def test_buffer_clear_fmt(self):
+        buf = self.ctx.buffer(reserve=32)
+        buf.clear(chunk=struct.pack('4f', 1.0, 2.0, 3.0, 4.0), fmt='4f')
+        self.assertEqual(buf.read(), struct.pack('4f', 1.0, 2.0, 3.0, 4.0) * 2)
+        buf.clear(size=8, offset=4, chunk=struct.pack('I', 7), fmt='1u4')
+        self.assertEqual(buf.read(12), struct.pack('f2I', 1.0, 7, 7))
+
+    def test_buffer_write_many(self):
+        buf = self.ctx.buffer(data=b'.' * 16)
+        buf.write_many([0, 2, 12], b'AaBbCc')
+        self.assertEqual(buf.read(), b'AaBb........Cc..')
+        buf.write_many(array.array('i', [14, 5, 6]), [b'X', b'YYY', b'Z'])
+        self.assertEqual(buf.read(), b'AaBb.YZY....CcX.')
+
+    def test_buffer_write_many_errors(self):
+        buf = self.ctx.buffer(reserve=16)
+        with self.assertRaises(moderngl.Error):
+            buf.write_many([0, 15], b'AaBb')
+        with self.assertRaises(moderngl.Error):
+            buf.write_many([0, 4], b'AaB')
+        with self.assertRaises(moderngl.Error):
+            buf.write_many([0, 4], [b'Aa'])
+
+    def test_buffer_clear_fmt_mismatch(self):
+        buf = self.ctx.buffer(reserve=32)
+        with self.assertRaises(moderngl.Error):
+            buf.clear(chunk=b'\x00' * 8, fmt='4f')
+        with self.assertRaises(moderngl.Error):
+            buf.clear(fmt='4x')
+
+    def test_buffer_write_chunks_strided(self):
+        source = memoryview(b'AaBbCcDd')[::2]
+        buf = self.ctx.buffer(data=b'.' * 8)
+        buf.write_chunks(source, 1, 2, 4)
+        self.assertEqual(buf.read(), b'.A.B.C.D')
+
+    def test_buffer_read_chunks_into(self):
+        buf = self.ctx.buffer(data=b'aXbXcX')
+        res = bytearray(4)
+        buf.read_chunks_into(res, 1, 0, 2, 3, write_offset=1)
+        self.assertEqual(bytes(res), b'\x00abc')
+
+    def test_buffer_read_chunks_into_strided(self):
+        buf = self.ctx.buffer(data=b'abcd')
+        res = bytearray(b'........')
+        buf.read_chunks_into(memoryview(res)[1::2], 1, 0, 1, 4)
+        self.assertEqual(bytes(res), b'.a.b.c.d')
+
+    def test_buffer_read_async(self):
+        buf = self.ctx.buffer(data=b'Hello World!')
+        readback = buf.read_async(5, offset=6)
+        self.assertEqual(readback.size, 5)
+        buf.write(b'xxxxxxxxxxxx')
+        self.assertTrue(readback.wait(1.0))
+        self.assertTrue(readback.done())
+        self.assertEqual(readback.result(), b'World')
+        self.assertEqual(readback.result(), b'World')
+        self.assertTrue(readback.done())
+
+    def test_buffer_read_async_released(self):
+        buf = self.ctx.buffer(data=b'Hello World!')
+        readback = buf.read_async()
+        readback.release()
+        self.assertTrue(readback.wait())
+        with self.assertRaises(moderngl.Error):
+            readback.result()
+
+    def test_buffer_read_async_into(self):
+        buf = self.ctx.buffer(data=b'Hello World!')
+        res = bytearray(14)
+        buf.read_async().result_into(res, write_offset=2)
+        self.assertEqual(bytes(res), b'\x00\x00Hello World!')
+
+    def test_buffer_resize_grow(self):
+        buf = self.ctx.buffer(data=b'abcd', dynamic=True)
+        buf.resize(8)
+        self.assertEqual(buf.size, 8)
+        self.assertEqual(buf.read(4), b'abcd')
+
+    def test_buffer_resize_shrink(self):
+        buf = self.ctx.buffer(data=b'abcdefgh')
+        buf.resize(3)
+        self.assertEqual(buf.read(), b'abc')
+
+    def test_buffer_resize_discard(self):
+        buf = self.ctx.buffer(data=b'abcd')
+        buf.resize(16, preserve=False)
+        self.assertEqual(buf.size, 16)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,80 @@
+import struct
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_allocate_aligned(self):
+        pool = self.ctx.buffer_pool(1024, alignment=16)
+        a = pool.allocate(10)
+        b = pool.allocate(20)
+        self.assertEqual(a.offset, 0)
+        self.assertEqual(b.offset, 16)
+        self.assertEqual(pool.stats['allocations'], 2)
+        self.assertEqual(pool.stats['used'], 30)
+
+    def test_free_reuse(self):
+        pool = self.ctx.buffer_pool(64, alignment=16)
+        a = pool.allocate(32)
+        pool.allocate(32)
+        with self.assertRaises(moderngl.Error):
+            pool.allocate(16)
+        a.release()
+        self.assertEqual(pool.allocate(16).offset, 0)
+
+    def test_write_read(self):
+        pool = self.ctx.buffer_pool(64)
+        pool.allocate(8)
+        r = pool.allocate(8)
+        r.write(b'abcdefgh')
+        self.assertEqual(r.read(), b'abcdefgh')
+        self.assertEqual(pool.buffer.read(8, offset=r.offset), b'abcdefgh')
+        with self.assertRaises(moderngl.Error):
+            r.write(b'123456789')
+
+    def test_defragment(self):
+        pool = self.ctx.buffer_pool(64, alignment=8)
+        a = pool.allocate(8)
+        b = pool.allocate(8)
+        b.write(b'12345678')
+        a.release()
+        pool.defragment()
+        self.assertEqual(b.offset, 0)
+        self.assertEqual(b.read(), b'12345678')
+        self.assertEqual(pool.stats['largest_free'], 56)
+
+    def test_vertex_array_base_offset(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float v_in;
+                out float v_out;
+                void main() {
+                    v_out = v_in * 2.0;
+                }
+            ''',
+            varyings=['v_out'],
+        )
+        pool = self.ctx.buffer_pool(64, alignment=16)
+        pool.allocate(4)
+        r = pool.allocate(8)
+        r.write(struct.pack('2f', 1.0, 2.0))
+        vao = self.ctx.vertex_array(prog, [(r, 'f', 'v_in')])
+        self.assertEqual(vao.vertices, 2)
+        res = self.ctx.buffer(reserve=8)
+        vao.transform(res)
+        self.assertEqual(struct.unpack('2f', res.read()), (2.0, 4.0))
+        vao.set_buffer(0, r, offset=4)
+        self.assertEqual(vao.vertices, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
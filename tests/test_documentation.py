@@ -41,9 +41,30 @@ class TestCase(unittest.TestCase):
     def test_vertex_array_docs(self):
         self.validate('vertex_array.rst', 'VertexArray', [])
 
+    def test_vertex_layout_docs(self):
+        self.validate('vertex_layout.rst', 'VertexLayout', [])
+
     def test_buffer_docs(self):
         self.validate('buffer.rst', 'Buffer', [])
 
+    def test_readback_docs(self):
+        self.validate('readback.rst', 'Readback', [])
+
+    def test_buffer_pool_docs(self):
+        self.validate('buffer_pool.rst', 'BufferPool', [])
+
+    def test_buffer_range_docs(self):
+        self.validate('buffer_pool.rst', 'BufferRange', [])
+
+    def test_indirect_command_buffer_docs(self):
+        self.validate('indirect_command_buffer.rst', 'IndirectCommandBuffer', [])
+
+    def test_recorder_docs(self):
+        self.validate('recorder.rst', 'Recorder', [])
+
+    def test_stream_buffer_docs(self):
+        self.validate('stream_buffer.rst', 'StreamBuffer', [])
+
     def test_texture_docs(self):
         self.validate('texture.rst', 'Texture', [])
 
@@ -65,6 +86,21 @@ class TestCase(unittest.TestCase):
     def test_query_docs(self):
         self.validate('query.rst', 'Query', [])
 
+    def test_pending_program_docs(self):
+        self.validate('pending_program.rst', 'PendingProgram', [])
+
+    def test_program_pipeline_docs(self):
+        self.validate('program_pipeline.rst', 'ProgramPipeline', [], ['__getitem__', '__setitem__', '__iter__'])
+
+    def test_shader_library_docs(self):
+        self.validate('shader_library.rst', 'ShaderLibrary', [])
+
+    def test_uniform_struct_docs(self):
+        self.validate('uniform_struct.rst', 'UniformStruct', [], ['__getitem__', '__setitem__'])
+
+    def test_transform_feedback_docs(self):
+        self.validate('transform_feedback.rst', 'TransformFeedback', [])
+
     def test_scope_docs(self):
         self.validate('scope.rst', 'Scope', [])
 
@@ -77,9 +113,15 @@ class TestCase(unittest.TestCase):
     def test_uniform_docs(self):
         self.validate('uniform.rst', 'Uniform', [])
 
+    def test_uniform_batch_docs(self):
+        self.validate('uniform_batch.rst', 'UniformBatch', [])
+
     def test_uniform_block_docs(self):
         self.validate('uniform_block.rst', 'UniformBlock', [])
 
+    def test_storage_block_docs(self):
+        self.validate('storage_block.rst', 'StorageBlock', [])
+
     def test_varying_docs(self):
         self.validate('varying.rst', 'Varying', [])
 
@@ -0,0 +1,104 @@
+import struct
+import unittest
+
+import numpy as np
+
+import moderngl
+from moderngl.context import _dtype_content
+from moderngl.mgl import fmtdebug
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_dtype_format_simple(self):
+        dtype = np.dtype([('in_vert', 'f4', 3), ('in_norm', 'f4', 3), ('in_uv', 'f4', 2)])
+        self.assertEqual(moderngl.dtype_format(dtype), '3f 3f 2f')
+
+    def test_dtype_format_types(self):
+        dtype = np.dtype([('a', 'f2', 2), ('b', 'f8'), ('c', 'i1', 4), ('d', 'u2', 2), ('e', 'i4'), ('f', 'u4')])
+        self.assertEqual(moderngl.dtype_format(dtype), '2f2 1f8 4i1 2u2 1i 1u')
+
+    def test_dtype_format_padding(self):
+        dtype = np.dtype([('pos', 'f4', 3), ('weight', 'f8')], align=True)
+        fmt = moderngl.dtype_format(dtype)
+        self.assertEqual(fmt, '3f 4x 1f8')
+        self.assertEqual(fmtdebug(fmt)[0], dtype.itemsize)
+
+    def test_dtype_format_trailing_padding(self):
+        dtype = np.dtype({'names': ['pos'], 'formats': [('f4', 3)], 'itemsize': 16})
+        self.assertEqual(moderngl.dtype_format(dtype), '3f 4x')
+
+    def test_dtype_format_nested(self):
+        inner = np.dtype([('x', 'f4'), ('y', 'f4')])
+        dtype = np.dtype([('a', inner), ('b', 'f4', (2, 2))])
+        self.assertEqual(moderngl.dtype_format(dtype), '1f 1f 4f')
+
+    def test_dtype_content_offsets(self):
+        dtype = np.dtype({'names': ['uv', 'pos'], 'formats': [('f4', 2), ('f4', 3)], 'offsets': [12, 0]})
+        self.assertEqual(moderngl.dtype_format(dtype), '3f 2f')
+        self.assertEqual(_dtype_content((None, dtype)), (None, '3f 2f', 'pos', 'uv'))
+
+    def test_dtype_content_nested(self):
+        dtype = np.dtype([('pos', '3f4'), ('mat', [('a', '2f4'), ('b', '2f4')])])
+        self.assertEqual(_dtype_content((None, dtype, '/i')), (None, '3f 2f 2f/i', 'pos', 'mat_a', 'mat_b'))
+
+    def test_dtype_content_no_fields(self):
+        with self.assertRaises(moderngl.Error):
+            _dtype_content((None, np.dtype('f4')))
+        self.assertEqual(_dtype_content((None, np.dtype('f4'), 'in_value')), (None, '1f', 'in_value'))
+
+    def test_dtype_format_unsupported(self):
+        with self.assertRaises(moderngl.Error):
+            moderngl.dtype_format(np.dtype([('a', 'c8')]))
+
+    def test_buffer_dtype(self):
+        dtype = np.dtype([('in_vert', 'f4', 2)])
+        buf = self.ctx.buffer(np.zeros(4, dtype))
+        self.assertEqual(buf.dtype, dtype)
+        self.assertIsNone(self.ctx.buffer(reserve=4).dtype)
+
+    def test_vertex_array_dtype(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float v_in;
+                in float v_scale;
+                out float v_out;
+                void main() {
+                    v_out = v_in * v_scale;
+                }
+            ''',
+            varyings=['v_out'],
+        )
+        dtype = np.dtype([('v_in', 'f4'), ('unused', 'f4'), ('v_scale', 'f4')])
+        data = np.array([(1.0, 0.0, 2.0), (3.0, 0.0, 4.0)], dtype)
+        buf = self.ctx.buffer(data)
+        vao = self.ctx.vertex_array(prog, [(buf, buf.dtype[['v_in', 'v_scale']])])
+        res = self.ctx.buffer(reserve=8)
+        vao.transform(res, vertices=2)
+        self.assertEqual(struct.unpack('2f', res.read()), (2.0, 12.0))
+
+    def test_buffer_as_array(self):
+        dtype = np.dtype([('a', 'f4'), ('b', 'i4')])
+        buf = self.ctx.buffer(reserve=dtype.itemsize * 4, dtype=dtype)
+        with buf.as_array() as array:
+            self.assertEqual(array.shape, (4,))
+            array['a'] = 1.5
+            array['b'] = np.arange(4)
+        self.assertEqual(struct.unpack('fi', buf.read(8, offset=8)), (1.5, 1))
+
+    def test_buffer_write_strided(self):
+        data = np.arange(8, dtype='f4')
+        buf = self.ctx.buffer(reserve=16)
+        buf.write(data[::2])
+        self.assertEqual(struct.unpack('4f', buf.read()), (0.0, 2.0, 4.0, 6.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
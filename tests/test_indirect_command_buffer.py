@@ -0,0 +1,58 @@
+import struct
+import unittest
+
+import moderngl
+import numpy as np
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+        if cls.ctx.version_code < 430:
+            raise unittest.SkipTest('OpenGL 4.3 is not supported')
+
+    def test_write_indexed(self):
+        commands = self.ctx.indirect_command_buffer(4)
+        self.assertEqual(commands.write(np.array([3, 6]), firsts=np.array([0, 3]), base_vertices=-1), 2)
+        self.assertEqual(commands.count, 2)
+        self.assertEqual(commands.buffer.read(40), struct.pack('10i', 3, 1, 0, -1, 0, 6, 1, 3, -1, 0))
+
+    def test_write_arrays(self):
+        commands = self.ctx.indirect_command_buffer(4, indexed=False)
+        commands.write([4], firsts=2, base_vertices=3, base_instances=5, offset=1)
+        self.assertEqual(commands.count, 2)
+        self.assertEqual(commands.buffer.read(20, offset=20), struct.pack('5i', 4, 1, 5, 5, 0))
+
+    def test_write_overflow(self):
+        commands = self.ctx.indirect_command_buffer(2)
+        with self.assertRaises(moderngl.Error):
+            commands.write([1, 2, 3])
+
+    def test_cull(self):
+        commands = self.ctx.indirect_command_buffer(3)
+        commands.write([3, 6, 9])
+        spheres = np.array([
+            [0.0, 0.0, 0.0, 0.5],
+            [5.0, 0.0, 0.0, 0.5],
+            [0.9, 0.9, 0.0, 0.5],
+        ], dtype='f4')
+        commands.cull(spheres, np.eye(4, dtype='f4'))
+        self.assertEqual(commands.count_buffer.read(), struct.pack('I', 2))
+        visible = np.frombuffer(commands.visible_buffer.read(40), 'i4').reshape(2, 5)
+        self.assertEqual(sorted(visible[:, 0]), [3, 9])
+
+    def test_cull_float64(self):
+        commands = self.ctx.indirect_command_buffer(2)
+        commands.write([3, 6])
+        commands.cull(np.array([[0.0, 0.0, 0.0, 0.5], [5.0, 0.0, 0.0, 0.5]]), np.eye(4, dtype='f4'))
+        self.assertEqual(commands.count_buffer.read(), struct.pack('I', 1))
+        commands.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
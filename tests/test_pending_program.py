@@ -0,0 +1,69 @@
+import struct
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def transform_source(self, scale):
+        return {
+            'vertex_shader': '''
+                #version 330
+
+                in float in_value;
+                out float out_value;
+
+                void main() {
+                    out_value = in_value * %.1f;
+                }
+            ''' % scale,
+            'varyings': ['out_value'],
+        }
+
+    def test_program_async(self):
+        pending = self.ctx.program_async(**self.transform_source(2.0))
+        prog = pending.result()
+
+        self.assertTrue(pending.ready)
+        self.assertIs(pending.result(), prog)
+
+        vbo = self.ctx.buffer(struct.pack('f', 3.0))
+        out = self.ctx.buffer(reserve=4)
+        self.ctx.vertex_array(prog, [(vbo, 'f', 'in_value')]).transform(out)
+        self.assertAlmostEqual(struct.unpack('f', out.read())[0], 6.0)
+
+    def test_compile_many(self):
+        pending = self.ctx.compile_many([self.transform_source(scale) for scale in (1.0, 2.0, 3.0)])
+        programs = [item.result() for item in pending]
+
+        vbo = self.ctx.buffer(struct.pack('f', 1.0))
+        out = self.ctx.buffer(reserve=4)
+
+        for scale, prog in zip((1.0, 2.0, 3.0), programs):
+            self.ctx.vertex_array(prog, [(vbo, 'f', 'in_value')]).transform(out)
+            self.assertAlmostEqual(struct.unpack('f', out.read())[0], scale)
+
+    def test_compile_error(self):
+        pending = self.ctx.program_async(
+            vertex_shader='''
+                #version 330
+
+                void main() {
+                    gl_Position = undefined;
+                }
+            ''',
+        )
+
+        with self.assertRaisesRegex(moderngl.Error, 'vertex_shader'):
+            pending.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,6 +46,36 @@ class TestCase(unittest.TestCase):
         self.assertIsInstance(program['pos'], moderngl.Uniform)
         self.assertIsInstance(program['scale'], moderngl.Uniform)
 
+    def test_lazy_program(self):
+        program = self.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                uniform vec2 pos;
+                uniform float scale[4];
+                uniform int index;
+
+                in vec2 vert;
+
+                void main() {
+                    gl_Position = vec4(pos + vert * scale[index], 0.0, 1.0);
+                }
+            ''',
+            lazy=True,
+        )
+
+        self.assertEqual(sorted(program), ['index', 'pos', 'scale', 'vert'])
+        self.assertIn('scale', program)
+        self.assertNotIn('color', program)
+        self.assertIsNone(program.get('color', None))
+
+        self.assertIs(program['scale'], program['scale'])
+        self.assertEqual(program['scale'].array_length, 4)
+        self.assertIsInstance(program['vert'], moderngl.Attribute)
+
+        program['pos'] = (1.0, 2.0)
+        self.assertEqual(program['pos'].value, (1.0, 2.0))
+
 
 if __name__ == '__main__':
     unittest.main()
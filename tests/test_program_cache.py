@@ -0,0 +1,73 @@
+import os
+import struct
+import tempfile
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        moderngl.set_program_cache(self.directory.name)
+
+    def tearDown(self):
+        moderngl.set_program_cache(None)
+        self.directory.cleanup()
+
+    def create_program(self, **kwargs):
+        return self.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                uniform float scale;
+                in vec2 in_vert;
+                out vec2 out_vert;
+
+                void main() {
+                    out_vert = in_vert * scale;
+                }
+            ''',
+            varyings=['out_vert'],
+            **kwargs
+        )
+
+    def transform(self, prog):
+        prog['scale'] = 2.0
+        vbo = self.ctx.buffer(struct.pack('2f', 1.0, 2.0))
+        out = self.ctx.buffer(reserve=8)
+        self.ctx.vertex_array(prog, [(vbo, '2f', 'in_vert')]).transform(out)
+        return struct.unpack('2f', out.read())
+
+    def test_cached_program(self):
+        first = self.create_program()
+        if not os.listdir(self.directory.name):
+            self.skipTest('the driver does not provide program binaries')
+
+        second = self.create_program()
+        self.assertEqual(sorted(first._members), sorted(second._members))
+        self.assertEqual(second['in_vert'].location, first['in_vert'].location)
+        self.assertEqual(self.transform(second), (2.0, 4.0))
+
+    def test_corrupt_cache(self):
+        self.create_program()
+        for name in os.listdir(self.directory.name):
+            with open(os.path.join(self.directory.name, name), 'ab') as f:
+                f.write(b'\xff' * 16)
+
+        self.assertEqual(self.transform(self.create_program()), (2.0, 4.0))
+
+    def test_disabled_cache(self):
+        self.create_program(cache=False)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
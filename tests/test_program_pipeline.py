@@ -0,0 +1,143 @@
+import struct
+import unittest
+
+from common import get_context
+import moderngl
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+        if cls.ctx.version_code < 410:
+            raise unittest.SkipTest('OpenGL 4.1 is not supported')
+
+        cls.vertex = cls.ctx.shader_stage('vertex', '''
+            #version 410
+
+            uniform float scale;
+
+            in vec2 vert;
+
+            out gl_PerVertex {
+                vec4 gl_Position;
+                float gl_PointSize;
+            };
+
+            void main() {
+                gl_Position = vec4(vert * scale, 0.0, 1.0);
+            }
+        ''')
+
+        cls.fragment = cls.ctx.shader_stage('fragment', '''
+            #version 410
+
+            uniform float scale;
+            uniform vec3 color;
+
+            out vec4 frag;
+
+            void main() {
+                frag = vec4(color * scale, 1.0);
+            }
+        ''')
+
+    def test_shader_stage(self):
+        self.assertIsInstance(self.vertex, moderngl.Program)
+        self.assertIn('vert', self.vertex)
+        self.assertNotIn('color', self.vertex)
+        self.assertIn('color', self.fragment)
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.shader_stage('compute', '#version 410\nvoid main() {}')
+
+    def test_program_pipeline(self):
+        pipeline = self.ctx.program_pipeline(vertex=self.vertex, fragment=self.fragment)
+
+        self.assertIsInstance(pipeline, moderngl.ProgramPipeline)
+        self.assertEqual(pipeline.stages, {'vertex': self.vertex, 'fragment': self.fragment})
+        self.assertIs(pipeline['vert'], self.vertex['vert'])
+        self.assertIs(pipeline['color'], self.fragment['color'])
+        self.assertIsNone(pipeline.geometry_input)
+
+        # the uniforms declared in both stages are set in each of them
+        pipeline['scale'] = 0.5
+        self.assertAlmostEqual(self.vertex['scale'].value, 0.5)
+        self.assertAlmostEqual(self.fragment['scale'].value, 0.5)
+
+        pipeline.set_uniforms({'scale': 1.0, 'color': (0.0, 1.0, 0.0)})
+        self.assertAlmostEqual(self.vertex['scale'].value, 1.0)
+        self.assertAlmostEqual(self.fragment['scale'].value, 1.0)
+
+        with self.assertRaises(KeyError):
+            pipeline['missing'] = 1.0
+
+        pipeline.release()
+
+    def test_render(self):
+        pipeline = self.ctx.program_pipeline(vertex=self.vertex, fragment=self.fragment)
+        pipeline['scale'] = 1.0
+        pipeline['color'] = (0.0, 1.0, 0.0)
+
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        vbo = self.ctx.buffer(struct.pack('8f', -1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0))
+        vao = self.ctx.vertex_array(pipeline, [(vbo, '2f', 'vert')])
+
+        fbo.use()
+        fbo.clear()
+        vao.render(moderngl.TRIANGLE_STRIP)
+        self.assertEqual(fbo.read(components=4)[:4], b'\x00\xff\x00\xff')
+
+        # a program in use takes precedence over the pipeline, switching back must not use the program
+        program = self.ctx.program(
+            vertex_shader='''
+                #version 410
+
+                in vec2 vert;
+
+                void main() {
+                    gl_Position = vec4(vert, 0.0, 1.0);
+                }
+            ''',
+            fragment_shader='''
+                #version 410
+
+                out vec4 frag;
+
+                void main() {
+                    frag = vec4(1.0, 0.0, 0.0, 1.0);
+                }
+            ''',
+        )
+
+        vao2 = self.ctx.vertex_array(program, [(vbo, '2f', 'vert')])
+        vao2.render(moderngl.TRIANGLE_STRIP)
+        self.assertEqual(fbo.read(components=4)[:4], b'\xff\x00\x00\xff')
+
+        vao.render(moderngl.TRIANGLE_STRIP)
+        self.assertEqual(fbo.read(components=4)[:4], b'\x00\xff\x00\xff')
+
+        for obj in (vao, vao2, program, vbo, fbo, pipeline):
+            obj.release()
+
+    def test_stage_must_be_separable(self):
+        program = self.ctx.program(
+            vertex_shader='''
+                #version 410
+
+                void main() {
+                    gl_Position = vec4(0.0);
+                }
+            ''',
+        )
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.program_pipeline(vertex=program)
+
+        program.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
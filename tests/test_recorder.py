@@ -0,0 +1,114 @@
+import struct
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in vec2 in_vert;
+
+                void main() {
+                    gl_Position = vec4(in_vert, 0.0, 1.0);
+                }
+            ''',
+            fragment_shader='''
+                #version 330
+
+                uniform vec4 color;
+                out vec4 f_color;
+
+                void main() {
+                    f_color = color;
+                }
+            ''',
+        )
+        vbo = cls.ctx.buffer(struct.pack('8f', -1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0))
+        cls.vao = cls.ctx.vertex_array(cls.prog, [(vbo, '2f', 'in_vert')])
+
+    def test_record_and_replay(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+
+        self.prog['color'] = (1.0, 0.0, 0.0, 1.0)
+        with self.ctx.recorder as recorder:
+            self.assertTrue(recorder.recording)
+            fbo.use()
+            fbo.clear(0.0, 0.0, 1.0, 1.0)
+            self.vao.render(moderngl.TRIANGLE_STRIP)
+
+        bytecode = self.ctx.recorder.dump()
+        self.assertFalse(self.ctx.recorder.recording)
+        self.assertIsInstance(bytecode, bytes)
+        self.assertEqual(fbo.read(), b'\xff\x00\x00' * 16)
+
+        fbo.clear(0.0, 0.0, 0.0, 1.0)
+        self.prog['color'] = (0.0, 1.0, 0.0, 1.0)
+        self.ctx.replay(bytecode)
+        self.assertEqual(fbo.read(), b'\x00\xff\x00' * 16)
+
+    def test_record_scope(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        scope = self.ctx.scope(fbo)
+
+        self.prog['color'] = (1.0, 1.0, 1.0, 1.0)
+        with self.ctx.recorder:
+            with scope:
+                fbo.clear()
+                self.vao.render(moderngl.TRIANGLE_STRIP, vertices=3)
+
+        bytecode = self.ctx.recorder.dump()
+        fbo.clear()
+        self.ctx.replay(bytecode)
+        self.assertEqual(fbo.read((1, 1, 1, 1)), b'\xff\xff\xff')
+
+    def test_replay_released_object(self):
+        texture = self.ctx.texture((1, 1), 4)
+        with self.ctx.recorder:
+            texture.use(0)
+
+        bytecode = self.ctx.recorder.dump()
+        self.ctx.replay(bytecode)
+        with self.assertRaises(moderngl.Error):
+            self.ctx.replay(bytes(bytecode))
+
+        texture.release()
+        with self.assertRaises(moderngl.Error):
+            self.ctx.replay(bytecode)
+
+    def test_replay_while_recording(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        with self.ctx.recorder:
+            fbo.clear(1.0, 0.0, 0.0, 1.0)
+
+        inner = self.ctx.recorder.dump()
+        with self.ctx.recorder:
+            self.ctx.replay(inner)
+
+        outer = self.ctx.recorder.dump()
+        fbo.clear()
+        self.ctx.replay(outer)
+        self.assertEqual(fbo.read((1, 1, 1, 1)), b'\xff\x00\x00')
+
+    def test_nested_recording(self):
+        with self.ctx.recorder:
+            with self.assertRaises(moderngl.Error):
+                self.ctx.recorder.begin()
+
+    def test_invalid_bytecode(self):
+        with self.assertRaises(moderngl.Error):
+            self.ctx.replay(b'\xff' * 8)
+        with self.assertRaises(moderngl.Error):
+            self.ctx.replay(struct.pack('2i', 1 | (7 << 16), 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
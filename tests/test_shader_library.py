@@ -0,0 +1,88 @@
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def setUp(self):
+        self.library = self.ctx.shader_library(capacity=2)
+        self.library.add_file('scale.glsl', 'float scale(float x) {\n    return x * SCALE;\n}\n')
+
+    def vertex_shader(self):
+        return '''#version 330
+#include "scale.glsl"
+
+in float in_value;
+out float out_value;
+
+void main() {
+    out_value = scale(in_value);
+}
+'''
+
+    def test_preprocess(self):
+        source = self.library.preprocess(self.vertex_shader(), defines={'SCALE': 2.0, 'DEBUG': True})
+        lines = source.splitlines()
+
+        self.assertEqual(lines[:3], ['#version 330', '#define DEBUG', '#define SCALE 2.0'])
+        self.assertIn('    return x * SCALE;', lines)
+        self.assertNotIn('#include', source)
+
+    def test_include_errors(self):
+        with self.assertRaisesRegex(moderngl.Error, 'cannot include'):
+            self.library.preprocess('#include <missing.glsl>\n')
+
+        self.library.add_file('a.glsl', '#include "b.glsl"\n')
+        self.library.add_file('b.glsl', '#include "a.glsl"\n')
+
+        with self.assertRaisesRegex(moderngl.Error, 'recursive include'):
+            self.library.preprocess('#include "a.glsl"\n')
+
+    def test_variants(self):
+        first = self.library.program(vertex_shader=self.vertex_shader(), varyings=['out_value'], defines={'SCALE': 2.0})
+        second = self.library.program(vertex_shader=self.vertex_shader(), varyings=['out_value'], defines={'SCALE': 2.0})
+        other = self.library.program(vertex_shader=self.vertex_shader(), varyings=['out_value'], defines={'SCALE': 3.0})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(self.library.compiles, 2)
+        self.assertEqual(self.library.hits, 1)
+
+    def test_eviction(self):
+        programs = [
+            self.library.program(vertex_shader=self.vertex_shader(), varyings=['out_value'], defines={'SCALE': scale})
+            for scale in (1.0, 2.0, 3.0)
+        ]
+
+        self.assertEqual(self.library.size, 2)
+
+        # the least recently used variant is dropped but remains valid
+        self.assertNotEqual(type(programs[0].mglo).__name__, 'InvalidObject')
+        self.assertIn('in_value', programs[0])
+
+        self.library.program(vertex_shader=self.vertex_shader(), varyings=['out_value'], defines={'SCALE': 1.0})
+        self.assertEqual(self.library.compiles, 4)
+        programs[0].release()
+
+    def test_release(self):
+        source = self.vertex_shader()
+        program = self.library.program(vertex_shader=source, varyings=['out_value'], defines={'SCALE': 1.0})
+        self.library.clear()
+        self.assertEqual(self.library.size, 0)
+        self.assertNotEqual(type(program.mglo).__name__, 'InvalidObject')
+
+        program = self.library.program(vertex_shader=source, varyings=['out_value'], defines={'SCALE': 1.0})
+        self.library.release()
+        self.assertEqual(self.library.size, 0)
+        self.assertEqual(type(program.mglo).__name__, 'InvalidObject')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import struct
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in vec2 in_vert;
+
+                void main() {
+                    gl_Position = vec4(in_vert, 0.0, 1.0);
+                }
+            ''',
+            fragment_shader='''
+                #version 330
+
+                uniform sampler2D tex;
+                out vec4 f_color;
+
+                void main() {
+                    f_color = texture(tex, vec2(0.5, 0.5));
+                }
+            ''',
+        )
+        vbo = cls.ctx.buffer(struct.pack('8f', -1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0))
+        cls.vao = cls.ctx.vertex_array(cls.prog, [(vbo, '2f', 'in_vert')])
+
+    def test_released_texture(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        fbo.use()
+
+        red = self.ctx.texture((1, 1), 3, b'\xff\x00\x00')
+        red.use(0)
+        self.vao.render(moderngl.TRIANGLE_STRIP)
+        self.assertEqual(fbo.read((1, 1, 1, 1)), b'\xff\x00\x00')
+
+        # the new texture may reuse the name of the released one
+        red.release()
+        green = self.ctx.texture((1, 1), 3, b'\x00\xff\x00')
+        green.use(0)
+        self.vao.render(moderngl.TRIANGLE_STRIP)
+        self.assertEqual(fbo.read((1, 1, 1, 1)), b'\x00\xff\x00')
+
+    def test_framebuffer_use_twice(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        fbo.use()
+        fbo.viewport = (0, 0, 2, 2)
+        fbo.use()
+        self.assertEqual(self.ctx.viewport, (0, 0, 2, 2))
+
+        fbo.clear()
+        fbo.clear(1.0, 1.0, 1.0, 1.0, viewport=(0, 0, 2, 2))
+        self.assertEqual(fbo.read((0, 0, 1, 1)), b'\xff\xff\xff')
+        self.assertEqual(fbo.read((3, 3, 1, 1)), b'\x00\x00\x00')
+
+    def test_invalidate_state_cache(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        texture = self.ctx.texture((1, 1), 3, b'\x00\x00\xff')
+        texture.use(0)
+        fbo.use()
+
+        self.ctx.invalidate_state_cache()
+
+        texture.use(0)
+        fbo.use()
+        self.vao.render(moderngl.TRIANGLE_STRIP)
+        self.assertEqual(fbo.read((1, 1, 1, 1)), b'\x00\x00\xff')
+
+    def test_mirrored_state(self):
+        self.ctx.line_width = 1.0
+        self.ctx.point_size = 4.0
+        self.ctx.depth_func = '<'
+        self.ctx.blend_func = moderngl.ONE, moderngl.ONE
+        self.ctx.blend_equation = moderngl.FUNC_ADD, moderngl.MAX
+
+        self.assertEqual(self.ctx.line_width, 1.0)
+        self.assertEqual(self.ctx.point_size, 4.0)
+        self.assertEqual(self.ctx.depth_func, '<')
+        self.assertEqual(self.ctx.blend_func, (moderngl.ONE, moderngl.ONE, moderngl.ONE, moderngl.ONE))
+        self.assertEqual(self.ctx.blend_equation, (moderngl.FUNC_ADD, moderngl.MAX))
+
+        self.ctx.sync_state()
+
+        self.assertEqual(self.ctx.point_size, 4.0)
+        self.assertEqual(self.ctx.depth_func, '<')
+        self.assertEqual(self.ctx.blend_func, (moderngl.ONE, moderngl.ONE, moderngl.ONE, moderngl.ONE))
+        self.assertEqual(self.ctx.blend_equation, (moderngl.FUNC_ADD, moderngl.MAX))
+
+        self.ctx.point_size = 1.0
+        self.ctx.depth_func = '<='
+        self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self.ctx.blend_equation = moderngl.FUNC_ADD
+
+
+if __name__ == '__main__':
+    unittest.main()
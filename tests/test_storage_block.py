@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+        if cls.ctx.version_code < 430:
+            raise unittest.SkipTest('OpenGL 4.3 is not supported')
+
+        cls.compute_shader = cls.ctx.compute_shader('''
+            #version 430
+
+            layout (local_size_x = 1) in;
+
+            struct Particle {
+                vec3 position;
+                float mass;
+                vec4 velocity;
+            };
+
+            layout (std430, binding = 1) buffer Particles {
+                float time;
+                Particle particles[];
+            };
+
+            void main() {
+                uint i = gl_GlobalInvocationID.x;
+                particles[i].position += particles[i].velocity.xyz * time;
+                particles[i].mass *= 2.0;
+            }
+        ''')
+
+    def test_reflection(self):
+        block = self.compute_shader['Particles']
+
+        self.assertEqual(block.binding, 1)
+        self.assertEqual(block.array_offset, 16)
+        self.assertEqual(block.array_stride, 32)
+        self.assertEqual(block.buffer_size(10), 336)
+        self.assertEqual(block.layout['particles[0].mass']['offset'], 28)
+        self.assertEqual(block.layout['particles[0].mass']['top_level_array_length'], 0)
+
+        block.binding = 3
+        self.assertEqual(block.binding, 3)
+        block.binding = 1
+
+    def test_storage_buffer(self):
+        block = self.compute_shader['Particles']
+        buffer = self.ctx.storage_buffer(block, 4)
+        self.assertEqual(buffer.size, block.buffer_size(4))
+
+        with buffer.as_array() as view:
+            view[0]['time'] = 0.5
+            view[0]['particles']['position'] = np.arange(12).reshape(4, 3)
+            view[0]['particles']['mass'] = 1.0
+            view[0]['particles']['velocity'] = (2.0, 4.0, 6.0, 0.0)
+
+        buffer.bind_to_storage_buffer(1)
+        self.compute_shader.run(4)
+
+        with buffer.as_array(read=True, write=False) as view:
+            np.testing.assert_almost_equal(view[0]['particles']['position'][1], (4.0, 6.0, 8.0))
+            np.testing.assert_almost_equal(view[0]['particles']['mass'], (2.0, 2.0, 2.0, 2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+        if cls.ctx.version_code < 440:
+            raise unittest.SkipTest('OpenGL 4.4 is not supported')
+
+    def test_stream_buffer_create(self):
+        stream = self.ctx.stream_buffer(1024, frames=4)
+        self.assertEqual(stream.size, 1024)
+        self.assertEqual(stream.frames, 4)
+        self.assertEqual(stream.frame, 0)
+        self.assertEqual(stream.frame_size, 256)
+        self.assertEqual(stream.glo, stream.buffer.glo)
+
+    def test_stream_buffer_write(self):
+        stream = self.ctx.stream_buffer(1024, frames=4)
+        self.assertEqual(stream.write(b'abc', alignment=4), 0)
+        self.assertEqual(stream.write(b'defg', alignment=4), 4)
+        self.assertEqual(stream.buffer.read(3), b'abc')
+        self.assertEqual(stream.buffer.read(4, offset=4), b'defg')
+
+    def test_stream_buffer_allocate(self):
+        stream = self.ctx.stream_buffer(1024, frames=4)
+        offset = stream.allocate(16)
+        stream.buffer.write(b'0123456789abcdef', offset=offset)
+        self.assertEqual(stream.buffer.read(16, offset=offset), b'0123456789abcdef')
+
+    def test_stream_buffer_frame_full(self):
+        stream = self.ctx.stream_buffer(1024, frames=4)
+        stream.allocate(256)
+
+        with self.assertRaises(moderngl.Error):
+            stream.allocate(1)
+
+    def test_stream_buffer_next_frame(self):
+        stream = self.ctx.stream_buffer(1024, frames=2)
+        self.assertEqual(stream.write(b'abcd'), 0)
+        stream.next_frame()
+        self.assertEqual(stream.frame, 1)
+        self.assertEqual(stream.write(b'efgh'), 512)
+        stream.next_frame()
+        self.assertEqual(stream.frame, 0)
+        self.assertEqual(stream.write(b'ijkl'), 0)
+        self.assertEqual(stream.buffer.read(4), b'ijkl')
+
+    def test_stream_buffer_orphan(self):
+        stream = self.ctx.stream_buffer(1024)
+
+        with self.assertRaises(moderngl.Error):
+            stream.buffer.orphan()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import struct
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in float value;
+                out float doubled;
+                out float squared;
+
+                void main() {
+                    doubled = value * 2.0;
+                    squared = value * value;
+                }
+            ''',
+            varyings=['doubled', 'squared'],
+            varyings_capture_mode='separate',
+        )
+        vbo = cls.ctx.buffer(struct.pack('3f', 1.0, 2.0, 3.0))
+        cls.vao = cls.ctx.vertex_array(cls.prog, [(vbo, 'f', 'value')])
+
+    def test_separate_buffers(self):
+        doubled = self.ctx.buffer(reserve=12)
+        squared = self.ctx.buffer(reserve=12)
+        self.vao.transform([doubled, squared])
+        self.assertEqual(struct.unpack('3f', doubled.read()), (2.0, 4.0, 6.0))
+        self.assertEqual(struct.unpack('3f', squared.read()), (1.0, 4.0, 9.0))
+
+    def test_missing_separate_buffer(self):
+        with self.assertRaises(moderngl.Error):
+            self.vao.transform(self.ctx.buffer(reserve=12))
+
+    def test_invalid_capture_mode(self):
+        with self.assertRaises(moderngl.Error):
+            self.ctx.program(vertex_shader='#version 330\nvoid main() {}', varyings_capture_mode='mixed')
+
+    def test_pause_and_resume(self):
+        doubled = self.ctx.buffer(reserve=24)
+        squared = self.ctx.buffer(reserve=24)
+        other = [self.ctx.buffer(reserve=12), self.ctx.buffer(reserve=12)]
+        feedback = self.ctx.transform_feedback([doubled, squared])
+        self.assertEqual(feedback.buffers, (doubled, squared))
+
+        feedback.begin(self.prog)
+        self.assertTrue(feedback.active)
+        self.vao.transform(feedback)
+
+        feedback.pause()
+        self.assertTrue(feedback.paused)
+        self.vao.transform(other)
+
+        feedback.resume()
+        self.vao.transform(feedback)
+        feedback.end()
+
+        self.assertFalse(feedback.active)
+        self.assertEqual(struct.unpack('6f', doubled.read()), (2.0, 4.0, 6.0) * 2)
+        self.assertEqual(struct.unpack('3f', other[1].read()), (1.0, 4.0, 9.0))
+
+        self.ctx.finish()
+        self.assertEqual(feedback.primitives, 6)
+
+    def test_invalid_state(self):
+        feedback = self.ctx.transform_feedback([self.ctx.buffer(reserve=12), self.ctx.buffer(reserve=12)])
+        self.assertEqual(feedback.primitives, 0)
+
+        with self.assertRaises(moderngl.Error):
+            feedback.pause()
+
+        with self.assertRaises(moderngl.Error):
+            feedback.end()
+
+        feedback.begin(self.prog)
+
+        with self.assertRaises(moderngl.Error):
+            feedback.resume()
+
+        feedback.end()
+        feedback.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
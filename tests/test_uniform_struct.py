@@ -0,0 +1,73 @@
+import struct
+import unittest
+
+import numpy as np
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in vec2 in_v;
+                out vec2 out_v;
+
+                layout (std140) uniform Block {
+                    vec3 offset;
+                    float scale;
+                    float weights[2];
+                    mat2 rotation;
+                };
+
+                void main() {
+                    out_v = rotation * in_v * scale * (weights[0] + weights[1]) + offset.xy;
+                }
+            ''',
+            varyings=['out_v']
+        )
+
+    def test_layout(self):
+        layout = self.prog['Block'].layout
+
+        self.assertEqual(list(layout), ['offset', 'scale', 'weights', 'rotation'])
+        self.assertEqual(layout['offset']['type'], 'vec3')
+        self.assertEqual(layout['scale']['offset'], 12)
+        self.assertEqual(layout['weights']['array_length'], 2)
+        self.assertEqual(layout['weights']['array_stride'], 16)
+        self.assertEqual(layout['rotation']['matrix_stride'], 16)
+
+    def test_struct(self):
+        block = self.ctx.uniform_struct(self.prog['Block'])
+
+        block['offset'] = (1.0, 2.0, 3.0)
+        block['scale'] = 2.0
+        block['weights'] = (0.25, 0.75)
+        block['rotation'] = np.array([[0.0, 1.0], [-1.0, 0.0]])
+
+        self.assertTrue(block.dirty)
+        self.assertEqual(block['scale'], 2.0)
+        self.assertEqual(block['rotation'].tolist(), [[0.0, 1.0], [-1.0, 0.0]])
+
+        self.prog['Block'].binding = 3
+        block.bind(3)
+        self.assertFalse(block.dirty)
+
+        buf_v = self.ctx.buffer(struct.pack('2f', 1.0, 0.0))
+        buf_r = self.ctx.buffer(reserve=buf_v.size)
+        vao = self.ctx.vertex_array(self.prog, [(buf_v, '2f', 'in_v')])
+
+        vao.transform(buf_r)
+        a, b = struct.unpack('2f', buf_r.read())
+        self.assertAlmostEqual(a, 1.0)
+        self.assertAlmostEqual(b, 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
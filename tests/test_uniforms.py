@@ -1,7 +1,9 @@
+import array
 import struct
 import unittest
 
 from common import get_context
+import moderngl
 
 
 class TestCase(unittest.TestCase):
@@ -121,5 +123,73 @@ class TestCase(unittest.TestCase):
         self.assertAlmostEqual(m[5], 5.0)
 
 
+    def test_set_uniforms(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                uniform float Scale;
+                uniform vec2 Offset[2];
+                in float v_in;
+                out vec2 v_out;
+                void main() {
+                    v_out = (Offset[0] + Offset[1]) * Scale * v_in;
+                }
+            ''',
+            varyings=['v_out']
+        )
+
+        vbo = self.ctx.buffer(struct.pack('f', 1.0))
+        vao = self.ctx.simple_vertex_array(prog, vbo, 'v_in')
+
+        prog.set_uniforms({'Scale': 2.0, 'Offset': struct.pack('4f', 1.0, 2.0, 3.0, 4.0)})
+        vao.transform(self.res)
+        self.assertEqual(struct.unpack('2f', self.res.read(8)), (8.0, 12.0))
+
+        batch = prog.uniform_batch(['Scale', 'Offset'])
+        batch.set([0.5, memoryview(struct.pack('4f', 1.0, 1.0, 1.0, 1.0))])
+        vao.transform(self.res)
+        self.assertEqual(struct.unpack('2f', self.res.read(8)), (1.0, 1.0))
+
+        prog['Offset'] = array.array('f', [2.0, 2.0, 2.0, 2.0])
+        self.assertEqual(prog['Offset'].value, [(2.0, 2.0), (2.0, 2.0)])
+
+        # typed values must match the scalar type, the sizes are the same
+        with self.assertRaises(moderngl.Error):
+            prog['Offset'] = array.array('i', [1, 2, 3, 4])
+
+        with self.assertRaises(moderngl.Error):
+            prog['Offset'] = array.array('d', [1.0, 2.0])
+
+
+    def test_skipped_uniform_writes(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                uniform vec2 Uniform;
+                in float v_in;
+                out vec2 v_out;
+                void main() {
+                    v_out = Uniform * v_in;
+                }
+            ''',
+            varyings=['v_out']
+        )
+
+        skipped = self.ctx.skipped_uniform_writes
+
+        prog['Uniform'] = (1.0, 2.0)
+        prog['Uniform'] = (1.0, 2.0)
+        self.assertEqual(self.ctx.skipped_uniform_writes, skipped + 1)
+        self.assertEqual(prog['Uniform'].value, (1.0, 2.0))
+
+        prog['Uniform'] = (3.0, 4.0)
+        self.assertEqual(self.ctx.skipped_uniform_writes, skipped + 1)
+
+        self.ctx.invalidate_state_cache()
+        prog['Uniform'] = (3.0, 4.0)
+        self.assertEqual(self.ctx.skipped_uniform_writes, skipped + 1)
+        self.assertEqual(prog['Uniform'].value, (3.0, 4.0))
+
+
 if __name__ == '__main__':
     unittest.main()
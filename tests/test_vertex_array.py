@@ -158,6 +158,72 @@ class TestCase(unittest.TestCase):
         res = np.frombuffer(vbo2.read(), dtype='f4')
         np.testing.assert_almost_equal(res, [4.0, 0.0, 2.0, 0.0])
 
+    def test_render_multi(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in float in_vert;
+
+                void main() {
+                    gl_Position = vec4(in_vert, 0.0, 0.0, 1.0);
+                }
+            ''',
+        )
+
+        vbo = self.ctx.buffer(np.zeros(16, dtype='f4').tobytes())
+        index = self.ctx.buffer(np.arange(16, dtype='i4').tobytes())
+        query = self.ctx.query(primitives=True)
+
+        vao = self.ctx.vertex_array(prog, [(vbo, 'f', 'in_vert')])
+        with query:
+            vao.render_multi(np.array([0, 4, 10], dtype='i4'), np.array([2, 3, 4], dtype='i4'), mode=moderngl.POINTS)
+        self.assertEqual(query.primitives, 9)
+
+        vao = self.ctx.vertex_array(prog, [(vbo, 'f', 'in_vert')], index)
+        with query:
+            vao.render_multi([0, 8], [3, 3], base_vertices=[1, 2], mode=moderngl.POINTS)
+        self.assertEqual(query.primitives, 6)
+
+        with self.assertRaises(moderngl.Error):
+            vao.render_multi([0, 8], [3])
+
+    def test_set_buffer(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in vec2 in_vert;
+                out vec2 out_vert;
+
+                void main() {
+                    out_vert = in_vert;
+                }
+            ''',
+            varyings=['out_vert']
+        )
+
+        vbo1 = self.ctx.buffer(np.array([1.0, 2.0, 3.0, 4.0], dtype='f4').tobytes())
+        vbo2 = self.ctx.buffer(np.array([5.0, 6.0, 7.0, 8.0, 9.0, 10.0], dtype='f4').tobytes())
+        output = self.ctx.buffer(reserve=24)
+
+        vao = self.ctx.vertex_array(prog, [(vbo1, '2f', 'in_vert')])
+        self.assertIs(vao.layout, self.ctx.vertex_layout(prog, [('2f', 'in_vert')]))
+        self.assertEqual(vao.layout.strides, (8,))
+        self.assertEqual(vao.vertices, 2)
+
+        vao.set_buffer(0, vbo2)
+        self.assertEqual(vao.vertices, 3)
+        vao.transform(output)
+        np.testing.assert_almost_equal(np.frombuffer(output.read(), dtype='f4'), [5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+
+        vao.set_buffer(0, vbo2, offset=4, stride=12)
+        vao.transform(output, vertices=2)
+        np.testing.assert_almost_equal(np.frombuffer(output.read(16), dtype='f4'), [6.0, 7.0, 9.0, 10.0])
+
+        with self.assertRaises(moderngl.Error):
+            vao.set_buffer(1, vbo1)
+
 
 if __name__ == '__main__':
     unittest.main()